@@ -1,3 +1,4 @@
+import json
 import re
 import secrets
 import time
@@ -267,6 +268,23 @@ def update_objects_in_batches(
             model.objects.bulk_update(chunk, fields, batch_size)
 
 
+def get_estimated_count(queryset) -> int:
+    """
+    Returns the number of rows of a queryset estimated by the PostgreSQL planner.
+
+    The estimate comes from the table statistics through EXPLAIN, so the rows are
+    not read, unlike a COUNT over the whole (partitioned) table.
+
+    Args:
+        queryset (QuerySet): The queryset to estimate.
+
+    Returns:
+        int: The estimated number of rows, 0 if the planner does not return it.
+    """
+    plan = json.loads(queryset.order_by().explain(format="json"))
+    return int(plan[0]["Plan"].get("Plan Rows", 0))
+
+
 # Postgres Enums
 
 
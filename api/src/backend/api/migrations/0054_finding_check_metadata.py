@@ -0,0 +1,85 @@
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+import api.rls
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0053_lighthouse_bedrock_openai_compatible"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FindingCheckMetadata",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("inserted_at", models.DateTimeField(auto_now_add=True)),
+                ("check_id", models.CharField(max_length=100)),
+                ("metadata_hash", models.CharField(max_length=64)),
+                ("metadata", models.JSONField(default=dict)),
+                (
+                    "tenant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="api.tenant"
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "finding_check_metadata",
+                "abstract": False,
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="findingcheckmetadata",
+            constraint=models.UniqueConstraint(
+                fields=("tenant_id", "check_id", "metadata_hash"),
+                name="unique_finding_check_metadata_by_tenant",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="findingcheckmetadata",
+            constraint=api.rls.RowLevelSecurityConstraint(
+                "tenant_id",
+                name="rls_on_findingcheckmetadata",
+                statements=["SELECT", "INSERT", "UPDATE", "DELETE"],
+            ),
+        ),
+        # The column keeps its name, only the model field is renamed
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.RenameField(
+                    model_name="finding",
+                    old_name="check_metadata",
+                    new_name="legacy_check_metadata",
+                ),
+                migrations.AlterField(
+                    model_name="finding",
+                    name="legacy_check_metadata",
+                    field=models.JSONField(db_column="check_metadata", default=dict),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name="finding",
+            name="check_metadata_entry",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="findings",
+                to="api.findingcheckmetadata",
+            ),
+        ),
+    ]
@@ -0,0 +1,141 @@
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import Coalesce
+
+import api.rls
+from api.db_router import MainRouter
+
+
+def backfill_provider_latest_overviews(apps, schema_editor):
+    """Create the latest overview of every provider from its latest completed scan."""
+    Scan = apps.get_model("api", "Scan")
+    ScanSummary = apps.get_model("api", "ScanSummary")
+    Resource = apps.get_model("api", "Resource")
+    ProviderLatestOverview = apps.get_model("api", "ProviderLatestOverview")
+
+    latest_scans = list(
+        Scan.objects.using(MainRouter.admin_db)
+        .filter(state="completed")
+        .order_by("provider_id", "-inserted_at")
+        .distinct("provider_id")
+        .values("id", "tenant_id", "provider_id")
+    )
+    if not latest_scans:
+        return
+
+    totals_by_scan = {
+        row["scan_id"]: row
+        for row in ScanSummary.objects.using(MainRouter.admin_db)
+        .filter(scan_id__in=[scan["id"] for scan in latest_scans])
+        .values("scan_id")
+        .annotate(
+            _pass=Coalesce(Sum("_pass"), 0),
+            fail=Coalesce(Sum("fail"), 0),
+            muted=Coalesce(Sum("muted"), 0),
+            total=Coalesce(Sum("total"), 0),
+        )
+    }
+    resources_by_provider = {
+        row["provider_id"]: row["total_resources"]
+        for row in Resource.objects.using(MainRouter.admin_db)
+        .values("provider_id")
+        .annotate(total_resources=Count("id"))
+    }
+
+    overviews = []
+    for scan in latest_scans:
+        totals = totals_by_scan.get(scan["id"], {})
+        overviews.append(
+            ProviderLatestOverview(
+                tenant_id=scan["tenant_id"],
+                provider_id=scan["provider_id"],
+                scan_id=scan["id"],
+                _pass=totals.get("_pass", 0),
+                fail=totals.get("fail", 0),
+                muted=totals.get("muted", 0),
+                total=totals.get("total", 0),
+                total_resources=resources_by_provider.get(scan["provider_id"], 0),
+            )
+        )
+    ProviderLatestOverview.objects.using(MainRouter.admin_db).bulk_create(
+        overviews, batch_size=500, ignore_conflicts=True
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0054_finding_check_metadata"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProviderLatestOverview",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("inserted_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("_pass", models.IntegerField(db_column="pass", default=0)),
+                ("fail", models.IntegerField(default=0)),
+                ("muted", models.IntegerField(default=0)),
+                ("total", models.IntegerField(default=0)),
+                ("total_resources", models.IntegerField(default=0)),
+                (
+                    "provider",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="latest_overview",
+                        related_query_name="latest_overview",
+                        to="api.provider",
+                    ),
+                ),
+                (
+                    "scan",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="latest_overviews",
+                        related_query_name="latest_overview",
+                        to="api.scan",
+                    ),
+                ),
+                (
+                    "tenant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="api.tenant"
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "provider_latest_overviews",
+                "abstract": False,
+                "indexes": [
+                    models.Index(
+                        fields=["tenant_id", "scan_id"],
+                        name="plo_tenant_scan_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="providerlatestoverview",
+            constraint=api.rls.RowLevelSecurityConstraint(
+                "tenant_id",
+                name="rls_on_providerlatestoverview",
+                statements=["SELECT", "INSERT", "UPDATE", "DELETE"],
+            ),
+        ),
+        migrations.RunPython(
+            backfill_provider_latest_overviews,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
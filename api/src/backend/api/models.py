@@ -1,3 +1,4 @@
+import hashlib
 import json
 import logging
 import re
@@ -775,6 +776,43 @@ class ResourceTagMapping(RowLevelSecurityProtectedModel):
         ]
 
 
+class FindingCheckMetadata(RowLevelSecurityProtectedModel):
+    """
+    Check metadata shared by all the findings of a check.
+
+    The metadata only changes between Prowler versions, so it is stored once per
+    check and metadata hash instead of once per finding.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    inserted_at = models.DateTimeField(auto_now_add=True, editable=False)
+
+    check_id = models.CharField(max_length=100, blank=False, null=False)
+    metadata_hash = models.CharField(max_length=64, blank=False, null=False)
+    metadata = models.JSONField(default=dict, null=False)
+
+    class Meta(RowLevelSecurityProtectedModel.Meta):
+        db_table = "finding_check_metadata"
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=("tenant_id", "check_id", "metadata_hash"),
+                name="unique_finding_check_metadata_by_tenant",
+            ),
+            RowLevelSecurityConstraint(
+                field="tenant_id",
+                name="rls_on_%(class)s",
+                statements=["SELECT", "INSERT", "UPDATE", "DELETE"],
+            ),
+        ]
+
+    @staticmethod
+    def compute_hash(metadata: dict) -> str:
+        return hashlib.sha256(
+            json.dumps(metadata, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+
 class Finding(PostgresPartitionedModel, RowLevelSecurityProtectedModel):
     """
     Defines the Finding model.
@@ -818,7 +856,18 @@ class Finding(PostgresPartitionedModel, RowLevelSecurityProtectedModel):
     raw_result = models.JSONField(default=dict)
     tags = models.JSONField(default=dict, null=True, blank=True)
     check_id = models.CharField(max_length=100, blank=False, null=False)
-    check_metadata = models.JSONField(default=dict, null=False)
+    # Findings created before the check metadata was normalized keep it inline
+    legacy_check_metadata = models.JSONField(
+        default=dict, null=False, db_column="check_metadata"
+    )
+    check_metadata_entry = models.ForeignKey(
+        FindingCheckMetadata,
+        on_delete=models.PROTECT,
+        related_name="findings",
+        null=True,
+        blank=True,
+        db_index=False,
+    )
     muted = models.BooleanField(default=False, null=False)
     muted_reason = models.TextField(
         blank=True, null=True, validators=[MinLengthValidator(3)], max_length=500
@@ -910,6 +959,18 @@ class Finding(PostgresPartitionedModel, RowLevelSecurityProtectedModel):
     class JSONAPIMeta:
         resource_name = "findings"
 
+    @property
+    def check_metadata(self) -> dict:
+        if self.check_metadata_entry_id is not None:
+            return self.check_metadata_entry.metadata
+        return self.legacy_check_metadata
+
+    @check_metadata.setter
+    def check_metadata(self, value: dict):
+        # Metadata assigned to an instance is kept inline instead of shared
+        self.check_metadata_entry = None
+        self.legacy_check_metadata = value
+
     def add_resources(self, resources: list[Resource] | None):
         if not resources:
             return
@@ -1440,6 +1501,59 @@ class ScanSummary(RowLevelSecurityProtectedModel):
         resource_name = "scan-summaries"
 
 
+class ProviderLatestOverview(RowLevelSecurityProtectedModel):
+    """
+    Latest completed scan of a provider with the totals of its findings and resources.
+
+    The scan summary task keeps one row per provider, so the overview endpoints read
+    these rows instead of looking for the latest scan of every provider per request.
+    """
+
+    objects = ActiveProviderManager()
+    all_objects = models.Manager()
+
+    id = models.UUIDField(primary_key=True, default=uuid4, editable=False)
+    inserted_at = models.DateTimeField(auto_now_add=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True, editable=False)
+    provider = models.OneToOneField(
+        Provider,
+        on_delete=models.CASCADE,
+        related_name="latest_overview",
+        related_query_name="latest_overview",
+    )
+    scan = models.ForeignKey(
+        Scan,
+        on_delete=models.CASCADE,
+        related_name="latest_overviews",
+        related_query_name="latest_overview",
+    )
+    _pass = models.IntegerField(db_column="pass", default=0)
+    fail = models.IntegerField(default=0)
+    muted = models.IntegerField(default=0)
+    total = models.IntegerField(default=0)
+    total_resources = models.IntegerField(default=0)
+
+    class Meta(RowLevelSecurityProtectedModel.Meta):
+        db_table = "provider_latest_overviews"
+
+        constraints = [
+            RowLevelSecurityConstraint(
+                field="tenant_id",
+                name="rls_on_%(class)s",
+                statements=["SELECT", "INSERT", "UPDATE", "DELETE"],
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["tenant_id", "scan_id"],
+                name="plo_tenant_scan_idx",
+            ),
+        ]
+
+    class JSONAPIMeta:
+        resource_name = "provider-latest-overviews"
+
+
 class Integration(RowLevelSecurityProtectedModel):
     class IntegrationChoices(models.TextChoices):
         AMAZON_S3 = "amazon_s3", _("Amazon S3")
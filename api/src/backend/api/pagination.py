@@ -1,6 +1,87 @@
+from uuid import UUID
+
 from drf_spectacular_jsonapi.schemas.pagination import JsonApiPageNumberPagination
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from api.db_utils import get_estimated_count
 
 
 class ComplianceOverviewPagination(JsonApiPageNumberPagination):
     page_size = 50
     max_page_size = 100
+
+
+class KeysetPagination(JsonApiPageNumberPagination):
+    """
+    Keyset pagination over the primary key of a list of PKs.
+
+    The page starts after the `page[after]` cursor, the last PK of the previous
+    page (empty for the first page), so every page is an indexed range read and
+    no COUNT is needed. `page[count]=estimated` adds the number of rows estimated
+    by the planner statistics to the pagination meta.
+    """
+
+    cursor_query_param = "page[after]"
+    count_query_param = "page[count]"
+    estimated_count_value = "estimated"
+    invalid_cursor_message = "Invalid cursor."
+
+    @classmethod
+    def is_requested(cls, request) -> bool:
+        return request is not None and cls.cursor_query_param in request.query_params
+
+    def paginate_queryset(self, queryset, request, view=None, descending=True):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.count = None
+        if (
+            request.query_params.get(self.count_query_param)
+            == self.estimated_count_value
+        ):
+            self.count = get_estimated_count(queryset)
+
+        cursor = self.decode_cursor(request)
+        queryset = queryset.order_by("-pk" if descending else "pk")
+        if cursor:
+            queryset = queryset.filter(**{"pk__lt" if descending else "pk__gt": cursor})
+
+        page = list(queryset[: self.page_size + 1])
+        self.next_cursor = (
+            page[self.page_size - 1] if len(page) > self.page_size else None
+        )
+        return page[: self.page_size]
+
+    def decode_cursor(self, request) -> UUID | None:
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None
+        try:
+            return UUID(cursor)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+
+    def build_cursor_link(self, cursor):
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        pagination = {"size": self.page_size}
+        if self.count is not None:
+            pagination["count"] = self.count
+
+        return Response(
+            {
+                "results": data,
+                "meta": {"pagination": pagination},
+                "links": {
+                    "first": self.build_cursor_link(""),
+                    "next": (
+                        self.build_cursor_link(self.next_cursor)
+                        if self.next_cursor
+                        else None
+                    ),
+                },
+            }
+        )
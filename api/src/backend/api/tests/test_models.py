@@ -3,7 +3,14 @@ from allauth.socialaccount.models import SocialApp
 from django.core.exceptions import ValidationError
 
 from api.db_router import MainRouter
-from api.models import Resource, ResourceTag, SAMLConfiguration, SAMLDomainIndex
+from api.models import (
+    Finding,
+    FindingCheckMetadata,
+    Resource,
+    ResourceTag,
+    SAMLConfiguration,
+    SAMLDomainIndex,
+)
 
 
 @pytest.mark.django_db
@@ -125,6 +132,47 @@ class TestResourceModel:
 #         assert Finding.objects.filter(uid=long_uid).exists()
 
 
+@pytest.mark.django_db
+class TestFindingModel:
+    def test_check_metadata_from_entry(self, scans_fixture):
+        scan, *_ = scans_fixture
+        metadata = {"checkid": "test_check", "severity": "high"}
+        check_metadata_entry = FindingCheckMetadata.objects.create(
+            tenant_id=scan.tenant_id,
+            check_id="test_check",
+            metadata_hash=FindingCheckMetadata.compute_hash(metadata),
+            metadata=metadata,
+        )
+
+        finding = Finding.objects.create(
+            tenant_id=scan.tenant_id,
+            uid="test_finding_uid",
+            scan=scan,
+            status="FAIL",
+            severity="high",
+            impact="high",
+            check_id="test_check",
+            check_metadata_entry=check_metadata_entry,
+        )
+
+        finding = Finding.all_objects.get(id=finding.id)
+        assert finding.check_metadata == metadata
+        assert finding.legacy_check_metadata == {}
+
+    def test_check_metadata_inline(self, findings_fixture):
+        finding, *_ = findings_fixture
+
+        finding = Finding.all_objects.get(id=finding.id)
+        assert finding.check_metadata_entry is None
+        assert finding.check_metadata == finding.legacy_check_metadata
+        assert finding.check_metadata["CheckId"] == finding.check_id
+
+    def test_compute_hash_ignores_key_order(self):
+        assert FindingCheckMetadata.compute_hash(
+            {"a": 1, "b": 2}
+        ) == FindingCheckMetadata.compute_hash({"b": 2, "a": 1})
+
+
 @pytest.mark.django_db
 class TestSAMLConfigurationModel:
     VALID_METADATA = """<?xml version='1.0' encoding='UTF-8'?>
@@ -30,6 +30,7 @@ from django.urls import reverse
 from django_celery_results.models import TaskResult
 from rest_framework import status
 from rest_framework.response import Response
+from tasks.jobs.scan import update_provider_latest_overview
 
 from api.compliance import get_compliance_frameworks
 from api.db_router import MainRouter
@@ -3317,6 +3318,27 @@ class TestResourceViewSet:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.json()["data"]) == len(resources_fixture)
 
+    def test_resources_list_keyset_pagination(
+        self, authenticated_client, resources_fixture
+    ):
+        response = authenticated_client.get(
+            reverse("resource-list"),
+            {"filter[updated_at]": TODAY, "page[after]": "", "page[size]": 2},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        first_page_ids = [item["id"] for item in response.json()["data"]]
+        assert len(first_page_ids) == 2
+
+        response = authenticated_client.get(response.json()["links"]["next"])
+        assert response.status_code == status.HTTP_200_OK
+        resource_ids = first_page_ids + [item["id"] for item in response.json()["data"]]
+        assert (
+            resource_ids
+            == sorted(
+                (str(resource.id) for resource in resources_fixture), reverse=True
+            )[: len(resource_ids)]
+        )
+
     @pytest.mark.parametrize(
         "include_values, expected_resources",
         [
@@ -3844,6 +3866,65 @@ class TestFindingViewSet:
             response.json()["errors"][0]["detail"] == "invalid sort parameter: invalid"
         )
 
+    @pytest.mark.parametrize(
+        "sort_value, descending",
+        [(None, True), ("-inserted_at", True), ("inserted_at", False)],
+    )
+    def test_findings_list_keyset_pagination(
+        self, authenticated_client, findings_fixture, sort_value, descending
+    ):
+        params = {"filter[inserted_at]": TODAY, "page[after]": "", "page[size]": 1}
+        if sort_value:
+            params["sort"] = sort_value
+        expected_ids = sorted(
+            (str(finding.id) for finding in findings_fixture), reverse=descending
+        )
+
+        finding_ids = []
+        next_link = reverse("finding-list")
+        while next_link:
+            response = authenticated_client.get(next_link, params)
+            assert response.status_code == status.HTTP_200_OK
+            finding_ids.extend(item["id"] for item in response.json()["data"])
+            assert "count" not in response.json()["meta"]["pagination"]
+            next_link = response.json()["links"]["next"]
+            params = None
+
+        assert finding_ids == expected_ids
+
+    def test_findings_list_keyset_pagination_estimated_count(
+        self, authenticated_client, findings_fixture
+    ):
+        response = authenticated_client.get(
+            reverse("finding-list"),
+            {
+                "filter[inserted_at]": TODAY,
+                "page[after]": "",
+                "page[count]": "estimated",
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()["data"]) == len(findings_fixture)
+        assert isinstance(response.json()["meta"]["pagination"]["count"], int)
+        assert response.json()["links"]["next"] is None
+
+    def test_findings_list_keyset_pagination_invalid_cursor(self, authenticated_client):
+        response = authenticated_client.get(
+            reverse("finding-list"),
+            {"filter[inserted_at]": TODAY, "page[after]": "invalid"},
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_findings_list_keyset_pagination_unsupported_sort(
+        self, authenticated_client
+    ):
+        response = authenticated_client.get(
+            reverse("finding-list"),
+            {"filter[inserted_at]": TODAY, "page[after]": "", "sort": "severity"},
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["errors"][0]["code"] == "invalid"
+
     def test_findings_retrieve(self, authenticated_client, findings_fixture):
         finding_1, *_ = findings_fixture
         response = authenticated_client.get(
@@ -5890,6 +5971,15 @@ class TestComplianceOverviewViewSet:
                 assert attributes["version"] == filter_value
 
 
+def update_latest_overviews(tenant_id):
+    for scan_id in (
+        Scan.objects.filter(tenant_id=tenant_id, state=StateChoices.COMPLETED)
+        .order_by("inserted_at")
+        .values_list("id", flat=True)
+    ):
+        update_provider_latest_overview(str(tenant_id), str(scan_id))
+
+
 @pytest.mark.django_db
 class TestOverviewViewSet:
     def test_overview_list_invalid_method(self, authenticated_client):
@@ -5897,8 +5987,14 @@ class TestOverviewViewSet:
         assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
 
     def test_overview_providers_list(
-        self, authenticated_client, scan_summaries_fixture, resources_fixture
+        self,
+        authenticated_client,
+        scan_summaries_fixture,
+        resources_fixture,
+        tenants_fixture,
     ):
+        update_latest_overviews(tenants_fixture[0].id)
+
         response = authenticated_client.get(reverse("overview-providers"))
         assert response.status_code == status.HTTP_200_OK
         assert len(response.json()["data"]) == 1
@@ -5906,8 +6002,8 @@ class TestOverviewViewSet:
         assert response.json()["data"][0]["attributes"]["findings"]["pass"] == 2
         assert response.json()["data"][0]["attributes"]["findings"]["fail"] == 1
         assert response.json()["data"][0]["attributes"]["findings"]["muted"] == 1
-        # Aggregated resources include all AWS providers present in the tenant
-        assert response.json()["data"][0]["attributes"]["resources"]["total"] == 3
+        # Only the resources of the providers with a completed scan are counted
+        assert response.json()["data"][0]["attributes"]["resources"]["total"] == 2
 
     def test_overview_providers_aggregates_same_provider_type(
         self,
@@ -5950,6 +6046,7 @@ class TestOverviewViewSet:
             service="ec2",
             type="prowler-test",
         )
+        update_latest_overviews(tenant.id)
 
         response = authenticated_client.get(reverse("overview-providers"))
         assert response.status_code == status.HTTP_200_OK
@@ -5963,6 +6060,51 @@ class TestOverviewViewSet:
         assert attributes["findings"]["muted"] == 2
         assert attributes["resources"]["total"] == 4
 
+    def test_overview_providers_cache_refreshed_by_new_scan(
+        self,
+        authenticated_client,
+        scan_summaries_fixture,
+        providers_fixture,
+        tenants_fixture,
+    ):
+        tenant = tenants_fixture[0]
+        provider1, *_ = providers_fixture
+
+        response = authenticated_client.get(reverse("overview-providers"))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["data"][0]["attributes"]["findings"]["total"] == 4
+
+        scan = Scan.objects.create(
+            name="newer overview scan",
+            provider=provider1,
+            trigger=Scan.TriggerChoices.MANUAL,
+            state=StateChoices.COMPLETED,
+            tenant=tenant,
+        )
+        ScanSummary.objects.create(
+            tenant=tenant,
+            scan=scan,
+            check_id="check1",
+            service="service1",
+            severity="high",
+            region="region1",
+            _pass=0,
+            fail=7,
+            muted=0,
+            total=7,
+        )
+        # The cached overview is kept until the scan summary updates the provider overview
+        response = authenticated_client.get(reverse("overview-providers"))
+        assert response.json()["data"][0]["attributes"]["findings"]["total"] == 4
+
+        update_provider_latest_overview(str(tenant.id), str(scan.id))
+
+        response = authenticated_client.get(reverse("overview-providers"))
+        assert response.status_code == status.HTTP_200_OK
+        attributes = response.json()["data"][0]["attributes"]
+        assert attributes["findings"]["total"] == 7
+        assert attributes["findings"]["fail"] == 7
+
     def test_overview_providers_count(
         self,
         authenticated_client,
@@ -6093,6 +6235,7 @@ class TestOverviewViewSet:
             muted_new=1,
             muted_changed=0,
         )
+        update_latest_overviews(tenant.id)
 
         single_response = authenticated_client.get(
             reverse("overview-findings"),
@@ -6173,6 +6316,7 @@ class TestOverviewViewSet:
             muted=0,
             total=3,
         )
+        update_latest_overviews(tenant.id)
 
         single_response = authenticated_client.get(
             reverse("overview-findings_severity"),
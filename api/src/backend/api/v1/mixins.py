@@ -1,6 +1,7 @@
 from django.urls import reverse
 from django_celery_results.models import TaskResult
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
 from api.exceptions import (
@@ -9,6 +10,7 @@ from api.exceptions import (
     TaskNotFoundException,
 )
 from api.models import StateChoices, Task
+from api.pagination import KeysetPagination
 from api.v1.serializers import TaskSerializer
 
 
@@ -35,8 +37,32 @@ class PaginateByPkMixin:
     Mixin to paginate on a list of PKs (cheaper than heavy JOINs),
     re-fetch the full objects with the desired select/prefetch,
     re-sort them to preserve DB ordering, then serialize + return.
+
+    When `page[after]` is present the PKs are paginated with keyset pagination,
+    ordered by PK. `keyset_sort_orderings` maps the `sort` values supported in
+    that mode to whether the PKs are sorted in descending order.
     """
 
+    keyset_pagination_class = KeysetPagination
+    keyset_sort_orderings = {}
+
+    def get_keyset_descending(self, request) -> bool:
+        sort = request.query_params.get("sort")
+        if not sort:
+            return True
+        if sort not in self.keyset_sort_orderings:
+            raise ValidationError(
+                [
+                    {
+                        "detail": f"Sorting by '{sort}' is not supported with keyset pagination.",
+                        "status": 400,
+                        "source": {"pointer": "sort"},
+                        "code": "invalid",
+                    }
+                ]
+            )
+        return self.keyset_sort_orderings[sort]
+
     def paginate_by_pk(
         self,
         request,  # noqa: F841
@@ -53,7 +79,17 @@ class PaginateByPkMixin:
         pagination method.
         """
         pk_list = base_queryset.values_list("id", flat=True)
-        page = self.paginate_queryset(pk_list)
+        keyset_paginator = None
+        if self.keyset_pagination_class.is_requested(request):
+            keyset_paginator = self.keyset_pagination_class()
+            page = keyset_paginator.paginate_queryset(
+                pk_list,
+                request,
+                view=self,
+                descending=self.get_keyset_descending(request),
+            )
+        else:
+            page = self.paginate_queryset(pk_list)
         if page is None:
             return Response(self.get_serializer(base_queryset, many=True).data)
 
@@ -68,9 +104,12 @@ class PaginateByPkMixin:
         if hasattr(self, "_optimize_tags_loading"):
             queryset = self._optimize_tags_loading(queryset)
 
-        queryset = sorted(queryset, key=lambda obj: page.index(obj.id))
+        page_positions = {pk: position for position, pk in enumerate(page)}
+        queryset = sorted(queryset, key=lambda obj: page_positions[obj.id])
 
         serialized = self.get_serializer(queryset, many=True).data
+        if keyset_paginator:
+            return keyset_paginator.get_paginated_response(serialized)
         return self.get_paginated_response(serialized)
 
 
@@ -1273,6 +1273,7 @@ class FindingSerializer(RLSSerializer):
     """
 
     resources = serializers.ResourceRelatedField(many=True, read_only=True)
+    check_metadata = serializers.JSONField(read_only=True)
 
     class Meta:
         model = Finding
@@ -1308,6 +1309,8 @@ class FindingIncludeSerializer(RLSSerializer):
     Serializer for the include Finding model.
     """
 
+    check_metadata = serializers.JSONField(read_only=True)
+
     class Meta:
         model = Finding
         fields = [
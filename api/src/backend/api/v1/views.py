@@ -1,5 +1,6 @@
 import fnmatch
 import glob
+import hashlib
 import json
 import logging
 import os
@@ -23,8 +24,9 @@ from dj_rest_auth.registration.views import SocialLoginView
 from django.conf import settings as django_settings
 from django.contrib.postgres.aggregates import ArrayAgg
 from django.contrib.postgres.search import SearchQuery
+from django.core.cache import cache
 from django.db import transaction
-from django.db.models import Count, F, Prefetch, Q, Subquery, Sum
+from django.db.models import Count, F, Max, Prefetch, Q, Subquery, Sum
 from django.db.models.functions import Coalesce
 from django.http import HttpResponse
 from django.shortcuts import redirect
@@ -122,6 +124,7 @@ from api.models import (
     Provider,
     ProviderGroup,
     ProviderGroupMembership,
+    ProviderLatestOverview,
     ProviderSecret,
     Resource,
     ResourceFindingMapping,
@@ -235,6 +238,24 @@ CACHE_DECORATOR = cache_control(
     stale_while_revalidate=django_settings.CACHE_STALE_WHILE_REVALIDATE,
 )
 
+KEYSET_PAGINATION_PARAMETERS = [
+    OpenApiParameter(
+        name="page[after]",
+        description="Enables keyset pagination: the page starts after this cursor, taken from the `next` link of the "
+        "previous page. Leave it empty to get the first page. The results are ordered by ID.",
+        required=False,
+        type=OpenApiTypes.STR,
+    ),
+    OpenApiParameter(
+        name="page[count]",
+        description="With keyset pagination, set it to `estimated` to include the number of results estimated from the "
+        "database statistics in the pagination meta.",
+        required=False,
+        type=OpenApiTypes.STR,
+        enum=["estimated"],
+    ),
+]
+
 
 class RelationshipViewSchema(JsonApiAutoSchema):
     def _resolve_path_parameters(self, _path_variables):
@@ -2088,7 +2109,8 @@ class TaskViewSet(BaseRLSViewSet):
                 description="At least one of the variations of the `filter[updated_at]` filter must be provided.",
                 required=True,
                 type=OpenApiTypes.DATE,
-            )
+            ),
+            *KEYSET_PAGINATION_PARAMETERS,
         ],
     ),
     retrieve=extend_schema(
@@ -2117,6 +2139,7 @@ class TaskViewSet(BaseRLSViewSet):
         description="Retrieve a list of the latest resources from the latest scans for each provider with options for "
         "filtering by various criteria.",
         filters=True,
+        parameters=KEYSET_PAGINATION_PARAMETERS,
     ),
     metadata_latest=extend_schema(
         tags=["Resource"],
@@ -2201,8 +2224,10 @@ class ResourceViewSet(PaginateByPkMixin, BaseRLSViewSet):
         )
 
     def _get_findings_prefetch(self):
-        findings_queryset = Finding.all_objects.defer("scan", "resources").filter(
-            tenant_id=self.request.tenant_id
+        findings_queryset = (
+            Finding.all_objects.defer("scan", "resources")
+            .select_related("check_metadata_entry")
+            .filter(tenant_id=self.request.tenant_id)
         )
         return [Prefetch("findings", queryset=findings_queryset)]
 
@@ -2450,7 +2475,8 @@ class ResourceViewSet(PaginateByPkMixin, BaseRLSViewSet):
                 description="At least one of the variations of the `filter[inserted_at]` filter must be provided.",
                 required=True,
                 type=OpenApiTypes.DATE,
-            )
+            ),
+            *KEYSET_PAGINATION_PARAMETERS,
         ],
     ),
     retrieve=extend_schema(
@@ -2485,6 +2511,7 @@ class ResourceViewSet(PaginateByPkMixin, BaseRLSViewSet):
         description="Retrieve a list of the latest findings from the latest scans for each provider with options for "
         "filtering by various criteria.",
         filters=True,
+        parameters=KEYSET_PAGINATION_PARAMETERS,
     ),
     metadata_latest=extend_schema(
         tags=["Finding"],
@@ -2509,6 +2536,8 @@ class FindingViewSet(PaginateByPkMixin, BaseRLSViewSet):
         "inserted_at",
         "updated_at",
     ]
+    # Finding IDs are UUIDv7, so ordering them by ID is ordering them by insertion time
+    keyset_sort_orderings = {"-inserted_at": True, "inserted_at": False}
     prefetch_for_includes = {
         "__all__": [],
         "resources": [
@@ -2572,7 +2601,7 @@ class FindingViewSet(PaginateByPkMixin, BaseRLSViewSet):
             request,
             filtered_queryset,
             manager=Finding.all_objects,
-            select_related=["scan"],
+            select_related=["scan", "check_metadata_entry"],
             prefetch_related=["resources"],
         )
 
@@ -2731,7 +2760,7 @@ class FindingViewSet(PaginateByPkMixin, BaseRLSViewSet):
             request,
             filtered_queryset,
             manager=Finding.all_objects,
-            select_related=["scan"],
+            select_related=["scan", "check_metadata_entry"],
             prefetch_related=["resources"],
         )
 
@@ -3791,61 +3820,87 @@ class OverviewViewSet(BaseRLSViewSet):
     def retrieve(self, request, *args, **kwargs):
         raise MethodNotAllowed(method="GET")
 
-    @action(detail=False, methods=["get"], url_name="providers")
-    def providers(self, request):
-        tenant_id = self.request.tenant_id
-        queryset = self.get_queryset()
-        provider_filter = (
-            {"provider__in": self.allowed_providers}
-            if hasattr(self, "allowed_providers")
-            else {}
+    def _get_latest_overviews(self):
+        queryset = ProviderLatestOverview.all_objects.filter(
+            tenant_id=self.request.tenant_id
         )
+        if hasattr(self, "allowed_providers"):
+            queryset = queryset.filter(provider__in=self.allowed_providers)
+        return queryset
 
-        latest_scan_ids = (
-            Scan.all_objects.filter(
-                tenant_id=tenant_id, state=StateChoices.COMPLETED, **provider_filter
-            )
-            .order_by("provider_id", "-inserted_at")
-            .distinct("provider_id")
-            .values_list("id", flat=True)
-        )
+    def _get_latest_scan_ids(self):
+        return self._get_latest_overviews().values_list("scan_id", flat=True)
 
-        findings_aggregated = (
-            queryset.filter(scan_id__in=latest_scan_ids)
-            .values(provider=F("scan__provider__provider"))
-            .annotate(
-                findings_passed=Coalesce(Sum("_pass"), 0),
-                findings_failed=Coalesce(Sum("fail"), 0),
-                findings_muted=Coalesce(Sum("muted"), 0),
-                total_findings=Coalesce(Sum("total"), 0),
+    def _get_cached_overview(self, request, build_overview):
+        """
+        Returns the overview built by `build_overview`, cached by tenant, provider visibility and query.
+
+        The cache key includes the last update of the latest overviews, so the cached
+        overview is discarded as soon as a scan summary updates them.
+        """
+        visibility = (
+            sorted(
+                str(provider_id)
+                for provider_id in self.allowed_providers.values_list("id", flat=True)
             )
+            if hasattr(self, "allowed_providers")
+            else "unlimited"
+        )
+        version = self._get_latest_overviews().aggregate(
+            updated_at=Max("updated_at"), count=Count("id")
+        )
+        cache_key = (
+            "overview:"
+            + hashlib.sha256(
+                json.dumps(
+                    [
+                        str(request.tenant_id),
+                        self.action,
+                        visibility,
+                        str(version["updated_at"]),
+                        version["count"],
+                        sorted(request.query_params.lists()),
+                    ]
+                ).encode()
+            ).hexdigest()
         )
 
-        resources_queryset = Resource.all_objects.filter(tenant_id=tenant_id)
-        if hasattr(self, "allowed_providers"):
-            resources_queryset = resources_queryset.filter(
-                provider__in=self.allowed_providers
-            )
-        resources_aggregated = resources_queryset.values(
-            provider_type=F("provider__provider")
-        ).annotate(total_resources=Count("id"))
-        resource_map = {
-            row["provider_type"]: row["total_resources"] for row in resources_aggregated
-        }
+        overview = cache.get(cache_key)
+        if overview is None:
+            overview = build_overview()
+            cache.set(cache_key, overview, django_settings.OVERVIEW_CACHE_TTL)
+        return overview
 
-        overview = []
-        for row in findings_aggregated:
-            overview.append(
+    @action(detail=False, methods=["get"], url_name="providers")
+    def providers(self, request):
+        self.get_queryset()
+
+        def build_overview():
+            providers_aggregated = (
+                self._get_latest_overviews()
+                .values(provider_type=F("provider__provider"))
+                .annotate(
+                    findings_passed=Coalesce(Sum("_pass"), 0),
+                    findings_failed=Coalesce(Sum("fail"), 0),
+                    findings_muted=Coalesce(Sum("muted"), 0),
+                    total_findings=Coalesce(Sum("total"), 0),
+                    total_resources=Coalesce(Sum("total_resources"), 0),
+                )
+                .order_by("provider_type")
+            )
+            return [
                 {
-                    "provider": row["provider"],
-                    "total_resources": resource_map.get(row["provider"], 0),
+                    "provider": row["provider_type"],
+                    "total_resources": row["total_resources"],
                     "total_findings": row["total_findings"],
                     "findings_passed": row["findings_passed"],
                     "findings_failed": row["findings_failed"],
                     "findings_muted": row["findings_muted"],
                 }
-            )
+                for row in providers_aggregated
+            ]
 
+        overview = self._get_cached_overview(request, build_overview)
         return Response(
             self.get_serializer(overview, many=True).data,
             status=status.HTTP_200_OK,
@@ -3885,46 +3940,36 @@ class OverviewViewSet(BaseRLSViewSet):
     def findings(self, request):
         tenant_id = self.request.tenant_id
         queryset = self.get_queryset()
-        filtered_queryset = self.filter_queryset(queryset)
-        provider_filter = (
-            {"provider__in": self.allowed_providers}
-            if hasattr(self, "allowed_providers")
-            else {}
-        )
 
-        latest_scan_ids = (
-            Scan.all_objects.filter(
-                tenant_id=tenant_id, state=StateChoices.COMPLETED, **provider_filter
+        def build_overview():
+            filtered_queryset = self.filter_queryset(queryset).filter(
+                tenant_id=tenant_id, scan_id__in=self._get_latest_scan_ids()
             )
-            .order_by("provider_id", "-inserted_at")
-            .distinct("provider_id")
-            .values_list("id", flat=True)
-        )
-        filtered_queryset = filtered_queryset.filter(
-            tenant_id=tenant_id, scan_id__in=latest_scan_ids
-        )
 
-        aggregated_totals = filtered_queryset.aggregate(
-            _pass=Sum("_pass") or 0,
-            fail=Sum("fail") or 0,
-            muted=Sum("muted") or 0,
-            total=Sum("total") or 0,
-            new=Sum("new") or 0,
-            changed=Sum("changed") or 0,
-            unchanged=Sum("unchanged") or 0,
-            fail_new=Sum("fail_new") or 0,
-            fail_changed=Sum("fail_changed") or 0,
-            pass_new=Sum("pass_new") or 0,
-            pass_changed=Sum("pass_changed") or 0,
-            muted_new=Sum("muted_new") or 0,
-            muted_changed=Sum("muted_changed") or 0,
-        )
+            aggregated_totals = filtered_queryset.aggregate(
+                _pass=Sum("_pass") or 0,
+                fail=Sum("fail") or 0,
+                muted=Sum("muted") or 0,
+                total=Sum("total") or 0,
+                new=Sum("new") or 0,
+                changed=Sum("changed") or 0,
+                unchanged=Sum("unchanged") or 0,
+                fail_new=Sum("fail_new") or 0,
+                fail_changed=Sum("fail_changed") or 0,
+                pass_new=Sum("pass_new") or 0,
+                pass_changed=Sum("pass_changed") or 0,
+                muted_new=Sum("muted_new") or 0,
+                muted_changed=Sum("muted_changed") or 0,
+            )
 
-        for key in aggregated_totals:
-            if aggregated_totals[key] is None:
-                aggregated_totals[key] = 0
+            for key in aggregated_totals:
+                if aggregated_totals[key] is None:
+                    aggregated_totals[key] = 0
+            return aggregated_totals
 
-        serializer = self.get_serializer(aggregated_totals)
+        serializer = self.get_serializer(
+            self._get_cached_overview(request, build_overview)
+        )
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     @action(detail=False, methods=["get"], url_name="findings_severity")
@@ -3936,78 +3981,56 @@ class OverviewViewSet(BaseRLSViewSet):
             "tenant_id", "scan_id", "severity", "fail", "_pass", "total"
         )
 
-        filtered_queryset = self.filter_queryset(queryset)
-        provider_filter = (
-            {"provider__in": self.allowed_providers}
-            if hasattr(self, "allowed_providers")
-            else {}
-        )
-
-        latest_scan_ids = (
-            Scan.all_objects.filter(
-                tenant_id=tenant_id, state=StateChoices.COMPLETED, **provider_filter
+        def build_overview():
+            filtered_queryset = self.filter_queryset(queryset).filter(
+                tenant_id=tenant_id, scan_id__in=self._get_latest_scan_ids()
             )
-            .order_by("provider_id", "-inserted_at")
-            .distinct("provider_id")
-            .values_list("id", flat=True)
-        )
-        filtered_queryset = filtered_queryset.filter(
-            tenant_id=tenant_id, scan_id__in=latest_scan_ids
-        )
 
-        # The filter will have added a status_count annotation if any status filter was used
-        if "status_count" in filtered_queryset.query.annotations:
-            sum_expression = Sum("status_count")
-        else:
-            sum_expression = Sum("total")
+            # The filter will have added a status_count annotation if any status filter was used
+            if "status_count" in filtered_queryset.query.annotations:
+                sum_expression = Sum("status_count")
+            else:
+                sum_expression = Sum("total")
 
-        severity_counts = (
-            filtered_queryset.values("severity")
-            .annotate(count=sum_expression)
-            .order_by("severity")
-        )
+            severity_counts = (
+                filtered_queryset.values("severity")
+                .annotate(count=sum_expression)
+                .order_by("severity")
+            )
 
-        severity_data = {sev[0]: 0 for sev in SeverityChoices}
-        severity_data.update(
-            {item["severity"]: item["count"] for item in severity_counts}
-        )
+            severity_data = {sev[0]: 0 for sev in SeverityChoices}
+            severity_data.update(
+                {item["severity"]: item["count"] for item in severity_counts}
+            )
+            return severity_data
 
-        serializer = self.get_serializer(severity_data)
+        serializer = self.get_serializer(
+            self._get_cached_overview(request, build_overview)
+        )
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     @action(detail=False, methods=["get"], url_name="services")
     def services(self, request):
         tenant_id = self.request.tenant_id
         queryset = self.get_queryset()
-        filtered_queryset = self.filter_queryset(queryset)
-        provider_filter = (
-            {"provider__in": self.allowed_providers}
-            if hasattr(self, "allowed_providers")
-            else {}
-        )
 
-        latest_scan_ids = (
-            Scan.all_objects.filter(
-                tenant_id=tenant_id, state=StateChoices.COMPLETED, **provider_filter
+        def build_overview():
+            filtered_queryset = self.filter_queryset(queryset).filter(
+                tenant_id=tenant_id, scan_id__in=self._get_latest_scan_ids()
             )
-            .order_by("provider_id", "-inserted_at")
-            .distinct("provider_id")
-            .values_list("id", flat=True)
-        )
-        filtered_queryset = filtered_queryset.filter(
-            tenant_id=tenant_id, scan_id__in=latest_scan_ids
-        )
 
-        services_data = (
-            filtered_queryset.values("service")
-            .annotate(_pass=Sum("_pass"))
-            .annotate(fail=Sum("fail"))
-            .annotate(muted=Sum("muted"))
-            .annotate(total=Sum("total"))
-            .order_by("service")
-        )
+            return list(
+                filtered_queryset.values("service")
+                .annotate(_pass=Sum("_pass"))
+                .annotate(fail=Sum("fail"))
+                .annotate(muted=Sum("muted"))
+                .annotate(total=Sum("total"))
+                .order_by("service")
+            )
 
-        serializer = self.get_serializer(services_data, many=True)
+        serializer = self.get_serializer(
+            self._get_cached_overview(request, build_overview), many=True
+        )
 
         return Response(serializer.data, status=status.HTTP_200_OK)
 
@@ -265,6 +265,8 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # Cache settings
 CACHE_MAX_AGE = env.int("DJANGO_CACHE_MAX_AGE", 3600)
 CACHE_STALE_WHILE_REVALIDATE = env.int("DJANGO_STALE_WHILE_REVALIDATE", 60)
+# Seconds the overview endpoints keep their responses, per tenant and provider visibility
+OVERVIEW_CACHE_TTL = env.int("DJANGO_OVERVIEW_CACHE_TTL", 30)
 
 
 TESTING = False
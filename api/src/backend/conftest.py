@@ -12,6 +12,7 @@ from django_celery_results.models import TaskResult
 from rest_framework import status
 from rest_framework.test import APIClient
 from tasks.jobs.backfill import backfill_resource_scan_summaries
+from tasks.jobs.scan import update_provider_latest_overview
 
 from api.db_utils import rls_transaction
 from api.models import (
@@ -1151,6 +1152,8 @@ def scan_summaries_fixture(tenants_fixture, providers_fixture):
         scan=scan,
     )
 
+    update_provider_latest_overview(str(tenant.id), str(scan.id))
+
 
 @pytest.fixture
 def integrations_fixture(providers_fixture):
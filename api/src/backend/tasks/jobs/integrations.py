@@ -294,6 +294,7 @@ def upload_security_hub_integration(
                     qs = (
                         Finding.all_objects.filter(tenant_id=tenant_id, scan_id=scan_id)
                         .order_by("uid")
+                        .select_related("check_metadata_entry")
                         .iterator()
                     )
 
@@ -450,7 +451,9 @@ def send_findings_to_jira(
     for finding_id in finding_ids:
         with rls_transaction(tenant_id):
             finding_instance = (
-                Finding.all_objects.select_related("scan__provider")
+                Finding.all_objects.select_related(
+                    "scan__provider", "check_metadata_entry"
+                )
                 .prefetch_related("resources")
                 .get(id=finding_id)
             )
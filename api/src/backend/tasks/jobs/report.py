@@ -520,6 +520,7 @@ def _load_findings_for_requirement_checks(
         Finding.all_objects.filter(
             tenant_id=tenant_id, scan_id=scan_id, check_id__in=check_ids
         )
+        .select_related("check_metadata_entry")
         .order_by("uid")
         .iterator()
     )
@@ -12,6 +12,7 @@ from celery.utils.log import get_task_logger
 from config.settings.celery import CELERY_DEADLOCK_ATTEMPTS
 from django.db import IntegrityError, OperationalError
 from django.db.models import Case, Count, IntegerField, Prefetch, Sum, When
+from django.db.models.functions import Coalesce
 from tasks.utils import CustomEncoder
 
 from api.compliance import (
@@ -30,9 +31,11 @@ from api.exceptions import ProviderConnectionError
 from api.models import (
     ComplianceRequirementOverview,
     Finding,
+    FindingCheckMetadata,
     MuteRule,
     Processor,
     Provider,
+    ProviderLatestOverview,
     Resource,
     ResourceScanSummary,
     ResourceTag,
@@ -69,6 +72,7 @@ COMPLIANCE_REQUIREMENT_COPY_COLUMNS = (
     "total_findings",
     "scan_id",
 )
+THREATSCORE_COMPLIANCE_ID = "ProwlerThreatScore-1.0"
 
 
 def _create_finding_delta(
@@ -137,6 +141,31 @@ def _store_resources(
     return resource_instance, (resource_instance.uid, resource_instance.region)
 
 
+def _get_check_metadata_entry(
+    check_id: str, metadata: dict, metadata_hash: str, tenant_id: str
+) -> FindingCheckMetadata:
+    """
+    Get or create the shared check metadata entry referenced by a finding.
+
+    Args:
+        check_id (str): The check of the finding.
+        metadata (dict): The check metadata of the finding.
+        metadata_hash (str): The hash of the check metadata.
+        tenant_id (str): The ID of the tenant owning the finding.
+
+    Returns:
+        FindingCheckMetadata: The check metadata entry for the finding's metadata.
+    """
+    with rls_transaction(tenant_id):
+        check_metadata_entry, _ = FindingCheckMetadata.objects.get_or_create(
+            tenant_id=tenant_id,
+            check_id=check_id,
+            metadata_hash=metadata_hash,
+            defaults={"metadata": metadata},
+        )
+    return check_metadata_entry
+
+
 def _copy_compliance_requirement_rows(
     tenant_id: str, rows: list[dict[str, Any]]
 ) -> None:
@@ -255,6 +284,296 @@ def _normalized_compliance_key(framework: str | None, version: str | None) -> st
     return f"{normalized_framework}{normalized_version}"
 
 
+def _add_compliance_status(
+    check_status_by_region: dict[str, dict[str, str]],
+    findings_count_by_compliance: dict[str, dict[str, dict[str, dict[str, int]]]],
+    region: str,
+    check_id: str,
+    status: str,
+    compliance: dict,
+) -> None:
+    """Add the status of a non-muted finding to the compliance status of its region.
+
+    A check is FAIL in a region as soon as one of its findings fails there, and the
+    findings of the ThreatScore requirements are counted per region.
+
+    Args:
+        check_status_by_region: Status of each check by region, updated in place.
+        findings_count_by_compliance: Passed and total findings of each ThreatScore
+            requirement by region, updated in place.
+        region: The region of the finding's resource.
+        check_id: The check of the finding.
+        status: The status of the finding.
+        compliance: The compliance requirements of the finding.
+    """
+    current_status = check_status_by_region.setdefault(region, {})
+    if current_status.get(check_id) != "FAIL":
+        current_status[check_id] = status
+    if THREATSCORE_COMPLIANCE_ID in compliance:
+        compliance_key = findings_count_by_compliance.setdefault(region, {}).setdefault(
+            THREATSCORE_COMPLIANCE_ID.lower().replace("-", ""), {}
+        )
+        for requirement_id in compliance[THREATSCORE_COMPLIANCE_ID]:
+            requirement_count = compliance_key.setdefault(
+                requirement_id, {"total": 0, "pass": 0}
+            )
+            requirement_count["total"] += 1
+            if status == "PASS":
+                requirement_count["pass"] += 1
+
+
+def _get_compliance_regions(
+    prowler_provider, check_status_by_region: dict[str, dict[str, str]]
+) -> set:
+    """Get the regions of the compliance requirement rows of a provider.
+
+    The regions are listed by the Prowler provider class, which only AWS can do without
+    an authenticated session, otherwise the regions of the findings are used.
+
+    Args:
+        prowler_provider: The Prowler provider class returned by `return_prowler_provider`.
+        check_status_by_region: Status of each check by region.
+
+    Returns:
+        set: The regions of the compliance requirement rows.
+    """
+    try:
+        return prowler_provider.get_regions()
+    except Exception:
+        return set(check_status_by_region.keys())
+
+
+def _build_compliance_requirement_rows(
+    tenant_id: str,
+    scan_id: str,
+    provider_type: str,
+    regions,
+    check_status_by_region: dict[str, dict[str, str]],
+    findings_count_by_compliance: dict[str, dict[str, dict[str, dict[str, int]]]],
+) -> tuple[list[dict[str, Any]], dict[str, dict]]:
+    """Build the compliance requirement rows of a scan from its check status by region.
+
+    Args:
+        tenant_id: Target tenant UUID.
+        scan_id: The scan the rows belong to.
+        provider_type: The type of the scanned provider.
+        regions: The regions of the provider, the regions of the findings are added.
+        check_status_by_region: Status of each check by region.
+        findings_count_by_compliance: Passed and total findings of each ThreatScore
+            requirement by region.
+
+    Returns:
+        tuple: The compliance requirement rows and the compliance overview by region.
+    """
+    compliance_template = PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE[provider_type]
+
+    # Create compliance data by region
+    compliance_overview_by_region = {
+        region: deepcopy(compliance_template) for region in regions
+    }
+
+    # Apply check statuses to compliance data
+    for region, check_status in check_status_by_region.items():
+        compliance_data = compliance_overview_by_region.setdefault(
+            region, deepcopy(compliance_template)
+        )
+        for check_name, status in check_status.items():
+            generate_scan_compliance(
+                compliance_data,
+                provider_type,
+                check_name,
+                status,
+            )
+
+    # Prepare compliance requirement rows
+    compliance_requirement_rows: list[dict[str, Any]] = []
+    utc_datetime_now = datetime.now(tz=timezone.utc)
+    for region, compliance_data in compliance_overview_by_region.items():
+        for compliance_id, compliance in compliance_data.items():
+            modeled_compliance_id = _normalized_compliance_key(
+                compliance["framework"], compliance["version"]
+            )
+            # Create an overview record for each requirement within each compliance framework
+            for requirement_id, requirement in compliance["requirements"].items():
+                checks_status = requirement["checks_status"]
+                findings_count = (
+                    findings_count_by_compliance.get(region, {})
+                    .get(modeled_compliance_id, {})
+                    .get(requirement_id, {})
+                )
+                compliance_requirement_rows.append(
+                    {
+                        "id": uuid.uuid4(),
+                        "tenant_id": tenant_id,
+                        "inserted_at": utc_datetime_now,
+                        "compliance_id": compliance_id,
+                        "framework": compliance["framework"],
+                        "version": compliance["version"] or "",
+                        "description": requirement.get("description") or "",
+                        "region": region,
+                        "requirement_id": requirement_id,
+                        "requirement_status": requirement["status"],
+                        "passed_checks": checks_status["pass"],
+                        "failed_checks": checks_status["fail"],
+                        "total_checks": checks_status["total"],
+                        "scan_id": scan_id,
+                        "passed_findings": findings_count.get("pass", 0),
+                        "total_findings": findings_count.get("total", 0),
+                    }
+                )
+
+    return compliance_requirement_rows, compliance_overview_by_region
+
+
+class ScanAggregator:
+    """
+    Accumulates the post-scan aggregates of a scan while its findings are ingested.
+
+    The scan summaries, the compliance status by region, the ThreatScore findings counts
+    and the resource scan summaries are counted in memory from each stored finding, and
+    written with bulk inserts once the scan is completed, so the findings of the scan do
+    not have to be read again to build them.
+    """
+
+    SUMMARY_COUNTERS = (
+        "fail",
+        "_pass",
+        "muted",
+        "total",
+        "new",
+        "changed",
+        "unchanged",
+        "fail_new",
+        "fail_changed",
+        "pass_new",
+        "pass_changed",
+        "muted_new",
+        "muted_changed",
+    )
+
+    def __init__(self, tenant_id: str, scan_id: str):
+        self.tenant_id = tenant_id
+        self.scan_id = scan_id
+        self.summaries: dict[tuple[str, str, str, str], dict[str, int]] = {}
+        self.check_status_by_region: dict[str, dict[str, str]] = {}
+        self.findings_count_by_compliance: dict = {}
+        self.resource_summaries: set[tuple[str, str, str, str]] = set()
+
+    def add_finding(
+        self,
+        check_id: str,
+        severity: str,
+        status: str,
+        delta: str | None,
+        muted: bool,
+        compliance: dict,
+        resource: Resource,
+    ) -> None:
+        """Add a stored finding and its resource to the aggregates of the scan.
+
+        Args:
+            check_id: The check of the finding.
+            severity: The severity of the finding.
+            status: The status of the finding.
+            delta: The delta of the finding, None when unchanged.
+            muted: Whether the finding is muted.
+            compliance: The compliance requirements of the finding.
+            resource: The resource of the finding, after its fields were updated.
+        """
+        summary_key = (check_id, resource.service, severity, resource.region)
+        counters = self.summaries.get(summary_key)
+        if counters is None:
+            counters = self.summaries[summary_key] = dict.fromkeys(
+                self.SUMMARY_COUNTERS, 0
+            )
+        counters["total"] += 1
+        if muted:
+            counters["muted"] += 1
+            if delta in ("new", "changed"):
+                counters[f"muted_{delta}"] += 1
+        else:
+            if status == "FAIL":
+                counters["fail"] += 1
+            elif status == "PASS":
+                counters["_pass"] += 1
+            if delta is None:
+                counters["unchanged"] += 1
+            elif delta in ("new", "changed"):
+                counters[delta] += 1
+                if status == "FAIL":
+                    counters[f"fail_{delta}"] += 1
+                elif status == "PASS":
+                    counters[f"pass_{delta}"] += 1
+            _add_compliance_status(
+                self.check_status_by_region,
+                self.findings_count_by_compliance,
+                resource.region,
+                check_id,
+                status,
+                compliance,
+            )
+
+        self.resource_summaries.add(
+            (str(resource.id), resource.service, resource.region, resource.type)
+        )
+
+    def flush_scan_summaries(self) -> None:
+        """Write the scan summaries of the scan."""
+        scan_summaries = [
+            ScanSummary(
+                tenant_id=self.tenant_id,
+                scan_id=self.scan_id,
+                check_id=check_id,
+                service=service,
+                severity=severity,
+                region=region,
+                **counters,
+            )
+            for (check_id, service, severity, region), counters in (
+                self.summaries.items()
+            )
+        ]
+        with rls_transaction(self.tenant_id):
+            ScanSummary.objects.bulk_create(scan_summaries, batch_size=3000)
+
+    def flush_compliance_requirements(self, provider_type: str, regions) -> None:
+        """Write the compliance requirement overviews of the scan.
+
+        Args:
+            provider_type: The type of the scanned provider.
+            regions: The regions of the provider.
+        """
+        compliance_requirement_rows, _ = _build_compliance_requirement_rows(
+            self.tenant_id,
+            self.scan_id,
+            provider_type,
+            regions,
+            self.check_status_by_region,
+            self.findings_count_by_compliance,
+        )
+        _persist_compliance_requirement_rows(
+            self.tenant_id, compliance_requirement_rows
+        )
+
+    def flush_resource_summaries(self) -> None:
+        """Write the resource scan summaries of the scan."""
+        resource_scan_summaries = [
+            ResourceScanSummary(
+                tenant_id=self.tenant_id,
+                scan_id=self.scan_id,
+                resource_id=resource_id,
+                service=service,
+                region=region,
+                resource_type=resource_type,
+            )
+            for resource_id, service, region, resource_type in self.resource_summaries
+        ]
+        with rls_transaction(self.tenant_id):
+            ResourceScanSummary.objects.bulk_create(
+                resource_scan_summaries, batch_size=500, ignore_conflicts=True
+            )
+
+
 def perform_prowler_scan(
     tenant_id: str,
     scan_id: str,
@@ -279,7 +598,7 @@ def perform_prowler_scan(
     """
     exception = None
     unique_resources = set()
-    scan_resource_cache: set[tuple[str, str, str, str]] = set()
+    scan_aggregator = ScanAggregator(tenant_id, scan_id)
     start_time = time.time()
     exc = None
 
@@ -344,6 +663,7 @@ def perform_prowler_scan(
 
         resource_cache = {}
         tag_cache = {}
+        check_metadata_cache = {}
         last_status_cache = {}
         resource_failed_findings_cache = defaultdict(int)
 
@@ -483,13 +803,30 @@ def perform_prowler_scan(
                         resource_uid = finding.resource_uid
                         resource_failed_findings_cache[resource_uid] += 1
 
+                # Checks can set a different severity for each finding, so the
+                # metadata entries are cached by check and metadata hash
+                check_metadata = finding.get_metadata()
+                check_metadata_key = (
+                    finding.check_id,
+                    FindingCheckMetadata.compute_hash(check_metadata),
+                )
+                if check_metadata_key not in check_metadata_cache:
+                    check_metadata_cache[check_metadata_key] = (
+                        _get_check_metadata_entry(
+                            finding.check_id,
+                            check_metadata,
+                            check_metadata_key[1],
+                            tenant_id,
+                        )
+                    )
+
                 with rls_transaction(tenant_id):
                     # Create the finding
                     finding_instance = Finding.objects.create(
                         tenant_id=tenant_id,
                         uid=finding_uid,
                         delta=delta,
-                        check_metadata=finding.get_metadata(),
+                        check_metadata_entry=check_metadata_cache[check_metadata_key],
                         status=status,
                         status_extended=finding.status_extended,
                         severity=finding.severity,
@@ -505,14 +842,15 @@ def perform_prowler_scan(
                     )
                     finding_instance.add_resources([resource_instance])
 
-                # Update scan resource summaries
-                scan_resource_cache.add(
-                    (
-                        str(resource_instance.id),
-                        resource_instance.service,
-                        resource_instance.region,
-                        resource_instance.type,
-                    )
+                # Update the scan summaries, compliance and resource summaries
+                scan_aggregator.add_finding(
+                    check_id=finding.check_id,
+                    severity=getattr(finding.severity, "value", finding.severity),
+                    status=status.value,
+                    delta=delta,
+                    muted=is_muted,
+                    compliance=finding.compliance,
+                    resource=resource_instance,
                 )
 
             # Update scan progress
@@ -556,21 +894,7 @@ def perform_prowler_scan(
         raise exception
 
     try:
-        resource_scan_summaries = [
-            ResourceScanSummary(
-                tenant_id=tenant_id,
-                scan_id=scan_id,
-                resource_id=resource_id,
-                service=service,
-                region=region,
-                resource_type=resource_type,
-            )
-            for resource_id, service, region, resource_type in scan_resource_cache
-        ]
-        with rls_transaction(tenant_id):
-            ResourceScanSummary.objects.bulk_create(
-                resource_scan_summaries, batch_size=500, ignore_conflicts=True
-            )
+        scan_aggregator.flush_resource_summaries()
     except Exception as filter_exception:
         import sentry_sdk
 
@@ -579,6 +903,28 @@ def perform_prowler_scan(
             f"Error storing filter values for scan {scan_id}: {filter_exception}"
         )
 
+    # The scan summary and compliance tasks only aggregate the findings again if
+    # these could not be stored
+    try:
+        scan_aggregator.flush_scan_summaries()
+    except Exception as summary_exception:
+        logger.error(
+            f"Error storing scan summaries for scan {scan_id}: {summary_exception}"
+        )
+
+    try:
+        regions = _get_compliance_regions(
+            return_prowler_provider(provider_instance),
+            scan_aggregator.check_status_by_region,
+        )
+        scan_aggregator.flush_compliance_requirements(
+            provider_instance.provider, regions
+        )
+    except Exception as compliance_exception:
+        logger.error(
+            f"Error storing compliance requirements for scan {scan_id}: {compliance_exception}"
+        )
+
     serializer = ScanTaskSerializer(instance=scan_instance)
     return serializer.data
 
@@ -592,8 +938,8 @@ def aggregate_findings(tenant_id: str, scan_id: str):
     changed, unchanged). The results are grouped by `check_id`, `service`, `severity`, and `region`.
     These aggregated metrics are then stored in the `ScanSummary` table.
 
-    Additionally, it updates the failed_findings_count field for each resource based on the most
-    recent findings for each finding.uid.
+    The scan summaries are stored by `perform_prowler_scan` while the findings are ingested, so
+    the findings are only aggregated again if the scan has no summaries.
 
     Args:
         tenant_id (str): The ID of the tenant to which the scan belongs.
@@ -614,6 +960,10 @@ def aggregate_findings(tenant_id: str, scan_id: str):
         - muted_new: Muted findings with a delta of 'new'.
         - muted_changed: Muted findings with a delta of 'changed'.
     """
+    with rls_transaction(tenant_id):
+        if ScanSummary.objects.filter(tenant_id=tenant_id, scan_id=scan_id).exists():
+            return {"status": "already aggregated"}
+
     with rls_transaction(tenant_id, using=READ_REPLICA_ALIAS):
         findings = Finding.objects.filter(tenant_id=tenant_id, scan_id=scan_id)
 
@@ -738,6 +1088,77 @@ def aggregate_findings(tenant_id: str, scan_id: str):
         ScanSummary.objects.bulk_create(scan_aggregations, batch_size=3000)
 
 
+def update_provider_latest_overview(tenant_id: str, scan_id: str):
+    """
+    Points the latest overview of the scan's provider to the scan, if it is its latest completed scan.
+
+    The totals of the scan summaries and the number of resources of the provider are stored
+    with it, so the overview endpoints read one row per provider instead of looking for the
+    latest scan of every provider and aggregating its summaries on each request.
+
+    Args:
+        tenant_id (str): The ID of the tenant to which the scan belongs.
+        scan_id (str): The ID of the scan whose summaries were aggregated.
+
+    Returns:
+        dict: The status of the update.
+    """
+    for attempt in range(CELERY_DEADLOCK_ATTEMPTS):
+        try:
+            with rls_transaction(tenant_id):
+                scan_instance = Scan.all_objects.get(pk=scan_id)
+                if scan_instance.state != StateChoices.COMPLETED:
+                    return {"status": "scan is not completed"}
+
+                latest_overview = (
+                    ProviderLatestOverview.all_objects.select_for_update()
+                    .filter(tenant_id=tenant_id, provider_id=scan_instance.provider_id)
+                    .select_related("scan")
+                    .first()
+                )
+                if (
+                    latest_overview
+                    and latest_overview.scan_id != scan_instance.id
+                    and latest_overview.scan.inserted_at > scan_instance.inserted_at
+                ):
+                    return {"status": "newer scan already in the overview"}
+
+                totals = ScanSummary.all_objects.filter(
+                    tenant_id=tenant_id, scan_id=scan_id
+                ).aggregate(
+                    _pass=Coalesce(Sum("_pass"), 0),
+                    fail=Coalesce(Sum("fail"), 0),
+                    muted=Coalesce(Sum("muted"), 0),
+                    total=Coalesce(Sum("total"), 0),
+                )
+                total_resources = Resource.all_objects.filter(
+                    tenant_id=tenant_id, provider_id=scan_instance.provider_id
+                ).count()
+
+                ProviderLatestOverview.all_objects.update_or_create(
+                    tenant_id=tenant_id,
+                    provider_id=scan_instance.provider_id,
+                    defaults={
+                        "scan_id": scan_instance.id,
+                        "total_resources": total_resources,
+                        **totals,
+                    },
+                )
+            break
+        except IntegrityError:
+            # Another summary task of the same provider created its overview first, so the
+            # transaction is retried to lock that row and compare the scans again
+            if attempt < CELERY_DEADLOCK_ATTEMPTS - 1:
+                logger.warning(
+                    f"Integrity error detected when updating the latest overview of scan {scan_id}. Retrying..."
+                )
+                time.sleep(0.1 * (2**attempt))
+                continue
+            raise
+
+    return {"status": "updated"}
+
+
 def create_compliance_requirements(tenant_id: str, scan_id: str):
     """
     Create detailed compliance requirement overview records for a scan.
@@ -746,6 +1167,9 @@ def create_compliance_requirements(tenant_id: str, scan_id: str):
     individual records for each compliance requirement in each region. These detailed
     records provide a granular view of compliance status.
 
+    The records are stored by `perform_prowler_scan` while the findings are ingested, so
+    the findings are only read again if the scan has no records.
+
     Args:
         tenant_id (str): The ID of the tenant for which to create records.
         scan_id (str): The ID of the scan for which to create records.
@@ -757,28 +1181,17 @@ def create_compliance_requirements(tenant_id: str, scan_id: str):
         ValidationError: If tenant_id is not a valid UUID.
     """
     try:
+        with rls_transaction(tenant_id):
+            if ComplianceRequirementOverview.objects.filter(
+                tenant_id=tenant_id, scan_id=scan_id
+            ).exists():
+                return {"status": "already created"}
+
         with rls_transaction(tenant_id, using=READ_REPLICA_ALIAS):
             scan_instance = Scan.objects.get(pk=scan_id)
             provider_instance = scan_instance.provider
             prowler_provider = return_prowler_provider(provider_instance)
 
-        compliance_template = PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE[
-            provider_instance.provider
-        ]
-        modeled_threatscore_compliance_id = "ProwlerThreatScore-1.0"
-        threatscore_requirements_by_check: dict[str, set[str]] = {}
-        threatscore_framework = compliance_template.get(
-            modeled_threatscore_compliance_id
-        )
-        if threatscore_framework:
-            for requirement_id, requirement in threatscore_framework[
-                "requirements"
-            ].items():
-                for check_id in requirement["checks"]:
-                    threatscore_requirements_by_check.setdefault(check_id, set()).add(
-                        requirement_id
-                    )
-
         # Get check status data by region from findings
         findings = (
             Finding.all_objects.filter(scan_id=scan_id, muted=False)
@@ -798,98 +1211,27 @@ def create_compliance_requirements(tenant_id: str, scan_id: str):
         with rls_transaction(tenant_id, using=READ_REPLICA_ALIAS):
             for finding in findings:
                 for resource in finding.small_resources:
-                    region = resource.region
-                    current_status = check_status_by_region.setdefault(region, {})
-                    if current_status.get(finding.check_id) != "FAIL":
-                        current_status[finding.check_id] = finding.status
-                    if modeled_threatscore_compliance_id in finding.compliance:
-                        for requirement_id in finding.compliance[
-                            modeled_threatscore_compliance_id
-                        ]:
-                            compliance_key = findings_count_by_compliance.setdefault(
-                                region, {}
-                            ).setdefault(
-                                modeled_threatscore_compliance_id.lower().replace(
-                                    "-", ""
-                                ),
-                                {},
-                            )
-                            if requirement_id not in compliance_key:
-                                compliance_key[requirement_id] = {
-                                    "total": 0,
-                                    "pass": 0,
-                                }
-
-                            compliance_key[requirement_id]["total"] += 1
-                            if finding.status == "PASS":
-                                compliance_key[requirement_id]["pass"] += 1
+                    _add_compliance_status(
+                        check_status_by_region,
+                        findings_count_by_compliance,
+                        resource.region,
+                        finding.check_id,
+                        finding.status,
+                        finding.compliance,
+                    )
 
-        try:
-            # Try to get regions from provider
-            regions = prowler_provider.get_regions()
-        except (AttributeError, Exception):
-            # If not available, use regions from findings
-            regions = set(check_status_by_region.keys())
-
-        # Create compliance data by region
-        compliance_overview_by_region = {
-            region: deepcopy(compliance_template) for region in regions
-        }
+        regions = _get_compliance_regions(prowler_provider, check_status_by_region)
 
-        # Apply check statuses to compliance data
-        for region, check_status in check_status_by_region.items():
-            compliance_data = compliance_overview_by_region.setdefault(
-                region, deepcopy(compliance_template)
+        compliance_requirement_rows, compliance_overview_by_region = (
+            _build_compliance_requirement_rows(
+                tenant_id,
+                scan_instance.id,
+                provider_instance.provider,
+                regions,
+                check_status_by_region,
+                findings_count_by_compliance,
             )
-            for check_name, status in check_status.items():
-                generate_scan_compliance(
-                    compliance_data,
-                    provider_instance.provider,
-                    check_name,
-                    status,
-                )
-
-        # Prepare compliance requirement rows
-        compliance_requirement_rows: list[dict[str, Any]] = []
-        utc_datetime_now = datetime.now(tz=timezone.utc)
-        for region, compliance_data in compliance_overview_by_region.items():
-            for compliance_id, compliance in compliance_data.items():
-                modeled_compliance_id = _normalized_compliance_key(
-                    compliance["framework"], compliance["version"]
-                )
-                # Create an overview record for each requirement within each compliance framework
-                for requirement_id, requirement in compliance["requirements"].items():
-                    checks_status = requirement["checks_status"]
-                    compliance_requirement_rows.append(
-                        {
-                            "id": uuid.uuid4(),
-                            "tenant_id": tenant_id,
-                            "inserted_at": utc_datetime_now,
-                            "compliance_id": compliance_id,
-                            "framework": compliance["framework"],
-                            "version": compliance["version"] or "",
-                            "description": requirement.get("description") or "",
-                            "region": region,
-                            "requirement_id": requirement_id,
-                            "requirement_status": requirement["status"],
-                            "passed_checks": checks_status["pass"],
-                            "failed_checks": checks_status["fail"],
-                            "total_checks": checks_status["total"],
-                            "scan_id": scan_instance.id,
-                            "passed_findings": findings_count_by_compliance.get(
-                                region, {}
-                            )
-                            .get(modeled_compliance_id, {})
-                            .get(requirement_id, {})
-                            .get("pass", 0),
-                            "total_findings": findings_count_by_compliance.get(
-                                region, {}
-                            )
-                            .get(modeled_compliance_id, {})
-                            .get(requirement_id, {})
-                            .get("total", 0),
-                        }
-                    )
+        )
 
         # Bulk create requirement records using PostgreSQL COPY
         _persist_compliance_requirement_rows(tenant_id, compliance_requirement_rows)
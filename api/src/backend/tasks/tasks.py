@@ -37,8 +37,13 @@ from tasks.jobs.scan import (
     aggregate_findings,
     create_compliance_requirements,
     perform_prowler_scan,
+    update_provider_latest_overview,
+)
+from tasks.utils import (
+    BackgroundBatchConsumer,
+    batched,
+    get_next_execution_datetime,
 )
-from tasks.utils import batched, get_next_execution_datetime
 
 from api.compliance import get_compliance_frameworks
 from api.db_router import READ_REPLICA_ALIAS
@@ -274,7 +279,9 @@ def perform_scheduled_scan_task(self, tenant_id: str, provider_id: str):
 
 @shared_task(name="scan-summary", queue="overview")
 def perform_scan_summary_task(tenant_id: str, scan_id: str):
-    return aggregate_findings(tenant_id=tenant_id, scan_id=scan_id)
+    result = aggregate_findings(tenant_id=tenant_id, scan_id=scan_id)
+    update_provider_latest_overview(tenant_id=tenant_id, scan_id=scan_id)
+    return result
 
 
 @shared_task(name="tenant-deletion", queue="deletion", autoretry_for=(Exception,))
@@ -351,72 +358,86 @@ def generate_outputs_task(scan_id: str, provider_id: str, tenant_id: str):
         )
         generate_asff = security_hub_integrations.exists()
 
+    def write_batch(fos, is_last):
+        # Outputs
+        for mode, cfg in OUTPUT_FORMATS_MAPPING.items():
+            # Skip ASFF generation if not needed
+            if mode == "json-asff" and not generate_asff:
+                continue
+
+            cls = cfg["class"]
+            suffix = cfg["suffix"]
+            extra = cfg.get("kwargs", {}).copy()
+            if mode == "html":
+                extra.update(provider=prowler_provider, stats=scan_summary)
+
+            writer, initialization = get_writer(
+                output_writers,
+                cls,
+                lambda cls=cls, fos=fos, suffix=suffix: cls(
+                    findings=fos,
+                    file_path=out_dir,
+                    file_extension=suffix,
+                    from_cli=False,
+                ),
+                is_last,
+            )
+            if not initialization:
+                writer.transform(fos)
+            writer.batch_write_data_to_file(**extra)
+            writer._data.clear()
+
+        # Compliance CSVs
+        for name in frameworks_avail:
+            compliance_obj = frameworks_bulk[name]
+
+            klass = GenericCompliance
+            for condition, cls in COMPLIANCE_CLASS_MAP.get(provider_type, []):
+                if condition(name):
+                    klass = cls
+                    break
+
+            filename = f"{comp_dir}_{name}.csv"
+
+            writer, initialization = get_writer(
+                compliance_writers,
+                name,
+                lambda klass=klass, fos=fos: klass(
+                    findings=fos,
+                    compliance=compliance_obj,
+                    file_path=filename,
+                    from_cli=False,
+                ),
+                is_last,
+            )
+            if not initialization:
+                writer.transform(fos, compliance_obj, name)
+            writer.batch_write_data_to_file()
+            writer._data.clear()
+
+    # Resources and their tags are fetched once per chunk instead of once per finding
     qs = (
         Finding.all_objects.filter(tenant_id=tenant_id, scan_id=scan_id)
         .order_by("uid")
-        .iterator()
+        .select_related("check_metadata_entry")
+        .prefetch_related("resources__tags")
+        .iterator(chunk_size=DJANGO_FINDINGS_BATCH_SIZE)
     )
-    with rls_transaction(tenant_id, using=READ_REPLICA_ALIAS):
+    # The metadata of each check is only built once for all its findings
+    check_metadata_cache = {}
+    # Files are written in a background thread while the next batch is read
+    with (
+        rls_transaction(tenant_id, using=READ_REPLICA_ALIAS),
+        BackgroundBatchConsumer(write_batch) as batch_writer,
+    ):
         for batch, is_last in batched(qs, DJANGO_FINDINGS_BATCH_SIZE):
             fos = [
-                FindingOutput.transform_api_finding(f, prowler_provider) for f in batch
-            ]
-
-            # Outputs
-            for mode, cfg in OUTPUT_FORMATS_MAPPING.items():
-                # Skip ASFF generation if not needed
-                if mode == "json-asff" and not generate_asff:
-                    continue
-
-                cls = cfg["class"]
-                suffix = cfg["suffix"]
-                extra = cfg.get("kwargs", {}).copy()
-                if mode == "html":
-                    extra.update(provider=prowler_provider, stats=scan_summary)
-
-                writer, initialization = get_writer(
-                    output_writers,
-                    cls,
-                    lambda cls=cls, fos=fos, suffix=suffix: cls(
-                        findings=fos,
-                        file_path=out_dir,
-                        file_extension=suffix,
-                        from_cli=False,
-                    ),
-                    is_last,
+                FindingOutput.transform_api_finding(
+                    f, prowler_provider, check_metadata_cache=check_metadata_cache
                 )
-                if not initialization:
-                    writer.transform(fos)
-                writer.batch_write_data_to_file(**extra)
-                writer._data.clear()
-
-            # Compliance CSVs
-            for name in frameworks_avail:
-                compliance_obj = frameworks_bulk[name]
-
-                klass = GenericCompliance
-                for condition, cls in COMPLIANCE_CLASS_MAP.get(provider_type, []):
-                    if condition(name):
-                        klass = cls
-                        break
-
-                filename = f"{comp_dir}_{name}.csv"
-
-                writer, initialization = get_writer(
-                    compliance_writers,
-                    name,
-                    lambda klass=klass, fos=fos: klass(
-                        findings=fos,
-                        compliance=compliance_obj,
-                        file_path=filename,
-                        from_cli=False,
-                    ),
-                    is_last,
-                )
-                if not initialization:
-                    writer.transform(fos, compliance_obj, name)
-                writer.batch_write_data_to_file()
-                writer._data.clear()
+                for f in batch
+            ]
+            batch_writer.put(fos, is_last)
 
     compressed = _compress_output_files(out_dir)
 
@@ -1022,7 +1022,7 @@ class TestSecurityHubIntegrationUploads:
 
         # Mock findings
         mock_findings = [MagicMock(), MagicMock()]
-        mock_finding_model.all_objects.filter.return_value.order_by.return_value.iterator.return_value = iter(
+        mock_finding_model.all_objects.filter.return_value.order_by.return_value.select_related.return_value.iterator.return_value = iter(
             mock_findings
         )
 
@@ -1123,7 +1123,7 @@ class TestSecurityHubIntegrationUploads:
         mock_initialize_provider.return_value = mock_prowler_provider
 
         # Mock no findings
-        mock_finding_model.all_objects.filter.return_value.order_by.return_value.iterator.return_value = iter(
+        mock_finding_model.all_objects.filter.return_value.order_by.return_value.select_related.return_value.iterator.return_value = iter(
             []
         )
         mock_batched.return_value = []
@@ -1168,7 +1168,7 @@ class TestSecurityHubIntegrationUploads:
 
         # Mock findings exist
         mock_findings = [MagicMock()]
-        mock_finding_model.all_objects.filter.return_value.order_by.return_value.iterator.return_value = iter(
+        mock_finding_model.all_objects.filter.return_value.order_by.return_value.select_related.return_value.iterator.return_value = iter(
             mock_findings
         )
 
@@ -1248,7 +1248,7 @@ class TestSecurityHubIntegrationUploads:
 
         # Mock findings
         mock_findings = [MagicMock()]
-        mock_finding_model.all_objects.filter.return_value.order_by.return_value.iterator.return_value = iter(
+        mock_finding_model.all_objects.filter.return_value.order_by.return_value.select_related.return_value.iterator.return_value = iter(
             mock_findings
         )
 
@@ -1323,7 +1323,7 @@ class TestSecurityHubIntegrationUploads:
 
         # Mock findings
         mock_findings = [MagicMock()]
-        mock_finding_model.all_objects.filter.return_value.order_by.return_value.iterator.return_value = iter(
+        mock_finding_model.all_objects.filter.return_value.order_by.return_value.select_related.return_value.iterator.return_value = iter(
             mock_findings
         )
 
@@ -1424,7 +1424,7 @@ class TestSecurityHubIntegrationUploads:
 
         # Mock findings
         mock_findings = [MagicMock(), MagicMock()]
-        mock_finding_model.all_objects.filter.return_value.order_by.return_value.iterator.return_value = iter(
+        mock_finding_model.all_objects.filter.return_value.order_by.return_value.select_related.return_value.iterator.return_value = iter(
             mock_findings
         )
 
@@ -1518,7 +1518,7 @@ class TestSecurityHubIntegrationUploads:
 
         # Mock findings
         mock_findings = [MagicMock(), MagicMock()]
-        mock_finding_model.all_objects.filter.return_value.order_by.return_value.iterator.return_value = iter(
+        mock_finding_model.all_objects.filter.return_value.order_by.return_value.select_related.return_value.iterator.return_value = iter(
             mock_findings
         )
 
@@ -6,28 +6,38 @@ from io import StringIO
 from unittest.mock import MagicMock, patch
 
 import pytest
+from django.db import IntegrityError
 from tasks.jobs.scan import (
+    ScanAggregator,
     _copy_compliance_requirement_rows,
     _create_finding_delta,
     _persist_compliance_requirement_rows,
     _store_resources,
+    aggregate_findings,
     create_compliance_requirements,
     perform_prowler_scan,
+    update_provider_latest_overview,
 )
 from tasks.utils import CustomEncoder
 
 from api.db_router import MainRouter
 from api.exceptions import ProviderConnectionError
 from api.models import (
+    ComplianceRequirementOverview,
     Finding,
+    FindingCheckMetadata,
     MuteRule,
     Provider,
+    ProviderLatestOverview,
     Resource,
+    ResourceScanSummary,
     Scan,
+    ScanSummary,
     StateChoices,
     StatusChoices,
 )
 from prowler.lib.check.models import Severity
+from prowler.providers.aws.aws_provider import AwsProvider
 
 
 @pytest.mark.django_db
@@ -166,6 +176,12 @@ class TestPerformScan:
         assert scan_finding.muted
         assert scan_finding.compliance == finding.compliance
         assert scan_finding.muted_reason == "Muted by mutelist"
+        assert scan_finding.check_metadata == {"key": "value"}
+        assert scan_finding.legacy_check_metadata == {}
+        assert scan_finding.check_metadata_entry.check_id == finding.check_id
+        assert scan_finding.check_metadata_entry.metadata_hash == (
+            FindingCheckMetadata.compute_hash({"key": "value"})
+        )
 
         assert scan_resource.tenant == tenant
         assert scan_resource.uid == finding.resource_uid
@@ -190,6 +206,26 @@ class TestPerformScan:
         # Assert that failed_findings_count is 0 (finding is PASS and muted)
         assert scan_resource.failed_findings_count == 0
 
+        # Assert that the aggregates were stored while the findings were ingested
+        scan_summary = ScanSummary.objects.get(scan=scan)
+        assert scan_summary.check_id == finding.check_id
+        assert scan_summary.service == finding.service_name
+        assert scan_summary.severity == finding.severity
+        assert scan_summary.region == finding.region
+        assert scan_summary.total == 1
+        assert scan_summary.muted == 1
+        assert scan_summary._pass == 0
+        assert scan_summary.muted_new == 1
+        # The muted finding adds no region, so there is a row for each AWS region
+        assert set(
+            ComplianceRequirementOverview.objects.filter(scan=scan).values_list(
+                "region", flat=True
+            )
+        ) == set(AwsProvider.get_regions())
+        assert ResourceScanSummary.objects.filter(
+            scan_id=scan.id, resource_id=scan_resource.id
+        ).exists()
+
     @patch("tasks.jobs.scan.ProwlerScan")
     @patch(
         "tasks.jobs.scan.initialize_prowler_provider",
@@ -589,6 +625,80 @@ class TestPerformScan:
         # Assert that failed_findings_count is 2 (two FAIL findings, one PASS)
         assert scan_resource.failed_findings_count == 2
 
+    def test_perform_prowler_scan_check_metadata_per_finding_severity(
+        self,
+        tenants_fixture,
+        scans_fixture,
+        providers_fixture,
+    ):
+        """Test that findings of a check with a different severity keep their own metadata"""
+        with (
+            patch(
+                "tasks.jobs.scan.initialize_prowler_provider"
+            ) as mock_initialize_prowler_provider,
+            patch("tasks.jobs.scan.ProwlerScan") as mock_prowler_scan_class,
+            patch(
+                "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE",
+                new_callable=dict,
+            ),
+            patch("api.compliance.PROWLER_CHECKS", new_callable=dict),
+        ):
+            tenant = tenants_fixture[0]
+            scan = scans_fixture[0]
+            provider = providers_fixture[0]
+
+            tenant_id = str(tenant.id)
+            scan_id = str(scan.id)
+            provider_id = str(provider.id)
+
+            findings = []
+            for uid, severity in (
+                ("certificate_1", Severity.critical),
+                ("certificate_2", Severity.low),
+                ("certificate_3", Severity.critical),
+            ):
+                finding = MagicMock()
+                finding.uid = uid
+                finding.status = StatusChoices.FAIL
+                finding.status_extended = "certificate expiring"
+                finding.severity = severity
+                finding.check_id = "acm_certificates_expiration_check"
+                finding.get_metadata.return_value = {
+                    "CheckID": "acm_certificates_expiration_check",
+                    "Severity": severity.value,
+                }
+                finding.resource_uid = f"{uid}_arn"
+                finding.resource_name = uid
+                finding.region = "us-east-1"
+                finding.service_name = "acm"
+                finding.resource_type = "AwsCertificateManagerCertificate"
+                finding.resource_tags = {}
+                finding.muted = False
+                finding.raw = {}
+                finding.resource_metadata = {}
+                finding.resource_details = {}
+                finding.partition = "aws"
+                finding.compliance = {}
+                findings.append(finding)
+
+            mock_prowler_scan_class.return_value.scan.return_value = [(100, findings)]
+            mock_initialize_prowler_provider.return_value.get_regions.return_value = [
+                "us-east-1"
+            ]
+
+            perform_prowler_scan(tenant_id, scan_id, provider_id, [])
+
+        for finding in findings:
+            scan_finding = Finding.objects.get(scan=scan, uid=finding.uid)
+            assert scan_finding.check_metadata["Severity"] == finding.severity.value
+        # The findings with the same metadata share its entry
+        assert (
+            FindingCheckMetadata.objects.filter(
+                check_id="acm_certificates_expiration_check"
+            ).count()
+            == 2
+        )
+
     def test_perform_prowler_scan_with_muted_findings(
         self,
         tenants_fixture,
@@ -1303,7 +1413,213 @@ class TestPerformScan:
         assert before_scan <= finding_db.muted_at <= after_scan
 
 
-# TODO Add tests for aggregations
+class TestScanAggregator:
+    def _resource(self, region="region1"):
+        return MagicMock(
+            id=uuid.uuid4(), service="service1", region=region, type="resource_type"
+        )
+
+    def test_add_finding(self):
+        aggregator = ScanAggregator(str(uuid.uuid4()), str(uuid.uuid4()))
+        resource = self._resource()
+        threatscore = {"ProwlerThreatScore-1.0": ["1.1.1"]}
+
+        aggregator.add_finding("check1", "high", "FAIL", "new", False, {}, resource)
+        aggregator.add_finding(
+            "check1", "high", "PASS", None, False, threatscore, resource
+        )
+        aggregator.add_finding(
+            "check1", "high", "PASS", "changed", True, threatscore, resource
+        )
+
+        assert aggregator.summaries == {
+            ("check1", "service1", "high", "region1"): {
+                "fail": 1,
+                "_pass": 1,
+                "muted": 1,
+                "total": 3,
+                "new": 1,
+                "changed": 0,
+                "unchanged": 1,
+                "fail_new": 1,
+                "fail_changed": 0,
+                "pass_new": 0,
+                "pass_changed": 0,
+                "muted_new": 0,
+                "muted_changed": 1,
+            }
+        }
+        # Muted findings do not change the compliance status
+        assert aggregator.check_status_by_region == {"region1": {"check1": "FAIL"}}
+        assert aggregator.findings_count_by_compliance == {
+            "region1": {"prowlerthreatscore1.0": {"1.1.1": {"total": 1, "pass": 1}}}
+        }
+        assert aggregator.resource_summaries == {
+            (str(resource.id), "service1", "region1", "resource_type")
+        }
+
+    def test_add_finding_by_region(self):
+        aggregator = ScanAggregator(str(uuid.uuid4()), str(uuid.uuid4()))
+
+        aggregator.add_finding(
+            "check1", "low", "PASS", None, False, {}, self._resource("region1")
+        )
+        aggregator.add_finding(
+            "check1", "low", "FAIL", None, False, {}, self._resource("region2")
+        )
+        aggregator.add_finding(
+            "check1", "low", "PASS", None, False, {}, self._resource("region2")
+        )
+
+        assert set(aggregator.summaries) == {
+            ("check1", "service1", "low", "region1"),
+            ("check1", "service1", "low", "region2"),
+        }
+        assert aggregator.check_status_by_region == {
+            "region1": {"check1": "PASS"},
+            "region2": {"check1": "FAIL"},
+        }
+        assert len(aggregator.resource_summaries) == 3
+
+
+@pytest.mark.django_db
+class TestAggregateFindings:
+    def test_aggregate_findings_already_aggregated(
+        self, tenants_fixture, scans_fixture, findings_fixture
+    ):
+        tenant_id = str(tenants_fixture[0].id)
+        scan = scans_fixture[0]
+        ScanSummary.objects.create(
+            tenant_id=tenant_id,
+            scan=scan,
+            check_id="check1",
+            service="service1",
+            severity="high",
+            region="region1",
+            total=1,
+        )
+
+        result = aggregate_findings(tenant_id, str(scan.id))
+
+        assert result == {"status": "already aggregated"}
+        assert ScanSummary.objects.filter(scan=scan).count() == 1
+
+    def test_aggregate_findings(self, tenants_fixture, scans_fixture, findings_fixture):
+        tenant_id = str(tenants_fixture[0].id)
+        scan = scans_fixture[0]
+
+        aggregate_findings(tenant_id, str(scan.id))
+
+        assert ScanSummary.objects.filter(scan=scan).exists()
+
+
+@pytest.mark.django_db
+class TestUpdateProviderLatestOverview:
+    def _create_summary(self, scan, _pass, fail, muted):
+        ScanSummary.objects.create(
+            tenant_id=scan.tenant_id,
+            scan=scan,
+            check_id="check1",
+            service="service1",
+            severity="high",
+            region="region1",
+            _pass=_pass,
+            fail=fail,
+            muted=muted,
+            total=_pass + fail + muted,
+        )
+
+    def test_update_provider_latest_overview(
+        self, tenants_fixture, scans_fixture, resources_fixture
+    ):
+        tenant_id = str(tenants_fixture[0].id)
+        scan = scans_fixture[0]
+        self._create_summary(scan, _pass=2, fail=1, muted=1)
+
+        result = update_provider_latest_overview(tenant_id, str(scan.id))
+
+        assert result == {"status": "updated"}
+        overview = ProviderLatestOverview.objects.get(provider=scan.provider)
+        assert overview.scan_id == scan.id
+        assert overview._pass == 2
+        assert overview.fail == 1
+        assert overview.muted == 1
+        assert overview.total == 4
+        assert (
+            overview.total_resources
+            == Resource.objects.filter(provider=scan.provider).count()
+        )
+
+    def test_update_provider_latest_overview_newer_scan(
+        self, tenants_fixture, scans_fixture
+    ):
+        tenant_id = str(tenants_fixture[0].id)
+        old_scan = scans_fixture[0]
+        new_scan = Scan.objects.create(
+            name="Newer scan",
+            provider=old_scan.provider,
+            trigger=Scan.TriggerChoices.MANUAL,
+            state=StateChoices.COMPLETED,
+            tenant_id=tenant_id,
+        )
+        self._create_summary(old_scan, _pass=1, fail=0, muted=0)
+        self._create_summary(new_scan, _pass=0, fail=3, muted=0)
+
+        update_provider_latest_overview(tenant_id, str(new_scan.id))
+        # The summary of an older scan finishing later does not replace the overview
+        result = update_provider_latest_overview(tenant_id, str(old_scan.id))
+
+        assert result == {"status": "newer scan already in the overview"}
+        overview = ProviderLatestOverview.objects.get(provider=old_scan.provider)
+        assert overview.scan_id == new_scan.id
+        assert overview.fail == 3
+        assert overview.total == 3
+
+    def test_update_provider_latest_overview_scan_not_completed(
+        self, tenants_fixture, scans_fixture
+    ):
+        tenant_id = str(tenants_fixture[0].id)
+        failed_scan = scans_fixture[1]
+
+        result = update_provider_latest_overview(tenant_id, str(failed_scan.id))
+
+        assert result == {"status": "scan is not completed"}
+        assert not ProviderLatestOverview.objects.filter(
+            provider=failed_scan.provider
+        ).exists()
+
+    def test_update_provider_latest_overview_concurrent_create(
+        self, tenants_fixture, scans_fixture
+    ):
+        tenant_id = str(tenants_fixture[0].id)
+        scan = scans_fixture[0]
+        self._create_summary(scan, _pass=1, fail=1, muted=0)
+        update_or_create = ProviderLatestOverview.all_objects.update_or_create
+        calls = []
+
+        def concurrent_update_or_create(*args, **kwargs):
+            calls.append(kwargs)
+            # Another summary task of the provider created its overview first
+            if len(calls) == 1:
+                raise IntegrityError("duplicate key value violates unique constraint")
+            return update_or_create(*args, **kwargs)
+
+        with (
+            patch.object(
+                ProviderLatestOverview.all_objects,
+                "update_or_create",
+                side_effect=concurrent_update_or_create,
+            ),
+            patch("tasks.jobs.scan.time.sleep") as mock_sleep,
+        ):
+            result = update_provider_latest_overview(tenant_id, str(scan.id))
+
+        assert result == {"status": "updated"}
+        assert len(calls) == 2
+        mock_sleep.assert_called_once()
+        overview = ProviderLatestOverview.objects.get(provider=scan.provider)
+        assert overview.scan_id == scan.id
+        assert overview.total == 2
 
 
 @pytest.mark.django_db
@@ -1447,6 +1763,114 @@ class TestCreateComplianceRequirements:
 
             assert "regions_processed" in result
 
+    def test_create_compliance_requirements_matches_scan_rows(
+        self,
+        tenants_fixture,
+        scans_fixture,
+        providers_fixture,
+    ):
+        tenant = tenants_fixture[0]
+        scan = scans_fixture[0]
+        provider = providers_fixture[4]
+        assert provider.provider == Provider.ProviderChoices.AZURE
+        scan.provider = provider
+        scan.save()
+        tenant_id = str(tenant.id)
+        scan_id = str(scan.id)
+
+        finding = MagicMock()
+        finding.uid = "azure_finding_id"
+        finding.status = StatusChoices.FAIL
+        finding.status_extended = "test status extended"
+        finding.severity = Severity.high
+        finding.check_id = "check1"
+        finding.get_metadata.return_value = {"key": "value"}
+        finding.resource_uid = "azure_resource_uid"
+        finding.resource_name = "resource_name"
+        finding.region = "eastus"
+        finding.service_name = "service_name"
+        finding.resource_type = "resource_type"
+        finding.resource_tags = {}
+        finding.muted = False
+        finding.raw = {}
+        finding.resource_metadata = {}
+        finding.resource_details = {}
+        finding.partition = "AzureCloud"
+        finding.compliance = {"cis_azure": ["1.1"]}
+
+        def compliance_rows():
+            return set(
+                ComplianceRequirementOverview.objects.filter(scan=scan).values_list(
+                    "compliance_id",
+                    "region",
+                    "requirement_id",
+                    "requirement_status",
+                    "passed_checks",
+                    "failed_checks",
+                    "total_checks",
+                    "passed_findings",
+                    "total_findings",
+                )
+            )
+
+        with (
+            patch(
+                "tasks.jobs.scan.initialize_prowler_provider"
+            ) as mock_initialize_prowler_provider,
+            patch("tasks.jobs.scan.ProwlerScan") as mock_prowler_scan_class,
+            patch(
+                "tasks.jobs.scan.PROWLER_COMPLIANCE_OVERVIEW_TEMPLATE",
+                new_callable=dict,
+            ) as mock_compliance_template,
+            patch("api.compliance.PROWLER_CHECKS", new_callable=dict) as mock_checks,
+            # The rows are stored within the test transaction
+            patch(
+                "tasks.jobs.scan._copy_compliance_requirement_rows",
+                side_effect=Exception("COPY not available"),
+            ),
+        ):
+            mock_checks["azure"] = {"check1": {"cis_azure"}}
+            mock_compliance_template["azure"] = {
+                "cis_azure": {
+                    "framework": "CIS",
+                    "version": "2.0",
+                    "requirements": {
+                        "1.1": {
+                            "description": "Test requirement",
+                            "checks": {"check1": None},
+                            "checks_status": {
+                                "pass": 0,
+                                "fail": 0,
+                                "manual": 0,
+                                "total": 1,
+                            },
+                            "status": "PASS",
+                        },
+                    },
+                    "requirements_status": {"passed": 1, "failed": 0, "manual": 0},
+                    "total_requirements": 1,
+                },
+            }
+            mock_prowler_scan_class.return_value.scan.return_value = [(100, [finding])]
+            # The authenticated provider lists more regions than its findings
+            mock_initialize_prowler_provider.return_value.get_regions.return_value = [
+                "eastus",
+                "westeurope",
+            ]
+
+            perform_prowler_scan(tenant_id, scan_id, str(provider.id), ["check1"])
+            scan_rows = compliance_rows()
+
+            ComplianceRequirementOverview.objects.filter(scan=scan).delete()
+            create_compliance_requirements(tenant_id, scan_id)
+            fallback_rows = compliance_rows()
+
+        # The Azure provider class cannot list its regions, so both use the findings
+        assert scan_rows == fallback_rows
+        assert scan_rows == {
+            ("cis_azure", "eastus", "1.1", "FAIL", 0, 1, 1, 0, 0),
+        }
+
     def test_create_compliance_requirements_empty_template(
         self,
         tenants_fixture,
@@ -1487,6 +1911,32 @@ class TestCreateComplianceRequirements:
             with pytest.raises(Exception, match="Provider initialization failed"):
                 create_compliance_requirements(tenant_id, scan_id)
 
+    def test_create_compliance_requirements_already_created(
+        self, tenants_fixture, scans_fixture, providers_fixture
+    ):
+        tenant_id = str(tenants_fixture[0].id)
+        scan = scans_fixture[0]
+        ComplianceRequirementOverview.objects.create(
+            tenant_id=tenant_id,
+            scan=scan,
+            compliance_id="cis_1.4_aws",
+            framework="CIS AWS Foundations Benchmark",
+            version="1.4.0",
+            description="Test requirement",
+            region="region1",
+            requirement_id="1.1",
+            requirement_status="PASS",
+            passed_checks=1,
+            failed_checks=0,
+            total_checks=1,
+        )
+
+        with patch("tasks.jobs.scan.return_prowler_provider") as mock_provider:
+            result = create_compliance_requirements(tenant_id, str(scan.id))
+
+        assert result == {"status": "already created"}
+        mock_provider.assert_not_called()
+
     def test_create_compliance_requirements_check_status_priority(
         self, tenants_fixture, scans_fixture, providers_fixture, findings_fixture
     ):
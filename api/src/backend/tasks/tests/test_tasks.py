@@ -75,7 +75,7 @@ class TestGenerateOutputs:
         mock_get_available_frameworks.return_value = ["cis"]
 
         dummy_finding = MagicMock(uid="f1")
-        mock_finding_filter.return_value.order_by.return_value.iterator.return_value = [
+        mock_finding_filter.return_value.order_by.return_value.select_related.return_value.prefetch_related.return_value.iterator.return_value = [
             [dummy_finding],
             True,
         ]
@@ -163,7 +163,7 @@ class TestGenerateOutputs:
             patch("tasks.tasks.rmtree"),
         ):
             mock_filter.return_value.exists.return_value = True
-            mock_findings.return_value.order_by.return_value.iterator.return_value = [
+            mock_findings.return_value.order_by.return_value.select_related.return_value.prefetch_related.return_value.iterator.return_value = [
                 [MagicMock()],
                 True,
             ]
@@ -239,7 +239,7 @@ class TestGenerateOutputs:
             ),
         ):
             mock_filter.return_value.exists.return_value = True
-            mock_findings.return_value.order_by.return_value.iterator.return_value = [
+            mock_findings.return_value.order_by.return_value.select_related.return_value.prefetch_related.return_value.iterator.return_value = [
                 [MagicMock()],
                 True,
             ]
@@ -374,7 +374,7 @@ class TestGenerateOutputs:
             patch("tasks.tasks.FindingOutput._transform_findings_stats"),
             patch(
                 "tasks.tasks.FindingOutput.transform_api_finding",
-                side_effect=lambda f, prov: f,
+                side_effect=lambda f, prov, **kwargs: f,
             ),
             patch("tasks.tasks._compress_output_files", return_value="outdir.zip"),
             patch("tasks.tasks._upload_to_s3", return_value="s3://bucket/outdir.zip"),
@@ -466,7 +466,7 @@ class TestGenerateOutputs:
             ),
         ):
             mock_filter.return_value.exists.return_value = True
-            mock_findings.return_value.order_by.return_value.iterator.return_value = [
+            mock_findings.return_value.order_by.return_value.select_related.return_value.prefetch_related.return_value.iterator.return_value = [
                 [MagicMock()],
                 True,
             ]
@@ -505,7 +505,7 @@ class TestGenerateOutputs:
             patch("tasks.tasks.s3_integration_task.apply_async") as mock_s3_task,
         ):
             mock_summary.return_value.exists.return_value = True
-            mock_findings.return_value.order_by.return_value.iterator.return_value = [
+            mock_findings.return_value.order_by.return_value.select_related.return_value.prefetch_related.return_value.iterator.return_value = [
                 [MagicMock()],
                 True,
             ]
@@ -743,7 +743,7 @@ class TestCheckIntegrationsTask:
 
         # Mock findings
         mock_finding = MagicMock()
-        mock_findings.return_value.order_by.return_value.iterator.return_value = [
+        mock_findings.return_value.order_by.return_value.select_related.return_value.prefetch_related.return_value.iterator.return_value = [
             [mock_finding],
             True,
         ]
@@ -868,7 +868,7 @@ class TestCheckIntegrationsTask:
 
         # Mock findings
         mock_finding = MagicMock()
-        mock_findings.return_value.order_by.return_value.iterator.return_value = [
+        mock_findings.return_value.order_by.return_value.select_related.return_value.prefetch_related.return_value.iterator.return_value = [
             [mock_finding],
             True,
         ]
@@ -984,7 +984,7 @@ class TestCheckIntegrationsTask:
 
         # Mock findings
         mock_finding = MagicMock()
-        mock_findings.return_value.order_by.return_value.iterator.return_value = [
+        mock_findings.return_value.order_by.return_value.select_related.return_value.prefetch_related.return_value.iterator.return_value = [
             [mock_finding],
             True,
         ]
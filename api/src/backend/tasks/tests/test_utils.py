@@ -4,7 +4,11 @@ from unittest.mock import patch
 import pytest
 from django_celery_beat.models import IntervalSchedule, PeriodicTask
 from django_celery_results.models import TaskResult
-from tasks.utils import batched, get_next_execution_datetime
+from tasks.utils import (
+    BackgroundBatchConsumer,
+    batched,
+    get_next_execution_datetime,
+)
 
 
 @pytest.mark.django_db
@@ -100,3 +104,36 @@ class TestBatchedFunction:
         result = list(batched([1, 2, 3], 5))
         expected = [([1, 2, 3], True)]
         assert result == expected
+
+
+class TestBackgroundBatchConsumer:
+    def test_consumes_batches_in_order(self):
+        consumed = []
+
+        with BackgroundBatchConsumer(
+            lambda batch, is_last: consumed.append((batch, is_last))
+        ) as consumer:
+            for batch, is_last in batched([1, 2, 3, 4, 5], 2):
+                consumer.put(batch, is_last)
+
+        assert consumed == [([1, 2], False), ([3, 4], False), ([5], True)]
+
+    def test_consumer_error_is_raised_on_exit(self):
+        consumed = []
+
+        def consume(batch, is_last):
+            if batch == [1]:
+                raise ValueError("write failed")
+            consumed.append(batch)
+
+        with pytest.raises(ValueError, match="write failed"):
+            with BackgroundBatchConsumer(consume) as consumer:
+                consumer.put([1], False)
+
+        assert consumed == []
+
+    def test_producer_error_is_not_masked(self):
+        with pytest.raises(RuntimeError, match="read failed"):
+            with BackgroundBatchConsumer(lambda batch, is_last: None) as consumer:
+                consumer.put([1], False)
+                raise RuntimeError("read failed")
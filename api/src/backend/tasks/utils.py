@@ -1,4 +1,6 @@
 import json
+import queue
+import threading
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 
@@ -71,3 +73,55 @@ def batched(iterable, batch_size):
             batch = []
 
     yield batch, True
+
+
+class BackgroundBatchConsumer:
+    """
+    Consume batches in a background thread while the caller keeps producing them.
+
+    Used to overlap database reads with file serialization: the caller puts each
+    batch it reads and the consumer function processes them in order. The queue is
+    bounded, so at most `max_pending` batches are held in memory at any time.
+
+    An exception raised by the consumer is re-raised in the caller on the next
+    `put` or when leaving the context. The remaining batches are discarded.
+
+    Example:
+        >>> with BackgroundBatchConsumer(write_batch) as consumer:
+        ...     for batch, is_last in batched(findings, 100):
+        ...         consumer.put(batch, is_last)
+    """
+
+    _STOP = object()
+
+    def __init__(self, consume, max_pending: int = 2):
+        self._consume = consume
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._error = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._queue.put(self._STOP)
+        self._thread.join()
+        if exc_type is None and self._error is not None:
+            raise self._error
+        return False
+
+    def put(self, *args):
+        """Queue a batch for the consumer, blocking while the queue is full."""
+        if self._error is not None:
+            raise self._error
+        self._queue.put(args)
+
+    def _run(self):
+        while (item := self._queue.get()) is not self._STOP:
+            # Keep draining after a failure so the producer never blocks
+            if self._error is None:
+                try:
+                    self._consume(*item)
+                except Exception as error:
+                    self._error = error
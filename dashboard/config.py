@@ -28,6 +28,10 @@ informational_color = "#3274d9"
 folder_path_overview = os.getcwd() + "/output"
 folder_path_compliance = os.getcwd() + "/output/compliance"
 
+# Cache of the parsed output files, refreshed when a file changes
+cache_path_overview = folder_path_overview + "/.dashboard_cache"
+cache_path_compliance = folder_path_compliance + "/.dashboard_cache"
+
 encoding_format = "utf-8"
 # Error action, it is recommended to use "ignore" or "replace"
 error_action = "ignore"
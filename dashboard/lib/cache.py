@@ -0,0 +1,215 @@
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from dashboard.config import encoding_format, error_action
+from prowler.lib.logger import logger
+
+METADATA_FILE = "metadata.json"
+
+
+class OutputFileCache:
+    """
+    Columnar cache of the CSV output files loaded by the dashboard.
+
+    Each CSV file is parsed once and stored as one categorical column per
+    file, under a directory named after the CSV path. A column is saved as
+    its integer codes in a NumPy file and its categories in a JSON file, so
+    loading the cache never unpickles data. The cache entry is refreshed
+    when the modification time or size of the CSV file changes, so only new
+    or updated outputs are parsed when the dashboard starts.
+
+    Reading a file only loads the requested columns, and the number of rows
+    and the column names are available without loading any column.
+    """
+
+    def __init__(self, cache_path: str):
+        self.cache_path = cache_path
+        # Metadata of the files already loaded, by absolute path
+        self._metadata = {}
+
+    def rows(self, file_path: str) -> int:
+        """Number of rows of the CSV file."""
+        return self._get_metadata(file_path)["rows"]
+
+    def columns(self, file_path: str) -> list:
+        """Column names of the CSV file."""
+        return self._get_metadata(file_path)["columns"]
+
+    def read(
+        self,
+        file_path: str,
+        columns: list = None,
+        categorical: bool = False,
+        na_value: str = None,
+    ) -> pd.DataFrame:
+        """
+        Read the CSV file from the cache, parsing it first if needed.
+
+        Args:
+            file_path: Path of the CSV file
+            columns: Columns to load, all of them if not set. Missing columns are ignored
+            categorical: Keep the category dtype instead of returning strings
+            na_value: Value for the empty cells, NaN if not set
+
+        Returns:
+            pd.DataFrame: The file with every value read as a string
+        """
+        metadata = self._get_metadata(file_path)
+        if columns is None:
+            columns = metadata["columns"]
+        data = {}
+        for column in columns:
+            if column not in metadata["columns"]:
+                continue
+            series = self._read_column(file_path, metadata, column)
+            if na_value is not None and series.hasnans:
+                if na_value not in series.cat.categories:
+                    series = series.cat.add_categories(na_value)
+                series = series.fillna(na_value)
+            data[column] = series if categorical else series.astype(object)
+        return pd.DataFrame(data, index=pd.RangeIndex(metadata["rows"]))
+
+    def prune(self, file_paths: list):
+        """Remove the cache entries of the CSV files that are not in the list."""
+        if not os.path.isdir(self.cache_path):
+            return
+        entries = {self._get_entry_name(file_path) for file_path in file_paths}
+        for entry in os.listdir(self.cache_path):
+            if entry not in entries:
+                shutil.rmtree(os.path.join(self.cache_path, entry), ignore_errors=True)
+
+    def _get_entry_name(self, file_path: str) -> str:
+        return hashlib.sha1(os.path.abspath(file_path).encode()).hexdigest()
+
+    def _get_entry_path(self, file_path: str) -> str:
+        return os.path.join(self.cache_path, self._get_entry_name(file_path))
+
+    def _get_metadata(self, file_path: str) -> dict:
+        file_stat = os.stat(file_path)
+        metadata = self._metadata.get(os.path.abspath(file_path))
+        if metadata is None:
+            try:
+                with open(
+                    os.path.join(self._get_entry_path(file_path), METADATA_FILE)
+                ) as metadata_file:
+                    metadata = json.load(metadata_file)
+            except (OSError, ValueError):
+                metadata = {}
+        if (
+            metadata.get("mtime_ns") != file_stat.st_mtime_ns
+            or metadata.get("size") != file_stat.st_size
+        ):
+            metadata = self._ingest(file_path, file_stat)
+        self._metadata[os.path.abspath(file_path)] = metadata
+        return metadata
+
+    def _read_column(self, file_path: str, metadata: dict, column: str) -> pd.Series:
+        if "frame" in metadata:
+            return metadata["frame"][column]
+        column_path = os.path.join(
+            self._get_entry_path(file_path), str(metadata["columns"].index(column))
+        )
+        # Pickles are disabled, the cache directory may be writable by others
+        codes = np.load(f"{column_path}.npy", allow_pickle=False)
+        with open(f"{column_path}.json") as categories_file:
+            categories = json.load(categories_file)
+        return pd.Series(
+            pd.Categorical.from_codes(codes, categories=categories), name=column
+        )
+
+    def _ingest(self, file_path: str, file_stat: os.stat_result) -> dict:
+        """Parse the CSV file and store its columns in the cache."""
+        frame = pd.read_csv(
+            file_path,
+            sep=";",
+            on_bad_lines="skip",
+            encoding=encoding_format,
+            encoding_errors=error_action,
+            dtype=str,
+        )
+        frame.columns = frame.columns.astype(str)
+        frame = frame.astype("category")
+        metadata = {
+            "file_path": os.path.abspath(file_path),
+            "mtime_ns": file_stat.st_mtime_ns,
+            "size": file_stat.st_size,
+            "rows": len(frame),
+            "columns": list(frame.columns),
+        }
+
+        entry_path = self._get_entry_path(file_path)
+        try:
+            shutil.rmtree(entry_path, ignore_errors=True)
+            os.makedirs(entry_path)
+            for index, column in enumerate(frame.columns):
+                column_path = os.path.join(entry_path, str(index))
+                np.save(f"{column_path}.npy", frame[column].cat.codes.to_numpy())
+                with open(f"{column_path}.json", "w") as categories_file:
+                    json.dump(list(frame[column].cat.categories), categories_file)
+            # The metadata is written last so partial entries are never used
+            metadata_path = os.path.join(entry_path, METADATA_FILE)
+            with open(f"{metadata_path}.tmp", "w") as metadata_file:
+                json.dump(metadata, metadata_file)
+            os.replace(f"{metadata_path}.tmp", metadata_path)
+        except OSError as error:
+            logger.warning(
+                f"Could not cache {file_path}, it will be parsed again on the next load: {error}"
+            )
+            # Serve the parsed frame from memory
+            return {**metadata, "frame": frame}
+        return metadata
+
+
+def concat_categorical(frames: list) -> pd.DataFrame:
+    """
+    Concatenate the frames read from the cache keeping the category dtype.
+
+    pd.concat falls back to object dtype when the categories differ between
+    frames, so the categories of each column are merged first. Columns that
+    are not categorical in every frame are concatenated as objects.
+
+    Raises:
+        ValueError: If there are no frames to concatenate
+    """
+    if not frames:
+        raise ValueError("No objects to concatenate")
+    # Empty cells only, or a column missing from a frame, have no categories
+    empty = pd.CategoricalDtype(pd.Index([], dtype=object))
+    columns = list(dict.fromkeys(column for frame in frames for column in frame))
+    data = {}
+    for column in columns:
+        values = [
+            (
+                frame[column]
+                if column in frame
+                else pd.Series(pd.Categorical([np.nan] * len(frame), dtype=empty))
+            )
+            for frame in frames
+        ]
+        if all(isinstance(value.dtype, pd.CategoricalDtype) for value in values):
+            data[column] = pd.Series(
+                pd.api.types.union_categoricals(
+                    [
+                        value.astype(empty) if value.cat.categories.empty else value
+                        for value in values
+                    ],
+                    ignore_order=True,
+                )
+            )
+        else:
+            data[column] = pd.concat(
+                [value.astype(object) for value in values], ignore_index=True
+            )
+    return pd.DataFrame(data)
+
+
+def categorical_to_object(frame: pd.DataFrame) -> pd.DataFrame:
+    """Convert the categorical columns of the frame to object dtype."""
+    return frame.astype(
+        {column: object for column in frame.select_dtypes("category").columns}
+    )
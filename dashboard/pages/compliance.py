@@ -1,5 +1,4 @@
 # Standard library imports
-import csv
 import glob
 import importlib
 import os
@@ -15,14 +14,18 @@ from dash.dependencies import Input, Output
 
 # Config import
 from dashboard.config import (
-    encoding_format,
-    error_action,
+    cache_path_compliance,
     fail_color,
     folder_path_compliance,
     info_color,
     manual_color,
     pass_color,
 )
+from dashboard.lib.cache import (
+    OutputFileCache,
+    categorical_to_object,
+    concat_categorical,
+)
 from dashboard.lib.dropdowns import (
     create_account_dropdown_compliance,
     create_compliance_dropdown,
@@ -39,17 +42,18 @@ warnings.filterwarnings("ignore")
 # TODO: Create a flag to let the user put a custom path
 
 csv_files = []
-for file in glob.glob(os.path.join(folder_path_compliance, "*.csv")):
+compliance_cache = OutputFileCache(cache_path_compliance)
+
+all_csv_files = glob.glob(os.path.join(folder_path_compliance, "*.csv"))
+for file in all_csv_files:
     try:
-        with open(
-            file, "r", newline="", encoding=encoding_format, errors=error_action
-        ) as csvfile:
-            reader = csv.reader(csvfile)
-            num_rows = sum(1 for row in reader)
-            if num_rows > 1:
-                csv_files.append(file)
-    except UnicodeDecodeError:
-        logger.error(f"Error decoding file: {file}")
+        # Only new or modified files are parsed, the rest are read from the cache
+        num_rows = compliance_cache.rows(file)
+        if num_rows > 0:
+            csv_files.append(file)
+    except Exception:
+        logger.error(f"Error reading file: {file}")
+compliance_cache.prune(all_csv_files)
 
 
 def load_csv_files(csv_files):
@@ -57,9 +61,22 @@ def load_csv_files(csv_files):
     dfs = []
     results = []
     for file in csv_files:
-        df = pd.read_csv(file, sep=";", on_bad_lines="skip", encoding=encoding_format)
-        if "CHECKID" in df.columns:
-            dfs.append(df)
+        if "CHECKID" in compliance_cache.columns(file):
+            # Only the columns used to build the filters are loaded
+            dfs.append(
+                compliance_cache.read(
+                    file,
+                    [
+                        "ASSESSMENTDATE",
+                        "ACCOUNTID",
+                        "PROJECTID",
+                        "SUBSCRIPTIONID",
+                        "SUBSCRIPTION",
+                        "REGION",
+                        "LOCATION",
+                    ],
+                )
+            )
             result = file
             result = result.split("/")[-1]
             result = re.sub(r"^.*?_", "", result)
@@ -247,13 +264,9 @@ def display_data(
         """Load CSV files into a single pandas DataFrame."""
         dfs = []
         for file in files:
-            df = pd.read_csv(
-                file, sep=";", on_bad_lines="skip", encoding=encoding_format, dtype=str
-            )
-            df = df.astype(str).fillna("nan")
-            df.columns = df.columns.astype(str)
-            dfs.append(df)
-        return pd.concat(dfs, ignore_index=True)
+            # The columns stay categorical until the rows are filtered
+            dfs.append(compliance_cache.read(file, categorical=True, na_value="nan"))
+        return concat_categorical(dfs)
 
     data = load_csv_files(files)
 
@@ -347,13 +360,16 @@ def display_data(
             region_filter_options.remove(item)
 
     # Convert ASSESSMENTDATE to datetime
-    data["ASSESSMENTDATE"] = pd.to_datetime(data["ASSESSMENTDATE"], errors="coerce")
+    # Parsed from objects, a categorical column would give categorical dates
+    data["ASSESSMENTDATE"] = pd.to_datetime(
+        data["ASSESSMENTDATE"].astype(object), errors="coerce"
+    )
     data["ASSESSMENTDAY"] = data["ASSESSMENTDATE"].dt.date
 
     # Find the latest timestamp per account per day
-    latest_per_account_day = data.groupby(["ACCOUNTID", "ASSESSMENTDAY"])[
-        "ASSESSMENTDATE"
-    ].transform("max")
+    latest_per_account_day = data.groupby(
+        ["ACCOUNTID", "ASSESSMENTDAY"], observed=True
+    )["ASSESSMENTDATE"].transform("max")
 
     # Keep only rows with the latest timestamp for each account and day
     data = data[data["ASSESSMENTDATE"] == latest_per_account_day]
@@ -368,6 +384,9 @@ def display_data(
         date_filter_analytics = options_date[0]
         data = data[data["ASSESSMENTDAY"].astype(str) == date_filter_analytics]
 
+    # The compliance tables group and edit the values of the filtered rows
+    data = categorical_to_object(data)
+
     if data.empty:
         fig = px.pie()
         pie_1 = dcc.Graph(
@@ -18,6 +18,7 @@ from dash.dependencies import Input, Output
 
 # Config import
 from dashboard.config import (
+    cache_path_overview,
     critical_color,
     fail_color,
     folder_path_overview,
@@ -32,6 +33,11 @@ from dashboard.config import (
     muted_pass_color,
     pass_color,
 )
+from dashboard.lib.cache import (
+    OutputFileCache,
+    categorical_to_object,
+    concat_categorical,
+)
 from dashboard.lib.cards import create_provider_card
 from dashboard.lib.dropdowns import (
     create_account_dropdown,
@@ -52,15 +58,18 @@ warnings.filterwarnings("ignore")
 # Global variables
 # TODO: Create a flag to let the user put a custom path
 csv_files = []
+output_cache = OutputFileCache(cache_path_overview)
 
-for file in glob.glob(os.path.join(folder_path_overview, "*.csv")):
+all_csv_files = glob.glob(os.path.join(folder_path_overview, "*.csv"))
+for file in all_csv_files:
     try:
-        df = pd.read_csv(file, sep=";")
-        num_rows = len(df)
+        # Only new or modified files are parsed, the rest are read from the cache
+        num_rows = output_cache.rows(file)
         if num_rows > 1:
             csv_files.append(file)
     except Exception:
         logger.error(f"Error reading file {file}")
+output_cache.prune(all_csv_files)
 
 
 # Import logos providers
@@ -85,24 +94,19 @@ def load_csv_files(csv_files):
     """Load CSV files into a single pandas DataFrame."""
     dfs = []
     for file in csv_files:
-        account_columns = ["ACCOUNT_ID", "ACCOUNT_UID", "SUBSCRIPTION"]
-
-        df_sample = pd.read_csv(file, sep=";", on_bad_lines="skip", nrows=1)
-
-        dtype_dict = {}
-        for col in account_columns:
-            if col in df_sample.columns:
-                dtype_dict[col] = str
+        # Every column is cached as strings, so account IDs keep their leading zeros
+        columns = output_cache.columns(file)
 
-        # Read the full file with proper dtypes
-        df = pd.read_csv(file, sep=";", on_bad_lines="skip", dtype=dtype_dict)
-
-        if "CHECK_ID" in df.columns:
-            if "TIMESTAMP" in df.columns or df["PROVIDER"].unique() == "aws":
-                dfs.append(df.astype(str))
+        if "CHECK_ID" in columns:
+            if (
+                "TIMESTAMP" in columns
+                or output_cache.read(file, ["PROVIDER"])["PROVIDER"].unique() == "aws"
+            ):
+                # The columns stay categorical while the data is kept in memory
+                dfs.append(output_cache.read(file, categorical=True, na_value="nan"))
     # Handle the case where there are no files
     try:
-        data = pd.concat(dfs, ignore_index=True)
+        data = concat_categorical(dfs)
     except ValueError:
         data = None
     return data
@@ -180,7 +184,8 @@ else:
         )
 
     # For the timestamp, remove the two columns and keep only the date
-    data["TIMESTAMP"] = pd.to_datetime(data["TIMESTAMP"])
+    # Parsed from objects, a categorical column would give categorical dates
+    data["TIMESTAMP"] = pd.to_datetime(data["TIMESTAMP"].astype(object))
     # Handle findings from v3 outputs
     if "FINDING_UNIQUE_ID" in data.columns:
         data.rename(columns={"FINDING_UNIQUE_ID": "FINDING_UID"}, inplace=True)
@@ -195,7 +200,7 @@ else:
     data["DATE"] = data["TIMESTAMP"].dt.date
     data = (
         data.sort_values("TIMESTAMP")
-        .groupby(["DATE", "FINDING_UID"], as_index=False)
+        .groupby(["DATE", "FINDING_UID"], as_index=False, observed=True)
         .last()
     )
     data["TIMESTAMP"] = pd.to_datetime(data["TIMESTAMP"])
@@ -263,8 +268,6 @@ else:
     # Handle the case where there is no region column
     if "REGION" not in data.columns:
         data["REGION"] = "-"
-    # Handle the case where the region is null
-    data["REGION"].fillna("-")
     regions = ["All"] + list(data["REGION"].unique())
     regions = [x for x in regions if str(x) != "nan" and x.__class__.__name__ == "str"]
     # Correct the values
@@ -685,7 +688,10 @@ def filter_data(
     # Select the files in the list_files that have the same date as the selected date
     list_files = []
     for file in csv_files:
-        df = pd.read_csv(file, sep=";", on_bad_lines="skip")
+        # Only the columns needed to get the assessment date are loaded
+        df = output_cache.read(
+            file, ["CHECK_ID", "PROVIDER", "TIMESTAMP", "ASSESSMENT_START_TIME"]
+        )
         if "CHECK_ID" in df.columns:
             if "TIMESTAMP" in df.columns or df["PROVIDER"].unique() == "aws":
                 # This handles the case where we are using v3 outputs
@@ -931,6 +937,10 @@ def filter_data(
 
     status_filter_options = ["All"] + list(filtered_data["STATUS"].unique())
 
+    # The charts and the table count and edit the values of the filtered rows
+    filtered_data = categorical_to_object(filtered_data)
+    filtered_data_sp = categorical_to_object(filtered_data_sp)
+
     if len(filtered_data_sp) == 0:
         fig = px.pie()
         fig.update_layout(
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import atexit
 import sys
 from os import environ
 
@@ -13,9 +14,19 @@ from prowler.config.config import (
     html_file_suffix,
     json_asff_file_suffix,
     json_ocsf_file_suffix,
+    ndjson_ocsf_file_suffix,
     orange_color,
+    parquet_file_suffix,
+    performance_file_suffix,
 )
 from prowler.lib.banner import print_banner
+from prowler.lib.cassette import (
+    RECORD_MODE,
+    REPLAY_MODE,
+    cassette,
+    install_hooks,
+    set_replay_credentials,
+)
 from prowler.lib.check.check import (
     exclude_checks_to_run,
     exclude_services_to_run,
@@ -26,10 +37,12 @@ from prowler.lib.check.check import (
     list_services,
     parse_checks_from_file,
     parse_checks_from_folder,
+    plan_fixes,
     print_categories,
     print_checks,
     print_compliance_frameworks,
     print_compliance_requirements,
+    print_fixer_plan,
     print_fixers,
     print_services,
     remove_custom_checks_module,
@@ -46,75 +59,18 @@ from prowler.lib.check.models import CheckMetadata
 from prowler.lib.cli.parser import ProwlerArgumentParser
 from prowler.lib.logger import logger, set_logging_config
 from prowler.lib.outputs.asff.asff import ASFF
-from prowler.lib.outputs.compliance.aws_well_architected.aws_well_architected import (
-    AWSWellArchitected,
-)
-from prowler.lib.outputs.compliance.c5.c5_aws import AWSC5
-from prowler.lib.outputs.compliance.c5.c5_azure import AzureC5
-from prowler.lib.outputs.compliance.c5.c5_gcp import GCPC5
-from prowler.lib.outputs.compliance.ccc.ccc_aws import CCC_AWS
-from prowler.lib.outputs.compliance.ccc.ccc_azure import CCC_Azure
-from prowler.lib.outputs.compliance.ccc.ccc_gcp import CCC_GCP
-from prowler.lib.outputs.compliance.cis.cis_aws import AWSCIS
-from prowler.lib.outputs.compliance.cis.cis_azure import AzureCIS
-from prowler.lib.outputs.compliance.cis.cis_gcp import GCPCIS
-from prowler.lib.outputs.compliance.cis.cis_github import GithubCIS
-from prowler.lib.outputs.compliance.cis.cis_kubernetes import KubernetesCIS
-from prowler.lib.outputs.compliance.cis.cis_m365 import M365CIS
-from prowler.lib.outputs.compliance.cis.cis_oci import OCICIS
 from prowler.lib.outputs.compliance.compliance import display_compliance_table
-from prowler.lib.outputs.compliance.ens.ens_aws import AWSENS
-from prowler.lib.outputs.compliance.ens.ens_azure import AzureENS
-from prowler.lib.outputs.compliance.ens.ens_gcp import GCPENS
 from prowler.lib.outputs.compliance.generic.generic import GenericCompliance
-from prowler.lib.outputs.compliance.iso27001.iso27001_aws import AWSISO27001
-from prowler.lib.outputs.compliance.iso27001.iso27001_azure import AzureISO27001
-from prowler.lib.outputs.compliance.iso27001.iso27001_gcp import GCPISO27001
-from prowler.lib.outputs.compliance.iso27001.iso27001_kubernetes import (
-    KubernetesISO27001,
-)
-from prowler.lib.outputs.compliance.iso27001.iso27001_m365 import M365ISO27001
-from prowler.lib.outputs.compliance.iso27001.iso27001_nhn import NHNISO27001
-from prowler.lib.outputs.compliance.kisa_ismsp.kisa_ismsp_aws import AWSKISAISMSP
-from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_aws import AWSMitreAttack
-from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_azure import (
-    AzureMitreAttack,
-)
-from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_gcp import GCPMitreAttack
-from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_aws import (
-    ProwlerThreatScoreAWS,
-)
-from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_azure import (
-    ProwlerThreatScoreAzure,
-)
-from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_gcp import (
-    ProwlerThreatScoreGCP,
-)
-from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_m365 import (
-    ProwlerThreatScoreM365,
-)
 from prowler.lib.outputs.csv.csv import CSV
 from prowler.lib.outputs.finding import Finding
 from prowler.lib.outputs.html.html import HTML
-from prowler.lib.outputs.ocsf.ocsf import OCSF
+from prowler.lib.outputs.ocsf.ocsf import OCSF, OCSFNDJSON
 from prowler.lib.outputs.outputs import extract_findings_statistics, report
-from prowler.lib.outputs.slack.slack import Slack
+from prowler.lib.outputs.parquet.parquet import Parquet
 from prowler.lib.outputs.summary_table import display_summary_table
-from prowler.providers.aws.lib.s3.s3 import S3
-from prowler.providers.aws.lib.security_hub.security_hub import SecurityHub
-from prowler.providers.aws.models import AWSOutputOptions
-from prowler.providers.azure.models import AzureOutputOptions
+from prowler.lib.profiler import OUTPUT_SPAN, instrument_provider, profiler
 from prowler.providers.common.provider import Provider
 from prowler.providers.common.quick_inventory import run_provider_quick_inventory
-from prowler.providers.gcp.models import GCPOutputOptions
-from prowler.providers.github.models import GithubOutputOptions
-from prowler.providers.iac.models import IACOutputOptions
-from prowler.providers.kubernetes.models import KubernetesOutputOptions
-from prowler.providers.llm.models import LLMOutputOptions
-from prowler.providers.m365.models import M365OutputOptions
-from prowler.providers.mongodbatlas.models import MongoDBAtlasOutputOptions
-from prowler.providers.nhn.models import NHNOutputOptions
-from prowler.providers.oraclecloud.models import OCIOutputOptions
 
 
 def prowler():
@@ -170,6 +126,25 @@ def prowler():
     # Set Logger configuration
     set_logging_config(args.log_level, args.log_file, args.only_logs)
 
+    if getattr(args, "performance_report", False):
+        profiler.enable()
+
+    # The hooks must be installed before the provider creates its sessions
+    if getattr(args, "record_cassette", None):
+        cassette.enable(RECORD_MODE, args.record_cassette)
+        # Save the recorded responses also when Prowler exits before the end
+        atexit.register(cassette.save)
+        install_hooks()
+    elif getattr(args, "replay_cassette", None):
+        cassette.enable(
+            REPLAY_MODE,
+            args.replay_cassette,
+            latency=args.replay_latency,
+            throttling_rate=args.replay_throttling_rate,
+        )
+        set_replay_credentials(provider)
+        install_hooks()
+
     if args.list_services:
         print_services(list_services(provider))
         sys.exit()
@@ -243,6 +218,8 @@ def prowler():
     # Provider to scan
     Provider.init_global_provider(args)
     global_provider = Provider.get_global_provider()
+    if profiler.enabled:
+        instrument_provider(global_provider)
 
     # Print Provider Credentials
     if not args.only_logs:
@@ -298,43 +275,66 @@ def prowler():
         checks_to_execute = sorted(checks_to_execute)
 
     # Setup Output Options
+    # Provider specific modules are imported on demand to keep the startup fast
     if provider == "aws":
+        from prowler.providers.aws.models import AWSOutputOptions
+
         output_options = AWSOutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
     elif provider == "azure":
+        from prowler.providers.azure.models import AzureOutputOptions
+
         output_options = AzureOutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
     elif provider == "gcp":
+        from prowler.providers.gcp.models import GCPOutputOptions
+
         output_options = GCPOutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
     elif provider == "kubernetes":
+        from prowler.providers.kubernetes.models import KubernetesOutputOptions
+
         output_options = KubernetesOutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
     elif provider == "github":
+        from prowler.providers.github.models import GithubOutputOptions
+
         output_options = GithubOutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
     elif provider == "m365":
+        from prowler.providers.m365.models import M365OutputOptions
+
         output_options = M365OutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
     elif provider == "mongodbatlas":
+        from prowler.providers.mongodbatlas.models import MongoDBAtlasOutputOptions
+
         output_options = MongoDBAtlasOutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
     elif provider == "nhn":
+        from prowler.providers.nhn.models import NHNOutputOptions
+
         output_options = NHNOutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
     elif provider == "iac":
+        from prowler.providers.iac.models import IACOutputOptions
+
         output_options = IACOutputOptions(args, bulk_checks_metadata)
     elif provider == "llm":
+        from prowler.providers.llm.models import LLMOutputOptions
+
         output_options = LLMOutputOptions(args, bulk_checks_metadata)
     elif provider == "oci":
+        from prowler.providers.oraclecloud.models import OCIOutputOptions
+
         output_options = OCIOutputOptions(
             args, bulk_checks_metadata, global_provider.identity
         )
@@ -349,18 +349,18 @@ def prowler():
 
     if provider == "iac" or provider == "llm":
         # For IAC and LLM providers, run the scan directly
-        if provider == "llm":
 
-            def streaming_callback(findings_batch):
-                """Callback to report findings as they are processed in real-time."""
-                report(findings_batch, global_provider, output_options)
+        def streaming_callback(findings_batch):
+            """Callback to report findings as they are processed in real-time."""
+            report(findings_batch, global_provider, output_options)
+            if provider == "iac":
+                # The IaC provider does not return the findings it streams
+                findings.extend(findings_batch)
 
+        if provider == "llm":
             findings = global_provider.run_scan(streaming_callback=streaming_callback)
         else:
-            # Original behavior for IAC or non-verbose LLM
-            findings = global_provider.run()
-            # Report findings for verbose output
-            report(findings, global_provider, output_options)
+            global_provider.run(streaming_callback=streaming_callback)
     elif len(checks_to_execute):
         findings = execute_checks(
             checks_to_execute,
@@ -378,7 +378,9 @@ def prowler():
     if output_options.fixer:
         print(f"{Style.BRIGHT}\nRunning Prowler Fixer, please wait...{Style.RESET_ALL}")
         # Check if there are any FAIL findings
-        if any("FAIL" in finding.status for finding in findings):
+        if output_options.fixer_dry_run:
+            print_fixer_plan(plan_fixes(findings))
+        elif any("FAIL" in finding.status for finding in findings):
             fixed_findings = run_fixer(findings)
             if not fixed_findings:
                 print(
@@ -408,6 +410,8 @@ def prowler():
     stats = extract_findings_statistics(finding_outputs)
 
     if args.slack:
+        from prowler.lib.outputs.slack.slack import Slack
+
         # TODO: this should be also in a config file
         if "SLACK_API_TOKEN" in environ and (
             "SLACK_CHANNEL_NAME" in environ or "SLACK_CHANNEL_ID" in environ
@@ -432,49 +436,89 @@ def prowler():
 
     if args.output_formats:
         for mode in args.output_formats:
-            filename = (
-                f"{output_options.output_directory}/{output_options.output_filename}"
-            )
-            if mode == "csv":
-                csv_output = CSV(
-                    findings=finding_outputs,
-                    file_path=f"{filename}{csv_file_suffix}",
-                )
-                generated_outputs["regular"].append(csv_output)
-                # Write CSV Finding Object to file
-                csv_output.batch_write_data_to_file()
-
-            if mode == "json-asff":
-                asff_output = ASFF(
-                    findings=finding_outputs,
-                    file_path=f"{filename}{json_asff_file_suffix}",
-                )
-                generated_outputs["regular"].append(asff_output)
-                # Write ASFF Finding Object to file
-                asff_output.batch_write_data_to_file()
-
-            if mode == "json-ocsf":
-                json_output = OCSF(
-                    findings=finding_outputs,
-                    file_path=f"{filename}{json_ocsf_file_suffix}",
-                )
-                generated_outputs["regular"].append(json_output)
-                json_output.batch_write_data_to_file()
-            if mode == "html":
-                html_output = HTML(
-                    findings=finding_outputs,
-                    file_path=f"{filename}{html_file_suffix}",
-                )
-                generated_outputs["regular"].append(html_output)
-                html_output.batch_write_data_to_file(
-                    provider=global_provider, stats=stats
-                )
+            with profiler.span(OUTPUT_SPAN, mode):
+                filename = (
+                    f"{output_options.output_directory}/"
+                    f"{output_options.output_filename}"
+                )
+                if mode == "csv":
+                    csv_output = CSV(
+                        findings=finding_outputs,
+                        file_path=f"{filename}{csv_file_suffix}",
+                        compression=output_options.output_compression,
+                    )
+                    generated_outputs["regular"].append(csv_output)
+                    # Write CSV Finding Object to file
+                    csv_output.batch_write_data_to_file()
+
+                if mode == "json-asff":
+                    asff_output = ASFF(
+                        findings=finding_outputs,
+                        file_path=f"{filename}{json_asff_file_suffix}",
+                        compression=output_options.output_compression,
+                    )
+                    generated_outputs["regular"].append(asff_output)
+                    # Write ASFF Finding Object to file
+                    asff_output.batch_write_data_to_file()
+
+                if mode == "json-ocsf":
+                    json_output = OCSF(
+                        findings=finding_outputs,
+                        file_path=f"{filename}{json_ocsf_file_suffix}",
+                        compression=output_options.output_compression,
+                    )
+                    generated_outputs["regular"].append(json_output)
+                    json_output.batch_write_data_to_file()
+                if mode == "ndjson-ocsf":
+                    ndjson_output = OCSFNDJSON(
+                        findings=finding_outputs,
+                        file_path=f"{filename}{ndjson_ocsf_file_suffix}",
+                        compression=output_options.output_compression,
+                    )
+                    generated_outputs["regular"].append(ndjson_output)
+                    ndjson_output.batch_write_data_to_file()
+                if mode == "parquet":
+                    parquet_output = Parquet(
+                        findings=finding_outputs,
+                        file_path=f"{filename}{parquet_file_suffix}",
+                        compression=output_options.output_compression,
+                    )
+                    generated_outputs["regular"].append(parquet_output)
+                    parquet_output.batch_write_data_to_file()
+                if mode == "html":
+                    html_output = HTML(
+                        findings=finding_outputs,
+                        file_path=f"{filename}{html_file_suffix}",
+                        compression=output_options.output_compression,
+                    )
+                    generated_outputs["regular"].append(html_output)
+                    html_output.batch_write_data_to_file(
+                        provider=global_provider, stats=stats
+                    )
 
     # Compliance Frameworks
     input_compliance_frameworks = set(output_options.output_modes).intersection(
         get_available_compliance_frameworks(provider)
     )
     if provider == "aws":
+        from prowler.lib.outputs.compliance.aws_well_architected.aws_well_architected import (
+            AWSWellArchitected,
+        )
+        from prowler.lib.outputs.compliance.c5.c5_aws import AWSC5
+        from prowler.lib.outputs.compliance.ccc.ccc_aws import CCC_AWS
+        from prowler.lib.outputs.compliance.cis.cis_aws import AWSCIS
+        from prowler.lib.outputs.compliance.ens.ens_aws import AWSENS
+        from prowler.lib.outputs.compliance.iso27001.iso27001_aws import AWSISO27001
+        from prowler.lib.outputs.compliance.kisa_ismsp.kisa_ismsp_aws import (
+            AWSKISAISMSP,
+        )
+        from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_aws import (
+            AWSMitreAttack,
+        )
+        from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_aws import (
+            ProwlerThreatScoreAWS,
+        )
+
         for compliance_name in input_compliance_frameworks:
             if compliance_name.startswith("cis_"):
                 # Generate CIS Finding Object
@@ -486,6 +530,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(cis)
                 cis.batch_write_data_to_file()
@@ -499,6 +544,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(mitre_attack)
                 mitre_attack.batch_write_data_to_file()
@@ -512,6 +558,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(ens)
                 ens.batch_write_data_to_file()
@@ -525,6 +572,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(aws_well_architected)
                 aws_well_architected.batch_write_data_to_file()
@@ -538,6 +586,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(iso27001)
                 iso27001.batch_write_data_to_file()
@@ -551,6 +600,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(kisa_ismsp)
                 kisa_ismsp.batch_write_data_to_file()
@@ -563,6 +613,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(prowler_threatscore)
                 prowler_threatscore.batch_write_data_to_file()
@@ -577,6 +628,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
 
                 generated_outputs["compliance"].append(ccc_aws)
@@ -590,6 +642,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(c5)
                 c5.batch_write_data_to_file()
@@ -602,11 +655,24 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(generic_compliance)
                 generic_compliance.batch_write_data_to_file()
 
     elif provider == "azure":
+        from prowler.lib.outputs.compliance.c5.c5_azure import AzureC5
+        from prowler.lib.outputs.compliance.ccc.ccc_azure import CCC_Azure
+        from prowler.lib.outputs.compliance.cis.cis_azure import AzureCIS
+        from prowler.lib.outputs.compliance.ens.ens_azure import AzureENS
+        from prowler.lib.outputs.compliance.iso27001.iso27001_azure import AzureISO27001
+        from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_azure import (
+            AzureMitreAttack,
+        )
+        from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_azure import (
+            ProwlerThreatScoreAzure,
+        )
+
         for compliance_name in input_compliance_frameworks:
             if compliance_name.startswith("cis_"):
                 # Generate CIS Finding Object
@@ -618,6 +684,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(cis)
                 cis.batch_write_data_to_file()
@@ -631,6 +698,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(mitre_attack)
                 mitre_attack.batch_write_data_to_file()
@@ -644,6 +712,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(ens)
                 ens.batch_write_data_to_file()
@@ -657,6 +726,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(iso27001)
                 iso27001.batch_write_data_to_file()
@@ -669,6 +739,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(prowler_threatscore)
                 prowler_threatscore.batch_write_data_to_file()
@@ -681,6 +752,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(ccc_azure)
                 ccc_azure.batch_write_data_to_file()
@@ -693,6 +765,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(c5_azure)
                 c5_azure.batch_write_data_to_file()
@@ -705,11 +778,24 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(generic_compliance)
                 generic_compliance.batch_write_data_to_file()
 
     elif provider == "gcp":
+        from prowler.lib.outputs.compliance.c5.c5_gcp import GCPC5
+        from prowler.lib.outputs.compliance.ccc.ccc_gcp import CCC_GCP
+        from prowler.lib.outputs.compliance.cis.cis_gcp import GCPCIS
+        from prowler.lib.outputs.compliance.ens.ens_gcp import GCPENS
+        from prowler.lib.outputs.compliance.iso27001.iso27001_gcp import GCPISO27001
+        from prowler.lib.outputs.compliance.mitre_attack.mitre_attack_gcp import (
+            GCPMitreAttack,
+        )
+        from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_gcp import (
+            ProwlerThreatScoreGCP,
+        )
+
         for compliance_name in input_compliance_frameworks:
             if compliance_name.startswith("cis_"):
                 # Generate CIS Finding Object
@@ -721,6 +807,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(cis)
                 cis.batch_write_data_to_file()
@@ -734,6 +821,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(mitre_attack)
                 mitre_attack.batch_write_data_to_file()
@@ -747,6 +835,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(ens)
                 ens.batch_write_data_to_file()
@@ -760,6 +849,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(iso27001)
                 iso27001.batch_write_data_to_file()
@@ -772,6 +862,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(prowler_threatscore)
                 prowler_threatscore.batch_write_data_to_file()
@@ -784,6 +875,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(ccc_gcp)
                 ccc_gcp.batch_write_data_to_file()
@@ -796,6 +888,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(c5_gcp)
                 c5_gcp.batch_write_data_to_file()
@@ -808,11 +901,17 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(generic_compliance)
                 generic_compliance.batch_write_data_to_file()
 
     elif provider == "kubernetes":
+        from prowler.lib.outputs.compliance.cis.cis_kubernetes import KubernetesCIS
+        from prowler.lib.outputs.compliance.iso27001.iso27001_kubernetes import (
+            KubernetesISO27001,
+        )
+
         for compliance_name in input_compliance_frameworks:
             if compliance_name.startswith("cis_"):
                 # Generate CIS Finding Object
@@ -824,6 +923,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(cis)
                 cis.batch_write_data_to_file()
@@ -837,6 +937,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(iso27001)
                 iso27001.batch_write_data_to_file()
@@ -849,11 +950,18 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(generic_compliance)
                 generic_compliance.batch_write_data_to_file()
 
     elif provider == "m365":
+        from prowler.lib.outputs.compliance.cis.cis_m365 import M365CIS
+        from prowler.lib.outputs.compliance.iso27001.iso27001_m365 import M365ISO27001
+        from prowler.lib.outputs.compliance.prowler_threatscore.prowler_threatscore_m365 import (
+            ProwlerThreatScoreM365,
+        )
+
         for compliance_name in input_compliance_frameworks:
             if compliance_name.startswith("cis_"):
                 # Generate CIS Finding Object
@@ -865,6 +973,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(cis)
                 cis.batch_write_data_to_file()
@@ -877,6 +986,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(prowler_threatscore)
                 prowler_threatscore.batch_write_data_to_file()
@@ -890,6 +1000,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(iso27001)
                 iso27001.batch_write_data_to_file()
@@ -902,11 +1013,14 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(generic_compliance)
                 generic_compliance.batch_write_data_to_file()
 
     elif provider == "nhn":
+        from prowler.lib.outputs.compliance.iso27001.iso27001_nhn import NHNISO27001
+
         for compliance_name in input_compliance_frameworks:
             if compliance_name.startswith("iso27001_"):
                 # Generate ISO27001 Finding Object
@@ -918,6 +1032,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(iso27001)
                 iso27001.batch_write_data_to_file()
@@ -930,11 +1045,14 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(generic_compliance)
                 generic_compliance.batch_write_data_to_file()
 
     elif provider == "github":
+        from prowler.lib.outputs.compliance.cis.cis_github import GithubCIS
+
         for compliance_name in input_compliance_frameworks:
             if compliance_name.startswith("cis_"):
                 # Generate CIS Finding Object
@@ -946,6 +1064,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(cis)
                 cis.batch_write_data_to_file()
@@ -959,11 +1078,14 @@ def prowler():
                     compliance=bulk_compliance_frameworks[compliance_name],
                     create_file_descriptor=True,
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(generic_compliance)
                 generic_compliance.batch_write_data_to_file()
 
     elif provider == "oci":
+        from prowler.lib.outputs.compliance.cis.cis_oci import OCICIS
+
         for compliance_name in input_compliance_frameworks:
             if compliance_name.startswith("cis_"):
                 # Generate CIS Finding Object
@@ -975,6 +1097,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(cis)
                 cis.batch_write_data_to_file()
@@ -987,6 +1110,7 @@ def prowler():
                     findings=finding_outputs,
                     compliance=bulk_compliance_frameworks[compliance_name],
                     file_path=filename,
+                    compression=output_options.output_compression,
                 )
                 generated_outputs["compliance"].append(generic_compliance)
                 generic_compliance.batch_write_data_to_file()
@@ -995,6 +1119,8 @@ def prowler():
     if provider == "aws":
         # Send output to S3 if needed (-B / -D) for all the output formats
         if args.output_bucket or args.output_bucket_no_assume:
+            from prowler.providers.aws.lib.s3.s3 import S3
+
             output_bucket = args.output_bucket
             bucket_session = global_provider.session.current_session
             # Check if -D was input
@@ -1008,6 +1134,8 @@ def prowler():
             )
             s3.send_to_bucket(generated_outputs)
         if args.security_hub:
+            from prowler.providers.aws.lib.security_hub.security_hub import SecurityHub
+
             print(
                 f"{Style.BRIGHT}\nSending findings to AWS Security Hub, please wait...{Style.RESET_ALL}"
             )
@@ -1091,6 +1219,29 @@ def prowler():
                     f"\nDetailed compliance results are in {Fore.YELLOW}{output_options.output_directory}/compliance/{Style.RESET_ALL}\n"
                 )
 
+    if profiler.enabled:
+        performance_file = (
+            f"{output_options.output_directory}/"
+            f"{output_options.output_filename}{performance_file_suffix}"
+        )
+        profiler.write(
+            performance_file,
+            resource_attributes={"prowler.provider": provider},
+        )
+        if not args.only_logs:
+            profiler.print_summary()
+            print(
+                f"\nDetailed performance report in {Fore.YELLOW}{performance_file}{Style.RESET_ALL}\n"
+            )
+
+    if cassette.mode == RECORD_MODE:
+        cassette.save()
+        atexit.unregister(cassette.save)
+        if not args.only_logs:
+            print(
+                f"\nProvider API responses recorded in {Fore.YELLOW}{cassette.file_path}{Style.RESET_ALL}\n"
+            )
+
     # If custom checks were passed, remove the modules
     if checks_folder:
         remove_custom_checks_module(checks_folder, provider)
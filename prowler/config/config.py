@@ -70,7 +70,10 @@ csv_file_suffix = ".csv"
 json_file_suffix = ".json"
 json_asff_file_suffix = ".asff.json"
 json_ocsf_file_suffix = ".ocsf.json"
+ndjson_ocsf_file_suffix = ".ocsf.ndjson"
+parquet_file_suffix = ".parquet"
 html_file_suffix = ".html"
+performance_file_suffix = ".performance.json"
 default_config_file_path = (
     f"{pathlib.Path(os.path.dirname(os.path.realpath(__file__)))}/config.yaml"
 )
@@ -81,7 +84,15 @@ default_redteam_config_file_path = (
     f"{pathlib.Path(os.path.dirname(os.path.realpath(__file__)))}/llm_config.yaml"
 )
 encoding_format_utf_8 = "utf-8"
-available_output_formats = ["csv", "json-asff", "json-ocsf", "html"]
+available_output_formats = [
+    "csv",
+    "json-asff",
+    "json-ocsf",
+    "ndjson-ocsf",
+    "parquet",
+    "html",
+]
+available_output_compressions = ["gzip", "zstd"]
 
 
 def get_default_mute_file_path(provider: str):
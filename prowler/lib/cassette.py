@@ -0,0 +1,515 @@
+import base64
+import gzip
+import hashlib
+import io
+import json
+import os
+import random
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from functools import wraps
+
+from prowler.lib.logger import logger
+from prowler.lib.profiler import AWS_THROTTLING_ERROR_CODES
+
+RECORD_MODE = "record"
+REPLAY_MODE = "replay"
+
+# Status code and bodies served when a throttling error is injected in replay mode
+AWS_THROTTLING_STATUS_CODE = 400
+AWS_THROTTLING_XML_BODY = (
+    b"<ErrorResponse><Error><Type>Sender</Type><Code>Throttling</Code>"
+    b"<Message>Rate exceeded</Message></Error><RequestId>replay</RequestId>"
+    b"</ErrorResponse>"
+)
+AWS_THROTTLING_JSON_BODY = (
+    b'{"__type": "ThrottlingException", "message": "Rate exceeded"}'
+)
+HTTP_THROTTLING_STATUS_CODE = 429
+
+# Credentials returned by the APIs, e.g. by STS or the OAuth token endpoints, are
+# replaced by this value before the responses are written to the cassette
+REDACTED_VALUE = "REDACTED"
+CREDENTIAL_JSON_FIELDS = re.compile(
+    r'("(?:access_?token|refresh_?token|id_?token|client_?secret|password|'
+    r'secret_?access_?key|session_?token)"\s*:\s*)"(?:[^"\\]|\\.)*"',
+    re.IGNORECASE,
+)
+CREDENTIAL_XML_ELEMENTS = re.compile(
+    r"<(SecretAccessKey|SessionToken)>[^<]*</\1>", re.IGNORECASE
+)
+CREDENTIAL_HEADERS = {"authorization", "set-cookie"}
+
+
+class CassetteEntryNotFoundError(Exception):
+    """Raised in replay mode when a request was not recorded in the cassette."""
+
+    def __init__(self, name: str):
+        super().__init__(f"No recorded response for {name} in the cassette.")
+
+
+@dataclass
+class RecordedResponse:
+    """A raw HTTP response captured during a scan."""
+
+    status: int
+    headers: dict
+    body: bytes = b""
+    throttled: bool = False
+
+    def to_dict(self) -> dict:
+        recorded_response = asdict(self)
+        del recorded_response["throttled"]
+        try:
+            recorded_response["body"] = self.body.decode("utf-8")
+        except UnicodeDecodeError:
+            recorded_response["body"] = base64.b64encode(self.body).decode("ascii")
+            recorded_response["encoding"] = "base64"
+        return recorded_response
+
+    def redacted(self) -> "RecordedResponse":
+        """Return a copy of the response with the credentials it holds redacted."""
+        headers = {
+            header: REDACTED_VALUE if header.lower() in CREDENTIAL_HEADERS else value
+            for header, value in self.headers.items()
+        }
+        content_encoding = next(
+            (
+                value
+                for header, value in headers.items()
+                if header.lower() == "content-encoding"
+            ),
+            "",
+        )
+        body = self.body
+        if content_encoding.lower() == "gzip":
+            try:
+                body = gzip.compress(redact_credentials(gzip.decompress(body)))
+            except (OSError, EOFError):
+                pass
+        elif not content_encoding:
+            body = redact_credentials(body)
+        if body != self.body:
+            for header in headers:
+                if header.lower() == "content-length":
+                    headers[header] = str(len(body))
+        return RecordedResponse(status=self.status, headers=headers, body=body)
+
+    @classmethod
+    def from_dict(cls, recorded_response: dict) -> "RecordedResponse":
+        if recorded_response.get("encoding") == "base64":
+            body = base64.b64decode(recorded_response["body"])
+        else:
+            body = recorded_response["body"].encode("utf-8")
+        return cls(
+            status=recorded_response["status"],
+            headers=recorded_response["headers"],
+            body=body,
+        )
+
+
+def redact_credentials(body: bytes) -> bytes:
+    """Replace the credentials found in a JSON or XML response body by REDACTED_VALUE."""
+    try:
+        text = body.decode("utf-8")
+    except UnicodeDecodeError:
+        return body
+    redacted_text = CREDENTIAL_JSON_FIELDS.sub(rf'\1"{REDACTED_VALUE}"', text)
+    redacted_text = CREDENTIAL_XML_ELEMENTS.sub(
+        rf"<\1>{REDACTED_VALUE}</\1>", redacted_text
+    )
+    if redacted_text == text:
+        return body
+    return redacted_text.encode("utf-8")
+
+
+@dataclass
+class _Entries:
+    responses: list = field(default_factory=list)
+    served: int = 0
+
+    def next(self) -> RecordedResponse:
+        # Repeated requests get the responses in the recorded order, the last one
+        # is served again once all of them were used
+        response = self.responses[min(self.served, len(self.responses) - 1)]
+        self.served += 1
+        return response
+
+
+class Cassette:
+    """
+    Records the responses of the provider APIs during a scan to a gzip compressed
+    JSON Lines file and serves them back in later scans, so they can run offline.
+
+    Every response is stored with a key built from the request and with the
+    operation name. In replay mode the responses are looked up by key and, when
+    the request changed between runs (e.g. it contains a timestamp), by name.
+
+    The credentials returned by the APIs (access, refresh and ID tokens, client
+    secrets, passwords, AWS secret keys and session tokens, cookies) are redacted
+    before the responses are written. The rest of the account data is kept, so the
+    cassette must be handled as securely as the scan results.
+
+    The replay can simulate a remote API adding a latency to every response and
+    answering a rate of the requests with a throttling error.
+
+    Example:
+        >>> cassette.enable(RECORD_MODE, "aws.cassette.jsonl.gz")
+        >>> install_hooks()
+        >>> # run the scan
+        >>> cassette.save()
+    """
+
+    def __init__(self):
+        self.mode = None
+        self.file_path = None
+        self.latency = 0.0
+        self.throttling_rate = 0.0
+        self._random = random.Random(0)
+        self._lock = threading.Lock()
+        self._recorded = []
+        self._entries_by_key = {}
+        self._entries_by_name = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode is not None
+
+    def enable(
+        self,
+        mode: str,
+        file_path: str,
+        latency: float = 0.0,
+        throttling_rate: float = 0.0,
+        seed: int = 0,
+    ):
+        """
+        Enable the recording or the replay.
+
+        Args:
+            mode (str): RECORD_MODE or REPLAY_MODE.
+            file_path (str): the cassette file.
+            latency (float): seconds added to every replayed response.
+            throttling_rate (float): rate, from 0 to 1, of replayed requests
+                answered with a throttling error.
+            seed (int): seed of the throttling injection, to reproduce the runs.
+        """
+        self.mode = mode
+        self.file_path = file_path
+        self.latency = latency
+        self.throttling_rate = throttling_rate
+        self._random = random.Random(seed)
+        self._recorded = []
+        self._entries_by_key = {}
+        self._entries_by_name = {}
+        if mode == REPLAY_MODE:
+            self.load()
+
+    def disable(self):
+        self.mode = None
+
+    def record(self, key: str, name: str, response: RecordedResponse):
+        with self._lock:
+            self._recorded.append((key, name, response))
+
+    def replay(self, key: str, name: str) -> RecordedResponse:
+        """
+        Return the recorded response of the request, waiting the configured
+        latency. A throttling response, with the status and headers of the
+        recorded one, is returned for the configured rate of requests.
+
+        Raises:
+            CassetteEntryNotFoundError: if the request was not recorded.
+        """
+        with self._lock:
+            entries = self._entries_by_key.get(key) or self._entries_by_name.get(name)
+            if not entries:
+                raise CassetteEntryNotFoundError(name)
+            response = entries.next()
+            throttled = self._random.random() < self.throttling_rate
+        if self.latency:
+            time.sleep(self.latency)
+        if throttled:
+            return RecordedResponse(
+                status=response.status, headers=response.headers, throttled=True
+            )
+        return response
+
+    def load(self):
+        with gzip.open(self.file_path, "rt", encoding="utf-8") as file_descriptor:
+            for line in file_descriptor:
+                entry = json.loads(line)
+                response = RecordedResponse.from_dict(entry["response"])
+                self._entries_by_key.setdefault(
+                    entry["key"], _Entries()
+                ).responses.append(response)
+                self._entries_by_name.setdefault(
+                    entry["name"], _Entries()
+                ).responses.append(response)
+
+    def save(self):
+        if self.mode != RECORD_MODE:
+            return
+        try:
+            with gzip.open(self.file_path, "wt", encoding="utf-8") as file_descriptor:
+                for key, name, response in self._recorded:
+                    file_descriptor.write(
+                        json.dumps(
+                            {
+                                "key": key,
+                                "name": name,
+                                "response": response.redacted().to_dict(),
+                            },
+                            separators=(",", ":"),
+                        )
+                        + "\n"
+                    )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+
+cassette = Cassette()
+
+# Requests handled by botocore are not recorded again by the HTTP hooks
+_botocore_request = threading.local()
+
+
+def request_key(*parts) -> str:
+    """Build the key of a request hashing its method, URL, body, etc."""
+    request_hash = hashlib.sha256()
+    for part in parts:
+        if part is None:
+            part = b""
+        elif hasattr(part, "read"):
+            # Streamed bodies are not read to not consume them
+            part = b"<stream>"
+        elif isinstance(part, str):
+            part = part.encode("utf-8")
+        elif not isinstance(part, bytes):
+            part = repr(part).encode("utf-8")
+        request_hash.update(part)
+        request_hash.update(b"\0")
+    return request_hash.hexdigest()
+
+
+def install_hooks():
+    """
+    Install the record/replay hooks in the HTTP clients of the providers:
+      - botocore, for AWS, through a handler added to every new session.
+      - urllib3, used by the Azure, Kubernetes and GitHub SDKs.
+      - httplib2, used by the Google API discovery clients.
+
+    Sessions and clients must be created after calling this function.
+    """
+    _install_botocore_hooks()
+    _install_urllib3_hooks()
+    _install_httplib2_hooks()
+
+
+def _install_botocore_hooks():
+    from botocore import handlers
+
+    if ("before-send", _before_aws_send) in handlers.BUILTIN_HANDLERS:
+        return
+    handlers.BUILTIN_HANDLERS.append(("before-send", _before_aws_send))
+    handlers.BUILTIN_HANDLERS.append(("response-received", _on_aws_response))
+
+
+class _RawResponse(io.BytesIO):
+    """Raw body of a replayed botocore response."""
+
+    def stream(self, **_):
+        yield self.getvalue()
+
+
+def _before_aws_send(request, event_name, **_):
+    if not cassette.enabled:
+        return None
+    # Format: "before-send.{service_id}.{operation_name}"
+    _, service_id, operation_name = event_name.split(".", 2)
+    name = f"{service_id}.{operation_name}"
+    key = request_key(name, request.method, request.url, request.body)
+    if cassette.mode == RECORD_MODE:
+        _botocore_request.key = key
+        _botocore_request.name = name
+        return None
+
+    from botocore.awsrequest import AWSResponse
+
+    response = cassette.replay(key, name)
+    if response.throttled:
+        headers = {
+            "Content-Type": response.headers.get("Content-Type", "text/xml"),
+            "x-amzn-ErrorType": "ThrottlingException",
+        }
+        body = (
+            AWS_THROTTLING_JSON_BODY
+            if "json" in headers["Content-Type"]
+            else AWS_THROTTLING_XML_BODY
+        )
+        return AWSResponse(
+            request.url, AWS_THROTTLING_STATUS_CODE, headers, _RawResponse(body)
+        )
+    return AWSResponse(
+        request.url, response.status, response.headers, _RawResponse(response.body)
+    )
+
+
+def _on_aws_response(response_dict=None, parsed_response=None, **_):
+    key = getattr(_botocore_request, "key", None)
+    if cassette.mode != RECORD_MODE or key is None:
+        return
+    name = _botocore_request.name
+    _botocore_request.key = None
+    # Streamed bodies, e.g. s3 GetObject, can't be read without consuming them
+    if not response_dict or not isinstance(response_dict.get("body"), bytes):
+        return
+    # Throttled attempts are not recorded, the retried ones are
+    error_code = (parsed_response or {}).get("Error", {}).get("Code")
+    if error_code in AWS_THROTTLING_ERROR_CODES:
+        return
+    cassette.record(
+        key,
+        name,
+        RecordedResponse(
+            status=response_dict["status_code"],
+            headers=dict(response_dict["headers"]),
+            body=response_dict["body"],
+        ),
+    )
+
+
+def _install_urllib3_hooks():
+    from urllib3 import HTTPResponse
+    from urllib3.connectionpool import HTTPConnectionPool
+
+    if getattr(HTTPConnectionPool.urlopen, "__prowler_cassette__", False):
+        return
+    urlopen = HTTPConnectionPool.urlopen
+    nested = threading.local()
+
+    @wraps(urlopen)
+    def cassette_urlopen(pool, method, url, body=None, headers=None, **kwargs):
+        # Redirects and retries call urlopen again, only the outer call is handled
+        if (
+            not cassette.enabled
+            or getattr(nested, "active", False)
+            or getattr(_botocore_request, "key", None)
+        ):
+            return urlopen(pool, method, url, body, headers, **kwargs)
+        name = f"{method} {pool.host}{url.split('?')[0]}"
+        key = request_key(method, pool.scheme, pool.host, pool.port, url, body)
+        preload_content = kwargs.get("preload_content", True)
+        decode_content = kwargs.get("decode_content", True)
+
+        if cassette.mode == REPLAY_MODE:
+            response = cassette.replay(key, name)
+            status = (
+                HTTP_THROTTLING_STATUS_CODE if response.throttled else response.status
+            )
+            headers = {"Retry-After": "0"} if response.throttled else response.headers
+            return HTTPResponse(
+                body=io.BytesIO(response.body),
+                headers=headers,
+                status=status,
+                preload_content=preload_content,
+                decode_content=decode_content,
+                request_method=method,
+                request_url=url,
+            )
+
+        nested.active = True
+        try:
+            # The raw body is read to record it and the response is rebuilt
+            response = urlopen(
+                pool, method, url, body, headers, **{**kwargs, "preload_content": False}
+            )
+            raw_body = response.read(decode_content=False)
+            response.release_conn()
+        finally:
+            nested.active = False
+        # The rebuilt responses are not read in chunks
+        recorded_headers = {
+            header: value
+            for header, value in response.headers.items()
+            if header.lower() != "transfer-encoding"
+        }
+        cassette.record(
+            key,
+            name,
+            RecordedResponse(
+                status=response.status, headers=recorded_headers, body=raw_body
+            ),
+        )
+        return HTTPResponse(
+            body=io.BytesIO(raw_body),
+            headers=recorded_headers,
+            status=response.status,
+            reason=response.reason,
+            preload_content=preload_content,
+            decode_content=decode_content,
+            request_method=method,
+            request_url=url,
+        )
+
+    cassette_urlopen.__prowler_cassette__ = True
+    HTTPConnectionPool.urlopen = cassette_urlopen
+
+
+def _install_httplib2_hooks():
+    try:
+        import httplib2
+    except ImportError:
+        return
+
+    if getattr(httplib2.Http.request, "__prowler_cassette__", False):
+        return
+    request = httplib2.Http.request
+
+    @wraps(request)
+    def cassette_request(http, uri, method="GET", body=None, headers=None, **kwargs):
+        if not cassette.enabled:
+            return request(http, uri, method, body, headers, **kwargs)
+        name = f"{method} {uri.split('?')[0]}"
+        key = request_key(method, uri, body)
+
+        if cassette.mode == REPLAY_MODE:
+            response = cassette.replay(key, name)
+            if response.throttled:
+                return (
+                    httplib2.Response(
+                        {"status": str(HTTP_THROTTLING_STATUS_CODE), "retry-after": "0"}
+                    ),
+                    b"",
+                )
+            return (
+                httplib2.Response({**response.headers, "status": str(response.status)}),
+                response.body,
+            )
+
+        response, content = request(http, uri, method, body, headers, **kwargs)
+        cassette.record(
+            key,
+            name,
+            RecordedResponse(
+                status=response.status, headers=dict(response), body=content
+            ),
+        )
+        return response, content
+
+    cassette_request.__prowler_cassette__ = True
+    httplib2.Http.request = cassette_request
+
+
+def set_replay_credentials(provider: str):
+    """
+    Set placeholder credentials, if there are none, so the SDK clients can sign
+    the requests that will be answered from the cassette.
+    """
+    if provider == "aws":
+        os.environ.setdefault("AWS_ACCESS_KEY_ID", "replay")
+        os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "replay")
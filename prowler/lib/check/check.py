@@ -4,9 +4,13 @@ import os
 import re
 import shutil
 import sys
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from itertools import zip_longest
 from types import ModuleType
-from typing import Any
+from typing import Any, Callable
 
 from alive_progress import alive_bar
 from colorama import Fore, Style
@@ -18,9 +22,14 @@ from prowler.lib.check.models import Check
 from prowler.lib.check.utils import recover_checks_from_provider
 from prowler.lib.logger import logger
 from prowler.lib.outputs.outputs import report
+from prowler.lib.profiler import CHECK_LOAD_SPAN, CHECK_SPAN, MUTELIST_SPAN, profiler
 from prowler.lib.utils.utils import open_file, parse_json_file, print_boxes
 from prowler.providers.common.models import Audit_Metadata
 
+# Fixer calls run at the same time, in total and per service
+MAX_FIXER_WORKERS = 10
+MAX_FIXER_WORKERS_PER_SERVICE = 3
+
 
 # Exclude checks to run
 def exclude_checks_to_run(checks_to_execute: set, excluded_checks: list) -> set:
@@ -294,88 +303,166 @@ def print_checks(
 
 # Import an input check using its path
 def import_check(check_path: str) -> ModuleType:
-    lib = importlib.import_module(f"{check_path}")
+    # Importing the first check of a service also initializes the service client
+    # Format: "prowler.providers.{provider}.services.{service}.{check_name}.{check_name}"
+    with profiler.span(
+        CHECK_LOAD_SPAN,
+        check_path.split(".")[-1],
+        service=check_path.split(".")[-3] if check_path.count(".") >= 3 else "",
+    ):
+        lib = importlib.import_module(f"{check_path}")
     return lib
 
 
+@dataclass
+class FixerTask:
+    """A fixer call and the FAIL findings it fixes"""
+
+    check: str
+    service: str
+    fixer: Callable
+    arguments: dict
+    findings: list = field(default_factory=list)
+
+    @property
+    def target(self) -> str:
+        if "resource_id" in self.arguments and "region" in self.arguments:
+            return f"{self.arguments['resource_id']} in {self.arguments['region']}"
+        if "region" in self.arguments:
+            return self.arguments["region"]
+        if "resource_arn" in self.arguments:
+            return f"Resource {self.arguments['resource_arn']}"
+        return f"Resource {self.arguments['resource_id']}"
+
+
+def get_fixer_arguments(fixer: Callable, finding: Any) -> dict:
+    """
+    Get the arguments to call the fixer with for the finding based on the fixer scope:
+    - A specific resource and region
+    - A specific region, shared by all the findings in the region
+    - A specific resource by its ARN
+    - A specific resource by its ID
+    """
+    fixer_arguments = fixer.__code__.co_varnames[: fixer.__code__.co_argcount]
+    if "region" in fixer_arguments and "resource_id" in fixer_arguments:
+        return {"resource_id": finding.resource_id, "region": finding.region}
+    if "region" in fixer_arguments:
+        return {"region": finding.region}
+    if "resource_arn" in fixer_arguments:
+        return {"resource_arn": finding.resource_arn}
+    return {"resource_id": finding.resource_id}
+
+
+def plan_fixes(check_findings: list) -> list:
+    """
+    Plan the fixer calls needed to fix the FAIL findings.
+
+    The findings are grouped by check and fixer scope, so the fixers of a region are
+    called once for all the FAIL findings in the region.
+
+    Args:
+        check_findings (list): list of findings
+    Returns:
+        list: the FixerTask to run
+    """
+    fixer_tasks = {}
+    fixers = {}
+    for finding in check_findings:
+        if finding.status != "FAIL":
+            continue
+        check = finding.check_metadata.CheckID
+        if check not in fixers:
+            try:
+                check_module_path = f"prowler.providers.{finding.check_metadata.Provider}.services.{finding.check_metadata.ServiceName}.{check}.{check}_fixer"
+                fixers[check] = getattr(import_check(check_module_path), "fixer")
+            except ModuleNotFoundError:
+                logger.error(f"Fixer method not implemented for check {check}")
+                fixers[check] = None
+        fixer = fixers[check]
+        if not fixer:
+            continue
+        fixer_arguments = get_fixer_arguments(fixer, finding)
+        fixer_task_key = (check, tuple(fixer_arguments.items()))
+        if fixer_task_key not in fixer_tasks:
+            fixer_tasks[fixer_task_key] = FixerTask(
+                check=check,
+                service=finding.check_metadata.ServiceName,
+                fixer=fixer,
+                arguments=fixer_arguments,
+            )
+        fixer_tasks[fixer_task_key].findings.append(finding)
+    return list(fixer_tasks.values())
+
+
+def print_fixer_plan(fixer_tasks: list):
+    fixes_num = sum(len(fixer_task.findings) for fixer_task in fixer_tasks)
+    check = None
+    for fixer_task in sorted(fixer_tasks, key=lambda fixer_task: fixer_task.check):
+        if fixer_task.check != check:
+            check = fixer_task.check
+            print(f"\nFixing fails for check {Fore.YELLOW}{check}{Style.RESET_ALL}...")
+        print(
+            f"\t{orange_color}FIX{Style.RESET_ALL} {fixer_task.target} ({len(fixer_task.findings)} findings)"
+        )
+    print(
+        f"\n{Fore.YELLOW}{len(fixer_tasks)}{Style.RESET_ALL} fixer calls planned for {Fore.YELLOW}{fixes_num}{Style.RESET_ALL} findings.\n"
+    )
+
+
+def _apply_fix(fixer_task: FixerTask, service_semaphore: threading.Semaphore) -> bool:
+    with service_semaphore:
+        try:
+            return bool(fixer_task.fixer(**fixer_task.arguments))
+        except Exception as error:
+            logger.error(
+                f"{fixer_task.check} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+            return False
+
+
 def run_fixer(check_findings: list) -> int:
     """
-    Run the fixer for the check if it exists and there are any FAIL findings
+    Run the fixers of the checks with FAIL findings.
+
+    The fixer calls are planned with plan_fixes and run concurrently, with up to
+    MAX_FIXER_WORKERS calls at once and MAX_FIXER_WORKERS_PER_SERVICE per service.
     Args:
         check_findings (list): list of findings
     Returns:
         int: number of fixed findings
     """
     try:
-        # Map findings to each check
-        findings_dict = {}
         fixed_findings = 0
-        for finding in check_findings:
-            if finding.check_metadata.CheckID not in findings_dict:
-                findings_dict[finding.check_metadata.CheckID] = []
-            findings_dict[finding.check_metadata.CheckID].append(finding)
-
-        for check, findings in findings_dict.items():
-            # Check if there are any FAIL findings for the check
-            if any("FAIL" in finding.status for finding in findings):
-                try:
-                    check_module_path = f"prowler.providers.{findings[0].check_metadata.Provider}.services.{findings[0].check_metadata.ServiceName}.{check}.{check}_fixer"
-                    lib = import_check(check_module_path)
-                    fixer = getattr(lib, "fixer")
-                except ModuleNotFoundError:
-                    logger.error(f"Fixer method not implemented for check {check}")
+        fixer_tasks = plan_fixes(check_findings)
+        print_fixer_plan(fixer_tasks)
+        service_semaphores = {
+            fixer_task.service: threading.Semaphore(MAX_FIXER_WORKERS_PER_SERVICE)
+            for fixer_task in fixer_tasks
+        }
+        # Interleave the services so the workers are not waiting on the same service
+        fixer_tasks_by_service = {}
+        for fixer_task in fixer_tasks:
+            fixer_tasks_by_service.setdefault(fixer_task.service, []).append(fixer_task)
+        with ThreadPoolExecutor(max_workers=MAX_FIXER_WORKERS) as executor:
+            futures = {
+                executor.submit(
+                    _apply_fix, fixer_task, service_semaphores[fixer_task.service]
+                ): fixer_task
+                for service_fixer_tasks in zip_longest(*fixer_tasks_by_service.values())
+                for fixer_task in service_fixer_tasks
+                if fixer_task
+            }
+            for future in as_completed(futures):
+                fixer_task = futures[future]
+                if future.result():
+                    fixed_findings += len(fixer_task.findings)
+                    print(
+                        f"\t{Fore.GREEN}DONE{Style.RESET_ALL} {fixer_task.check}: {fixer_task.target}"
+                    )
                 else:
                     print(
-                        f"\nFixing fails for check {Fore.YELLOW}{check}{Style.RESET_ALL}..."
+                        f"\t{Fore.RED}ERROR{Style.RESET_ALL} {fixer_task.check}: {fixer_task.target}"
                     )
-                    for finding in findings:
-                        if finding.status == "FAIL":
-                            # Check what type of fixer is:
-                            # - If it is a fixer for a specific resource and region
-                            # - If it is a fixer for a specific region
-                            # - If it is a fixer for a specific resource
-                            if (
-                                "region" in fixer.__code__.co_varnames
-                                and "resource_id" in fixer.__code__.co_varnames
-                            ):
-                                print(
-                                    f"\t{orange_color}FIXING{Style.RESET_ALL} {finding.resource_id} in {finding.region}... "
-                                )
-                                if fixer(
-                                    resource_id=finding.resource_id,
-                                    region=finding.region,
-                                ):
-                                    fixed_findings += 1
-                                    print(f"\t{Fore.GREEN}DONE{Style.RESET_ALL}")
-                                else:
-                                    print(f"\t{Fore.RED}ERROR{Style.RESET_ALL}")
-                            elif "region" in fixer.__code__.co_varnames:
-                                print(
-                                    f"\t{orange_color}FIXING{Style.RESET_ALL} {finding.region}... "
-                                )
-                                if fixer(region=finding.region):
-                                    fixed_findings += 1
-                                    print(f"\t{Fore.GREEN}DONE{Style.RESET_ALL}")
-                                else:
-                                    print(f"\t{Fore.RED}ERROR{Style.RESET_ALL}")
-                            elif "resource_arn" in fixer.__code__.co_varnames:
-                                print(
-                                    f"\t{orange_color}FIXING{Style.RESET_ALL} Resource {finding.resource_arn}... "
-                                )
-                                if fixer(resource_arn=finding.resource_arn):
-                                    fixed_findings += 1
-                                    print(f"\t{Fore.GREEN}DONE{Style.RESET_ALL}")
-                                else:
-                                    print(f"\t{Fore.RED}ERROR{Style.RESET_ALL}")
-                            else:
-                                print(
-                                    f"\t{orange_color}FIXING{Style.RESET_ALL} Resource {finding.resource_id}... "
-                                )
-                                if fixer(resource_id=finding.resource_id):
-                                    fixed_findings += 1
-                                    print(f"\t\t{Fore.GREEN}DONE{Style.RESET_ALL}")
-                                else:
-                                    print(f"\t\t{Fore.RED}ERROR{Style.RESET_ALL}")
         return fixed_findings
     except Exception as error:
         logger.error(
@@ -620,7 +707,11 @@ def execute(
         check_findings = []
         logger.debug(f"Executing check: {check.CheckID}")
         try:
-            check_findings = check.execute()
+            with profiler.span(
+                CHECK_SPAN, check.CheckID, service=check.ServiceName
+            ) as span_attributes:
+                check_findings = check.execute()
+                span_attributes["findings"] = len(check_findings or [])
         except Exception as error:
             if not only_logs:
                 print(
@@ -657,15 +748,20 @@ def execute(
                 is_finding_muted_args["organization_id"] = (
                     global_provider.identity.organization_id
                 )
-            for finding in check_findings:
-                if global_provider.type == "azure":
-                    is_finding_muted_args["subscription_id"] = (
-                        global_provider.identity.subscriptions.get(finding.subscription)
+            with profiler.span(
+                MUTELIST_SPAN, check.CheckID, findings=len(check_findings)
+            ):
+                for finding in check_findings:
+                    if global_provider.type == "azure":
+                        is_finding_muted_args["subscription_id"] = (
+                            global_provider.identity.subscriptions.get(
+                                finding.subscription
+                            )
+                        )
+                    is_finding_muted_args["finding"] = finding
+                    finding.muted = global_provider.mutelist.is_finding_muted(
+                        **is_finding_muted_args
                     )
-                is_finding_muted_args["finding"] = finding
-                finding.muted = global_provider.mutelist.is_finding_muted(
-                    **is_finding_muted_args
-                )
 
     except ModuleNotFoundError:
         logger.error(
@@ -1,6 +1,11 @@
 import importlib
+import os
+import re
 import sys
-from pkgutil import walk_packages
+from functools import lru_cache
+from importlib.util import find_spec
+from pkgutil import iter_modules, walk_packages
+from typing import Optional
 
 from prowler.lib.logger import logger
 
@@ -56,10 +61,84 @@ def list_modules(provider: str, service: str):
     module_path = f"prowler.providers.{provider_directory}.services"
     if service:
         module_path += f".{service}"
-    return walk_packages(
-        importlib.import_module(module_path).__path__,
-        importlib.import_module(module_path).__name__ + ".",
-    )
+    module_spec = find_spec(module_path)
+    if module_spec is None:
+        raise ModuleNotFoundError(f"No module named '{module_path}'", name=module_path)
+    return walk_modules(module_spec.submodule_search_locations, module_path + ".")
+
+
+def walk_modules(path: list, prefix: str):
+    """
+    Yield the modules under the given path like pkgutil.walk_packages, but
+    without importing every package to discover its submodules.
+
+    Importing all the service and check packages is the slowest part of the
+    check discovery, and only the module names and locations are needed.
+    """
+    for module_info in iter_modules(path, prefix):
+        yield module_info
+        if module_info.ispkg:
+            package_name = module_info.name.rsplit(".", 1)[-1]
+            yield from walk_modules(
+                [os.path.join(module_info.module_finder.path, package_name)],
+                module_info.name + ".",
+            )
+
+
+# Attribute reads in a check source, e.g. s3_client.buckets or bucket.versioning
+ATTRIBUTE_ACCESS_PATTERN = re.compile(r"\.\s*([A-Za-z_][A-Za-z0-9_]*)")
+
+
+def get_checks_attributes(provider: str, checks: list) -> Optional[frozenset]:
+    """
+    get_checks_attributes returns the names of the attributes read by the given checks
+
+    The names are parsed from the checks source without importing them. The result is
+    a superset of the attributes really read, since any ".name" in a check counts.
+
+    Returns None if there are no checks or the source of any of them is not found,
+    meaning that every attribute can be read
+    """
+    if not checks or not isinstance(checks, (list, set, tuple)):
+        return None
+    return _get_checks_attributes(provider, tuple(sorted(set(checks))))
+
+
+@lru_cache(maxsize=None)
+def _get_checks_attributes(provider: str, checks: tuple) -> Optional[frozenset]:
+    attributes = set()
+    for check in checks:
+        check_attributes = _get_check_attributes(provider, check)
+        if check_attributes is None:
+            return None
+        attributes.update(check_attributes)
+    return frozenset(attributes)
+
+
+@lru_cache(maxsize=None)
+def _get_check_attributes(provider: str, check: str) -> Optional[frozenset]:
+    try:
+        provider_directory_map = {
+            "oci": "oraclecloud",  # OCI SDK conflict avoidance
+        }
+        provider_directory = provider_directory_map.get(provider, provider)
+        # Format: "prowler.providers.{provider}.services.{service}.{check_name}.{check_name}"
+        service = check.split("_")[0]
+        module_spec = find_spec(
+            f"prowler.providers.{provider_directory}.services.{service}"
+        )
+        if module_spec is None:
+            return None
+        check_file = os.path.join(
+            module_spec.submodule_search_locations[0], check, f"{check}.py"
+        )
+        with open(check_file, encoding="utf-8") as source:
+            return frozenset(ATTRIBUTE_ACCESS_PATTERN.findall(source.read()))
+    except Exception as error:
+        logger.debug(
+            f"Attributes of check {check} not found -- {error.__class__.__name__}: {error}"
+        )
+        return None
 
 
 def recover_checks_from_service(service_list: list, provider: str) -> set:
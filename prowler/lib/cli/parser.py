@@ -5,6 +5,7 @@ from argparse import RawTextHelpFormatter
 from dashboard.lib.arguments.arguments import init_dashboard_parser
 from prowler.config.config import (
     available_compliance_frameworks,
+    available_output_compressions,
     available_output_formats,
     check_current_version,
     default_config_file_path,
@@ -13,6 +14,8 @@ from prowler.config.config import (
 )
 from prowler.lib.check.models import Severity
 from prowler.lib.outputs.common import Status
+from prowler.lib.outputs.compression import is_compression_available
+from prowler.lib.outputs.parquet.parquet import is_parquet_available
 from prowler.providers.common.arguments import (
     init_providers_parser,
     validate_provider_arguments,
@@ -68,6 +71,7 @@ Detailed documentation at https://docs.prowler.com
 
         self.__init_outputs_parser__()
         self.__init_logging_parser__()
+        self.__init_record_replay_parser__()
         self.__init_checks_parser__()
         self.__init_exclude_checks_parser__()
         self.__init_list_checks_parser__()
@@ -127,6 +131,36 @@ Detailed documentation at https://docs.prowler.com
         if args.provider != "dashboard" and (args.only_logs or args.list_checks_json):
             args.no_banner = True
 
+        # Record/Replay Configuration
+        if args.provider != "dashboard" and (
+            args.replay_latency or args.replay_throttling_rate
+        ):
+            if not args.replay_cassette:
+                self.parser.error(
+                    "--replay-latency and --replay-throttling-rate require --replay-cassette."
+                )
+            if args.replay_latency < 0 or not 0 <= args.replay_throttling_rate <= 1:
+                self.parser.error(
+                    "--replay-latency must be positive and --replay-throttling-rate between 0 and 1."
+                )
+
+        # Output Compression Configuration
+        if getattr(args, "output_compression", None) and not is_compression_available(
+            args.output_compression
+        ):
+            self.parser.error(
+                f"--output-compression {args.output_compression} requires the zstandard package to be installed, install it with: pip install prowler[zstd]"
+            )
+
+        # Parquet Output Configuration
+        if (
+            "parquet" in (getattr(args, "output_formats", None) or [])
+            and not is_parquet_available()
+        ):
+            self.parser.error(
+                "--output-formats parquet requires the pyarrow package to be installed, install it with: pip install prowler[parquet]"
+            )
+
         # Extra validation for provider arguments
         valid, message = validate_provider_arguments(args)
         if not valid:
@@ -175,6 +209,11 @@ Detailed documentation at https://docs.prowler.com
             help="Custom output directory, by default the folder where Prowler is stored",
             default=default_output_directory,
         )
+        common_outputs_parser.add_argument(
+            "--output-compression",
+            choices=available_output_compressions,
+            help="Compress the output files while they are written",
+        )
         common_outputs_parser.add_argument(
             "--verbose",
             action="store_true",
@@ -224,6 +263,44 @@ Detailed documentation at https://docs.prowler.com
             action="store_true",
             help="Print only Prowler logs by the stdout. This option sets --no-banner.",
         )
+        common_logging_parser.add_argument(
+            "--performance-report",
+            action="store_true",
+            help="Record the time spent initializing services, running checks, generating outputs and calling the cloud APIs. The spans are saved in OTLP JSON format in the output directory and the slowest ones are printed at the end of the scan.",
+        )
+
+    def __init_record_replay_parser__(self):
+        # Record/Replay Options
+        record_replay_parser = self.common_providers_parser.add_argument_group(
+            "Record/Replay"
+        )
+        cassette_parser = record_replay_parser.add_mutually_exclusive_group()
+        cassette_parser.add_argument(
+            "--record-cassette",
+            default=None,
+            metavar="CASSETTE_FILE",
+            help="Record the responses of the provider APIs during the scan in a gzip compressed cassette file, e.g. aws.cassette.jsonl.gz. Credentials returned by the APIs (tokens, secret keys, session tokens, cookies) are redacted, but the file holds the rest of the account data and must be stored as securely as the scan results.",
+        )
+        cassette_parser.add_argument(
+            "--replay-cassette",
+            default=None,
+            metavar="CASSETTE_FILE",
+            help="Run the scan offline serving the provider API responses from a cassette file recorded with --record-cassette.",
+        )
+        record_replay_parser.add_argument(
+            "--replay-latency",
+            type=float,
+            default=0.0,
+            metavar="SECONDS",
+            help="Seconds to wait before serving every replayed response, to simulate the network latency. Default: 0",
+        )
+        record_replay_parser.add_argument(
+            "--replay-throttling-rate",
+            type=float,
+            default=0.0,
+            metavar="RATE",
+            help="Rate, from 0 to 1, of replayed requests answered with a throttling error, so the SDK retries them. Default: 0",
+        )
 
     def __init_exclude_checks_parser__(self):
         # Exclude checks options
@@ -1,5 +1,4 @@
 from json import dump
-from os import SEEK_SET
 from typing import Optional
 
 from pydantic.v1 import BaseModel, validator
@@ -126,7 +125,7 @@ class ASFF(Output):
         """
         Writes the findings data to a file in JSON ASFF format.
 
-        This method iterates over the findings data stored in the '_data' attribute and writes it to the file descriptor '_file_descriptor' in JSON format. It starts by writing the JSON opening/header '[', then iterates over each finding, dumping it to the file with an indent of 4 spaces. After writing all findings, it writes the closing ']' to complete the JSON array structure. Finally, it closes the file descriptor.
+        This method iterates over the findings data stored in the '_data' attribute and writes it to the file descriptor '_file_descriptor' in JSON format. It starts by writing the JSON opening/header '[', then iterates over each finding, dumping it to the file without indentation after a comma separating it from the previous one. After writing all findings, it writes the closing ']' to complete the JSON array structure. Finally, it closes the file descriptor.
 
         Returns:
             None
@@ -140,23 +139,19 @@ class ASFF(Output):
                 # Write JSON opening/header [
                 self._file_descriptor.write("[")
 
-                # Write findings
+                # Write findings, separated by commas written before each one
+                separator = ""
                 for finding in self._data:
+                    self._file_descriptor.write(separator)
                     dump(
                         finding.dict(exclude_none=True),
                         self._file_descriptor,
-                        indent=4,
+                        separators=(",", ":"),
                     )
-                    self._file_descriptor.write(",")
+                    separator = ","
 
                 # Write footer/closing ]
-                if self._file_descriptor.tell() > 0:
-                    if self._file_descriptor.tell() != 1:
-                        self._file_descriptor.seek(
-                            self._file_descriptor.tell() - 1, SEEK_SET
-                        )
-                    self._file_descriptor.truncate()
-                    self._file_descriptor.write("]")
+                self._file_descriptor.write("]")
 
                 # Close file descriptor
                 self._file_descriptor.close()
@@ -4,8 +4,10 @@ from typing import List
 
 from prowler.lib.check.compliance_models import Compliance
 from prowler.lib.logger import logger
+from prowler.lib.outputs.compression import COMPRESSION_FILE_EXTENSIONS
 from prowler.lib.outputs.finding import Finding
 from prowler.lib.outputs.output import Output
+from prowler.lib.profiler import OUTPUT_SPAN, profiler
 
 
 class ComplianceOutput(Output):
@@ -32,6 +34,7 @@ class ComplianceOutput(Output):
         file_path: str = None,
         file_extension: str = "",
         from_cli: bool = True,
+        compression: str = None,
     ) -> None:
         # TODO: This class needs to be refactored to use the Output class init, methods and properties
         self._data = []
@@ -40,6 +43,7 @@ class ComplianceOutput(Output):
         self.file_descriptor = None
         # This parameter is to avoid refactoring more code, the CLI does not write in batches, the API does
         self._from_cli = from_cli
+        self.compression = compression
 
         if not file_extension and file_path:
             # Compliance reports are always CSV, so just use the last suffix
@@ -49,6 +53,10 @@ class ComplianceOutput(Output):
         if file_extension:
             self._file_extension = file_extension
             self.file_path = f"{file_path}{self.file_extension}"
+        if compression and self.file_path:
+            self.file_path = (
+                f"{self.file_path}{COMPRESSION_FILE_EXTENSIONS[compression]}"
+            )
 
         if findings:
             # Get the compliance name of the model
@@ -57,7 +65,13 @@ class ComplianceOutput(Output):
                 if compliance.Version
                 else compliance.Framework
             )
-            self.transform(findings, compliance, compliance_name)
+            with profiler.span(
+                OUTPUT_SPAN,
+                f"{self.__class__.__name__}.transform",
+                compliance=compliance_name,
+                findings=len(findings),
+            ):
+                self.transform(findings, compliance, compliance_name)
             if not self._file_descriptor and file_path:
                 self.create_file_descriptor(self.file_path)
 
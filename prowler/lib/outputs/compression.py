@@ -0,0 +1,75 @@
+import gzip
+import os
+
+from prowler.config.config import encoding_format_utf_8
+
+# File extension added to the outputs by compression algorithm
+COMPRESSION_FILE_EXTENSIONS = {"gzip": ".gz", "zstd": ".zst"}
+
+
+class CompressedTextFile:
+    """
+    Text file compressed while it is written.
+
+    It offers the file methods used by the outputs, so they can write to it as
+    to a plain text file. tell() returns the characters written, which lets the
+    outputs know if nothing was written yet, since the compressed stream
+    cannot be positioned. Appending to an existing file adds a new gzip member
+    or zstd frame, both read back as a single stream.
+
+    Usage:
+        file_descriptor = CompressedTextFile("output.csv.gz", "gzip")
+        file_descriptor.write("header\\n")
+        file_descriptor.close()
+    """
+
+    def __init__(self, file_path: str, compression: str, mode: str = "a") -> None:
+        self.name = file_path
+        # An existing file is not empty, its uncompressed size is not known
+        self._position = (
+            os.path.getsize(file_path)
+            if mode.startswith("a") and os.path.exists(file_path)
+            else 0
+        )
+        self._file = open(file_path, f"{mode[0]}b")
+        if compression == "gzip":
+            self._stream = gzip.GzipFile(fileobj=self._file, mode=f"{mode[0]}b")
+        elif compression == "zstd":
+            import zstandard
+
+            self._stream = zstandard.ZstdCompressor().stream_writer(
+                self._file, closefd=False
+            )
+        else:
+            self._file.close()
+            raise ValueError(f"Unsupported output compression {compression}")
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def write(self, data: str) -> int:
+        self._stream.write(data.encode(encoding_format_utf_8))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._stream.close()
+            self._file.close()
+
+
+def is_compression_available(compression: str) -> bool:
+    """Check if the libraries needed by the compression algorithm are installed"""
+    if compression == "zstd":
+        try:
+            import zstandard  # noqa: F401
+        except ImportError:
+            return False
+    return compression in COMPRESSION_FILE_EXTENSIONS
@@ -367,7 +367,9 @@ class Finding(BaseModel):
             raise error
 
     @classmethod
-    def transform_api_finding(cls, finding, provider) -> "Finding":
+    def transform_api_finding(
+        cls, finding, provider, check_metadata_cache: dict = None
+    ) -> "Finding":
         """
         Transform a FindingModel instance into an API-friendly Finding object.
 
@@ -381,12 +383,16 @@ class Finding(BaseModel):
         Args:
             finding (API Finding): An API Finding instance containing data from the database.
             provider (Provider): the provider object.
+            check_metadata_cache (dict, optional): CheckMetadata objects already built, keyed by the
+                check metadata entry of the findings, or by their serialized metadata if they have no entry.
+                When given, each check metadata is built once and shared by the findings that have it.
 
         Returns:
             Finding: A new Finding instance populated with data from the provided model.
         """
         # Missing Finding's API values
-        resource = finding.resources.first()
+        # Use all() instead of first() to reuse the prefetched resources, if any
+        resource = finding.resources.all()[0]
         finding.resource_arn = resource.uid
         finding.resource_name = resource.name
         finding.resource = json.loads(resource.metadata)
@@ -410,47 +416,70 @@ class Finding(BaseModel):
         elif provider.type == "oci":
             finding.compartment_id = getattr(finding, "compartment_id", "")
 
-        finding.check_metadata = CheckMetadata(
-            Provider=finding.check_metadata["provider"],
-            CheckID=finding.check_metadata["checkid"],
-            CheckTitle=finding.check_metadata["checktitle"],
-            CheckType=finding.check_metadata["checktype"],
-            ServiceName=finding.check_metadata["servicename"],
-            SubServiceName=finding.check_metadata["subservicename"],
-            Severity=finding.check_metadata["severity"],
-            ResourceType=finding.check_metadata["resourcetype"],
-            Description=finding.check_metadata["description"],
-            Risk=finding.check_metadata["risk"],
-            RelatedUrl=finding.check_metadata["relatedurl"],
+        # Checks can set a different severity for each finding, so the metadata
+        # is not shared by check ID
+        check_metadata_key = None
+        if check_metadata_cache is not None:
+            check_metadata_key = getattr(finding, "check_metadata_entry_id", None)
+            if check_metadata_key is None:
+                check_metadata_key = json.dumps(
+                    finding.check_metadata, sort_keys=True, default=str
+                )
+        if check_metadata_key in (check_metadata_cache or {}):
+            finding.check_metadata = check_metadata_cache[check_metadata_key]
+        else:
+            finding.check_metadata = cls._transform_api_check_metadata(
+                finding.check_metadata
+            )
+            if check_metadata_cache is not None:
+                check_metadata_cache[check_metadata_key] = finding.check_metadata
+        finding.resource_tags = unroll_tags(
+            [{"key": tag.key, "value": tag.value} for tag in resource.tags.all()]
+        )
+
+        return cls.generate_output(provider, finding, SimpleNamespace())
+
+    @staticmethod
+    def _transform_api_check_metadata(check_metadata: dict) -> CheckMetadata:
+        """
+        Build a CheckMetadata object from the check metadata stored in an API Finding.
+
+        Args:
+            check_metadata (dict): The check metadata with lowercase keys, as stored by the API.
+
+        Returns:
+            CheckMetadata: The check metadata object.
+        """
+        return CheckMetadata(
+            Provider=check_metadata["provider"],
+            CheckID=check_metadata["checkid"],
+            CheckTitle=check_metadata["checktitle"],
+            CheckType=check_metadata["checktype"],
+            ServiceName=check_metadata["servicename"],
+            SubServiceName=check_metadata["subservicename"],
+            Severity=check_metadata["severity"],
+            ResourceType=check_metadata["resourcetype"],
+            Description=check_metadata["description"],
+            Risk=check_metadata["risk"],
+            RelatedUrl=check_metadata["relatedurl"],
             Remediation=Remediation(
                 Recommendation=Recommendation(
-                    Text=finding.check_metadata["remediation"]["recommendation"][
-                        "text"
-                    ],
-                    Url=finding.check_metadata["remediation"]["recommendation"]["url"],
+                    Text=check_metadata["remediation"]["recommendation"]["text"],
+                    Url=check_metadata["remediation"]["recommendation"]["url"],
                 ),
                 Code=Code(
-                    NativeIaC=finding.check_metadata["remediation"]["code"][
-                        "nativeiac"
-                    ],
-                    Terraform=finding.check_metadata["remediation"]["code"][
-                        "terraform"
-                    ],
-                    CLI=finding.check_metadata["remediation"]["code"]["cli"],
-                    Other=finding.check_metadata["remediation"]["code"]["other"],
+                    NativeIaC=check_metadata["remediation"]["code"]["nativeiac"],
+                    Terraform=check_metadata["remediation"]["code"]["terraform"],
+                    CLI=check_metadata["remediation"]["code"]["cli"],
+                    Other=check_metadata["remediation"]["code"]["other"],
                 ),
             ),
-            ResourceIdTemplate=finding.check_metadata["resourceidtemplate"],
-            Categories=finding.check_metadata["categories"],
-            DependsOn=finding.check_metadata["dependson"],
-            RelatedTo=finding.check_metadata["relatedto"],
-            Notes=finding.check_metadata["notes"],
+            ResourceIdTemplate=check_metadata["resourceidtemplate"],
+            Categories=check_metadata["categories"],
+            DependsOn=check_metadata["dependson"],
+            RelatedTo=check_metadata["relatedto"],
+            Notes=check_metadata["notes"],
         )
-        finding.resource_tags = unroll_tags(
-            [{"key": tag.key, "value": tag.value} for tag in resource.tags.all()]
-        )
-
-        return cls.generate_output(provider, finding, SimpleNamespace())
 
     def _transform_findings_stats(scan_summaries: list[dict]) -> dict:
         """
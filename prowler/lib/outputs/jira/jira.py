@@ -1,5 +1,7 @@
 import base64
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
@@ -8,6 +10,7 @@ import requests
 import requests.compat
 from markdown_it import MarkdownIt
 from markdown_it.token import Token
+from requests.adapters import HTTPAdapter
 
 from prowler.lib.logger import logger
 from prowler.lib.outputs.finding import Finding
@@ -37,6 +40,14 @@ from prowler.lib.outputs.jira.exceptions.exceptions import (
 )
 from prowler.providers.common.models import Connection
 
+# Issues created concurrently by send_findings, also the size of the connection pool
+MAX_WORKERS = 5
+# Maximum number of issues accepted by the Jira bulk create endpoint
+BULK_CREATE_BATCH_SIZE = 50
+MAX_RETRIES = 5
+# Status codes returned by Jira when the request has to be retried later
+RETRYABLE_STATUS_CODES = (429, 503)
+
 
 @dataclass
 class JiraConnection(Connection):
@@ -280,6 +291,7 @@ class Jira:
         - get_projects: Get the projects from Jira
         - get_available_issue_types: Get the available issue types for a project
         - get_available_issue_labels: Get the available labels for a project
+        - get_open_issue_summaries: Get the summaries of the open Prowler issues of a project
         - send_findings: Send the findings to Jira and create an issue
 
     Raises:
@@ -325,6 +337,8 @@ class Jira:
     _expiration_date: int = None
     _cloud_id: str = None
     _scopes: list[str] = None
+    _http_session: requests.Session = None
+    _bulk_create_supported: bool = True
     AUTH_URL = "https://auth.atlassian.com/authorize"
     PARAMS_TEMPLATE = {
         "audience": "api.atlassian.com",
@@ -445,6 +459,51 @@ class Jira:
     def using_basic_auth(self):
         return self._using_basic_auth
 
+    @property
+    def http_session(self) -> requests.Session:
+        """Keep-alive HTTP session with a connection pool sized for the concurrent issue creation"""
+        if self._http_session is None:
+            http_session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS)
+            http_session.mount("https://", adapter)
+            self._http_session = http_session
+        return self._http_session
+
+    def _post(
+        self,
+        url: str,
+        payload: dict,
+        headers: dict,
+        max_retries: int = MAX_RETRIES,
+        retry_delay: float = 1,
+    ) -> requests.Response:
+        """Send a POST request through the pooled session, retrying throttled responses
+
+        Args:
+            url: The URL of the request
+            payload: The JSON body of the request
+            headers: Headers for the request
+            max_retries: Maximum number of retries
+            retry_delay: Delay between retries in seconds, the Retry-After header of throttled responses takes precedence
+
+        Returns:
+            requests.Response: The last response received
+        """
+        for attempt in range(max_retries + 1):
+            response = self.http_session.post(url, json=payload, headers=headers)
+            if (
+                response.status_code not in RETRYABLE_STATUS_CODES
+                or attempt == max_retries
+            ):
+                return response
+            wait_seconds = _retry_after(response, retry_delay)
+            logger.warning(
+                f"Jira throttled the request to {url}, retrying in {wait_seconds} seconds..."
+            )
+            time.sleep(wait_seconds)
+            retry_delay *= 2
+        return response
+
     def get_headers(
         self, access_token: str = None, content_type_json: bool = False
     ) -> dict:
@@ -1782,6 +1841,168 @@ class Jira:
             ],
         }
 
+    def get_open_issue_summaries(self, project_key: str, headers: dict) -> set[str]:
+        """
+        Get the summaries of the open Prowler issues of a project with a single paginated JQL search
+
+        Args:
+            - project_key: The project key
+            - headers: Headers for the request
+
+        Returns:
+            - The summaries of the open issues created by Prowler, empty if the search fails
+        """
+        summaries = set()
+        body = {
+            "jql": f'project = "{project_key}" AND statusCategory != Done AND summary ~ "Prowler"',
+            "fields": ["summary"],
+            "maxResults": 100,
+        }
+        try:
+            while True:
+                response = self._post(
+                    f"https://api.atlassian.com/ex/jira/{self.cloud_id}/rest/api/3/search/jql",
+                    body,
+                    headers,
+                )
+                if response.status_code != 200:
+                    logger.warning(
+                        f"Failed to search open issues, findings will not be deduplicated: {response.status_code} - {response.text}"
+                    )
+                    return summaries
+                response_json = response.json()
+                for issue in response_json.get("issues", []):
+                    summary = issue.get("fields", {}).get("summary")
+                    if summary and summary.startswith("[Prowler]"):
+                        summaries.add(summary)
+                next_page_token = response_json.get("nextPageToken")
+                if response_json.get("isLast", True) or not next_page_token:
+                    return summaries
+                body["nextPageToken"] = next_page_token
+        except Exception as e:
+            logger.warning(
+                f"Failed to search open issues, findings will not be deduplicated: {e}"
+            )
+            return summaries
+
+    def _build_finding_payload(
+        self,
+        finding: Finding,
+        project_key: str,
+        issue_type: str,
+        issue_labels: list[str],
+        finding_url: str,
+        tenant_info: str,
+    ) -> dict:
+        """Build the create issue payload of a finding"""
+        status_color = self.get_color_from_status(finding.status.value)
+        severity_color = self.get_severity_color(
+            finding.metadata.Severity.value.lower()
+        )
+        adf_description = self.get_adf_description(
+            check_id=finding.metadata.CheckID,
+            check_title=finding.metadata.CheckTitle,
+            severity=finding.metadata.Severity.value.upper(),
+            severity_color=severity_color,
+            status=finding.status.value,
+            status_color=status_color,
+            status_extended=finding.status_extended,
+            provider=finding.metadata.Provider,
+            region=finding.region,
+            resource_uid=finding.resource_uid,
+            resource_name=finding.resource_name,
+            risk=finding.metadata.Risk,
+            recommendation_text=finding.metadata.Remediation.Recommendation.Text,
+            recommendation_url=finding.metadata.Remediation.Recommendation.Url,
+            remediation_code_native_iac=finding.metadata.Remediation.Code.NativeIaC,
+            remediation_code_terraform=finding.metadata.Remediation.Code.Terraform,
+            remediation_code_cli=finding.metadata.Remediation.Code.CLI,
+            remediation_code_other=finding.metadata.Remediation.Code.Other,
+            resource_tags=finding.resource_tags,
+            compliance=finding.compliance,
+            finding_url=finding_url,
+            tenant_info=tenant_info,
+        )
+        payload = {
+            "fields": {
+                "project": {"key": project_key},
+                "summary": f"[Prowler] {finding.metadata.Severity.value.upper()} - {finding.metadata.CheckID} - {finding.resource_uid}",
+                "description": adf_description,
+                "issuetype": {"name": issue_type},
+                "customfield_10148": {"value": "SDK"},
+                "customfield_10088": {"value": "Core"},
+            }
+        }
+        if issue_labels:
+            payload["fields"]["labels"] = issue_labels
+        return payload
+
+    def _create_issues(self, payloads: list[dict], headers: dict) -> list[dict]:
+        """
+        Create a batch of issues with the bulk create endpoint, or one by one if it is not available
+
+        Args:
+            - payloads: The create issue payloads, at most BULK_CREATE_BATCH_SIZE
+            - headers: Headers for the requests
+
+        Returns:
+            - The errors of the issues that could not be created, as dicts with status, errors and errorMessages
+        """
+        if self._bulk_create_supported:
+            response = self._post(
+                f"https://api.atlassian.com/ex/jira/{self.cloud_id}/rest/api/3/issue/bulk",
+                {"issueUpdates": payloads},
+                headers,
+            )
+            if response.status_code in (404, 405):
+                logger.warning(
+                    "Jira bulk issue creation is not available, creating issues one by one"
+                )
+                self._bulk_create_supported = False
+            else:
+                response_json = _response_json(response)
+                if response_json is None:
+                    if response.status_code == 201:
+                        return []
+                    return [
+                        _issue_error(response.status_code, {}, response.text)
+                    ] * len(payloads)
+                errors = response_json.get("errors", [])
+                if isinstance(errors, dict):
+                    # The whole request was rejected with the single issue error format
+                    return [_issue_error(response.status_code, response_json)] * len(
+                        payloads
+                    )
+                failures = [
+                    _issue_error(error.get("status"), error.get("elementErrors", {}))
+                    for error in errors
+                ]
+                if response.status_code not in (200, 201) and not failures:
+                    failures = [
+                        _issue_error(response.status_code, {}, str(response_json))
+                    ] * len(payloads)
+                for issue in response_json.get("issues", []):
+                    logger.info(f"Finding sent successfully: {issue}")
+                return failures
+
+        failures = []
+        for payload in payloads:
+            response = self._post(
+                f"https://api.atlassian.com/ex/jira/{self.cloud_id}/rest/api/3/issue",
+                payload,
+                headers,
+            )
+            response_json = _response_json(response)
+            if response.status_code == 201:
+                logger.info(
+                    f"Finding sent successfully: {response_json or response.status_code}"
+                )
+            elif response_json is None:
+                failures.append(_issue_error(response.status_code, {}, response.text))
+            else:
+                failures.append(_issue_error(response.status_code, response_json))
+        return failures
+
     def send_findings(
         self,
         findings: list[Finding] = None,
@@ -1790,10 +2011,14 @@ class Jira:
         issue_labels: list[str] = None,
         finding_url: str = None,
         tenant_info: str = None,
-    ):
+        deduplicate: bool = True,
+    ) -> int:
         """
         Send the findings to Jira
 
+        The issues are created concurrently in batches through the bulk create endpoint,
+        falling back to one request per issue if the endpoint is not available.
+
         Args:
             - findings: The findings to send
             - project_key: The project key
@@ -1801,6 +2026,10 @@ class Jira:
             - issue_labels: The issue labels
             - finding_url: The finding URL
             - tenant_info: The tenant info
+            - deduplicate: Skip the findings that already have an open issue with the same summary, retrieved with a single JQL search
+
+        Returns:
+            - The number of issues created
 
         Raises:
             - JiraRefreshTokenError: Failed to refresh the access token
@@ -1837,109 +2066,69 @@ class Jira:
 
             headers = self.get_headers(access_token, content_type_json=True)
 
+            open_issue_summaries = (
+                self.get_open_issue_summaries(project_key, headers)
+                if deduplicate
+                else set()
+            )
+
+            payloads = []
             for finding in findings:
-                status_color = self.get_color_from_status(finding.status.value)
-                severity_color = self.get_severity_color(
-                    finding.metadata.Severity.value.lower()
-                )
-                adf_description = self.get_adf_description(
-                    check_id=finding.metadata.CheckID,
-                    check_title=finding.metadata.CheckTitle,
-                    severity=finding.metadata.Severity.value.upper(),
-                    severity_color=severity_color,
-                    status=finding.status.value,
-                    status_color=status_color,
-                    status_extended=finding.status_extended,
-                    provider=finding.metadata.Provider,
-                    region=finding.region,
-                    resource_uid=finding.resource_uid,
-                    resource_name=finding.resource_name,
-                    risk=finding.metadata.Risk,
-                    recommendation_text=finding.metadata.Remediation.Recommendation.Text,
-                    recommendation_url=finding.metadata.Remediation.Recommendation.Url,
-                    remediation_code_native_iac=finding.metadata.Remediation.Code.NativeIaC,
-                    remediation_code_terraform=finding.metadata.Remediation.Code.Terraform,
-                    remediation_code_cli=finding.metadata.Remediation.Code.CLI,
-                    remediation_code_other=finding.metadata.Remediation.Code.Other,
-                    resource_tags=finding.resource_tags,
-                    compliance=finding.compliance,
+                payload = self._build_finding_payload(
+                    finding=finding,
+                    project_key=project_key,
+                    issue_type=issue_type,
+                    issue_labels=issue_labels,
                     finding_url=finding_url,
                     tenant_info=tenant_info,
                 )
-                summary_parts = ["[Prowler]"]
-                if finding.metadata.Severity.value:
-                    summary_parts.append(finding.metadata.Severity.value.upper())
-                if finding.metadata.CheckID:
-                    summary_parts.append(finding.metadata.CheckID)
-                if finding.resource_uid:
-                    summary_parts.append(finding.resource_uid)
-
-                summary = " - ".join(summary_parts[1:])
-                summary = f"{summary_parts[0]} {summary}"
-
-                payload = {
-                    "fields": {
-                        "project": {"key": project_key},
-                        "summary": f"[Prowler] {finding.metadata.Severity.value.upper()} - {finding.metadata.CheckID} - {finding.resource_uid}",
-                        "description": adf_description,
-                        "issuetype": {"name": issue_type},
-                        "customfield_10148": {"value": "SDK"},
-                        "customfield_10088": {"value": "Core"},
-                    }
-                }
-                if issue_labels:
-                    payload["fields"]["labels"] = issue_labels
-
-                response = requests.post(
-                    f"https://api.atlassian.com/ex/jira/{self.cloud_id}/rest/api/3/issue",
-                    json=payload,
-                    headers=headers,
-                )
-
-                if response.status_code != 201:
-                    try:
-                        response_json = response.json()
-                    except (ValueError, requests.exceptions.JSONDecodeError):
-                        response_error = f"Failed to send finding: {response.status_code} - {response.text}"
-                        logger.error(response_error)
-                        raise JiraSendFindingsResponseError(
-                            message=response_error, file=os.path.basename(__file__)
-                        )
-
-                    # Check if the error is due to required custom fields
-                    if response.status_code == 400 and "errors" in response_json:
-                        errors = response_json.get("errors", {})
-                        # Look for custom field errors (fields starting with "customfield_")
-                        custom_field_errors = {
+                summary = payload["fields"]["summary"]
+                if summary in open_issue_summaries:
+                    logger.info(f"Skipping finding with an open Jira issue: {summary}")
+                    continue
+                if deduplicate:
+                    open_issue_summaries.add(summary)
+                payloads.append(payload)
+
+            batches = [
+                payloads[i : i + BULK_CREATE_BATCH_SIZE]
+                for i in range(0, len(payloads), BULK_CREATE_BATCH_SIZE)
+            ]
+            failures = []
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as thread_pool:
+                for batch_failures in thread_pool.map(
+                    lambda batch: self._create_issues(batch, headers), batches
+                ):
+                    failures.extend(batch_failures)
+
+            if failures:
+                custom_field_errors = {}
+                for failure in failures:
+                    # Look for custom field errors (fields starting with "customfield_")
+                    custom_field_errors.update(
+                        {
                             k: v
-                            for k, v in errors.items()
+                            for k, v in failure.get("errors", {}).items()
                             if k.startswith("customfield_")
                         }
-                        if custom_field_errors:
-                            custom_fields_formatted = ", ".join(
-                                [
-                                    f"'{k}': '{v}'"
-                                    for k, v in custom_field_errors.items()
-                                ]
-                            )
-                            raise JiraRequiredCustomFieldsError(
-                                message=f"Jira project requires custom fields that are not supported: {custom_fields_formatted}",
-                                file=os.path.basename(__file__),
-                            )
-
-                    response_error = f"Failed to send finding: {response.status_code} - {response_json}"
-                    logger.error(response_error)
-                    raise JiraSendFindingsResponseError(
-                        message=response_error, file=os.path.basename(__file__)
                     )
-                else:
-                    try:
-                        response_json = response.json()
-                        logger.info(f"Finding sent successfully: {response_json}")
-                    except (ValueError, requests.exceptions.JSONDecodeError):
-                        logger.info(
-                            f"Finding sent successfully: Status {response.status_code}"
-                        )
+                if custom_field_errors:
+                    custom_fields_formatted = ", ".join(
+                        [f"'{k}': '{v}'" for k, v in custom_field_errors.items()]
+                    )
+                    raise JiraRequiredCustomFieldsError(
+                        message=f"Jira project requires custom fields that are not supported: {custom_fields_formatted}",
+                        file=os.path.basename(__file__),
+                    )
+
+                response_error = f"Failed to send {len(failures)} of {len(payloads)} findings: {failures[0]}"
+                logger.error(response_error)
+                raise JiraSendFindingsResponseError(
+                    message=response_error, file=os.path.basename(__file__)
+                )
+
+            logger.info(f"{len(payloads)} findings sent successfully")
+            return len(payloads)
         except JiraRequiredCustomFieldsError as custom_fields_error:
             raise custom_fields_error
         except JiraRefreshTokenError as refresh_error:
@@ -2094,10 +2283,10 @@ class Jira:
             if issue_labels:
                 payload["fields"]["labels"] = issue_labels
 
-            response = requests.post(
+            response = self._post(
                 f"https://api.atlassian.com/ex/jira/{self.cloud_id}/rest/api/3/issue",
-                json=payload,
-                headers=headers,
+                payload,
+                headers,
             )
 
             if response.status_code != 201:
@@ -2150,3 +2339,31 @@ class Jira:
         except Exception as e:
             logger.error(f"Failed to send finding: {e}")
             return False
+
+
+def _retry_after(response: requests.Response, default: float) -> float:
+    """Seconds to wait before retrying a throttled response"""
+    try:
+        return float(response.headers.get("Retry-After", default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _response_json(response: requests.Response) -> Optional[dict]:
+    """JSON body of a response, None if it is not valid JSON"""
+    try:
+        return response.json()
+    except (ValueError, requests.exceptions.JSONDecodeError):
+        return None
+
+
+def _issue_error(status: int, errors: dict, message: str = None) -> dict:
+    """Normalize the error of an issue that could not be created"""
+    error_messages = list(errors.get("errorMessages", []))
+    if message:
+        error_messages.append(message)
+    return {
+        "status": status,
+        "errors": errors.get("errors", {}) or {},
+        "errorMessages": error_messages,
+    }
@@ -1,5 +1,5 @@
-import os
-from datetime import datetime
+import json
+from datetime import datetime, timezone
 from typing import List
 
 from py_ocsf_models.events.base_event import SeverityID, StatusID
@@ -52,142 +52,148 @@ class OCSF(Output):
         """
         try:
             for finding in findings:
-                finding_activity = ActivityID.Create
-                cloud_account_type = self.get_account_type_id_by_provider(
-                    finding.metadata.Provider
-                )
-                finding_severity = getattr(
-                    SeverityID,
-                    finding.metadata.Severity.capitalize(),
-                    SeverityID.Unknown,
-                )
-                finding_status = self.get_finding_status_id(finding.muted)
-
-                detection_finding = DetectionFinding(
-                    message=finding.status_extended,
-                    activity_id=finding_activity.value,
-                    activity_name=finding_activity.name,
-                    finding_info=FindingInformation(
-                        created_time_dt=finding.timestamp,
-                        created_time=(
-                            int(finding.timestamp.timestamp())
-                            if isinstance(finding.timestamp, datetime)
-                            else finding.timestamp
-                        ),
-                        desc=finding.metadata.Description,
-                        title=finding.metadata.CheckTitle,
-                        uid=finding.uid,
-                        name=finding.resource_name,
-                        types=finding.metadata.CheckType,
-                    ),
-                    time_dt=finding.timestamp,
-                    time=(
-                        int(finding.timestamp.timestamp())
-                        if isinstance(finding.timestamp, datetime)
-                        else finding.timestamp
-                    ),
-                    remediation=Remediation(
-                        desc=finding.metadata.Remediation.Recommendation.Text,
-                        references=list(
-                            filter(
-                                None,
-                                [
-                                    finding.metadata.Remediation.Recommendation.Url,
-                                ],
-                            )
-                        ),
-                    ),
-                    severity_id=finding_severity.value,
-                    severity=finding_severity.name,
-                    status_id=finding_status.value,
-                    status=finding_status.name,
-                    status_code=finding.status,
-                    status_detail=finding.status_extended,
-                    risk_details=finding.metadata.Risk,
-                    resources=(
-                        [
-                            ResourceDetails(
-                                labels=unroll_dict_to_list(finding.resource_tags),
-                                name=finding.resource_name,
-                                uid=finding.resource_uid,
-                                group=Group(name=finding.metadata.ServiceName),
-                                type=finding.metadata.ResourceType,
-                                # TODO: this should be included only if using the Cloud profile
-                                cloud_partition=finding.partition,
-                                region=finding.region,
-                                data={
-                                    "details": finding.resource_details,
-                                    "metadata": finding.resource_metadata,
-                                },
-                            )
-                        ]
-                        if finding.metadata.Provider != "kubernetes"
-                        else [
-                            ResourceDetails(
-                                labels=unroll_dict_to_list(finding.resource_tags),
-                                name=finding.resource_name,
-                                uid=finding.resource_uid,
-                                group=Group(name=finding.metadata.ServiceName),
-                                type=finding.metadata.ResourceType,
-                                data={
-                                    "details": finding.resource_details,
-                                    "metadata": finding.resource_metadata,
-                                },
-                                namespace=finding.region.replace("namespace: ", ""),
-                            )
-                        ]
-                    ),
-                    metadata=Metadata(
-                        event_code=finding.metadata.CheckID,
-                        product=Product(
-                            uid="prowler",
-                            name="Prowler",
-                            vendor_name="Prowler",
-                            version=finding.prowler_version,
-                        ),
-                        profiles=(
-                            ["cloud", "datetime"]
-                            if finding.metadata.Provider != "kubernetes"
-                            else ["container", "datetime"]
-                        ),
-                        tenant_uid=finding.account_organization_uid,
-                    ),
-                    type_uid=DetectionFindingTypeID.Create,
-                    type_name=f"Detection Finding: {DetectionFindingTypeID.Create.name}",
-                    unmapped={
-                        "related_url": finding.metadata.RelatedUrl,
-                        "categories": finding.metadata.Categories,
-                        "depends_on": finding.metadata.DependsOn,
-                        "related_to": finding.metadata.RelatedTo,
-                        "additional_urls": finding.metadata.AdditionalURLs,
-                        "notes": finding.metadata.Notes,
-                        "compliance": finding.compliance,
-                    },
-                )
-                if finding.provider != "kubernetes":
-                    detection_finding.cloud = Cloud(
-                        account=Account(
-                            name=finding.account_name,
-                            type_id=cloud_account_type.value,
-                            type=cloud_account_type.name.replace("_", " "),
-                            uid=finding.account_uid,
-                            labels=unroll_dict_to_list(finding.account_tags),
-                        ),
-                        org=Organization(
-                            uid=finding.account_organization_uid,
-                            name=finding.account_organization_name,
-                            # TODO: add the org unit id and name
-                        ),
-                        provider=finding.provider,
-                        region=finding.region,
-                    )
-
-                self._data.append(detection_finding)
+                self._data.append(self.get_detection_finding(finding))
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    def get_detection_finding(self, finding: Finding) -> DetectionFinding:
+        """Transforms a finding into an OCSF Detection Finding.
+
+        Args:
+            finding (Finding): the Finding object
+
+        Returns:
+            DetectionFinding: the OCSF Detection Finding of the finding
+        """
+        finding_activity = ActivityID.Create
+        cloud_account_type = self.get_account_type_id_by_provider(
+            finding.metadata.Provider
+        )
+        finding_severity = self.get_finding_severity_id(finding.metadata.Severity)
+        finding_status = self.get_finding_status_id(finding.muted)
+
+        detection_finding = DetectionFinding(
+            message=finding.status_extended,
+            activity_id=finding_activity.value,
+            activity_name=finding_activity.name,
+            finding_info=FindingInformation(
+                created_time_dt=finding.timestamp,
+                created_time=(
+                    int(finding.timestamp.timestamp())
+                    if isinstance(finding.timestamp, datetime)
+                    else finding.timestamp
+                ),
+                desc=finding.metadata.Description,
+                title=finding.metadata.CheckTitle,
+                uid=finding.uid,
+                name=finding.resource_name,
+                types=finding.metadata.CheckType,
+            ),
+            time_dt=finding.timestamp,
+            time=(
+                int(finding.timestamp.timestamp())
+                if isinstance(finding.timestamp, datetime)
+                else finding.timestamp
+            ),
+            remediation=Remediation(
+                desc=finding.metadata.Remediation.Recommendation.Text,
+                references=list(
+                    filter(
+                        None,
+                        [
+                            finding.metadata.Remediation.Recommendation.Url,
+                        ],
+                    )
+                ),
+            ),
+            severity_id=finding_severity.value,
+            severity=finding_severity.name,
+            status_id=finding_status.value,
+            status=finding_status.name,
+            status_code=finding.status,
+            status_detail=finding.status_extended,
+            risk_details=finding.metadata.Risk,
+            resources=(
+                [
+                    ResourceDetails(
+                        labels=unroll_dict_to_list(finding.resource_tags),
+                        name=finding.resource_name,
+                        uid=finding.resource_uid,
+                        group=Group(name=finding.metadata.ServiceName),
+                        type=finding.metadata.ResourceType,
+                        # TODO: this should be included only if using the Cloud profile
+                        cloud_partition=finding.partition,
+                        region=finding.region,
+                        data={
+                            "details": finding.resource_details,
+                            "metadata": finding.resource_metadata,
+                        },
+                    )
+                ]
+                if finding.metadata.Provider != "kubernetes"
+                else [
+                    ResourceDetails(
+                        labels=unroll_dict_to_list(finding.resource_tags),
+                        name=finding.resource_name,
+                        uid=finding.resource_uid,
+                        group=Group(name=finding.metadata.ServiceName),
+                        type=finding.metadata.ResourceType,
+                        data={
+                            "details": finding.resource_details,
+                            "metadata": finding.resource_metadata,
+                        },
+                        namespace=finding.region.replace("namespace: ", ""),
+                    )
+                ]
+            ),
+            metadata=Metadata(
+                event_code=finding.metadata.CheckID,
+                product=Product(
+                    uid="prowler",
+                    name="Prowler",
+                    vendor_name="Prowler",
+                    version=finding.prowler_version,
+                ),
+                profiles=(
+                    ["cloud", "datetime"]
+                    if finding.metadata.Provider != "kubernetes"
+                    else ["container", "datetime"]
+                ),
+                tenant_uid=finding.account_organization_uid,
+            ),
+            type_uid=DetectionFindingTypeID.Create,
+            type_name=f"Detection Finding: {DetectionFindingTypeID.Create.name}",
+            unmapped={
+                "related_url": finding.metadata.RelatedUrl,
+                "categories": finding.metadata.Categories,
+                "depends_on": finding.metadata.DependsOn,
+                "related_to": finding.metadata.RelatedTo,
+                "additional_urls": finding.metadata.AdditionalURLs,
+                "notes": finding.metadata.Notes,
+                "compliance": finding.compliance,
+            },
+        )
+        if finding.provider != "kubernetes":
+            detection_finding.cloud = Cloud(
+                account=Account(
+                    name=finding.account_name,
+                    type_id=cloud_account_type.value,
+                    type=cloud_account_type.name.replace("_", " "),
+                    uid=finding.account_uid,
+                    labels=unroll_dict_to_list(finding.account_tags),
+                ),
+                org=Organization(
+                    uid=finding.account_organization_uid,
+                    name=finding.account_organization_name,
+                    # TODO: add the org unit id and name
+                ),
+                provider=finding.provider,
+                region=finding.region,
+            )
+        return detection_finding
+
     def batch_write_data_to_file(self) -> None:
         """Writes the findings to a file using the OCSF format using the `Output._file_descriptor`."""
         try:
@@ -198,22 +204,20 @@ class OCSF(Output):
             ):
                 if self._file_descriptor.tell() == 0:
                     self._file_descriptor.write("[")
+                # Commas are written before the findings, so the file is never moved back
+                # to remove the last one and it can be compressed while it is written
+                separator = "," if self._file_descriptor.tell() > 1 else ""
                 for finding in self._data:
                     try:
                         self._file_descriptor.write(
-                            finding.json(exclude_none=True, indent=4)
+                            separator + finding.json(exclude_none=True)
                         )
-                        self._file_descriptor.write(",")
+                        separator = ","
                     except Exception as error:
                         logger.error(
                             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                         )
                 if self.close_file or self._from_cli:
-                    if self._file_descriptor.tell() != 1:
-                        self._file_descriptor.seek(
-                            self._file_descriptor.tell() - 1, os.SEEK_SET
-                        )
-                    self._file_descriptor.truncate()
                     self._file_descriptor.write("]")
                     self._file_descriptor.close()
         except Exception as error:
@@ -241,6 +245,19 @@ class OCSF(Output):
             type_id = TypeID.GCP_Account
         return type_id
 
+    @staticmethod
+    def get_finding_severity_id(severity: str) -> SeverityID:
+        """
+        Returns the SeverityID based on the severity of the finding.
+
+        Args:
+            severity (str): The severity of the finding
+
+        Returns:
+            SeverityID: The SeverityID of the severity, Unknown if it is not an OCSF severity
+        """
+        return getattr(SeverityID, severity.capitalize(), SeverityID.Unknown)
+
     @staticmethod
     def get_finding_status_id(muted: bool) -> StatusID:
         """
@@ -256,3 +273,225 @@ class OCSF(Output):
         if muted:
             status_id = StatusID.Suppressed
         return status_id
+
+
+class OCSFNDJSON(OCSF):
+    """
+    OCSFNDJSON class that writes the findings in the OCSF Detection Finding format as newline-delimited JSON.
+
+    The findings are built as plain dictionaries from a template per check, holding the attributes
+    shared by all the findings of the check, instead of building the DetectionFinding models, and
+    each one is written in a single line without indentation. Since there is no enclosing JSON array,
+    the file can be appended and read incrementally.
+
+    Attributes:
+        - _data: A list to store the transformed findings as dictionaries.
+        - _file_descriptor: A file descriptor to write the findings to a file.
+        - _check_templates: The templates of the checks already transformed, keyed by check ID.
+
+    Methods:
+        - transform(findings: List[Finding]) -> None: Transforms the findings into OCSF Detection Finding dictionaries.
+        - batch_write_data_to_file() -> None: Writes the findings to a file, one JSON finding per line.
+        - get_check_template(finding: Finding) -> dict: Returns the attributes shared by the findings of the check.
+        - get_detection_finding_dict(finding: Finding, check_template: dict) -> dict: Returns the OCSF Detection Finding of the finding as a dictionary.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        self._check_templates = {}
+        super().__init__(*args, **kwargs)
+
+    def transform(self, findings: List[Finding]) -> None:
+        """Transforms the findings into OCSF Detection Finding dictionaries.
+
+        Args:
+            findings (List[Finding]): a list of Finding objects
+        """
+        try:
+            for finding in findings:
+                check_template = self._check_templates.get(finding.metadata.CheckID)
+                if check_template is None:
+                    check_template = self.get_check_template(finding)
+                    self._check_templates[finding.metadata.CheckID] = check_template
+                self._data.append(
+                    self.get_detection_finding_dict(finding, check_template)
+                )
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def batch_write_data_to_file(self) -> None:
+        """Writes the findings to a file, one JSON finding per line, using the `Output._file_descriptor`."""
+        try:
+            if (
+                getattr(self, "_file_descriptor", None)
+                and not self._file_descriptor.closed
+                and self._data
+            ):
+                for finding in self._data:
+                    try:
+                        self._file_descriptor.write(ndjson_encoder.encode(finding))
+                        self._file_descriptor.write("\n")
+                    except Exception as error:
+                        logger.error(
+                            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                        )
+                if self.close_file or self._from_cli:
+                    self._file_descriptor.close()
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def get_check_template(self, finding: Finding) -> dict:
+        """
+        Returns the attributes of the OCSF Detection Finding shared by all the findings of the check.
+
+        The template is taken from the DetectionFinding model of the first finding of the check, without
+        the attributes that depend on the finding.
+
+        Args:
+            finding (Finding): the first Finding of the check
+
+        Returns:
+            dict: The OCSF Detection Finding attributes of the check
+        """
+        check_template = json.loads(
+            self.get_detection_finding(finding).json(exclude_none=True)
+        )
+        for attribute in (
+            "message",
+            "severity",
+            "severity_id",
+            "status",
+            "status_id",
+            "status_code",
+            "status_detail",
+            "time",
+            "time_dt",
+            "cloud",
+        ):
+            check_template.pop(attribute, None)
+        for attribute in ("created_time", "created_time_dt", "uid"):
+            check_template["finding_info"].pop(attribute, None)
+        check_template["metadata"].pop("tenant_uid", None)
+        check_template["unmapped"].pop("compliance", None)
+        check_template["resources"] = {
+            attribute: value
+            for attribute, value in check_template["resources"][0].items()
+            if attribute in ("group", "type")
+        }
+        return check_template
+
+    def get_detection_finding_dict(
+        self, finding: Finding, check_template: dict
+    ) -> dict:
+        """
+        Returns the OCSF Detection Finding of the finding as a dictionary, filling the template of its check.
+
+        Args:
+            finding (Finding): the Finding object
+            check_template (dict): the template returned by get_check_template for the check of the finding
+
+        Returns:
+            dict: The OCSF Detection Finding, with the same attributes as the DetectionFinding model without None values
+        """
+        if isinstance(finding.timestamp, datetime):
+            timestamp = int(finding.timestamp.timestamp())
+            timestamp_dt = finding.timestamp.isoformat()
+        else:
+            timestamp = finding.timestamp
+            timestamp_dt = datetime.fromtimestamp(
+                finding.timestamp, tz=timezone.utc
+            ).isoformat()
+        finding_severity = self.get_finding_severity_id(finding.metadata.Severity)
+        finding_status = self.get_finding_status_id(finding.muted)
+
+        resource = {
+            **check_template["resources"],
+            "labels": unroll_dict_to_list(finding.resource_tags),
+            "name": finding.resource_name,
+            "uid": finding.resource_uid,
+            "data": {
+                "details": finding.resource_details,
+                "metadata": finding.resource_metadata,
+            },
+        }
+        if finding.metadata.Provider != "kubernetes":
+            resource["cloud_partition"] = finding.partition
+            resource["region"] = finding.region
+        else:
+            resource["namespace"] = finding.region.replace("namespace: ", "")
+
+        detection_finding = {
+            **check_template,
+            "message": finding.status_extended,
+            "severity_id": finding_severity.value,
+            "severity": finding_severity.name,
+            "status_id": finding_status.value,
+            "status": finding_status.name,
+            "status_code": finding.status,
+            "status_detail": finding.status_extended,
+            "time": timestamp,
+            "time_dt": timestamp_dt,
+            "finding_info": {
+                **check_template["finding_info"],
+                "created_time": timestamp,
+                "created_time_dt": timestamp_dt,
+                "uid": finding.uid,
+            },
+            "metadata": _without_none(
+                {
+                    **check_template["metadata"],
+                    "tenant_uid": finding.account_organization_uid,
+                }
+            ),
+            "unmapped": {
+                **check_template["unmapped"],
+                "compliance": finding.compliance,
+            },
+            "resources": [_without_none(resource)],
+        }
+        if finding.provider != "kubernetes":
+            cloud_account_type = self.get_account_type_id_by_provider(
+                finding.metadata.Provider
+            )
+            detection_finding["cloud"] = _without_none(
+                {
+                    "account": _without_none(
+                        {
+                            "name": finding.account_name,
+                            "type_id": cloud_account_type.value,
+                            "type": cloud_account_type.name.replace("_", " "),
+                            "uid": finding.account_uid,
+                            "labels": unroll_dict_to_list(finding.account_tags),
+                        }
+                    ),
+                    "org": _without_none(
+                        {
+                            "uid": finding.account_organization_uid,
+                            "name": finding.account_organization_name,
+                        }
+                    ),
+                    "provider": finding.provider,
+                    "region": finding.region,
+                }
+            )
+        return detection_finding
+
+
+def _without_none(attributes: dict) -> dict:
+    """Attributes without the None values, like the models serialized with exclude_none"""
+    return {key: value for key, value in attributes.items() if value is not None}
+
+
+def _json_default(value) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+# Compact encoder of the findings written one per line
+ndjson_encoder = json.JSONEncoder(
+    ensure_ascii=False, separators=(",", ":"), default=_json_default
+)
@@ -4,7 +4,12 @@ from pathlib import Path
 from typing import List
 
 from prowler.lib.logger import logger
+from prowler.lib.outputs.compression import (
+    COMPRESSION_FILE_EXTENSIONS,
+    CompressedTextFile,
+)
 from prowler.lib.outputs.finding import Finding
+from prowler.lib.profiler import OUTPUT_SPAN, profiler
 from prowler.lib.utils.utils import open_file
 
 
@@ -16,6 +21,7 @@ class Output(ABC):
         _data (list): A list to store transformed data from findings.
         _file_descriptor (TextIOWrapper): A file descriptor to write data to a file.
         _file_extension (str): The extension of the file with the leading ., e.g.: .csv
+        compression (str): The algorithm compressing the file while it is written, e.g.: gzip
 
     Methods:
         __init__: Initializes the Output class with findings, optionally creates a file descriptor.
@@ -35,6 +41,7 @@ class Output(ABC):
         file_path: str = None,
         file_extension: str = "",
         from_cli: bool = True,
+        compression: str = None,
     ) -> None:
         self._data = []
         self.close_file = False
@@ -42,15 +49,26 @@ class Output(ABC):
         self._file_descriptor = None
         # This parameter is to avoid refactoring more code, the CLI does not write in batches, the API does
         self._from_cli = from_cli
+        self.compression = compression
 
         if not file_extension and file_path:
             self._file_extension = "".join(Path(file_path).suffixes)
         if file_extension:
             self._file_extension = file_extension
             self.file_path = f"{file_path}{self.file_extension}"
+        # The file extension is kept without the compression one, e.g.: .csv for output.csv.gz
+        if compression and self.file_path:
+            self.file_path = (
+                f"{self.file_path}{COMPRESSION_FILE_EXTENSIONS[compression]}"
+            )
 
         if findings:
-            self.transform(findings)
+            with profiler.span(
+                OUTPUT_SPAN,
+                f"{self.__class__.__name__}.transform",
+                findings=len(findings),
+            ):
+                self.transform(findings)
             if not self._file_descriptor and file_path:
                 self.create_file_descriptor(self.file_path)
 
@@ -93,13 +111,19 @@ class Output(ABC):
 
         Note:
             The file is opened in append mode ("a") to ensure data is written at the end of the file without overwriting existing content.
+            If the output is compressed, the data is compressed while it is written.
         """
         try:
             mode = "a"
-            self._file_descriptor = open_file(
-                file_path,
-                mode,
-            )
+            if self.compression:
+                self._file_descriptor = CompressedTextFile(
+                    file_path, self.compression, mode
+                )
+            else:
+                self._file_descriptor = open_file(
+                    file_path,
+                    mode,
+                )
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
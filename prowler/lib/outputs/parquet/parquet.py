@@ -0,0 +1,269 @@
+from datetime import datetime, timezone
+from typing import List
+
+from prowler.lib.logger import logger
+from prowler.lib.outputs.finding import Finding
+from prowler.lib.outputs.output import Output
+
+# Findings written in each Parquet row group, so a row group is flushed to the
+# file as soon as it is complete instead of keeping the whole table in memory
+PARQUET_ROW_GROUP_SIZE = 10000
+# Parquet compresses each column itself, the file is not compressed again
+PARQUET_COMPRESSION_CODECS = {"gzip": "gzip", "zstd": "zstd"}
+PARQUET_DEFAULT_COMPRESSION_CODEC = "snappy"
+
+
+def is_parquet_available() -> bool:
+    """Check if pyarrow, needed to write the Parquet output, is installed"""
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def get_parquet_schema():
+    """
+    Returns the pyarrow schema of the Parquet output.
+
+    The columns with a few distinct values are dictionary encoded, the lists
+    are kept as lists of strings and the tags and compliance as maps.
+
+    Returns:
+        pyarrow.Schema: The schema of the Parquet output
+    """
+    import pyarrow
+
+    category = pyarrow.dictionary(pyarrow.int32(), pyarrow.string())
+    string_list = pyarrow.list_(pyarrow.string())
+    tags = pyarrow.map_(pyarrow.string(), pyarrow.string())
+    return pyarrow.schema(
+        [
+            ("auth_method", category),
+            ("timestamp", pyarrow.timestamp("us", tz="UTC")),
+            ("account_uid", category),
+            ("account_name", category),
+            ("account_email", pyarrow.string()),
+            ("account_organization_uid", category),
+            ("account_organization_name", category),
+            ("account_tags", tags),
+            ("finding_uid", pyarrow.string()),
+            ("provider", category),
+            ("check_id", category),
+            ("check_title", category),
+            ("check_type", string_list),
+            ("status", category),
+            ("status_extended", pyarrow.string()),
+            ("muted", pyarrow.bool_()),
+            ("service_name", category),
+            ("subservice_name", category),
+            ("severity", category),
+            ("resource_type", category),
+            ("resource_uid", pyarrow.string()),
+            ("resource_name", pyarrow.string()),
+            ("resource_details", pyarrow.string()),
+            ("resource_tags", tags),
+            ("partition", category),
+            ("region", category),
+            ("description", category),
+            ("risk", category),
+            ("related_url", category),
+            ("remediation_recommendation_text", category),
+            ("remediation_recommendation_url", category),
+            ("remediation_code_nativeiac", category),
+            ("remediation_code_terraform", category),
+            ("remediation_code_cli", category),
+            ("remediation_code_other", category),
+            (
+                "compliance",
+                pyarrow.map_(pyarrow.string(), string_list),
+            ),
+            ("categories", string_list),
+            ("depends_on", string_list),
+            ("related_to", string_list),
+            ("notes", category),
+            ("prowler_version", category),
+            ("additional_urls", string_list),
+        ]
+    )
+
+
+class Parquet(Output):
+    """
+    Columnar Parquet output built from the same `Finding` fields as the CSV one.
+
+    The findings are written in row groups of PARQUET_ROW_GROUP_SIZE findings and
+    every call to `batch_write_data_to_file` appends row groups to the same file,
+    so query engines can read only the columns they need. The Parquet file is
+    closed when the last batch is written.
+
+    Usage:
+        parquet = Parquet(findings=findings, file_path="output.parquet")
+        parquet.batch_write_data_to_file()
+    """
+
+    def __init__(
+        self,
+        findings: List[Finding],
+        file_path: str = None,
+        file_extension: str = "",
+        from_cli: bool = True,
+        compression: str = None,
+    ) -> None:
+        self._writer = None
+        # The output compression is used as the Parquet column codec
+        self._codec = PARQUET_COMPRESSION_CODECS.get(
+            compression, PARQUET_DEFAULT_COMPRESSION_CODEC
+        )
+        super().__init__(
+            findings=findings,
+            file_path=file_path,
+            file_extension=file_extension,
+            from_cli=from_cli,
+        )
+
+    def transform(self, findings: List[Finding]) -> None:
+        """Transforms the findings into the Parquet rows.
+
+        Args:
+            findings (list[Finding]): a list of Finding objects
+
+        """
+        try:
+            for finding in findings:
+                timestamp = finding.timestamp
+                if isinstance(timestamp, int):
+                    timestamp = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+                finding_dict = {}
+                finding_dict["auth_method"] = finding.auth_method
+                finding_dict["timestamp"] = timestamp
+                finding_dict["account_uid"] = finding.account_uid
+                finding_dict["account_name"] = finding.account_name
+                finding_dict["account_email"] = finding.account_email
+                finding_dict["account_organization_uid"] = (
+                    finding.account_organization_uid
+                )
+                finding_dict["account_organization_name"] = (
+                    finding.account_organization_name
+                )
+                finding_dict["account_tags"] = [
+                    (str(key), str(value))
+                    for key, value in finding.account_tags.items()
+                ]
+                finding_dict["finding_uid"] = finding.uid
+                finding_dict["provider"] = finding.metadata.Provider
+                finding_dict["check_id"] = finding.metadata.CheckID
+                finding_dict["check_title"] = finding.metadata.CheckTitle
+                finding_dict["check_type"] = finding.metadata.CheckType
+                finding_dict["status"] = finding.status.value
+                finding_dict["status_extended"] = finding.status_extended
+                finding_dict["muted"] = finding.muted
+                finding_dict["service_name"] = finding.metadata.ServiceName
+                finding_dict["subservice_name"] = finding.metadata.SubServiceName
+                finding_dict["severity"] = finding.metadata.Severity.value
+                finding_dict["resource_type"] = finding.metadata.ResourceType
+                finding_dict["resource_uid"] = finding.resource_uid
+                finding_dict["resource_name"] = finding.resource_name
+                finding_dict["resource_details"] = finding.resource_details
+                finding_dict["resource_tags"] = [
+                    (str(key), str(value))
+                    for key, value in finding.resource_tags.items()
+                ]
+                finding_dict["partition"] = finding.partition
+                finding_dict["region"] = finding.region
+                finding_dict["description"] = finding.metadata.Description
+                finding_dict["risk"] = finding.metadata.Risk
+                finding_dict["related_url"] = finding.metadata.RelatedUrl
+                finding_dict["remediation_recommendation_text"] = (
+                    finding.metadata.Remediation.Recommendation.Text
+                )
+                finding_dict["remediation_recommendation_url"] = (
+                    finding.metadata.Remediation.Recommendation.Url
+                )
+                finding_dict["remediation_code_nativeiac"] = (
+                    finding.metadata.Remediation.Code.NativeIaC
+                )
+                finding_dict["remediation_code_terraform"] = (
+                    finding.metadata.Remediation.Code.Terraform
+                )
+                finding_dict["remediation_code_cli"] = (
+                    finding.metadata.Remediation.Code.CLI
+                )
+                finding_dict["remediation_code_other"] = (
+                    finding.metadata.Remediation.Code.Other
+                )
+                finding_dict["compliance"] = [
+                    (
+                        framework,
+                        (
+                            [requirements]
+                            if isinstance(requirements, str)
+                            else [str(requirement) for requirement in requirements]
+                        ),
+                    )
+                    for framework, requirements in finding.compliance.items()
+                ]
+                finding_dict["categories"] = finding.metadata.Categories
+                finding_dict["depends_on"] = finding.metadata.DependsOn
+                finding_dict["related_to"] = finding.metadata.RelatedTo
+                finding_dict["notes"] = finding.metadata.Notes
+                finding_dict["prowler_version"] = finding.prowler_version
+                finding_dict["additional_urls"] = finding.metadata.AdditionalURLs
+                self._data.append(finding_dict)
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def create_file_descriptor(self, file_path: str) -> None:
+        """
+        Creates a binary file descriptor for writing the Parquet file.
+
+        Parameters:
+            file_path (str): The path to the file where the data will be written.
+
+        Note:
+            A Parquet file can not be appended once closed, so the file is truncated and
+            the following batches are added as row groups through the same writer.
+        """
+        try:
+            self._file_descriptor = open(file_path, "wb")
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def batch_write_data_to_file(self) -> None:
+        """Writes the findings to a file using the Parquet format using the `Output._file_descriptor`."""
+        try:
+            if (
+                getattr(self, "_file_descriptor", None)
+                and not self._file_descriptor.closed
+                and self._data
+            ):
+                import pyarrow
+                import pyarrow.parquet
+
+                schema = get_parquet_schema()
+                if not self._writer:
+                    self._writer = pyarrow.parquet.ParquetWriter(
+                        self._file_descriptor,
+                        schema,
+                        compression=self._codec,
+                    )
+                for start in range(0, len(self._data), PARQUET_ROW_GROUP_SIZE):
+                    self._writer.write_table(
+                        pyarrow.Table.from_pylist(
+                            self._data[start : start + PARQUET_ROW_GROUP_SIZE],
+                            schema=schema,
+                        ),
+                        row_group_size=PARQUET_ROW_GROUP_SIZE,
+                    )
+                if self.close_file or self._from_cli:
+                    self._writer.close()
+                    self._file_descriptor.close()
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
@@ -8,9 +8,12 @@ from prowler.config.config import (
     html_file_suffix,
     json_asff_file_suffix,
     json_ocsf_file_suffix,
+    ndjson_ocsf_file_suffix,
     orange_color,
+    parquet_file_suffix,
 )
 from prowler.lib.logger import logger
+from prowler.lib.outputs.compression import COMPRESSION_FILE_EXTENSIONS
 from prowler.providers.github.models import GithubAppIdentityInfo, GithubIdentityInfo
 
 
@@ -160,19 +163,32 @@ def display_summary_table(
                 f"{Style.BRIGHT}* You only see here those services that contains resources.{Style.RESET_ALL}"
             )
             print("\nDetailed results are in:")
+            compression_extension = COMPRESSION_FILE_EXTENSIONS.get(
+                getattr(output_options, "output_compression", None), ""
+            )
             if "json-asff" in output_options.output_modes:
                 print(
-                    f" - JSON-ASFF: {output_directory}/{output_filename}{json_asff_file_suffix}"
+                    f" - JSON-ASFF: {output_directory}/{output_filename}{json_asff_file_suffix}{compression_extension}"
                 )
             if "json-ocsf" in output_options.output_modes:
                 print(
-                    f" - JSON-OCSF: {output_directory}/{output_filename}{json_ocsf_file_suffix}"
+                    f" - JSON-OCSF: {output_directory}/{output_filename}{json_ocsf_file_suffix}{compression_extension}"
+                )
+            if "ndjson-ocsf" in output_options.output_modes:
+                print(
+                    f" - NDJSON-OCSF: {output_directory}/{output_filename}{ndjson_ocsf_file_suffix}{compression_extension}"
+                )
+            if "parquet" in output_options.output_modes:
+                print(
+                    f" - PARQUET: {output_directory}/{output_filename}{parquet_file_suffix}"
                 )
             if "csv" in output_options.output_modes:
-                print(f" - CSV: {output_directory}/{output_filename}{csv_file_suffix}")
+                print(
+                    f" - CSV: {output_directory}/{output_filename}{csv_file_suffix}{compression_extension}"
+                )
             if "html" in output_options.output_modes:
                 print(
-                    f" - HTML: {output_directory}/{output_filename}{html_file_suffix}"
+                    f" - HTML: {output_directory}/{output_filename}{html_file_suffix}{compression_extension}"
                 )
 
         else:
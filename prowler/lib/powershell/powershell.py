@@ -1,9 +1,10 @@
+import itertools
 import json
-import queue
 import re
 import subprocess
 import threading
-from typing import Union
+from collections import deque
+from typing import List, Optional, Union
 
 from prowler.lib.logger import logger
 
@@ -23,6 +24,8 @@ class PowerShellSession:
     - Manages ANSI escape sequence removal
     - Supports JSON output parsing
     - Implements timeout handling for long-running commands
+    - Frames the output of each command in a single line read by one persistent
+      reader thread per stream, allowing several commands in flight
 
     Attributes:
         END (str): Marker string used to signal the end of PowerShell command output.
@@ -55,6 +58,16 @@ class PowerShellSession:
             text=True,
             bufsize=1,
         )
+        # The pending commands are guarded by `_lock`, shared with the reader
+        # threads, and the writes to stdin by `_write_lock`, so a full stdin
+        # pipe never blocks the readers
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._command_ids = itertools.count(1)
+        self._pending_output = deque()
+        self._pending_errors = deque()
+        self._stdout_reader = None
+        self._stderr_reader = None
 
     def sanitize(self, credential: str) -> str:
         """
@@ -103,106 +116,163 @@ class PowerShellSession:
         """
         Send a command to PowerShell and retrieve its output.
 
-        Executes the given command in the PowerShell session, adds an END marker,
-        and parses the output as JSON if possible. The command is executed
-        asynchronously with a timeout mechanism.
+        Sends the command through the framed protocol (see `send`) and waits for
+        its result, parsing it as JSON if requested.
 
         Args:
             command (str): PowerShell command to execute.
+            json_parse (bool): Whether to parse the output of the command as JSON.
+            timeout (int): Maximum time in seconds to wait for the output.
 
         Returns:
-            dict: JSON-parsed output if available, otherwise an empty dictionary.
+            Union[str, dict]: The output of the command, or its JSON-parsed content if json_parse is set.
 
         Example:
-            >>> execute("Get-Process | ConvertTo-Json")
+            >>> execute("Get-Process | ConvertTo-Json", json_parse=True)
             {"Name": "process1", "Id": 1234}
         """
-        self.process.stdin.write(f"{command}\n")
-        self.process.stdin.write(f"Write-Output '{self.END}'\n")
-        self.process.stdin.write(f"Write-Error '{self.END}'\n")
-        return (
-            self.json_parse_output(self.read_output(timeout=timeout))
-            if json_parse
-            else self.read_output(timeout=timeout)
-        )
+        return self.receive(self.send(command), json_parse=json_parse, timeout=timeout)
 
-    def read_output(self, timeout: int = 10, default: str = "") -> str:
+    def send(self, command: str) -> "PowerShellCommand":
         """
-        Read output from a process with timeout functionality.
-
-        This method reads lines from process stdout and stderr in separate threads until it encounters
-        the END marker for each stream. If reading stdout takes longer than the timeout period,
-        the method returns a default value while allowing the reading to continue in the background.
+        Send a command to PowerShell without waiting for its output.
 
-        Any errors from stderr are logged but do not affect the return value.
+        The output of the command is captured and written back as a single frame
+        line `<END:id>"json encoded output"`, or `<END:id>null` if the command
+        failed, followed by an `<END:id>` line in stderr. Since PowerShell runs the commands in order, several commands can
+        be sent before reading their results (pipelining).
 
         Args:
-            timeout (int, optional): Maximum time in seconds to wait for stdout output.
-                Defaults to 10.
-            default (str, optional): Value to return if stdout timeout occurs.
-                Defaults to empty string.
+            command (str): PowerShell command to execute. It must fit in a single line.
 
         Returns:
-            str: The stdout output if available, otherwise the default value.
-                Errors from stderr are logged but not returned.
+            PowerShellCommand: The pending command, to be passed to `receive`.
 
-        Note:
-            This method uses daemon threads to read stdout and stderr asynchronously,
-            ensuring that the main thread is not blocked.
+        Example:
+            >>> pending = [session.send(command) for command in commands]
+            >>> results = [session.receive(command) for command in pending]
+        """
+        # The commands are written in the same order they are queued
+        with self._write_lock:
+            with self._lock:
+                self._start_readers()
+                pending_command = PowerShellCommand(next(self._command_ids), self.END)
+                self._pending_output.append(pending_command)
+                self._pending_errors.append(pending_command)
+            # A terminating error skips the assignment, so the output of the
+            # previous command must not be left in the variable
+            self.process.stdin.write("$prowlerOutput = $null\n")
+            self.process.stdin.write(
+                f"$prowlerOutput = . {{ {command} }} | Out-String\n"
+            )
+            self.process.stdin.write(
+                f"Write-Output ('{pending_command.marker}' + (ConvertTo-Json -InputObject $prowlerOutput -Compress))\n"
+            )
+            self.process.stdin.write(
+                f"[Console]::Error.WriteLine('{pending_command.marker}')\n"
+            )
+        return pending_command
+
+    def receive(
+        self,
+        command: "PowerShellCommand",
+        json_parse: bool = False,
+        timeout: int = 10,
+        default: str = "",
+    ) -> Union[str, dict]:
         """
-        output_lines = []
-        result_queue = queue.Queue()
-        error_lines = []
-        error_queue = queue.Queue()
+        Wait for the result of a command previously sent with `send`.
 
-        def reader_thread():
-            try:
-                while True:
-                    line = self.remove_ansi(self.process.stdout.readline().strip())
-                    if line == self.END:
-                        break
-                    output_lines.append(line)
-                result_queue.put("\n".join(output_lines))
-            except Exception as error:
-                result_queue.put(str(error))
-
-        def error_reader_thread():
-            try:
-                while True:
-                    line = self.remove_ansi(self.process.stderr.readline().strip())
-                    if line == f"Write-Error: {self.END}":
-                        break
-                    error_lines.append(line)
-                error_queue.put("\n".join(error_lines))
-            except Exception as error:
-                error_queue.put(str(error))
-
-        thread = threading.Thread(target=reader_thread)
-        thread.daemon = True
-        thread.start()
-
-        error_thread = threading.Thread(target=error_reader_thread)
-        error_thread.daemon = True
-        error_thread.start()
-
-        error_result = None
-        try:
-            result = result_queue.get(timeout=timeout) or default
-            error_result = error_queue.get(timeout=1)
-        except queue.Empty:
-            result = default
+        Any errors written to stderr by the command are logged but do not affect
+        the return value.
 
-        if error_result:
-            logger.error(f"PowerShell error output: {error_result}")
+        Args:
+            command (PowerShellCommand): The pending command.
+            json_parse (bool): Whether to parse the captured output as JSON.
+            timeout (int): Maximum time in seconds to wait for the output.
+            default (str): Value to return if the output is not received in time.
 
-        return result
+        Returns:
+            Union[str, dict]: The output of the command, or its JSON-parsed content if json_parse is set.
+        """
+        if not command.output_received.wait(timeout) or command.output is None:
+            return self.json_parse_output(default) if json_parse else default
+
+        if command.errors_received.wait(1) and command.errors:
+            logger.error(f"PowerShell error output: {command.errors}")
+
+        if json_parse:
+            # Only the captured output is parsed, host messages are left out
+            return self.json_parse_output(command.output.strip())
+        return command.text or default
+
+    def _start_readers(self) -> None:
+        """Start the stdout and stderr reader threads if they are not running."""
+        if not (self._stdout_reader and self._stdout_reader.is_alive()):
+            self._stdout_reader = threading.Thread(
+                target=self._read_stream,
+                args=(self.process.stdout, self._pending_output, False),
+                daemon=True,
+            )
+            self._stdout_reader.start()
+        if not (self._stderr_reader and self._stderr_reader.is_alive()):
+            self._stderr_reader = threading.Thread(
+                target=self._read_stream,
+                args=(self.process.stderr, self._pending_errors, True),
+                daemon=True,
+            )
+            self._stderr_reader.start()
+
+    def _read_stream(self, stream, pending: deque, errors: bool) -> None:
+        """
+        Read a PowerShell stream and route its lines to the pending commands.
+
+        Lines are assigned to the oldest pending command until its end frame is
+        read. The thread lives as long as the session; if the stream is closed or
+        fails, the commands still pending are completed without output.
+
+        Args:
+            stream: The stdout or stderr pipe of the PowerShell process.
+            pending (deque): Commands waiting for this stream, oldest first.
+            errors (bool): Whether the stream is stderr.
+        """
+        try:
+            for raw_line in iter(stream.readline, ""):
+                line = self.remove_ansi(raw_line.rstrip("\r\n"))
+                with self._lock:
+                    command = pending[0] if pending else None
+                if command is None:
+                    logger.debug(f"Unexpected PowerShell output: {line}")
+                elif line.startswith(command.marker):
+                    with self._lock:
+                        pending.popleft()
+                    if errors:
+                        command.set_errors()
+                    else:
+                        command.set_output(json.loads(line[len(command.marker) :]))
+                elif errors:
+                    command.error_lines.append(line)
+                else:
+                    command.host_lines.append(line)
+        except Exception as error:
+            logger.debug(
+                f"PowerShell reader stopped: {error.__class__.__name__}: {error}"
+            )
+        finally:
+            with self._lock:
+                while pending:
+                    command = pending.popleft()
+                    if errors:
+                        command.set_errors()
+                    else:
+                        command.set_output(None)
 
     def json_parse_output(self, output: str) -> dict:
         """
         Parse command execution output to JSON format.
 
-        Searches for a JSON object in the output string and parses it.
-        The method looks for both object and array JSON structures.
+        Decodes the first JSON object or array found in the output string,
+        stopping at its end instead of scanning the rest of the text.
 
         Args:
             output (str): The string output from a PowerShell command.
@@ -210,9 +280,6 @@ class PowerShellSession:
         Returns:
             dict: Parsed JSON object if found, otherwise an empty dictionary.
 
-        Raises:
-            JSONDecodeError: If the JSON parsing fails.
-
         Example:
             >>> json_parse_output('Some text {"key": "value"} more text')
             {"key": "value"}
@@ -220,14 +287,16 @@ class PowerShellSession:
         if output == "":
             return {}
 
-        json_match = re.search(r"(\[.*\]|\{.*\})", output, re.DOTALL)
-        if not json_match:
+        json_starts = [
+            index for index in (output.find("{"), output.find("[")) if index != -1
+        ]
+        if not json_starts:
             logger.error(
                 f"Unexpected PowerShell output: {output}\n",
             )
         else:
             try:
-                return json.loads(json_match.group(1))
+                return json.JSONDecoder().raw_decode(output, min(json_starts))[0]
             except json.JSONDecodeError as error:
                 logger.error(
                     f"Error parsing PowerShell output as JSON: {str(error)}\n",
@@ -267,3 +336,42 @@ class PowerShellSession:
                 self.process.stdout.close()
                 self.process.stderr.close()
                 self.process = None
+
+
+class PowerShellCommand:
+    """
+    Pending result of a command sent to a PowerShellSession.
+
+    Attributes:
+        id (int): Identifier of the command within its session.
+        marker (str): Frame marker that closes the command output in stdout and stderr.
+        output (str): Output captured from the command, None if it was not received.
+        host_lines (list): Lines written directly to the host (e.g. Write-Host) while the command ran.
+        error_lines (list): Lines written to stderr while the command ran.
+    """
+
+    def __init__(self, command_id: int, end: str):
+        self.id = command_id
+        self.marker = f"{end[:-1]}:{command_id}>"
+        self.output: Optional[str] = None
+        self.host_lines: List[str] = []
+        self.error_lines: List[str] = []
+        self.output_received = threading.Event()
+        self.errors_received = threading.Event()
+
+    def set_output(self, output: Optional[str]) -> None:
+        self.output = output
+        self.output_received.set()
+
+    def set_errors(self) -> None:
+        self.errors_received.set()
+
+    @property
+    def errors(self) -> str:
+        return "\n".join(line for line in self.error_lines if line.strip())
+
+    @property
+    def text(self) -> str:
+        """Host messages and captured output, one stripped line each."""
+        lines = self.host_lines + (self.output or "").splitlines()
+        return "\n".join(line.strip() for line in lines).strip()
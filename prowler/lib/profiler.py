@@ -0,0 +1,397 @@
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from urllib.parse import urlparse
+
+from tabulate import tabulate
+
+from prowler.config.config import prowler_version
+from prowler.lib.logger import logger
+
+# Kinds of spans recorded during a scan
+SERVICE_SPAN = "service"
+CHECK_LOAD_SPAN = "check_load"
+CHECK_SPAN = "check"
+MUTELIST_SPAN = "mutelist"
+OUTPUT_SPAN = "output"
+API_CALL_SPAN = "api_call"
+
+# Error codes returned by AWS when a request is throttled
+AWS_THROTTLING_ERROR_CODES = {
+    "Throttling",
+    "ThrottlingException",
+    "ThrottledException",
+    "RequestThrottledException",
+    "TooManyRequestsException",
+    "RequestLimitExceeded",
+    "RequestThrottled",
+    "SlowDown",
+    "EC2ThrottledException",
+    "ProvisionedThroughputExceededException",
+    "BandwidthLimitExceeded",
+    "PriorRequestNotComplete",
+}
+
+
+@dataclass
+class Span:
+    """A timed operation of the scan, with its timestamps in nanoseconds."""
+
+    kind: str
+    name: str
+    start_time: int
+    end_time: int
+    attributes: dict = field(default_factory=dict)
+    span_id: str = field(default_factory=lambda: os.urandom(8).hex())
+
+    @property
+    def duration(self) -> float:
+        """Duration of the span in seconds."""
+        return (self.end_time - self.start_time) / 1e9
+
+
+class Profiler:
+    """
+    Records the wall time of the scan phases: service initialization, check
+    loading and execution, output generation and cloud API calls.
+
+    It is disabled by default, recording nothing, and it is thread-safe since
+    services and API calls run in thread pools.
+
+    Example:
+        >>> profiler.enable()
+        >>> with profiler.span(CHECK_SPAN, "ec2_instance_public_ip"):
+        ...     check.execute()
+        >>> profiler.write("output/prowler-output.performance.json")
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._spans = []
+        self._lock = threading.Lock()
+        self._trace_id = os.urandom(16).hex()
+
+    def enable(self):
+        self.enabled = True
+
+    def reset(self):
+        with self._lock:
+            self._spans = []
+        self._trace_id = os.urandom(16).hex()
+
+    @property
+    def spans(self) -> list[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def record(
+        self,
+        kind: str,
+        name: str,
+        start_time: int,
+        end_time: int,
+        attributes: dict = None,
+    ):
+        if not self.enabled:
+            return
+        span = Span(
+            kind=kind,
+            name=name,
+            start_time=start_time,
+            end_time=end_time,
+            attributes=attributes or {},
+        )
+        with self._lock:
+            self._spans.append(span)
+
+    @contextmanager
+    def span(self, kind: str, name: str, **attributes):
+        """
+        Time the wrapped block. The yielded attributes dict can be updated to
+        add details only known at the end, like the number of findings.
+        """
+        if not self.enabled:
+            yield attributes
+            return
+        start_time = time.time_ns()
+        try:
+            yield attributes
+        except BaseException as error:
+            attributes["error"] = error.__class__.__name__
+            raise
+        finally:
+            self.record(kind, name, start_time, time.time_ns(), attributes)
+
+    def summary(self, top: int = 10) -> dict:
+        """
+        Aggregate the spans by kind and name.
+
+        Returns:
+            dict: for each kind, the `top` names with the highest total time as
+            dicts with `name`, `count`, `total`, `max`, `retries` and `throttles`.
+        """
+        aggregated = defaultdict(
+            lambda: {"count": 0, "total": 0.0, "max": 0.0, "retries": 0, "throttles": 0}
+        )
+        for span in self.spans:
+            entry = aggregated[(span.kind, span.name)]
+            entry["count"] += 1
+            entry["total"] += span.duration
+            entry["max"] = max(entry["max"], span.duration)
+            entry["retries"] += span.attributes.get("retries", 0)
+            entry["throttles"] += span.attributes.get("throttles", 0)
+
+        summary = defaultdict(list)
+        for (kind, name), entry in aggregated.items():
+            summary[kind].append({"name": name, **entry})
+        return {
+            kind: sorted(entries, key=lambda entry: entry["total"], reverse=True)[:top]
+            for kind, entries in summary.items()
+        }
+
+    def to_otlp(self, resource_attributes: dict = None) -> dict:
+        """Return the spans following the OTLP/JSON trace format."""
+        resource_attributes = {
+            "service.name": "prowler",
+            "service.version": prowler_version,
+            **(resource_attributes or {}),
+        }
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": _otlp_attributes(resource_attributes)},
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "prowler", "version": prowler_version},
+                            "spans": [
+                                {
+                                    "traceId": self._trace_id,
+                                    "spanId": span.span_id,
+                                    "name": span.name,
+                                    # SPAN_KIND_INTERNAL and SPAN_KIND_CLIENT
+                                    "kind": 3 if span.kind == API_CALL_SPAN else 1,
+                                    "startTimeUnixNano": str(span.start_time),
+                                    "endTimeUnixNano": str(span.end_time),
+                                    "attributes": _otlp_attributes(
+                                        {"prowler.span.kind": span.kind}
+                                        | span.attributes
+                                    ),
+                                    "status": {
+                                        "code": 2 if "error" in span.attributes else 0
+                                    },
+                                }
+                                for span in self.spans
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def write(self, file_path: str, resource_attributes: dict = None):
+        try:
+            with open(file_path, "w") as file_descriptor:
+                json.dump(self.to_otlp(resource_attributes), file_descriptor)
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
+    def print_summary(self, top: int = 10):
+        titles = {
+            SERVICE_SPAN: "Service calls",
+            CHECK_LOAD_SPAN: "Check loading (including service initialization)",
+            CHECK_SPAN: "Check executions",
+            MUTELIST_SPAN: "Mutelist evaluations",
+            OUTPUT_SPAN: "Outputs",
+            API_CALL_SPAN: "API calls",
+        }
+        for kind, entries in self.summary(top).items():
+            table = {
+                "Name": [entry["name"] for entry in entries],
+                "Count": [entry["count"] for entry in entries],
+                "Total (s)": [round(entry["total"], 3) for entry in entries],
+                "Max (s)": [round(entry["max"], 3) for entry in entries],
+            }
+            if kind == API_CALL_SPAN:
+                table["Retries"] = [entry["retries"] for entry in entries]
+                table["Throttles"] = [entry["throttles"] for entry in entries]
+            print(f"\nTop {len(entries)} {titles.get(kind, kind)} by wall time:")
+            print(tabulate(table, headers="keys", tablefmt="rounded_grid"))
+
+
+def _otlp_attributes(attributes: dict) -> list[dict]:
+    otlp_attributes = []
+    for key, value in attributes.items():
+        if isinstance(value, bool):
+            otlp_value = {"boolValue": value}
+        elif isinstance(value, int):
+            otlp_value = {"intValue": str(value)}
+        elif isinstance(value, float):
+            otlp_value = {"doubleValue": value}
+        else:
+            otlp_value = {"stringValue": str(value)}
+        otlp_attributes.append({"key": key, "value": otlp_value})
+    return otlp_attributes
+
+
+profiler = Profiler()
+
+
+def instrument_provider(provider):
+    """Record the API calls made by the provider's SDK clients."""
+    try:
+        if provider.type == "aws":
+            instrument_boto3_session(provider.session.current_session)
+        elif provider.type == "kubernetes":
+            instrument_kubernetes_api_client(provider.session.api_client)
+        elif provider.type == "azure":
+            instrument_azure_pipeline()
+        elif provider.type == "gcp":
+            instrument_gcp_http_request()
+        else:
+            logger.info(f"API calls are not recorded for the {provider.type} provider.")
+    except Exception as error:
+        logger.error(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+        )
+
+
+def instrument_boto3_session(session):
+    """
+    Register botocore event handlers in the session to time every API call.
+
+    The clients copy the session events when created, so this must be called
+    before the service clients are created.
+    """
+    session.events.register("before-call", _before_aws_call)
+    session.events.register("needs-retry", _on_aws_needs_retry)
+    session.events.register("after-call", _after_aws_call)
+    session.events.register("after-call-error", _after_aws_call)
+
+
+def _before_aws_call(context, **_):
+    context["prowler_start_time"] = time.time_ns()
+    context["prowler_throttles"] = 0
+
+
+def _on_aws_needs_retry(request_dict, response=None, **_):
+    # This handler only counts throttles, returning None keeps the retry logic
+    if response:
+        error_code = response[1].get("Error", {}).get("Code")
+        if error_code in AWS_THROTTLING_ERROR_CODES:
+            context = request_dict.get("context", {})
+            context["prowler_throttles"] = context.get("prowler_throttles", 0) + 1
+
+
+def _after_aws_call(context, event_name, parsed=None, exception=None, **_):
+    start_time = context.get("prowler_start_time")
+    if start_time is None:
+        return
+    # Format: "after-call.{service_id}.{operation_name}"
+    _, service_id, operation_name = event_name.split(".", 2)
+    attributes = {
+        "provider": "aws",
+        "region": context.get("client_region"),
+        "retries": (parsed or {}).get("ResponseMetadata", {}).get("RetryAttempts", 0),
+        "throttles": context.get("prowler_throttles", 0),
+    }
+    if exception is not None:
+        attributes["error"] = exception.__class__.__name__
+    elif (parsed or {}).get("Error"):
+        attributes["error"] = parsed["Error"].get("Code")
+    profiler.record(
+        API_CALL_SPAN,
+        f"{service_id}.{operation_name}",
+        start_time,
+        time.time_ns(),
+        attributes,
+    )
+
+
+def instrument_kubernetes_api_client(api_client):
+    """Time the requests made through the Kubernetes API client."""
+    call_api = api_client.call_api
+
+    @wraps(call_api)
+    def profiled_call_api(resource_path, method, *args, **kwargs):
+        # The resource path is a template, e.g. /api/v1/namespaces/{namespace}/pods
+        with profiler.span(
+            API_CALL_SPAN, f"{method} {resource_path}", provider="kubernetes"
+        ):
+            return call_api(resource_path, method, *args, **kwargs)
+
+    api_client.call_api = profiled_call_api
+
+
+def instrument_azure_pipeline():
+    """Time the requests sent through the Azure SDK pipelines, retries included."""
+    from azure.core.pipeline import Pipeline
+
+    if getattr(Pipeline.run, "__prowler_profiled__", False):
+        return
+    run = Pipeline.run
+
+    @wraps(run)
+    def profiled_run(pipeline, request, **kwargs):
+        with profiler.span(
+            API_CALL_SPAN,
+            azure_operation_name(request.method, request.url),
+            provider="azure",
+        ):
+            return run(pipeline, request, **kwargs)
+
+    profiled_run.__prowler_profiled__ = True
+    Pipeline.run = profiled_run
+
+
+def azure_operation_name(method: str, url: str) -> str:
+    """
+    Build the operation name of an Azure request replacing the resource names of
+    the path, e.g. GET /subscriptions/{}/providers/Microsoft.Storage/storageAccounts
+    """
+    parsed_url = urlparse(url)
+    segments = [segment for segment in parsed_url.path.split("/") if segment]
+    operation_segments = []
+    index = 0
+    while index < len(segments):
+        segment = segments[index]
+        operation_segments.append(segment)
+        if segment.lower() in ("subscriptions", "resourcegroups", "locations"):
+            if index + 1 < len(segments):
+                operation_segments.append("{}")
+            index += 2
+        elif segment.lower() == "providers" and index + 1 < len(segments):
+            # Keep the namespace and then alternate resource types and names
+            operation_segments.append(segments[index + 1])
+            index += 2
+            while index < len(segments):
+                operation_segments.append(segments[index])
+                if index + 1 < len(segments):
+                    operation_segments.append("{}")
+                index += 2
+        else:
+            index += 1
+    return f"{method} {parsed_url.netloc}/{'/'.join(operation_segments)}"
+
+
+def instrument_gcp_http_request():
+    """Time the requests executed through the Google API discovery clients."""
+    from googleapiclient.http import HttpRequest
+
+    if getattr(HttpRequest.execute, "__prowler_profiled__", False):
+        return
+    execute = HttpRequest.execute
+
+    @wraps(execute)
+    def profiled_execute(request, *args, **kwargs):
+        with profiler.span(API_CALL_SPAN, request.methodId or "", provider="gcp"):
+            return execute(request, *args, **kwargs)
+
+    profiled_execute.__prowler_profiled__ = True
+    HttpRequest.execute = profiled_execute
@@ -1,10 +1,148 @@
+import fnmatch
+import re
+from typing import Iterable, Optional
+
 from prowler.lib.logger import logger
 
+# Characters that make an audit resource a pattern instead of an exact ARN
+WILDCARD_CHARACTERS = ("*", "?")
+
+
+class AuditResources(list):
+    """
+    List of resources to audit indexed once for fast lookups.
+
+    It behaves like the list of resources it was built from, but membership is
+    resolved with a hashed set for exact resources and with the wildcard
+    patterns (e.g. arn:aws:s3:::prod-*) indexed by their ARN service. It also
+    keeps the services, regions and resource types of the ARNs, so services can
+    skip the regions or resource types without targeted resources.
+
+    Usage:
+        audit_resources = AuditResources(["arn:aws:ec2:us-east-1:123456789012:instance/i-1"])
+        "arn:aws:ec2:us-east-1:123456789012:instance/i-1" in audit_resources
+        audit_resources.targets("ec2", "eu-west-1", "instance")
+    """
+
+    def __init__(self, resources: Iterable[str] = ()):
+        super().__init__(resources)
+        self._exact = set()
+        # Wildcard patterns by ARN service, "*" holds the ones for any service
+        self._patterns = {}
+        # (service, region, resource_type) of the resources, "*" matches any value
+        self._targets = set()
+        # (service, region) of the resources
+        self._service_regions = set()
+        # Resources that are not ARNs can not be placed in a region or resource type
+        self._unindexed = False
+        for resource in self:
+            self._index(resource)
+
+    def _index(self, resource: str) -> None:
+        arn_elements = resource.split(":", 5)
+        is_arn = len(arn_elements) == 6 and arn_elements[0] == "arn"
+        if any(character in resource for character in WILDCARD_CHARACTERS):
+            service = arn_elements[2] if is_arn else "*"
+            if any(character in service for character in WILDCARD_CHARACTERS):
+                service = "*"
+            self._patterns.setdefault(service, []).append(
+                re.compile(fnmatch.translate(resource))
+            )
+        else:
+            self._exact.add(resource)
+
+        if not is_arn:
+            self._unindexed = True
+            return
+        service, region = arn_elements[2], arn_elements[3]
+        resource_type = _get_resource_type(arn_elements[5])
+        self._targets.add(
+            (_field_key(service), _field_key(region), _field_key(resource_type))
+        )
+        self._service_regions.add((_field_key(service), _field_key(region)))
+
+    def append(self, resource: str) -> None:
+        super().append(resource)
+        self._index(resource)
+
+    def extend(self, resources: Iterable[str]) -> None:
+        for resource in resources:
+            self.append(resource)
+
+    def __contains__(self, resource: object) -> bool:
+        if resource in self._exact:
+            return True
+        if not self._patterns or not isinstance(resource, str):
+            return False
+        arn_elements = resource.split(":", 3)
+        service = arn_elements[2] if len(arn_elements) > 2 else None
+        for pattern in self._patterns.get(service, []) + self._patterns.get("*", []):
+            if pattern.match(resource):
+                return True
+        return False
+
+    def targets(
+        self, service: str, region: str = "", resource_type: Optional[str] = None
+    ) -> bool:
+        """
+        Check if any of the resources to audit can be in the given service, region and resource type.
+
+        Resources without region (e.g. S3 buckets or IAM roles) and without resource type
+        (e.g. SNS topics) are considered to be in every region and of every type.
+
+        Args:
+            service: The ARN service namespace, e.g. ec2 or elasticloadbalancing
+            region: The region, empty for global resources
+            resource_type: The ARN resource type, e.g. instance or security-group. None matches any resource type
+
+        Returns:
+            bool: False only if no resource to audit can be in the given service, region and resource type
+        """
+        if self._unindexed:
+            return True
+        for target_service in (service, "*"):
+            for target_region in {region, "", "*"}:
+                if resource_type is None:
+                    if (target_service, target_region) in self._service_regions:
+                        return True
+                    continue
+                for target_type in (resource_type, "", "*"):
+                    if (target_service, target_region, target_type) in self._targets:
+                        return True
+        return False
+
+
+def _get_resource_type(resource: str) -> str:
+    """Resource type of the resource part of an ARN, empty if it has none"""
+    match = re.search(r"[/:]", resource)
+    return resource[: match.start()] if match else ""
+
+
+def _field_key(value: str) -> str:
+    """Index key of an ARN field, "*" if it contains wildcards"""
+    if any(character in value for character in WILDCARD_CHARACTERS):
+        return "*"
+    return value
+
+
+def compile_audit_resources(audit_resources: Optional[list]) -> AuditResources:
+    """
+    Build the indexed AuditResources from the list of resources to audit.
+
+    Returns the same object if it is already indexed.
+    """
+    if isinstance(audit_resources, AuditResources):
+        return audit_resources
+    return AuditResources(audit_resources or [])
+
 
 def is_resource_filtered(resource: str, audit_resources: list) -> bool:
     """
     Check if the resource passed as argument is present in the audit_resources.
 
+    The lookup is a hash lookup when audit_resources is an AuditResources, the
+    wildcard patterns in it are also matched.
+
     Returns True if it is filtered and False if it does not match the input filters
     """
     try:
@@ -15,3 +153,29 @@ def is_resource_filtered(resource: str, audit_resources: list) -> bool:
         logger.error(
             f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error} ({resource})"
         )
+
+
+def is_region_filtered(
+    audit_resources: list,
+    service: str,
+    region: str = "",
+    resource_type: Optional[str] = None,
+) -> bool:
+    """
+    Check if the audit_resources can contain resources of the service and resource type in the region.
+
+    Services use it to skip listing the regions or resource types without targeted resources.
+
+    Returns True if there are no audit_resources or any of them can be in the region
+    """
+    try:
+        if not audit_resources:
+            return True
+        return compile_audit_resources(audit_resources).targets(
+            service, region, resource_type
+        )
+    except Exception as error:
+        logger.error(
+            f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error} ({service} {region} {resource_type})"
+        )
+        return True
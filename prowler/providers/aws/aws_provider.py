@@ -21,6 +21,7 @@ from prowler.config.config import (
 )
 from prowler.lib.check.utils import list_modules, recover_checks_from_service
 from prowler.lib.logger import logger
+from prowler.lib.scan_filters.scan_filters import AuditResources
 from prowler.lib.utils.utils import open_file, parse_json_file, print_boxes
 from prowler.providers.aws.config import (
     AWS_REGION_US_EAST_1,
@@ -81,7 +82,7 @@ class AwsProvider(Provider):
         _identity (AWSIdentityInfo): The AWS provider identity information.
         _session (AWSSession): The AWS provider session.
         _organizations_metadata (AWSOrganizationsInfo): The AWS Organizations metadata.
-        _audit_resources (list): The list of resources to audit.
+        _audit_resources (AuditResources): The list of resources to audit, indexed for fast lookups.
         _audit_config (dict): The audit configuration.
         _scan_unused_services (bool): A boolean indicating whether to scan unused services.
         _enabled_regions (set): The set of enabled regions.
@@ -334,11 +335,13 @@ class AwsProvider(Provider):
 
         # Parse Scan Tags
         if resource_tags:
-            self._audit_resources = self.get_tagged_resources(resource_tags)
+            self._audit_resources = AuditResources(
+                self.get_tagged_resources(resource_tags)
+            )
 
         # Parse Input Resource ARNs
         if resource_arn:
-            self._audit_resources = resource_arn
+            self._audit_resources = AuditResources(resource_arn)
 
         # Get Enabled Regions
         self._enabled_regions = self.get_aws_enabled_regions(
@@ -166,6 +166,11 @@ def init_parser(self):
         action="store_true",
         help="Fix the failed findings that can be fixed by Prowler",
     )
+    prowler_fixer_subparser.add_argument(
+        "--fixer-dry-run",
+        action="store_true",
+        help="Print the fixes planned for the failed findings without applying them",
+    )
 
 
 def validate_session_duration(session_duration: int) -> int:
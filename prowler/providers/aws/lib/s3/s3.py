@@ -168,6 +168,10 @@ class S3:
             subfolder_name = "json-ocsf"
         elif extension == ".asff.json":
             subfolder_name = "json-asff"
+        elif extension == ".ocsf.ndjson":
+            subfolder_name = "ndjson-ocsf"
+        elif extension == ".parquet":
+            subfolder_name = "parquet"
         else:
             subfolder_name = extension.lstrip(".")
         return subfolder_name
@@ -192,6 +196,8 @@ class S3:
                 ".csv": "text/csv",
                 ".ocsf.json": "application/json",
                 ".asff.json": "application/json",
+                ".ocsf.ndjson": "application/x-ndjson",
+                ".parquet": "application/vnd.apache.parquet",
             }
             # Keys are regular and/or compliance
             for key, output_list in outputs.items():
@@ -216,13 +222,17 @@ class S3:
                         # TODO: This will need further optimization if some processes are calling this since the files are written
                         # into the local filesystem because S3 upload file is the recommended way.
                         # https://aws.amazon.com/blogs/developer/uploading-files-to-amazon-s3/
+                        extra_args = {
+                            "ContentType": extension_to_content_type[file_extension]
+                        }
+                        # Compressed outputs are uploaded as they were written
+                        if getattr(output, "compression", None):
+                            extra_args["ContentEncoding"] = output.compression
                         self._session.upload_file(
                             Filename=output.file_descriptor.name,
                             Bucket=self._bucket_name,
                             Key=object_name,
-                            ExtraArgs={
-                                "ContentType": extension_to_content_type[file_extension]
-                            },
+                            ExtraArgs=extra_args,
                         )
 
                         if output.file_extension in uploaded_objects["success"]:
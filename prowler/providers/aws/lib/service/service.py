@@ -1,6 +1,12 @@
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable
 
+from pydantic.v1 import BaseModel, PrivateAttr
+
+from prowler.lib.check.utils import get_checks_attributes
 from prowler.lib.logger import logger
+from prowler.lib.profiler import SERVICE_SPAN, profiler
 from prowler.providers.aws.aws_provider import AwsProvider
 
 # TODO: review the following code
@@ -10,6 +16,8 @@ from prowler.providers.aws.aws_provider import AwsProvider
 # )
 
 MAX_WORKERS = 10
+# Attributes read from every resource by the check reports
+REPORTED_ATTRIBUTES = {"tags"}
 
 
 class AWSService:
@@ -19,6 +27,7 @@ class AWSService:
     - AWS Session
     - Thread pool for the __threading_call__
     - Also handles if the AWS Service is Global
+    - Collection of only the attributes read by the checks to execute, deferring the rest until they are first read
     """
 
     failed_checks = set()
@@ -42,6 +51,13 @@ class AWSService:
         self.audit_resources = provider.audit_resources
         # TODO: remove this
         self.audited_checks = provider.audit_metadata.expected_checks
+        # Attributes read by the checks to execute, None if any attribute can be read
+        self.audited_attributes = get_checks_attributes(
+            provider.type, self.audited_checks
+        )
+        # Service attributes whose collection is deferred until they are first read
+        self._deferred_attributes = {}
+        self._deferred_lock = threading.Lock()
         self.audit_config = provider.audit_config
         self.fixer_config = provider.fixer_config
 
@@ -91,16 +107,145 @@ class AWSService:
                 f"{self.service.upper()} - Starting threads for '{call_name}' function to process {item_count} items..."
             )
 
-        # Submit tasks to the thread pool
-        futures = [self.thread_pool.submit(call, item) for item in items]
+        with profiler.span(
+            SERVICE_SPAN,
+            f"{self.service}.{call.__name__}",
+            provider="aws",
+            items=item_count,
+        ):
+            # Submit tasks to the thread pool
+            futures = [self.thread_pool.submit(call, item) for item in items]
+
+            # Wait for all tasks to complete
+            for future in as_completed(futures):
+                try:
+                    future.result()  # Raises exceptions from the thread, if any
+                except Exception:
+                    # Handle exceptions if necessary
+                    pass  # Replace 'pass' with any additional exception handling logic. Currently handled within the called function
+
+    def is_attribute_audited(self, *attributes: str) -> bool:
+        """
+        Check if the checks to execute can read any of the given attributes
+
+        Returns True if the attributes read by the checks are unknown
+        """
+        if self.audited_attributes is None:
+            return True
+        return any(
+            attribute in self.audited_attributes or attribute in REPORTED_ATTRIBUTES
+            for attribute in attributes
+        )
+
+    def __lazy_threading_call__(
+        self, call: Callable, resources: Iterable, attributes: tuple
+    ):
+        """
+        Run the call for every resource with __threading_call__ if the checks to execute read any
+        of the resource attributes it fills, otherwise defer it for each resource until one of them is first read.
+
+        Args:
+            call: The function filling the attributes of a resource
+            resources: The LazyResource items to process
+            attributes: The resource attributes filled by the call
+        """
+        if self.is_attribute_audited(*attributes):
+            self.__threading_call__(call, resources)
+        else:
+            for resource in resources:
+                resource.defer(call, attributes)
+
+    def __lazy_pipeline_call__(self, calls: list, resources: Iterable):
+        """
+        Run every call for every resource in a single pass of the thread pool, deferring the calls
+        filling attributes not read by the checks to execute like __lazy_threading_call__.
+
+        The tasks of all the calls are queued together, resource by resource, so the calls for a
+        resource do not wait for the previous call to finish for every other resource.
+
+        Args:
+            calls: The calls to run, each one a tuple with the function filling the attributes of a resource
+                and the resource attributes it fills
+            resources: The LazyResource items to process
+        """
+        resources = list(resources)
+        audited_calls = []
+        for call, attributes in calls:
+            if self.is_attribute_audited(*attributes):
+                audited_calls.append(call)
+            else:
+                for resource in resources:
+                    resource.defer(call, attributes)
+        if not audited_calls or not resources:
+            return
 
-        # Wait for all tasks to complete
-        for future in as_completed(futures):
-            try:
-                future.result()  # Raises exceptions from the thread, if any
-            except Exception:
-                # Handle exceptions if necessary
-                pass  # Replace 'pass' with any additional exception handling logic. Currently handled within the called function
+        logger.info(
+            f"{self.service.upper()} - Starting threads for {len(audited_calls)} functions to process {len(resources)} items..."
+        )
+        with profiler.span(
+            SERVICE_SPAN,
+            f"{self.service}.{'+'.join(call.__name__ for call in audited_calls)}",
+            provider="aws",
+            items=len(resources) * len(audited_calls),
+        ):
+            futures = [
+                self.thread_pool.submit(call, resource)
+                for resource in resources
+                for call in audited_calls
+            ]
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception:
+                    # Exceptions are handled within the called function
+                    pass
+
+    def __lazy_collect__(self, attributes: dict, *calls):
+        """
+        Set the service attributes to their default values and fill them running the calls with
+        __threading_call__ if the checks to execute read any of them, otherwise defer the calls
+        until one of the attributes is first read.
+
+        Args:
+            attributes: The service attributes filled by the calls and their default values
+            calls: The calls to run in order, each one a function run across the regions
+                or a tuple with the function and a callable returning the items to process
+        """
+        collection = (attributes, calls)
+        if self.is_attribute_audited(*attributes):
+            self._run_collection(collection)
+        else:
+            for attribute in attributes:
+                self._deferred_attributes[attribute] = collection
+
+    def _run_collection(self, collection: tuple):
+        attributes, calls = collection
+        for attribute, default in attributes.items():
+            setattr(self, attribute, default)
+        for call in calls:
+            if isinstance(call, tuple):
+                call, items = call
+                self.__threading_call__(call, items())
+            else:
+                self.__threading_call__(call)
+
+    def __getattr__(self, name):
+        # Only called for the attributes not set yet, like the deferred ones
+        deferred_attributes = self.__dict__.get("_deferred_attributes")
+        if not deferred_attributes or name not in deferred_attributes:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{name}'"
+            )
+        with self._deferred_lock:
+            collection = deferred_attributes.get(name)
+            if collection:
+                for attribute in collection[0]:
+                    deferred_attributes.pop(attribute, None)
+                logger.info(
+                    f"{self.service.upper()} - Collecting deferred attributes {', '.join(collection[0])}..."
+                )
+                self._run_collection(collection)
+        return getattr(self, name)
 
     def get_unknown_arn(self, resource_type: str = None, region: str = None) -> str:
         """
@@ -115,3 +260,33 @@ class AWSService:
             arn:aws:s3:us-east-1:123456789012:bucket/unknown
         """
         return f"arn:{self.audited_partition}:{self.service}:{f'{region}' if region else ''}:{self.audited_account}:{f'{resource_type}/' if resource_type else ''}unknown"
+
+
+class LazyResource(BaseModel):
+    """
+    Base model for the service resources whose attributes can be collected on first read.
+
+    Reading an attribute deferred with __lazy_threading_call__ runs the call filling it for this resource.
+    dict() does not run the deferred calls, it reports the default values of the attributes not collected
+    so the resource metadata keeps the same fields whatever checks are executed.
+    """
+
+    _deferred_calls: dict = PrivateAttr(default_factory=dict)
+
+    def defer(self, call: Callable, attributes: tuple):
+        for attribute in attributes:
+            self._deferred_calls[attribute] = call
+
+    def __getattribute__(self, name):
+        if name[0] != "_":
+            deferred_calls = object.__getattribute__(self, "_deferred_calls")
+            call = deferred_calls.get(name)
+            if call is not None:
+                for attribute in [
+                    attribute
+                    for attribute, deferred_call in deferred_calls.items()
+                    if deferred_call == call
+                ]:
+                    del deferred_calls[attribute]
+                call(self)
+        return object.__getattribute__(self, name)
@@ -1,3 +1,6 @@
+import json
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -8,6 +11,11 @@ from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
 from prowler.providers.aws.lib.service.service import AWSService
 
+# LookupEvents allows 2 requests per second per account and region
+LOOKUP_EVENTS_REQUESTS_PER_SECOND = 2
+# LookupEvents pages of up to 50 events read by event name for the threat detection checks
+THREAT_DETECTION_LOOKUP_EVENTS_MAX_PAGES = 5
+
 
 class Cloudtrail(AWSService):
     def __init__(self, provider):
@@ -15,6 +23,11 @@ class Cloudtrail(AWSService):
         super().__init__(__class__.__name__, provider)
         self.trail_arn_template = f"arn:{self.audited_partition}:cloudtrail:{self.region}:{self.audited_account}:trail"
         self.trails = {}
+        # Events looked up by the threat detection checks by region and minutes
+        self._event_windows = {}
+        self._event_windows_lock = threading.Lock()
+        self._lookup_events_next_request = {}
+        self._lookup_events_lock = threading.Lock()
         self.__threading_call__(self._get_trails)
         if self.trails:
             self._get_trail_status()
@@ -191,21 +204,125 @@ class Cloudtrail(AWSService):
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
-    def _lookup_events(self, trail, event_name, minutes):
+    def _lookup_events(
+        self, trail, event_name, minutes, start_time=None, max_pages=None
+    ):
         logger.info("CloudTrail - Lookup Events...")
+        events = []
         try:
             regional_client = self.regional_clients[trail.region]
-            response = regional_client.lookup_events(
-                LookupAttributes=[
+            lookup_events_arguments = {
+                "LookupAttributes": [
                     {"AttributeKey": "EventName", "AttributeValue": event_name}
                 ],
-                StartTime=datetime.now() - timedelta(minutes=minutes),
-            )
-            return response.get("Events")
+                "StartTime": start_time or datetime.now() - timedelta(minutes=minutes),
+            }
+            pages = 0
+            while True:
+                self._wait_lookup_events_rate(trail.region)
+                response = regional_client.lookup_events(**lookup_events_arguments)
+                events.extend(response.get("Events", []))
+                pages += 1
+                if not response.get("NextToken"):
+                    break
+                if max_pages and pages >= max_pages:
+                    logger.warning(
+                        f"{trail.region} -- CloudTrail LookupEvents for {event_name} stopped after {max_pages} pages, the events of the older pages are not analyzed."
+                    )
+                    break
+                lookup_events_arguments["NextToken"] = response["NextToken"]
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
+        return events
+
+    def _wait_lookup_events_rate(self, region):
+        """Block until the next LookupEvents request in the region fits in its rate limit"""
+        with self._lookup_events_lock:
+            now = time.monotonic()
+            request_time = max(now, self._lookup_events_next_request.get(region, now))
+            self._lookup_events_next_request[region] = (
+                request_time + 1 / LOOKUP_EVENTS_REQUESTS_PER_SECOND
+            )
+        time.sleep(request_time - now)
+
+    def _get_event_identities(self, trail, event_names, minutes) -> dict:
+        """
+        Get the identities that called each event name in the last minutes from the trail region.
+
+        The events of the time window are looked up once per event name, concurrently, and shared
+        by all the threat detection checks using the same region and minutes. Only the most recent
+        threat_detection_lookup_events_max_pages pages of each event name are read, since
+        LookupEvents is limited to 2 requests per second per region.
+
+        Args:
+            trail: The trail whose region events are looked up
+            event_names: The event names to get the identities of
+            minutes: The minutes of the time window
+
+        Returns:
+            dict: The (identity ARN, identity type) tuples and their number of events by event name.
+                Events without identity ARN, the ones from AWS services, are ignored.
+        """
+        with self._event_windows_lock:
+            event_window = self._event_windows.get((trail.region, minutes))
+            if event_window is None:
+                event_window = Event_Window(
+                    start_time=datetime.now() - timedelta(minutes=minutes)
+                )
+                self._event_windows[(trail.region, minutes)] = event_window
+            # Claim the event names nobody is looking up yet
+            event_names_to_lookup = [
+                event_name
+                for event_name in dict.fromkeys(event_names)
+                if event_name not in event_window.lookups
+            ]
+            for event_name in event_names_to_lookup:
+                event_window.lookups[event_name] = threading.Event()
+        # The lookups run without the lock, so other regions and windows are not blocked
+        if event_names_to_lookup:
+            self.__threading_call__(
+                self._index_events,
+                [
+                    (trail, event_name, event_window)
+                    for event_name in event_names_to_lookup
+                ],
+            )
+        # Wait for the event names claimed by other callers
+        for event_name in dict.fromkeys(event_names):
+            event_window.lookups[event_name].wait()
+        return {
+            event_name: event_window.identities.get(event_name, {})
+            for event_name in event_names
+        }
+
+    def _index_events(self, lookup):
+        trail, event_name, event_window = lookup
+        identities = {}
+        try:
+            for event in self._lookup_events(
+                trail=trail,
+                event_name=event_name,
+                minutes=None,
+                start_time=event_window.start_time,
+                max_pages=self.audit_config.get(
+                    "threat_detection_lookup_events_max_pages",
+                    THREAT_DETECTION_LOOKUP_EVENTS_MAX_PAGES,
+                ),
+            ):
+                try:
+                    user_identity = json.loads(event["CloudTrailEvent"])["userIdentity"]
+                    if "arn" in user_identity:
+                        identity = (user_identity["arn"], user_identity["type"])
+                        identities[identity] = identities.get(identity, 0) + 1
+                except Exception as error:
+                    logger.error(
+                        f"{trail.region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                    )
+        finally:
+            event_window.identities[event_name] = identities
+            event_window.lookups[event_name].set()
 
     def _list_tags_for_resource(self):
         logger.info("CloudTrail - List Tags...")
@@ -232,6 +349,14 @@ class Cloudtrail(AWSService):
             )
 
 
+class Event_Window(BaseModel):
+    start_time: datetime
+    # (identity ARN, identity type) tuples and their number of events by event name
+    identities: dict = {}
+    # Lookup of each event name, set once its identities are indexed
+    lookups: dict = {}
+
+
 class Event_Selector(BaseModel):
     is_advanced: bool
     event_selector: dict
@@ -1,5 +1,3 @@
-import json
-
 from prowler.lib.check.models import Check, Check_Report_AWS
 from prowler.providers.aws.services.cloudtrail.cloudtrail_client import (
     cloudtrail_client,
@@ -128,32 +126,16 @@ class cloudtrail_threat_detection_enumeration(Check):
             else [multiregion_trail]
         )
         for trail in trails_to_scan:
-            for event_name in enumeration_actions:
-                for event_log in cloudtrail_client._lookup_events(
-                    trail=trail,
-                    event_name=event_name,
-                    minutes=threat_detection_minutes,
-                ):
-                    event_log = json.loads(event_log["CloudTrailEvent"])
-                    if (
-                        "arn" in event_log["userIdentity"]
-                    ):  # Ignore event logs without ARN since they are AWS services
-                        if (
-                            event_log["userIdentity"]["arn"],
-                            event_log["userIdentity"]["type"],
-                        ) not in potential_enumeration:
-                            potential_enumeration[
-                                (
-                                    event_log["userIdentity"]["arn"],
-                                    event_log["userIdentity"]["type"],
-                                )
-                            ] = set()
-                        potential_enumeration[
-                            (
-                                event_log["userIdentity"]["arn"],
-                                event_log["userIdentity"]["type"],
-                            )
-                        ].add(event_name)
+            event_identities = cloudtrail_client._get_event_identities(
+                trail=trail,
+                event_names=enumeration_actions,
+                minutes=threat_detection_minutes,
+            )
+            for event_name, identities in event_identities.items():
+                for aws_identity in identities:
+                    potential_enumeration.setdefault(aws_identity, set()).add(
+                        event_name
+                    )
 
         for aws_identity, actions in potential_enumeration.items():
             identity_threshold = round(len(actions) / len(enumeration_actions), 2)
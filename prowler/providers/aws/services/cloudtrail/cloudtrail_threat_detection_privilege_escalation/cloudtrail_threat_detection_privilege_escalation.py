@@ -1,5 +1,3 @@
-import json
-
 from prowler.lib.check.models import Check, Check_Report_AWS
 from prowler.providers.aws.services.cloudtrail.cloudtrail_client import (
     cloudtrail_client,
@@ -88,32 +86,17 @@ class cloudtrail_threat_detection_privilege_escalation(Check):
             else [multiregion_trail]
         )
         for trail in trails_to_scan:
-            for event_name in privilege_escalation_actions:
-                for event_log in cloudtrail_client._lookup_events(
-                    trail=trail,
-                    event_name=event_name,
-                    minutes=threat_detection_minutes,
-                ):
-                    event_log = json.loads(event_log["CloudTrailEvent"])
-                    if (
-                        "arn" in event_log["userIdentity"]
-                    ):  # Ignore event logs without ARN since they are AWS services
-                        if (
-                            event_log["userIdentity"]["arn"],
-                            event_log["userIdentity"]["type"],
-                        ) not in potential_privilege_escalation:
-                            potential_privilege_escalation[
-                                (
-                                    event_log["userIdentity"]["arn"],
-                                    event_log["userIdentity"]["type"],
-                                )
-                            ] = set()
-                        potential_privilege_escalation[
-                            (
-                                event_log["userIdentity"]["arn"],
-                                event_log["userIdentity"]["type"],
-                            )
-                        ].add(event_name)
+            event_identities = cloudtrail_client._get_event_identities(
+                trail=trail,
+                event_names=privilege_escalation_actions,
+                minutes=threat_detection_minutes,
+            )
+            for event_name, identities in event_identities.items():
+                for aws_identity in identities:
+                    potential_privilege_escalation.setdefault(aws_identity, set()).add(
+                        event_name
+                    )
+
         for aws_identity, actions in potential_privilege_escalation.items():
             identity_threshold = round(
                 len(actions) / len(privilege_escalation_actions), 2
@@ -6,7 +6,10 @@ from botocore.client import ClientError
 from pydantic.v1 import BaseModel
 
 from prowler.lib.logger import logger
-from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from prowler.lib.scan_filters.scan_filters import (
+    is_region_filtered,
+    is_resource_filtered,
+)
 from prowler.providers.aws.lib.service.service import AWSService
 
 
@@ -30,29 +33,30 @@ class EC2(AWSService):
         self.__threading_call__(self._determine_public_snapshots, self.snapshots)
         self.network_interfaces = {}
         self.__threading_call__(self._describe_network_interfaces)
-        self.images = []
-        self.__threading_call__(self._describe_images)
+        self.__lazy_collect__({"images": []}, self._describe_images)
         self.volumes = []
         self.__threading_call__(self._describe_volumes)
         self.attributes_for_regions = {}
         self.__threading_call__(self._get_resources_for_regions)
-        self.ebs_encryption_by_default = []
-        self.__threading_call__(self._get_ebs_encryption_settings)
-        self.elastic_ips = []
-        self.__threading_call__(self._describe_ec2_addresses)
-        self.ebs_block_public_access_snapshots_states = []
-        self.__threading_call__(self._get_snapshot_block_public_access_state)
-        self.instance_metadata_defaults = []
-        self.__threading_call__(self._get_instance_metadata_defaults)
-        self.launch_templates = []
-        self.__threading_call__(self._describe_launch_templates)
-        self.__threading_call__(
-            self._describe_launch_template_versions, self.launch_templates
+        # The following attributes are collected only if the checks to execute read them
+        self.__lazy_collect__(
+            {"ebs_encryption_by_default": []}, self._get_ebs_encryption_settings
         )
-        self.vpn_endpoints = {}
-        self.__threading_call__(self._describe_vpn_endpoints)
-        self.transit_gateways = {}
-        self.__threading_call__(self._describe_transit_gateways)
+        self.__lazy_collect__({"elastic_ips": []}, self._describe_ec2_addresses)
+        self.__lazy_collect__(
+            {"ebs_block_public_access_snapshots_states": []},
+            self._get_snapshot_block_public_access_state,
+        )
+        self.__lazy_collect__(
+            {"instance_metadata_defaults": []}, self._get_instance_metadata_defaults
+        )
+        self.__lazy_collect__(
+            {"launch_templates": []},
+            self._describe_launch_templates,
+            (self._describe_launch_template_versions, lambda: self.launch_templates),
+        )
+        self.__lazy_collect__({"vpn_endpoints": {}}, self._describe_vpn_endpoints)
+        self.__lazy_collect__({"transit_gateways": {}}, self._describe_transit_gateways)
 
     def _get_volume_arn_template(self, region):
         return (
@@ -60,6 +64,10 @@ class EC2(AWSService):
         )
 
     def _describe_instances(self, regional_client):
+        if not is_region_filtered(
+            self.audit_resources, "ec2", regional_client.region, "instance"
+        ):
+            return
         try:
             describe_instances_paginator = regional_client.get_paginator(
                 "describe_instances"
@@ -118,6 +126,10 @@ class EC2(AWSService):
             )
 
     def _describe_security_groups(self, regional_client):
+        if not is_region_filtered(
+            self.audit_resources, "ec2", regional_client.region, "security-group"
+        ):
+            return
         try:
             describe_security_groups_paginator = regional_client.get_paginator(
                 "describe_security_groups"
@@ -153,6 +165,10 @@ class EC2(AWSService):
             )
 
     def _describe_network_acls(self, regional_client):
+        if not is_region_filtered(
+            self.audit_resources, "ec2", regional_client.region, "network-acl"
+        ):
+            return
         try:
             describe_network_acls_paginator = regional_client.get_paginator(
                 "describe_network_acls"
@@ -348,6 +364,10 @@ class EC2(AWSService):
             )
 
     def _describe_images(self, regional_client):
+        if not is_region_filtered(
+            self.audit_resources, "ec2", regional_client.region, "image"
+        ):
+            return
         try:
             for owner in ["self", "amazon"]:
                 try:
@@ -380,6 +400,10 @@ class EC2(AWSService):
             )
 
     def _describe_volumes(self, regional_client):
+        if not is_region_filtered(
+            self.audit_resources, "ec2", regional_client.region, "volume"
+        ):
+            return
         try:
             describe_volumes_paginator = regional_client.get_paginator(
                 "describe_volumes"
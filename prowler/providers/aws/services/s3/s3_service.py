@@ -6,7 +6,10 @@ from pydantic.v1 import BaseModel, Field
 
 from prowler.lib.logger import logger
 from prowler.lib.scan_filters.scan_filters import is_resource_filtered
-from prowler.providers.aws.lib.service.service import AWSService
+from prowler.providers.aws.lib.service.service import AWSService, LazyResource
+
+# Buckets requested per ListBuckets page, the maximum allowed
+LIST_BUCKETS_PAGE_SIZE = 10000
 
 
 class S3(AWSService):
@@ -18,72 +21,70 @@ class S3(AWSService):
         self.buckets = {}
         self.audited_canonical_id = ""
         self._list_buckets(provider)
-        self.__threading_call__(self._get_bucket_versioning, self.buckets.values())
-        self.__threading_call__(self._get_bucket_logging, self.buckets.values())
-        self.__threading_call__(self._get_bucket_policy, self.buckets.values())
-        self.__threading_call__(self._get_bucket_acl, self.buckets.values())
-        self.__threading_call__(self._get_public_access_block, self.buckets.values())
-        self.__threading_call__(self._get_bucket_encryption, self.buckets.values())
-        self.__threading_call__(
-            self._get_bucket_ownership_controls, self.buckets.values()
-        )
-        self.__threading_call__(
-            self._get_object_lock_configuration, self.buckets.values()
-        )
-        self.__threading_call__(self._get_bucket_tagging, self.buckets.values())
-        self.__threading_call__(self._get_bucket_replication, self.buckets.values())
-        self.__threading_call__(self._get_bucket_lifecycle, self.buckets.values())
-        self.__threading_call__(
-            self._get_bucket_notification_configuration, self.buckets.values()
+        # Bucket attributes are collected only if the checks to execute read them,
+        # all the calls for every bucket are queued at once through its regional client
+        self.__lazy_pipeline_call__(
+            [
+                (self._get_bucket_versioning, ("versioning", "mfa_delete")),
+                (self._get_bucket_logging, ("logging", "logging_target_bucket")),
+                (self._get_bucket_policy, ("policy",)),
+                (self._get_bucket_acl, ("owner_id", "acl_grantees")),
+                (self._get_public_access_block, ("public_access_block",)),
+                (self._get_bucket_encryption, ("encryption",)),
+                (self._get_bucket_ownership_controls, ("ownership",)),
+                (self._get_object_lock_configuration, ("object_lock",)),
+                (self._get_bucket_tagging, ("tags",)),
+                (self._get_bucket_replication, ("replication_rules",)),
+                (self._get_bucket_lifecycle, ("lifecycle",)),
+                (
+                    self._get_bucket_notification_configuration,
+                    ("notification_config",),
+                ),
+            ],
+            self.buckets.values(),
         )
 
     def _list_buckets(self, provider):
         logger.info("S3 - Listing buckets...")
         try:
-            list_buckets = self.client.list_buckets()
-            self.audited_canonical_id = list_buckets["Owner"]["ID"]
-            for bucket in list_buckets["Buckets"]:
-                try:
-                    bucket_region = self.client.get_bucket_location(
-                        Bucket=bucket["Name"]
-                    )["LocationConstraint"]
-                    if bucket_region == "EU":  # If EU, bucket_region is eu-west-1
-                        bucket_region = "eu-west-1"
-                    if not bucket_region:  # If None, bucket_region is us-east-1
-                        bucket_region = "us-east-1"
-                    # Arn
+            listed_buckets = []
+            list_buckets_paginator = self.client.get_paginator("list_buckets")
+            # Paginated requests return the region of every bucket
+            for page in list_buckets_paginator.paginate(
+                PaginationConfig={"PageSize": LIST_BUCKETS_PAGE_SIZE}
+            ):
+                self.audited_canonical_id = page["Owner"]["ID"]
+                for bucket in page["Buckets"]:
                     arn = f"arn:{self.audited_partition}:s3:::{bucket['Name']}"
                     if not self.audit_resources or (
                         is_resource_filtered(arn, self.audit_resources)
                     ):
-                        self.regions_with_buckets.append(bucket_region)
-                        # Check if there are filter regions
-                        # FIXME: what if the bucket comes from a CloudTrail bucket in another audited region
-                        if provider.identity.audited_regions:
-                            if bucket_region in provider.identity.audited_regions:
-                                self.buckets[arn] = Bucket(
-                                    arn=arn,
-                                    name=bucket["Name"],
-                                    region=bucket_region,
-                                )
-                        else:
-                            self.buckets[arn] = Bucket(
-                                arn=arn,
-                                name=bucket["Name"],
-                                region=bucket_region,
-                            )
-                except ClientError as error:
-                    if error.response["Error"]["Code"] == "NoSuchBucket":
-                        logger.warning(
-                            f"{bucket['Name']} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
-                        )
-                    else:
-                        logger.error(
-                            f"{bucket['Name']} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                        listed_buckets.append(
+                            {
+                                "arn": arn,
+                                "name": bucket["Name"],
+                                "region": bucket.get("BucketRegion"),
+                            }
                         )
-                except Exception as error:
-                    logger.error(
-                        f"{bucket['Name']} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            # The location is only requested for the buckets listed without region
+            self.__threading_call__(
+                self._get_bucket_location,
+                [bucket for bucket in listed_buckets if not bucket["region"]],
+            )
+            for bucket in listed_buckets:
+                if not bucket["region"]:
+                    continue
+                self.regions_with_buckets.append(bucket["region"])
+                # Check if there are filter regions
+                # FIXME: what if the bucket comes from a CloudTrail bucket in another audited region
+                if (
+                    not provider.identity.audited_regions
+                    or bucket["region"] in provider.identity.audited_regions
+                ):
+                    self.buckets[bucket["arn"]] = Bucket(
+                        arn=bucket["arn"],
+                        name=bucket["name"],
+                        region=bucket["region"],
                     )
         except ClientError as error:
             if error.response["Error"]["Code"] == "NotSignedUp":
@@ -99,6 +100,30 @@ class S3(AWSService):
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
 
+    def _get_bucket_location(self, bucket):
+        try:
+            bucket_region = self.client.get_bucket_location(Bucket=bucket["name"])[
+                "LocationConstraint"
+            ]
+            if bucket_region == "EU":  # If EU, bucket_region is eu-west-1
+                bucket_region = "eu-west-1"
+            if not bucket_region:  # If None, bucket_region is us-east-1
+                bucket_region = "us-east-1"
+            bucket["region"] = bucket_region
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "NoSuchBucket":
+                logger.warning(
+                    f"{bucket['name']} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+            else:
+                logger.error(
+                    f"{bucket['name']} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+        except Exception as error:
+            logger.error(
+                f"{bucket['name']} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
+
     def _get_bucket_versioning(self, bucket):
         logger.info("S3 - Get buckets versioning...")
         try:
@@ -683,7 +708,7 @@ class ReplicationRule(BaseModel):
     destination: str
 
 
-class Bucket(BaseModel):
+class Bucket(LazyResource):
     arn: str
     name: str
     owner_id: Optional[str]
@@ -36,7 +36,9 @@ class ProviderOutputOptions:
         self.only_logs = getattr(arguments, "only_logs", None)
         self.unix_timestamp = getattr(arguments, "unix_timestamp", None)
         self.shodan_api_key = getattr(arguments, "shodan", None)
-        self.fixer = getattr(arguments, "fixer", None)
+        self.output_compression = getattr(arguments, "output_compression", None)
+        self.fixer_dry_run = getattr(arguments, "fixer_dry_run", None)
+        self.fixer = getattr(arguments, "fixer", None) or self.fixer_dry_run
 
         # Shodan API Key
         if self.shodan_api_key:
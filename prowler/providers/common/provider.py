@@ -275,6 +275,8 @@ class Provider(ABC):
                         github_username=arguments.github_username,
                         personal_access_token=arguments.personal_access_token,
                         oauth_app_token=arguments.oauth_app_token,
+                        shards=arguments.shards,
+                        cache_directory=arguments.cache_directory,
                     )
                 elif "llm" in provider_class_name.lower():
                     provider_class(
@@ -301,6 +303,7 @@ class Provider(ABC):
                         mutelist_path=arguments.mutelist_file,
                         fixer_config=fixer_config,
                         use_instance_principal=arguments.use_instance_principal,
+                        use_resource_search=arguments.resource_search,
                     )
 
         except TypeError as error:
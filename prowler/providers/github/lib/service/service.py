@@ -1,3 +1,6 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import github
 from github import Auth, Github, GithubIntegration
 from github.GithubRetry import GithubRetry
@@ -5,6 +8,10 @@ from github.GithubRetry import GithubRetry
 from prowler.lib.logger import logger
 from prowler.providers.github.github_provider import GithubProvider
 
+MAX_WORKERS = 10
+# Remaining REST requests below which the workers wait for the quota to reset
+RATE_LIMIT_RESERVE = 100
+
 
 class GithubService:
     def __init__(
@@ -44,6 +51,57 @@ class GithubService:
             )
         return clients
 
+    def __threading_call__(self, call, iterator):
+        items = iterator
+        # Determine the total count for logging
+        item_count = len(items)
+
+        # Trim leading and trailing underscores from the call's name
+        call_name = call.__name__.strip("_")
+        # Add Capitalization
+        call_name = " ".join([x.capitalize() for x in call_name.split("_")])
+
+        logger.info(
+            f"{self.__class__.__name__} - Starting threads for '{call_name}' function to process {item_count} items..."
+        )
+
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as thread_pool:
+            # Submit tasks to the thread pool
+            futures = [thread_pool.submit(call, item) for item in items]
+
+            # Wait for all tasks to complete
+            for future in as_completed(futures):
+                try:
+                    future.result()  # Raises exceptions from the thread, if any
+                except Exception:
+                    # Errors are handled within the called function
+                    pass
+
+    def _wait_for_rate_limit(self, client, reserve: int = RATE_LIMIT_RESERVE):
+        """
+        Block until the client has enough REST quota left.
+
+        PyGithub keeps the X-RateLimit-* headers of the last response, so reading
+        them does not cost an extra request once the client has been used.
+
+        Args:
+            client: Github client whose quota is checked
+            reserve: Remaining requests below which the call waits for the reset
+        """
+        try:
+            remaining, _ = client.rate_limiting
+            if remaining > reserve:
+                return
+            wait_seconds = max(client.rate_limiting_resettime - time.time(), 0) + 1
+            logger.warning(
+                f"GitHub API rate limit almost exhausted ({remaining} requests left), waiting {int(wait_seconds)} seconds for the reset..."
+            )
+            time.sleep(wait_seconds)
+        except Exception as error:
+            logger.debug(
+                f"Could not read GitHub API rate limit: {error.__class__.__name__}: {error}"
+            )
+
     def _handle_github_api_error(
         self, error, context: str, item_name: str, reraise_rate_limit: bool = False
     ):
@@ -1,3 +1,4 @@
+import json
 from datetime import datetime
 from typing import Optional
 
@@ -9,6 +10,24 @@ from prowler.lib.logger import logger
 from prowler.providers.github.lib.service.service import GithubService
 from prowler.providers.github.models import GithubAppIdentityInfo
 
+SECURITYMD_PATH = "SECURITY.md"
+# CODEOWNERS file can be in .github/, root, or docs/
+# https://docs.github.com/en/repositories/managing-your-repositorys-settings-and-features/customizing-your-repository/about-code-owners#codeowners-file-location
+CODEOWNERS_PATHS = [
+    ".github/CODEOWNERS",
+    "CODEOWNERS",
+    "docs/CODEOWNERS",
+]
+# GraphQL aliases for each file looked up in the default branch
+REPOSITORY_FILES_ALIASES = {
+    SECURITYMD_PATH: "securitymd",
+    ".github/CODEOWNERS": "codeowners_github",
+    "CODEOWNERS": "codeowners_root",
+    "docs/CODEOWNERS": "codeowners_docs",
+}
+# Number of repositories resolved in a single GraphQL query
+GRAPHQL_BATCH_SIZE = 50
+
 
 class Repository(GithubService):
     def __init__(self, provider):
@@ -112,6 +131,7 @@ class Repository(GithubService):
         repos = {}
         try:
             for client in self.clients:
+                repos_to_process = {}
                 if (
                     self.provider.repositories
                     or self.provider.organizations
@@ -132,7 +152,7 @@ class Repository(GithubService):
                                 continue
                             try:
                                 repo = client.get_repo(repo_name)
-                                self._process_repository(repo, repos)
+                                repos_to_process[repo.full_name] = repo
                             except Exception as error:
                                 self._handle_github_api_error(
                                     error, "accessing repository", repo_name
@@ -148,7 +168,7 @@ class Repository(GithubService):
                                     client, org_name
                                 )
                                 for repo in repos_list:
-                                    self._process_repository(repo, repos)
+                                    repos_to_process[repo.full_name] = repo
                             except Exception as error:
                                 self._handle_github_api_error(
                                     error, "processing organization", org_name
@@ -167,7 +187,7 @@ class Repository(GithubService):
                                     client, org_name
                                 )
                                 for repo in repos_list:
-                                    self._process_repository(repo, repos)
+                                    repos_to_process[repo.full_name] = repo
                             except Exception as error:
                                 self._handle_github_api_error(
                                     error, "processing organization", org_name
@@ -189,7 +209,7 @@ class Repository(GithubService):
                             logger.info(
                                 f"Processing repository found via GraphQL: {repo.full_name}"
                             )
-                            self._process_repository(repo, repos)
+                            repos_to_process[repo.full_name] = repo
                         except Exception as error:
                             if hasattr(self, "_handle_github_api_error"):
                                 self._handle_github_api_error(
@@ -202,6 +222,10 @@ class Repository(GithubService):
                                     f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                                 )
 
+                self._process_repositories(
+                    client, list(repos_to_process.values()), repos
+                )
+
         except github.RateLimitExceededException as error:
             logger.error(f"GitHub API rate limit exceeded: {error}")
             raise
@@ -213,21 +237,87 @@ class Repository(GithubService):
             )
         return repos
 
-    def _process_repository(self, repo, repos):
-        """Process a single repository and extract all its information."""
+    def _get_repository_files_graphql(self, client, repos) -> dict:
+        """
+        Check the SECURITY.md and CODEOWNERS files of many repositories at once.
+
+        Each GraphQL query resolves up to GRAPHQL_BATCH_SIZE repositories using aliases,
+        replacing the four REST `get_contents` calls done per repository.
+
+        Args:
+            client: Github client used to send the queries
+            repos: List of PyGithub repositories
+
+        Returns:
+            dict: Repository full name -> {file path: exists}. Repositories of a failed batch are not included, so they fall back to the REST API.
+        """
+        repository_files = {}
+        for start in range(0, len(repos), GRAPHQL_BATCH_SIZE):
+            batch = repos[start : start + GRAPHQL_BATCH_SIZE]
+            try:
+                files_query = " ".join(
+                    f"{alias}: object(expression: {json.dumps('HEAD:' + path)}) {{ id }}"
+                    for path, alias in REPOSITORY_FILES_ALIASES.items()
+                )
+                repositories_query = " ".join(
+                    f"repo_{index}: repository(owner: {json.dumps(repo.owner.login)}, name: {json.dumps(repo.name)}) {{ {files_query} }}"
+                    for index, repo in enumerate(batch)
+                )
+                _, data = client.requester.graphql_query(
+                    f"query {{ {repositories_query} }}", {}
+                )
+                for index, repo in enumerate(batch):
+                    repository_data = data["data"][f"repo_{index}"] or {}
+                    repository_files[repo.full_name] = {
+                        path: repository_data.get(alias) is not None
+                        for path, alias in REPOSITORY_FILES_ALIASES.items()
+                    }
+            except Exception as error:
+                logger.warning(
+                    f"Could not batch the repository files lookup, falling back to the REST API: {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+        return repository_files
+
+    def _process_repositories(self, client, repos_to_process, repos):
+        """
+        Process the repositories of a client concurrently.
+
+        The files present in each repository are resolved with batched GraphQL queries
+        and the remaining REST calls run in a thread pool that waits for the
+        rate limit reset when the quota is about to be exhausted.
+
+        Args:
+            client: Github client that retrieved the repositories
+            repos_to_process: List of PyGithub repositories
+            repos: Dictionary where the processed repositories are stored
+        """
+        if not repos_to_process:
+            return
+        repository_files = self._get_repository_files_graphql(client, repos_to_process)
+
+        def _process_repository_rate_limited(repo):
+            self._wait_for_rate_limit(client)
+            self._process_repository(repo, repos, repository_files.get(repo.full_name))
+
+        self.__threading_call__(_process_repository_rate_limited, repos_to_process)
+
+    def _process_repository(self, repo, repos, files: dict = None):
+        """Process a single repository and extract all its information.
+
+        Args:
+            repo: PyGithub repository
+            repos: Dictionary where the processed repository is stored
+            files: Optional {file path: exists} map already resolved via GraphQL
+        """
         try:
             default_branch = repo.default_branch
-            securitymd_exists = self._file_exists(repo, "SECURITY.md")
-            # CODEOWNERS file can be in .github/, root, or docs/
-            # https://docs.github.com/en/repositories/managing-your-repositorys-settings-and-features/customizing-your-repository/about-code-owners#codeowners-file-location
-            codeowners_paths = [
-                ".github/CODEOWNERS",
-                "CODEOWNERS",
-                "docs/CODEOWNERS",
-            ]
-            codeowners_files = [
-                self._file_exists(repo, path) for path in codeowners_paths
-            ]
+            if files is None:
+                files = {
+                    path: self._file_exists(repo, path)
+                    for path in REPOSITORY_FILES_ALIASES
+                }
+            securitymd_exists = files.get(SECURITYMD_PATH)
+            codeowners_files = [files.get(path) for path in CODEOWNERS_PATHS]
             if True in codeowners_files:
                 codeowners_exists = True
             elif all(file is None for file in codeowners_files):
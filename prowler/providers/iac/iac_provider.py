@@ -1,10 +1,16 @@
+import gzip
+import hashlib
 import json
+import os
+import queue
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from os import environ
-from typing import List
+from typing import Callable, Iterator, List, Optional, TextIO
 
 from alive_progress import alive_bar
 from colorama import Fore, Style
@@ -20,6 +26,11 @@ from prowler.lib.utils.utils import print_boxes
 from prowler.providers.common.models import Audit_Metadata
 from prowler.providers.common.provider import Provider
 
+# Size of the chunks read from the Trivy JSON output and from the hashed files
+READ_CHUNK_SIZE = 64 * 1024
+# Directories never sent to Trivy nor hashed for the results cache
+IGNORED_DIRECTORIES = {".git"}
+
 
 class IacProvider(Provider):
     _type: str = "iac"
@@ -37,6 +48,8 @@ class IacProvider(Provider):
         github_username: str = None,
         personal_access_token: str = None,
         oauth_app_token: str = None,
+        shards: int = 1,
+        cache_directory: str = None,
     ):
         logger.info("Instantiating IAC Provider...")
 
@@ -44,6 +57,10 @@ class IacProvider(Provider):
         self.scan_repository_url = scan_repository_url
         self.scanners = scanners
         self.exclude_path = exclude_path
+        # Number of Trivy processes running in parallel, one per top-level directory
+        self.shards = max(1, shards)
+        # Directory where the Trivy results are cached by the content of the files
+        self.cache_directory = cache_directory
         self.region = "global"
         self.audited_account = "local-iac"
         self._session = None
@@ -262,7 +279,9 @@ class IacProvider(Provider):
                 f"{error.__class__.__name__}:{error.__traceback__.tb_lineno} -- {error}"
             )
 
-    def run(self) -> List[CheckReportIAC]:
+    def run(
+        self, streaming_callback: Optional[Callable] = None
+    ) -> List[CheckReportIAC]:
         temp_dir = None
         if self.scan_repository_url:
             scan_dir = temp_dir = self._clone_repository(
@@ -275,7 +294,12 @@ class IacProvider(Provider):
             scan_dir = self.scan_path
 
         try:
-            reports = self.run_scan(scan_dir, self.scanners, self.exclude_path)
+            reports = self.run_scan(
+                scan_dir,
+                self.scanners,
+                self.exclude_path,
+                streaming_callback=streaming_callback,
+            )
         finally:
             if temp_dir:
                 logger.info(f"Removing temporary directory {temp_dir}...")
@@ -284,24 +308,36 @@ class IacProvider(Provider):
         return reports
 
     def run_scan(
-        self, directory: str, scanners: list[str], exclude_path: list[str]
+        self,
+        directory: str,
+        scanners: list[str],
+        exclude_path: list[str],
+        streaming_callback: Optional[Callable] = None,
     ) -> List[CheckReportIAC]:
+        """
+        Run Trivy on the directory and return its findings as reports.
+
+        The directory is split in shards, one per top-level directory, scanned by
+        up to `self.shards` Trivy processes in parallel. The JSON output of each
+        process is parsed while it is read, and the reports of every Trivy result
+        are passed to the `streaming_callback` as soon as they are available. The
+        streamed reports are not kept, so the memory used by the scan does not grow
+        with the number of findings.
+
+        Args:
+            directory: The directory to scan
+            scanners: The Trivy scanners to run
+            exclude_path: The paths excluded from the scan
+            streaming_callback: Optional callback receiving the reports in batches
+
+        Returns:
+            List[CheckReportIAC]: All the reports of the scan, or an empty list if they
+                were passed to the `streaming_callback`
+        """
         try:
             logger.info(f"Running IaC scan on {directory} ...")
-            trivy_command = [
-                "trivy",
-                "fs",
-                directory,
-                "--format",
-                "json",
-                "--scanners",
-                ",".join(scanners),
-                "--parallel",
-                "0",
-                "--include-non-failures",
-            ]
-            if exclude_path:
-                trivy_command.extend(["--skip-dirs", ",".join(exclude_path)])
+            reports = []
+            reports_count = 0
             with alive_bar(
                 ctrl_c=False,
                 bar="blocks",
@@ -311,86 +347,22 @@ class IacProvider(Provider):
             ) as bar:
                 try:
                     bar.title = f"-> Running IaC scan on {directory} ..."
-                    # Run Trivy with JSON output
-                    process = subprocess.run(
-                        trivy_command,
-                        capture_output=True,
-                        text=True,
-                    )
+                    for target_prefix, result in self._scan_shards(
+                        directory, scanners, exclude_path
+                    ):
+                        result_reports = self._process_result(result, target_prefix)
+                        reports_count += len(result_reports)
+                        if not streaming_callback:
+                            reports.extend(result_reports)
+                        elif result_reports:
+                            streaming_callback(result_reports)
                     bar.title = "-> Scan completed!"
                 except Exception as error:
                     bar.title = "-> Scan failed!"
                     raise error
-            # Log Trivy's stderr output with preserved log levels
-            if process.stderr:
-                for line in process.stderr.strip().split("\n"):
-                    if line.strip():
-                        # Parse Trivy's log format to extract level and message
-                        # Trivy format: timestamp level message
-                        parts = line.split()
-                        if len(parts) >= 3:
-                            # Extract level and message
-                            level = parts[1]
-                            message = " ".join(parts[2:])
-
-                            # Map Trivy log levels to Python logging levels
-                            if level == "ERROR":
-                                logger.error(f"{message}")
-                            elif level == "WARN":
-                                logger.warning(f"{message}")
-                            elif level == "INFO":
-                                logger.info(f"{message}")
-                            elif level == "DEBUG":
-                                logger.debug(f"{message}")
-                            else:
-                                # Default to info for unknown levels
-                                logger.info(f"{message}")
-                        else:
-                            # If we can't parse the format, log as info
-                            logger.info(f"{line}")
-
-            try:
-                output = json.loads(process.stdout).get("Results", [])
-
-                if not output:
-                    logger.warning("No findings returned from Trivy scan")
-                    return []
-            except Exception as error:
-                logger.critical(
-                    f"{error.__class__.__name__}:{error.__traceback__.tb_lineno} -- {error}"
-                )
-                sys.exit(1)
-
-            reports = []
-
-            # Process all trivy findings
-            for finding in output:
-
-                # Process Misconfigurations
-                for misconfiguration in finding.get("Misconfigurations", []):
-                    report = self._process_finding(
-                        misconfiguration, finding["Target"], finding["Type"]
-                    )
-                    reports.append(report)
-                # Process Vulnerabilities
-                for vulnerability in finding.get("Vulnerabilities", []):
-                    report = self._process_finding(
-                        vulnerability, finding["Target"], finding["Type"]
-                    )
-                    reports.append(report)
-                # Process Secrets
-                for secret in finding.get("Secrets", []):
-                    report = self._process_finding(
-                        secret, finding["Target"], finding["Class"]
-                    )
-                    reports.append(report)
-                # Process Licenses
-                for license in finding.get("Licenses", []):
-                    report = self._process_finding(
-                        license, finding["Target"], finding["Type"]
-                    )
-                    reports.append(report)
 
+            if not reports_count:
+                logger.warning("No findings returned from Trivy scan")
             return reports
 
         except Exception as error:
@@ -404,6 +376,312 @@ class IacProvider(Provider):
             )
             sys.exit(1)
 
+    def _process_result(
+        self, result: dict, target_prefix: str = ""
+    ) -> List[CheckReportIAC]:
+        """Create the reports of every check in a Trivy result."""
+        file_path = (
+            os.path.join(target_prefix, result["Target"])
+            if target_prefix
+            else result["Target"]
+        )
+        reports = []
+        # Process Misconfigurations
+        for misconfiguration in result.get("Misconfigurations") or []:
+            reports.append(
+                self._process_finding(misconfiguration, file_path, result["Type"])
+            )
+        # Process Vulnerabilities
+        for vulnerability in result.get("Vulnerabilities") or []:
+            reports.append(
+                self._process_finding(vulnerability, file_path, result["Type"])
+            )
+        # Process Secrets
+        for secret in result.get("Secrets") or []:
+            reports.append(self._process_finding(secret, file_path, result["Class"]))
+        # Process Licenses
+        for license in result.get("Licenses") or []:
+            reports.append(self._process_finding(license, file_path, result["Type"]))
+        return reports
+
+    def _get_shards(
+        self, directory: str, exclude_path: list[str]
+    ) -> list[tuple[str, str, list[str]]]:
+        """
+        Split the directory in shards to be scanned by different Trivy processes.
+
+        Every top-level directory is a shard and the files at the root of the
+        directory are another one. Terraform modules referenced across top-level
+        directories are not resolved when sharding, so it is disabled by default.
+
+        Returns:
+            list: tuples with the path to scan, the prefix of the result targets
+            and the directories to skip.
+        """
+        if self.shards == 1 or not os.path.isdir(directory):
+            return [(directory, "", exclude_path)]
+
+        subdirectories = []
+        root_has_files = False
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if (
+                        entry.name not in IGNORED_DIRECTORIES
+                        and entry.name not in exclude_path
+                    ):
+                        subdirectories.append(entry.name)
+                else:
+                    root_has_files = True
+
+        shards = []
+        for subdirectory in sorted(subdirectories):
+            # Exclusions relative to the scan path are made relative to the shard
+            shard_exclude_path = [
+                (
+                    path.removeprefix(f"{subdirectory}/")
+                    if path.startswith(f"{subdirectory}/")
+                    else path
+                )
+                for path in exclude_path
+            ]
+            shards.append(
+                (
+                    os.path.join(directory, subdirectory),
+                    subdirectory,
+                    shard_exclude_path,
+                )
+            )
+        if root_has_files:
+            shards.append((directory, "", exclude_path + sorted(subdirectories)))
+        return shards
+
+    def _scan_shards(
+        self, directory: str, scanners: list[str], exclude_path: list[str]
+    ) -> Iterator[tuple[str, dict]]:
+        """Yield the Trivy results of every shard, with their target prefix."""
+        shards = self._get_shards(directory, exclude_path)
+        cache_key = self._get_cache_key(scanners)
+        sharded = len(shards) > 1
+        if sharded and "vuln" in scanners:
+            # Download the vulnerability database once instead of once per process
+            subprocess.run(
+                ["trivy", "fs", "--download-db-only", "--quiet", directory],
+                capture_output=True,
+                text=True,
+            )
+
+        results = queue.Queue()
+        processes = []
+        processes_lock = threading.Lock()
+
+        def scan_shard(shard: tuple[str, str, list[str]]):
+            shard_path, target_prefix, shard_exclude_path = shard
+            try:
+                for result in self._scan_shard(
+                    shard_path,
+                    scanners,
+                    shard_exclude_path,
+                    sharded,
+                    cache_key,
+                    processes,
+                    processes_lock,
+                ):
+                    results.put((target_prefix, result))
+            except Exception as error:
+                results.put(error)
+            finally:
+                results.put(None)
+
+        executor = ThreadPoolExecutor(max_workers=min(self.shards, len(shards)))
+        try:
+            for shard in shards:
+                executor.submit(scan_shard, shard)
+            pending_shards = len(shards)
+            while pending_shards:
+                item = results.get()
+                if item is None:
+                    pending_shards -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            # Stop the running processes if the scan failed
+            with processes_lock:
+                for process in processes:
+                    if process.poll() is None:
+                        process.kill()
+            executor.shutdown(wait=True)
+
+    def _scan_shard(
+        self,
+        directory: str,
+        scanners: list[str],
+        exclude_path: list[str],
+        sharded: bool,
+        cache_key: Optional[str],
+        processes: list,
+        processes_lock: threading.Lock,
+    ) -> Iterator[dict]:
+        """Yield the Trivy results of a shard, from the cache if it is unchanged."""
+        cache_file = None
+        if cache_key:
+            cache_file = os.path.join(
+                self.cache_directory,
+                f"{self._hash_directory(directory, cache_key, exclude_path, sharded)}.jsonl.gz",
+            )
+            if os.path.exists(cache_file):
+                logger.info(f"Using cached Trivy results for {directory}")
+                with gzip.open(cache_file, "rt", encoding="utf-8") as cached_results:
+                    for line in cached_results:
+                        yield json.loads(line)
+                return
+
+        trivy_command = [
+            "trivy",
+            "fs",
+            directory,
+            "--format",
+            "json",
+            "--scanners",
+            ",".join(scanners),
+            "--parallel",
+            str(max(1, (os.cpu_count() or 1) // self.shards)) if sharded else "0",
+            "--include-non-failures",
+        ]
+        if exclude_path:
+            trivy_command.extend(["--skip-dirs", ",".join(exclude_path)])
+        if sharded:
+            # Parallel processes would wait for the lock of the filesystem cache
+            trivy_command.extend(["--cache-backend", "memory"])
+            if "vuln" in scanners:
+                trivy_command.append("--skip-db-update")
+
+        cached_results = None
+        if cache_file:
+            os.makedirs(self.cache_directory, exist_ok=True)
+            cached_results = tempfile.NamedTemporaryFile(
+                dir=self.cache_directory, suffix=".tmp", delete=False
+            )
+        try:
+            with tempfile.TemporaryFile("w+") as stderr:
+                process = subprocess.Popen(
+                    trivy_command,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr,
+                    text=True,
+                )
+                with processes_lock:
+                    processes.append(process)
+                try:
+                    with (
+                        gzip.open(cached_results, "wt", encoding="utf-8")
+                        if cached_results
+                        else open(os.devnull, "w")
+                    ) as cache_writer:
+                        for result in iter_trivy_results(process.stdout):
+                            cache_writer.write(json.dumps(result) + "\n")
+                            yield result
+                finally:
+                    process.wait()
+                    stderr.seek(0)
+                    self._log_trivy_output(stderr.read())
+            if cached_results:
+                cached_results.close()
+                os.replace(cached_results.name, cache_file)
+                cached_results = None
+        finally:
+            if cached_results:
+                cached_results.close()
+                os.remove(cached_results.name)
+
+    def _get_cache_key(self, scanners: list[str]) -> Optional[str]:
+        """
+        Return the key of the results cache: the results change with the Trivy
+        version, its vulnerability database and the scanners. None disables the
+        cache.
+        """
+        if not self.cache_directory:
+            return None
+        try:
+            version = subprocess.run(
+                ["trivy", "version", "--format", "json"],
+                capture_output=True,
+                text=True,
+            ).stdout
+            return hashlib.sha256(
+                f"{version}{sorted(scanners)}".encode("utf-8")
+            ).hexdigest()
+        except Exception as error:
+            logger.warning(
+                f"Trivy results will not be cached -- {error.__class__.__name__}:{error.__traceback__.tb_lineno} -- {error}"
+            )
+            return None
+
+    @staticmethod
+    def _hash_directory(
+        directory: str, cache_key: str, exclude_path: list[str], sharded: bool
+    ) -> str:
+        """
+        Hash the path and content of every file of a shard. The files of the
+        subdirectories are not part of the root shard when sharding.
+        """
+        directory_hash = hashlib.sha256(f"{cache_key}{exclude_path}".encode("utf-8"))
+        for root, dirs, files in os.walk(directory):
+            dirs[:] = sorted(
+                name
+                for name in dirs
+                if name not in IGNORED_DIRECTORIES
+                and not (sharded and root == directory and name in exclude_path)
+            )
+            for name in sorted(files):
+                file_path = os.path.join(root, name)
+                directory_hash.update(
+                    os.path.relpath(file_path, directory).encode("utf-8")
+                )
+                try:
+                    file_hash = hashlib.sha256()
+                    with open(file_path, "rb") as file_descriptor:
+                        for chunk in iter(
+                            lambda: file_descriptor.read(READ_CHUNK_SIZE), b""
+                        ):
+                            file_hash.update(chunk)
+                    directory_hash.update(file_hash.digest())
+                except OSError:
+                    # Broken links and unreadable files are not scanned either
+                    continue
+        return directory_hash.hexdigest()
+
+    @staticmethod
+    def _log_trivy_output(output: str):
+        """Log Trivy's stderr output with preserved log levels."""
+        for line in output.strip().split("\n"):
+            if line.strip():
+                # Parse Trivy's log format to extract level and message
+                # Trivy format: timestamp level message
+                parts = line.split()
+                if len(parts) >= 3:
+                    # Extract level and message
+                    level = parts[1]
+                    message = " ".join(parts[2:])
+
+                    # Map Trivy log levels to Python logging levels
+                    if level == "ERROR":
+                        logger.error(f"{message}")
+                    elif level == "WARN":
+                        logger.warning(f"{message}")
+                    elif level == "INFO":
+                        logger.info(f"{message}")
+                    elif level == "DEBUG":
+                        logger.debug(f"{message}")
+                    else:
+                        # Default to info for unknown levels
+                        logger.info(f"{message}")
+                else:
+                    # If we can't parse the format, log as info
+                    logger.info(f"{line}")
+
     def print_credentials(self):
         if self.scan_repository_url:
             report_title = (
@@ -434,3 +712,96 @@ class IacProvider(Provider):
         )
 
         print_boxes(report_lines, report_title)
+
+
+def iter_trivy_results(
+    stream: TextIO, chunk_size: int = READ_CHUNK_SIZE
+) -> Iterator[dict]:
+    """
+    Yield the items of the "Results" array of a Trivy JSON report while it is read
+    from the stream, so the whole report is never held in memory.
+
+    Raises:
+        ValueError: If the stream does not contain a JSON object.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    index = 0
+    end_of_stream = False
+
+    def read_chunk():
+        nonlocal buffer, index, end_of_stream
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            end_of_stream = True
+            return
+        buffer = buffer[index:] + chunk
+        index = 0
+
+    def next_character() -> Optional[str]:
+        """Skip the whitespaces and return the next character, None at the end."""
+        nonlocal index
+        while True:
+            while index < len(buffer) and buffer[index] in " \t\r\n":
+                index += 1
+            if index < len(buffer):
+                return buffer[index]
+            if end_of_stream:
+                return None
+            read_chunk()
+
+    def decode_value():
+        nonlocal index
+        next_character()
+        # Decoding is only retried once the pending data has doubled, so a value
+        # spanning many chunks is decoded in linear time
+        decode_length = 0
+        while True:
+            if end_of_stream or len(buffer) - index >= decode_length:
+                try:
+                    value, end = decoder.raw_decode(buffer, index)
+                    # A number at the end of the buffer could be incomplete
+                    if (
+                        end < len(buffer)
+                        or end_of_stream
+                        or isinstance(value, (dict, list, str))
+                    ):
+                        index = end
+                        return value
+                except json.JSONDecodeError:
+                    if end_of_stream:
+                        raise
+                decode_length = 2 * (len(buffer) - index)
+            read_chunk()
+
+    if next_character() != "{":
+        raise ValueError("Trivy output is not a JSON object")
+    index += 1
+    while True:
+        character = next_character()
+        if character == "}":
+            return
+        if character == ",":
+            index += 1
+            continue
+        if character is None:
+            raise ValueError("Trivy output is incomplete")
+        key = decode_value()
+        if next_character() != ":":
+            raise ValueError("Trivy output is not a valid JSON object")
+        index += 1
+        if key != "Results" or next_character() != "[":
+            decode_value()
+            continue
+        index += 1
+        while True:
+            character = next_character()
+            if character == "]":
+                index += 1
+                break
+            if character == ",":
+                index += 1
+                continue
+            if character is None:
+                raise ValueError("Trivy output is incomplete")
+            yield decode_value()
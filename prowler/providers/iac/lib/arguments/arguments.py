@@ -47,6 +47,20 @@ def init_parser(self):
         help="Comma-separated list of paths to exclude from the scan. Default: none",
     )
 
+    iac_scan_subparser.add_argument(
+        "--shards",
+        dest="shards",
+        type=int,
+        default=1,
+        help="Number of Trivy processes scanning the top-level directories of the scan path in parallel. Terraform modules referenced across top-level directories are not resolved when sharding. Default: 1",
+    )
+    iac_scan_subparser.add_argument(
+        "--cache-directory",
+        dest="cache_directory",
+        default=None,
+        help="Directory to cache the Trivy results. Directories whose files did not change since the previous scan are not scanned again. Default: none",
+    )
+
     iac_scan_subparser.add_argument(
         "--github-username",
         dest="github_username",
@@ -80,4 +94,6 @@ def validate_arguments(arguments):
                 False,
                 "--scan-path (-P) and --scan-repository-url (-R) are mutually exclusive. Please specify only one.",
             )
+    if getattr(arguments, "shards", 1) < 1:
+        return (False, "--shards must be greater than 0.")
     return (True, "")
@@ -1,4 +1,8 @@
 import os
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Optional
 
 from prowler.lib.logger import logger
 from prowler.lib.powershell.powershell import PowerShellSession
@@ -9,6 +13,9 @@ from prowler.providers.m365.exceptions.exceptions import (
 from prowler.providers.m365.lib.jwt.jwt_decoder import decode_jwt, decode_msal_token
 from prowler.providers.m365.models import M365Credentials, M365IdentityInfo
 
+# Maximum number of PowerShell sessions kept alive by a M365PowerShellPool
+MAX_POWERSHELL_SESSIONS = 3
+
 
 class M365PowerShell(PowerShellSession):
     """
@@ -47,6 +54,8 @@ class M365PowerShell(PowerShellSession):
         """
         super().__init__()
         self.tenant_identity = identity
+        # Workloads (exchange, teams) already connected in this session
+        self.connected_workloads = set()
         self.init_credential(credentials)
 
     def clean_certificate_content(self, cert_content: str) -> str:
@@ -260,17 +269,26 @@ class M365PowerShell(PowerShellSession):
         1. Application authentication (client_id/client_secret)
         2. Certificate authentication (certificate_content in base64/client_id)
 
+        Once connected, later calls in the same session reuse the connection. A
+        failed connection is attempted again on the next call.
+
         Returns:
             dict: Connection status information in JSON format.
 
         Note:
             This method requires the Microsoft Teams PowerShell module to be installed.
         """
+        if "teams" in self.connected_workloads:
+            return True
         # Certificate Auth
         if self.execute("Write-Output $certificate") != "":
-            return self.test_teams_certificate_connection()
+            connected = self.test_teams_certificate_connection()
         # Application Auth
-        return self.test_teams_connection()
+        else:
+            connected = self.test_teams_connection()
+        if connected:
+            self.connected_workloads.add("teams")
+        return connected
 
     def get_teams_settings(self) -> dict:
         """
@@ -361,17 +379,26 @@ class M365PowerShell(PowerShellSession):
         1. Application authentication (client_id/client_secret)
         2. Certificate authentication (certificate_content in base64/client_id)
 
+        Once connected, later calls in the same session reuse the connection. A
+        failed connection is attempted again on the next call.
+
         Returns:
             dict: Connection status information in JSON format.
 
         Note:
             This method requires the Exchange Online PowerShell module to be installed.
         """
+        if "exchange" in self.connected_workloads:
+            return True
         # Certificate Auth
         if self.execute("Write-Output $certificate") != "":
-            return self.test_exchange_certificate_connection()
+            connected = self.test_exchange_certificate_connection()
         # Application Auth
-        return self.test_exchange_connection()
+        else:
+            connected = self.test_exchange_connection()
+        if connected:
+            self.connected_workloads.add("exchange")
+        return connected
 
     def get_audit_log_config(self) -> dict:
         """
@@ -855,6 +882,195 @@ class M365PowerShell(PowerShellSession):
         )
 
 
+class M365PowerShellPool:
+    """
+    Provider-scoped pool of long-lived Microsoft 365 PowerShell sessions.
+
+    Starting `pwsh`, initializing the credentials and connecting to Exchange Online
+    or Teams takes tens of seconds, so the M365 services share the sessions of this
+    pool instead of creating their own. Every cmdlet method of `M365PowerShell`
+    called on the pool borrows a session for the duration of the call, so
+    independent cmdlets run concurrently in different sessions. A new session is
+    only started when all the existing ones are borrowed, up to `max_sessions`, and
+    it connects to the workloads already connected by the pool before running its
+    first cmdlet, so each workload is connected once per session.
+
+    Attributes:
+        max_sessions (int): Maximum number of PowerShell sessions kept alive.
+        connected_workloads (set): Workloads (exchange, teams) connected by the pool.
+    """
+
+    # Method of M365PowerShell that connects each workload
+    WORKLOAD_CONNECTIONS = {
+        "exchange": "connect_exchange_online",
+        "teams": "connect_microsoft_teams",
+    }
+
+    def __init__(
+        self,
+        credentials: M365Credentials,
+        identity: M365IdentityInfo,
+        max_sessions: int = MAX_POWERSHELL_SESSIONS,
+    ):
+        """
+        Initialize an empty pool, sessions are started on demand.
+
+        Args:
+            credentials (M365Credentials): The Microsoft 365 credentials used by the sessions.
+            identity (M365IdentityInfo): The identity of the audited tenant.
+            max_sessions (int): Maximum number of PowerShell sessions kept alive.
+        """
+        self._credentials = credentials
+        self._identity = identity
+        self.max_sessions = max_sessions
+        self.connected_workloads = set()
+        self._sessions = []
+        self._idle_sessions = queue.LifoQueue()
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: Optional[float] = None) -> M365PowerShell:
+        """
+        Borrow a PowerShell session from the pool.
+
+        Returns an idle session if there is one, otherwise starts a new session if
+        the pool is not full, or waits until another borrower releases one.
+
+        Args:
+            timeout (float, optional): Maximum time in seconds to wait for an idle session.
+
+        Returns:
+            M365PowerShell: A PowerShell session with the credentials initialized.
+
+        Raises:
+            queue.Empty: If no session was released within the timeout.
+        """
+        try:
+            return self._idle_sessions.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            start_session = len(self._sessions) < self.max_sessions
+            if start_session:
+                # Reserve the slot while the session is starting
+                self._sessions.append(None)
+
+        if not start_session:
+            return self._idle_sessions.get(timeout=timeout)
+
+        try:
+            session = M365PowerShell(self._credentials, self._identity)
+        except Exception:
+            with self._lock:
+                self._sessions.remove(None)
+            raise
+        with self._lock:
+            self._sessions[self._sessions.index(None)] = session
+        return session
+
+    def release(self, session: M365PowerShell) -> None:
+        """
+        Return a borrowed session to the pool so it can be reused.
+
+        Sessions that have been closed are discarded, freeing their slot.
+
+        Args:
+            session (M365PowerShell): The session previously returned by `acquire`.
+        """
+        if session is None:
+            return
+        if session.process:
+            self._idle_sessions.put(session)
+        else:
+            with self._lock:
+                if session in self._sessions:
+                    self._sessions.remove(session)
+
+    @contextmanager
+    def session(self, timeout: Optional[float] = None):
+        """
+        Borrow a session connected to the workloads of the pool for the duration of a `with` block.
+
+        Example:
+            >>> with pool.session() as powershell:
+            ...     powershell.get_transport_config()
+        """
+        session = self.acquire(timeout=timeout)
+        try:
+            with self._lock:
+                workloads = self.connected_workloads - session.connected_workloads
+            for workload in workloads:
+                getattr(session, self.WORKLOAD_CONNECTIONS[workload])()
+            yield session
+        finally:
+            self.release(session)
+
+    def connect_exchange_online(self) -> bool:
+        """
+        Connect the pool to Exchange Online.
+
+        The connection is established in one session, the other sessions connect
+        before running their next cmdlet. A failed connection is attempted again on
+        the next call.
+
+        Returns:
+            bool: Whether the pool is connected to Exchange Online.
+        """
+        return self._connect_workload("exchange")
+
+    def connect_microsoft_teams(self) -> bool:
+        """
+        Connect the pool to Microsoft Teams.
+
+        The connection is established in one session, the other sessions connect
+        before running their next cmdlet. A failed connection is attempted again on
+        the next call.
+
+        Returns:
+            bool: Whether the pool is connected to Microsoft Teams.
+        """
+        return self._connect_workload("teams")
+
+    def _connect_workload(self, workload: str) -> bool:
+        """Connect a session to the workload and, if it succeeds, the next sessions borrowed."""
+        if workload in self.connected_workloads:
+            return True
+        with self.session() as session:
+            connected = getattr(session, self.WORKLOAD_CONNECTIONS[workload])()
+        if connected:
+            with self._lock:
+                self.connected_workloads.add(workload)
+        return connected
+
+    def __getattr__(self, name: str):
+        """Run the cmdlet methods of M365PowerShell in a borrowed session."""
+        if name.startswith("_") or not callable(getattr(M365PowerShell, name, None)):
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{name}'"
+            )
+
+        def call_in_session(*args, **kwargs):
+            with self.session() as session:
+                return getattr(session, name)(*args, **kwargs)
+
+        return call_in_session
+
+    def close(self) -> None:
+        """Terminate all the PowerShell sessions started by the pool."""
+        with self._lock:
+            sessions = [session for session in self._sessions if session]
+            self._sessions = []
+            self._idle_sessions = queue.LifoQueue()
+            self.connected_workloads = set()
+        for session in sessions:
+            try:
+                session.close()
+            except Exception as error:
+                logger.error(
+                    f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+                )
+
+
 # This function is used to install the required M365 PowerShell modules in Docker containers
 def initialize_m365_powershell_modules():
     """
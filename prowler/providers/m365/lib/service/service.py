@@ -1,6 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
 from msgraph import GraphServiceClient
 
-from prowler.providers.m365.lib.powershell.m365_powershell import M365PowerShell
+from prowler.providers.m365.lib.powershell.m365_powershell import (
+    MAX_POWERSHELL_SESSIONS,
+    M365PowerShellPool,
+)
 from prowler.providers.m365.m365_provider import M365Provider
 
 
@@ -13,9 +19,21 @@ class M365Service:
         self.audit_config = provider.audit_config
         self.fixer_config = provider.fixer_config
 
-        # Initialize PowerShell client only if credentials are available
-        self.powershell = (
-            M365PowerShell(provider.credentials, provider.identity)
-            if provider.credentials and provider.identity
-            else None
+        # Use the PowerShell sessions shared by the provider only if credentials are available
+        self.powershell: Optional[M365PowerShellPool] = (
+            provider.powershell if provider.credentials and provider.identity else None
         )
+
+    def _fetch_concurrently(self, *fetchers) -> tuple:
+        """
+        Run independent PowerShell fetchers concurrently, one per pooled session.
+
+        Args:
+            *fetchers: Callables without arguments, usually the `_get_*` methods of the service.
+
+        Returns:
+            tuple: The value returned by each fetcher, in the same order.
+        """
+        with ThreadPoolExecutor(max_workers=MAX_POWERSHELL_SESSIONS) as executor:
+            futures = [executor.submit(fetcher) for fetcher in fetchers]
+            return tuple(future.result() for future in futures)
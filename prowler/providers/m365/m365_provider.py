@@ -1,4 +1,5 @@
 import asyncio
+import atexit
 import base64
 import os
 from argparse import ArgumentTypeError
@@ -55,6 +56,7 @@ from prowler.providers.m365.exceptions.exceptions import (
 from prowler.providers.m365.lib.mutelist.mutelist import M365Mutelist
 from prowler.providers.m365.lib.powershell.m365_powershell import (
     M365PowerShell,
+    M365PowerShellPool,
     initialize_m365_powershell_modules,
 )
 from prowler.providers.m365.lib.regions.regions import get_regions_config
@@ -216,6 +218,8 @@ class M365Provider(Provider):
             identity=self.identity,
             init_modules=init_modules,
         )
+        # Pool of PowerShell sessions shared by all the services, created on demand
+        self._powershell = None
 
         # Audit Config
         if config_content:
@@ -282,6 +286,20 @@ class M365Provider(Provider):
         """Return powershell credentials"""
         return self._credentials
 
+    @property
+    def powershell(self) -> M365PowerShellPool:
+        """
+        Pool of PowerShell sessions shared by all the M365 services.
+
+        The pool starts its sessions on demand, up to `MAX_POWERSHELL_SESSIONS`,
+        so independent cmdlets run concurrently and each workload is connected
+        once per session. All the sessions are closed when Prowler exits.
+        """
+        if self._powershell is None and self._credentials and self._identity:
+            self._powershell = M365PowerShellPool(self._credentials, self._identity)
+            atexit.register(self._powershell.close)
+        return self._powershell
+
     @staticmethod
     def validate_arguments(
         az_cli_auth: bool,
@@ -16,9 +16,13 @@ class AdminCenter(M365Service):
         self.sharing_policy = None
         if self.powershell:
             if self.powershell.connect_exchange_online():
-                self.organization_config = self._get_organization_config()
-                self.sharing_policy = self._get_sharing_policy()
-            self.powershell.close()
+                (
+                    self.organization_config,
+                    self.sharing_policy,
+                ) = self._fetch_concurrently(
+                    self._get_organization_config,
+                    self._get_sharing_policy,
+                )
 
         created_loop = False
         try:
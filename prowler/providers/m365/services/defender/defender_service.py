@@ -22,18 +22,31 @@ class Defender(M365Service):
         self.report_submission_policy = None
         if self.powershell:
             if self.powershell.connect_exchange_online():
-                self.malware_policies = self._get_malware_filter_policy()
-                self.malware_rules = self._get_malware_filter_rule()
-                self.outbound_spam_policies = self._get_outbound_spam_filter_policy()
-                self.outbound_spam_rules = self._get_outbound_spam_filter_rule()
-                self.antiphishing_policies = self._get_antiphishing_policy()
-                self.antiphishing_rules = self._get_antiphishing_rules()
-                self.connection_filter_policy = self._get_connection_filter_policy()
-                self.dkim_configurations = self._get_dkim_config()
-                self.inbound_spam_policies = self._get_inbound_spam_filter_policy()
-                self.inbound_spam_rules = self._get_inbound_spam_filter_rule()
-                self.report_submission_policy = self._get_report_submission_policy()
-            self.powershell.close()
+                (
+                    self.malware_policies,
+                    self.malware_rules,
+                    self.outbound_spam_policies,
+                    self.outbound_spam_rules,
+                    self.antiphishing_policies,
+                    self.antiphishing_rules,
+                    self.connection_filter_policy,
+                    self.dkim_configurations,
+                    self.inbound_spam_policies,
+                    self.inbound_spam_rules,
+                    self.report_submission_policy,
+                ) = self._fetch_concurrently(
+                    self._get_malware_filter_policy,
+                    self._get_malware_filter_rule,
+                    self._get_outbound_spam_filter_policy,
+                    self._get_outbound_spam_filter_rule,
+                    self._get_antiphishing_policy,
+                    self._get_antiphishing_rules,
+                    self._get_connection_filter_policy,
+                    self._get_dkim_config,
+                    self._get_inbound_spam_filter_policy,
+                    self._get_inbound_spam_filter_rule,
+                    self._get_report_submission_policy,
+                )
 
     def _get_malware_filter_policy(self):
         logger.info("M365 - Getting Defender malware filter policy...")
@@ -18,7 +18,6 @@ class Entra(M365Service):
         if self.powershell:
             self.powershell.connect_exchange_online()
             self.user_accounts_status = self.powershell.get_user_account_status()
-            self.powershell.close()
 
         created_loop = False
         try:
@@ -13,7 +13,6 @@ class Purview(M365Service):
         if self.powershell:
             if self.powershell.connect_exchange_online():
                 self.audit_log_config = self._get_audit_log_config()
-            self.powershell.close()
 
     def _get_audit_log_config(self):
         logger.info("M365 - Getting Admin Audit Log settings...")
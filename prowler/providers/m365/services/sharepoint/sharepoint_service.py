@@ -13,8 +13,6 @@ from prowler.providers.m365.m365_provider import M365Provider
 class SharePoint(M365Service):
     def __init__(self, provider: M365Provider):
         super().__init__(provider)
-        if self.powershell:
-            self.powershell.close()
 
         created_loop = False
         try:
@@ -15,11 +15,17 @@ class Teams(M365Service):
 
         if self.powershell:
             if self.powershell.connect_microsoft_teams():
-                self.teams_settings = self._get_teams_client_configuration()
-                self.global_meeting_policy = self._get_global_meeting_policy()
-                self.global_messaging_policy = self._get_global_messaging_policy()
-                self.user_settings = self._get_user_settings()
-            self.powershell.close()
+                (
+                    self.teams_settings,
+                    self.global_meeting_policy,
+                    self.global_messaging_policy,
+                    self.user_settings,
+                ) = self._fetch_concurrently(
+                    self._get_teams_client_configuration,
+                    self._get_global_meeting_policy,
+                    self._get_global_messaging_policy,
+                    self._get_user_settings,
+                )
 
     def _get_teams_client_configuration(self):
         logger.info("M365 - Getting Teams settings...")
@@ -1,8 +1,11 @@
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from threading import current_thread
 from typing import Any, Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPDigestAuth
 
 from prowler.lib.logger import logger
@@ -11,6 +14,73 @@ from prowler.providers.mongodbatlas.exceptions.exceptions import (
     MongoDBAtlasRateLimitError,
 )
 
+MAX_WORKERS = 10
+# Default requests per second sent to the Atlas Administration API by all the
+# services, overridable with `max_api_requests_per_second` in the audit config
+MAX_REQUESTS_PER_SECOND = 10
+ATLAS_HEADERS = {
+    "Accept": "application/vnd.atlas.2025-01-01+json",
+    "Content-Type": "application/json",
+}
+
+
+class MongoDBAtlasRateLimiter:
+    """
+    Token bucket shared by the threads of every MongoDB Atlas service.
+
+    Each request takes a token, blocking until one is available, so concurrent
+    fetching never goes over the configured rate. The bucket holds at least one
+    token, so rates below one request per second are also supported.
+    """
+
+    def __init__(self, requests_per_second: float = MAX_REQUESTS_PER_SECOND):
+        if requests_per_second <= 0:
+            raise ValueError(
+                f"The requests per second must be greater than 0, got {requests_per_second}"
+            )
+        self.requests_per_second = requests_per_second
+        self._capacity = max(1, requests_per_second)
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._last_refill) * self.requests_per_second,
+                )
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_seconds = (1 - self._tokens) / self.requests_per_second
+            time.sleep(wait_seconds)
+
+
+def create_http_session(session) -> requests.Session:
+    """
+    Create the keep-alive HTTP session shared by the MongoDB Atlas services.
+
+    HTTPDigestAuth keeps the digest challenge per thread, so the session can be
+    used by several threads at once.
+
+    Args:
+        session: MongoDBAtlasSession with the API credentials
+
+    Returns:
+        requests.Session: Session with a connection pool sized for the service threads
+    """
+    http_session = requests.Session()
+    http_session.auth = HTTPDigestAuth(session.public_key, session.private_key)
+    http_session.headers.update(ATLAS_HEADERS)
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS)
+    http_session.mount("https://", adapter)
+    http_session.mount("http://", adapter)
+    return http_session
+
 
 class MongoDBAtlasService:
     """Base class for MongoDB Atlas services"""
@@ -21,13 +91,39 @@ class MongoDBAtlasService:
         self.session = provider.session
         self.base_url = provider.session.base_url
         self.audit_config = provider.audit_config
-        self.auth = HTTPDigestAuth(
-            provider.session.public_key, provider.session.private_key
+        self.http_session = provider.http_session
+        self.rate_limiter = provider.rate_limiter
+
+    def __threading_call__(self, call, iterator):
+        """
+        Run the call for every item in a thread pool.
+
+        Returns:
+            list: The results of the call in the order of the items
+        """
+        items = list(iterator)
+        # Trim leading and trailing underscores from the call's name
+        call_name = call.__name__.strip("_")
+        # Add Capitalization
+        call_name = " ".join([x.capitalize() for x in call_name.split("_")])
+
+        logger.info(
+            f"{self.__class__.__name__} - Starting threads for '{call_name}' function to process {len(items)} items..."
         )
-        self.headers = {
-            "Accept": "application/vnd.atlas.2025-01-01+json",
-            "Content-Type": "application/json",
-        }
+
+        results = [None] * len(items)
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as thread_pool:
+            futures = {
+                thread_pool.submit(call, item): index
+                for index, item in enumerate(items)
+            }
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception:
+                    # Errors are handled within the called function
+                    pass
+        return results
 
     def _make_request(
         self,
@@ -47,7 +143,8 @@ class MongoDBAtlasService:
             params: Query parameters
             data: Request body data
             max_retries: Maximum number of retries
-            retry_delay: Delay between retries in seconds
+            retry_delay: Delay between retries in seconds, the Retry-After
+                header of throttled responses takes precedence
 
         Returns:
             dict: Response JSON data
@@ -60,11 +157,10 @@ class MongoDBAtlasService:
 
         for attempt in range(max_retries + 1):
             try:
-                response = requests.request(
+                self.rate_limiter.acquire()
+                response = self.http_session.request(
                     method=method,
                     url=url,
-                    auth=self.auth,
-                    headers=self.headers,
                     params=params,
                     json=data,
                     timeout=30,
@@ -72,10 +168,11 @@ class MongoDBAtlasService:
 
                 if response.status_code == 429:
                     if attempt < max_retries:
+                        wait_seconds = _retry_after(response, retry_delay)
                         logger.warning(
-                            f"Rate limit exceeded for {url}, retrying in {retry_delay} seconds..."
+                            f"Rate limit exceeded for {url}, retrying in {wait_seconds} seconds..."
                         )
-                        time.sleep(retry_delay)
+                        time.sleep(wait_seconds)
                         retry_delay *= 2
                         continue
                     else:
@@ -113,6 +210,9 @@ class MongoDBAtlasService:
         """
         Make paginated requests to MongoDB Atlas API
 
+        The first page returns the total count of items, then the remaining
+        pages are fetched concurrently.
+
         Args:
             endpoint: API endpoint
             params: Query parameters
@@ -122,47 +222,55 @@ class MongoDBAtlasService:
         Returns:
             list: List of all items from all pages
         """
-        if params is None:
-            params = {}
-
-        params.update({"pageNum": 1, "itemsPerPage": page_size})
+        params = {**(params or {}), "itemsPerPage": page_size}
 
-        all_items = []
-        page_num = 1
-
-        while True:
-            params["pageNum"] = page_num
-
-            try:
-                response = self._make_request("GET", endpoint, params=params)
+        def get_page(page_num: int) -> List[Dict[str, Any]]:
+            response = self._make_request(
+                "GET", endpoint, params={**params, "pageNum": page_num}
+            )
+            return response.get("results", [])
 
-                if "results" in response:
-                    items = response["results"]
-                    all_items.extend(items)
+        try:
+            response = self._make_request(
+                "GET", endpoint, params={**params, "pageNum": 1}
+            )
+        except Exception as e:
+            logger.error(f"Error during pagination for {endpoint} at page 1: {str(e)}")
+            return []
 
-                    total_count = response.get("totalCount", 0)
+        if "results" not in response:
+            return []
+        all_items = list(response["results"])
+        total_count = response.get("totalCount", 0)
 
-                    if len(items) < page_size or len(all_items) >= total_count:
-                        break
+        page_count = 1
+        if len(all_items) >= page_size and total_count > len(all_items):
+            page_count = -(-total_count // page_size)
+            if max_pages and page_count > max_pages:
+                logger.warning(
+                    f"Reached maximum pages limit ({max_pages}) for {endpoint}"
+                )
+                page_count = max_pages
 
-                    if max_pages and page_num >= max_pages:
-                        logger.warning(
-                            f"Reached maximum pages limit ({max_pages}) for {endpoint}"
+        if page_count > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(MAX_WORKERS, page_count - 1)
+            ) as thread_pool:
+                futures = {
+                    page_num: thread_pool.submit(get_page, page_num)
+                    for page_num in range(2, page_count + 1)
+                }
+                # Keep the order of the pages
+                for page_num, future in futures.items():
+                    try:
+                        all_items.extend(future.result())
+                    except Exception as e:
+                        logger.error(
+                            f"Error during pagination for {endpoint} at page {page_num}: {str(e)}"
                         )
-                        break
-
-                    page_num += 1
-                else:
-                    break
-
-            except Exception as e:
-                logger.error(
-                    f"Error during pagination for {endpoint} at page {page_num}: {str(e)}"
-                )
-                break
 
         logger.info(
-            f"Retrieved {len(all_items)} items from {endpoint} across {page_num} pages"
+            f"Retrieved {len(all_items)} items from {endpoint} across {page_count} pages"
         )
 
         return all_items
@@ -170,3 +278,11 @@ class MongoDBAtlasService:
     def _get_thread_info(self) -> str:
         """Get thread information for logging"""
         return f"[{current_thread().name}]"
+
+
+def _retry_after(response: requests.Response, default: float) -> float:
+    """Seconds to wait before retrying a throttled request."""
+    try:
+        return float(response.headers.get("Retry-After", default))
+    except ValueError:
+        return default
@@ -20,6 +20,11 @@ from prowler.providers.mongodbatlas.exceptions.exceptions import (
     MongoDBAtlasSessionError,
 )
 from prowler.providers.mongodbatlas.lib.mutelist.mutelist import MongoDBAtlasMutelist
+from prowler.providers.mongodbatlas.lib.service.service import (
+    MAX_REQUESTS_PER_SECOND,
+    MongoDBAtlasRateLimiter,
+    create_http_session,
+)
 from prowler.providers.mongodbatlas.models import (
     MongoDBAtlasIdentityInfo,
     MongoDBAtlasSession,
@@ -91,6 +96,22 @@ class MongodbatlasProvider(Provider):
         # Fixer Config
         self._fixer_config = fixer_config
 
+        # HTTP session and rate limiter shared by all the services, created on demand
+        self._http_session = None
+        self._rate_limiter = None
+        self._max_requests_per_second = (self._audit_config or {}).get(
+            "max_api_requests_per_second", MAX_REQUESTS_PER_SECOND
+        )
+        if (
+            isinstance(self._max_requests_per_second, bool)
+            or not isinstance(self._max_requests_per_second, (int, float))
+            or self._max_requests_per_second <= 0
+        ):
+            logger.warning(
+                f"Invalid max_api_requests_per_second value {self._max_requests_per_second}, it must be a number greater than 0. Using the default value {MAX_REQUESTS_PER_SECOND}."
+            )
+            self._max_requests_per_second = MAX_REQUESTS_PER_SECOND
+
         # Mutelist
         if mutelist_content:
             self._mutelist = MongoDBAtlasMutelist(
@@ -140,6 +161,20 @@ class MongodbatlasProvider(Provider):
         """Returns the project ID filter"""
         return self._project_id
 
+    @property
+    def http_session(self):
+        """Returns the keep-alive HTTP session shared by the MongoDB Atlas services"""
+        if self._http_session is None:
+            self._http_session = create_http_session(self._session)
+        return self._http_session
+
+    @property
+    def rate_limiter(self) -> MongoDBAtlasRateLimiter:
+        """Returns the rate limiter shared by the MongoDB Atlas services"""
+        if self._rate_limiter is None:
+            self._rate_limiter = MongoDBAtlasRateLimiter(self._max_requests_per_second)
+        return self._rate_limiter
+
     @staticmethod
     def setup_session(
         atlas_public_key: str = None,
@@ -28,80 +28,11 @@ class Clusters(MongoDBAtlasService):
         clusters = {}
 
         try:
-            for project in projects_client.projects.values():
-                logger.info(f"Getting clusters for project {project.name}...")
-                try:
-                    project_clusters = {}
-                    clusters_data = self._paginate_request(
-                        f"/groups/{project.id}/clusters"
-                    )
-                    for cluster_data in clusters_data:
-                        # Process cluster data
-                        cluster_name = cluster_data.get("name", "")
-
-                        # Get encryption provider
-                        encryption_provider = None
-                        encryption_at_rest = cluster_data.get(
-                            "encryptionAtRestProvider"
-                        )
-                        if encryption_at_rest:
-                            encryption_provider = encryption_at_rest
-                        else:
-                            provider_settings = cluster_data.get("providerSettings", {})
-                            encrypt_ebs_volume = provider_settings.get(
-                                "encryptEBSVolume", False
-                            )
-                            if encrypt_ebs_volume:
-                                encryption_provider = provider_settings.get(
-                                    "providerName", "AWS"
-                                )
-
-                        # Get backup status
-                        backup_enabled = cluster_data.get("backupEnabled", False)
-                        pit_enabled = cluster_data.get("pitEnabled", False)
-                        backup_enabled = backup_enabled or pit_enabled
-
-                        # Create cluster object
-                        cluster = Cluster(
-                            id=cluster_data.get("id", ""),
-                            name=cluster_name,
-                            project_id=project.id,
-                            project_name=project.name,
-                            mongo_db_version=cluster_data.get("mongoDBVersion", ""),
-                            cluster_type=cluster_data.get("clusterType", ""),
-                            state_name=cluster_data.get("stateName", ""),
-                            encryption_at_rest_provider=encryption_provider,
-                            backup_enabled=backup_enabled,
-                            auth_enabled=cluster_data.get("authEnabled", False),
-                            ssl_enabled=cluster_data.get("sslEnabled", False),
-                            provider_settings=cluster_data.get("providerSettings", {}),
-                            replication_specs=cluster_data.get("replicationSpecs", []),
-                            disk_size_gb=cluster_data.get("diskSizeGB"),
-                            num_shards=cluster_data.get("numShards"),
-                            replication_factor=cluster_data.get("replicationFactor"),
-                            auto_scaling=cluster_data.get("autoScaling", {}),
-                            mongo_db_major_version=cluster_data.get(
-                                "mongoDBMajorVersion"
-                            ),
-                            paused=cluster_data.get("paused", False),
-                            pit_enabled=pit_enabled,
-                            connection_strings=cluster_data.get(
-                                "connectionStrings", {}
-                            ),
-                            tags=cluster_data.get("tags", []),
-                            location=cluster_data.get("replicationSpecs", {})[0]
-                            .get("regionConfigs", {})[0]
-                            .get("regionName", ""),
-                        )
-
-                        # Use a unique key combining project_id and cluster_name
-                        cluster_key = f"{project.id}:{cluster.name}"
-                        project_clusters[cluster_key] = cluster
+            for project_clusters in self.__threading_call__(
+                self._list_project_clusters, projects_client.projects.values()
+            ):
+                if project_clusters:
                     clusters.update(project_clusters)
-                except Exception as error:
-                    logger.error(
-                        f"Error getting clusters for project {project.name}: {error}"
-                    )
 
         except Exception as error:
             logger.error(
@@ -111,6 +42,81 @@ class Clusters(MongoDBAtlasService):
         logger.info(f"Found {len(clusters)} MongoDB Atlas clusters")
         return clusters
 
+    def _list_project_clusters(self, project):
+        """
+        List the clusters of a project
+
+        Args:
+            project: Project of the projects service
+
+        Returns:
+            Dict[str, Cluster]: Dictionary of clusters indexed by project ID and cluster name
+        """
+        logger.info(f"Getting clusters for project {project.name}...")
+        try:
+            project_clusters = {}
+            clusters_data = self._paginate_request(f"/groups/{project.id}/clusters")
+            for cluster_data in clusters_data:
+                # Process cluster data
+                cluster_name = cluster_data.get("name", "")
+
+                # Get encryption provider
+                encryption_provider = None
+                encryption_at_rest = cluster_data.get("encryptionAtRestProvider")
+                if encryption_at_rest:
+                    encryption_provider = encryption_at_rest
+                else:
+                    provider_settings = cluster_data.get("providerSettings", {})
+                    encrypt_ebs_volume = provider_settings.get(
+                        "encryptEBSVolume", False
+                    )
+                    if encrypt_ebs_volume:
+                        encryption_provider = provider_settings.get(
+                            "providerName", "AWS"
+                        )
+
+                # Get backup status
+                backup_enabled = cluster_data.get("backupEnabled", False)
+                pit_enabled = cluster_data.get("pitEnabled", False)
+                backup_enabled = backup_enabled or pit_enabled
+
+                # Create cluster object
+                cluster = Cluster(
+                    id=cluster_data.get("id", ""),
+                    name=cluster_name,
+                    project_id=project.id,
+                    project_name=project.name,
+                    mongo_db_version=cluster_data.get("mongoDBVersion", ""),
+                    cluster_type=cluster_data.get("clusterType", ""),
+                    state_name=cluster_data.get("stateName", ""),
+                    encryption_at_rest_provider=encryption_provider,
+                    backup_enabled=backup_enabled,
+                    auth_enabled=cluster_data.get("authEnabled", False),
+                    ssl_enabled=cluster_data.get("sslEnabled", False),
+                    provider_settings=cluster_data.get("providerSettings", {}),
+                    replication_specs=cluster_data.get("replicationSpecs", []),
+                    disk_size_gb=cluster_data.get("diskSizeGB"),
+                    num_shards=cluster_data.get("numShards"),
+                    replication_factor=cluster_data.get("replicationFactor"),
+                    auto_scaling=cluster_data.get("autoScaling", {}),
+                    mongo_db_major_version=cluster_data.get("mongoDBMajorVersion"),
+                    paused=cluster_data.get("paused", False),
+                    pit_enabled=pit_enabled,
+                    connection_strings=cluster_data.get("connectionStrings", {}),
+                    tags=cluster_data.get("tags", []),
+                    location=cluster_data.get("replicationSpecs", {})[0]
+                    .get("regionConfigs", {})[0]
+                    .get("regionName", ""),
+                )
+
+                # Use a unique key combining project_id and cluster_name
+                cluster_key = f"{project.id}:{cluster.name}"
+                project_clusters[cluster_key] = cluster
+            return project_clusters
+        except Exception as error:
+            logger.error(f"Error getting clusters for project {project.name}: {error}")
+            return {}
+
 
 class Cluster(BaseModel):
     """MongoDB Atlas Cluster model"""
@@ -27,72 +27,65 @@ class Projects(MongoDBAtlasService):
         try:
             # If project_id filter is set, only get that project
             if self.provider.project_id:
-                project_data = self._make_request(
-                    "GET", f"/groups/{self.provider.project_id}"
-                )
-                project_id = project_data["id"]
+                all_projects = [
+                    self._make_request("GET", f"/groups/{self.provider.project_id}")
+                ]
+            else:
+                # Get all projects with pagination
+                all_projects = self._paginate_request("/groups")
 
-                # Get cluster count
-                cluster_count = self._get_cluster_count(project_id)
+            for project in self.__threading_call__(self._get_project, all_projects):
+                if project:
+                    projects[project.id] = project
 
-                # Get network access entries
-                network_access_entries = self._get_network_access_entries(project_id)
+        except Exception as error:
+            logger.error(
+                f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
+            )
 
-                # Get project settings
-                project_settings = self._get_project_settings(project_id)
+        logger.info(f"Found {len(projects)} MongoDB Atlas projects")
+        return projects
 
-                # Get audit configuration
-                audit_config = self._get_audit_config(project_id)
+    def _get_project(self, project_data: dict):
+        """
+        Get the details of a project
 
-                projects[project_id] = Project(
-                    id=project_id,
-                    name=project_data.get("name", ""),
-                    org_id=project_data.get("orgId", ""),
-                    created=project_data.get("created", ""),
-                    cluster_count=cluster_count,
-                    network_access_entries=network_access_entries,
-                    project_settings=project_settings,
-                    audit_config=audit_config,
-                )
-            else:
-                # Get all projects with pagination
-                all_projects = self._paginate_request("/groups")
+        Args:
+            project_data: Project returned by the API
 
-                for project_data in all_projects:
-                    project_id = project_data["id"]
+        Returns:
+            Project: Project with its clusters, network access and settings
+        """
+        try:
+            project_id = project_data["id"]
 
-                    # Get cluster count
-                    cluster_count = self._get_cluster_count(project_id)
+            # Get cluster count
+            cluster_count = self._get_cluster_count(project_id)
 
-                    # Get network access entries
-                    network_access_entries = self._get_network_access_entries(
-                        project_id
-                    )
+            # Get network access entries
+            network_access_entries = self._get_network_access_entries(project_id)
 
-                    # Get project settings
-                    project_settings = self._get_project_settings(project_id)
-
-                    # Get audit configuration
-                    audit_config = self._get_audit_config(project_id)
-
-                    projects[project_id] = Project(
-                        id=project_id,
-                        name=project_data.get("name", ""),
-                        org_id=project_data.get("orgId", ""),
-                        created=project_data.get("created", ""),
-                        cluster_count=cluster_count,
-                        network_access_entries=network_access_entries,
-                        project_settings=project_settings,
-                        audit_config=audit_config,
-                    )
+            # Get project settings
+            project_settings = self._get_project_settings(project_id)
 
+            # Get audit configuration
+            audit_config = self._get_audit_config(project_id)
+
+            return Project(
+                id=project_id,
+                name=project_data.get("name", ""),
+                org_id=project_data.get("orgId", ""),
+                created=project_data.get("created", ""),
+                cluster_count=cluster_count,
+                network_access_entries=network_access_entries,
+                project_settings=project_settings,
+                audit_config=audit_config,
+            )
         except Exception as error:
             logger.error(
                 f"{error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
             )
-
-        logger.info(f"Found {len(projects)} MongoDB Atlas projects")
-        return projects
+            return None
 
     def _get_cluster_count(self, project_id: str) -> int:
         """
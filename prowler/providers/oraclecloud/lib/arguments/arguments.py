@@ -58,6 +58,11 @@ def init_parser(self):
         type=validate_compartment_ocid,
         help="OCI compartment OCIDs to audit. If not specified, all compartments in the tenancy will be audited",
     )
+    oci_compartments_subparser.add_argument(
+        "--resource-search",
+        action="store_true",
+        help="Find the compartments holding resources with one OCI Resource Search query per region and skip the empty ones. Resources created in the last minutes may not be indexed yet",
+    )
 
 
 def validate_compartment_ocid(ocid: str) -> str:
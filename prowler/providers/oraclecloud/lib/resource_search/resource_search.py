@@ -0,0 +1,115 @@
+import threading
+from collections import defaultdict
+from typing import Optional
+
+import oci
+
+from prowler.lib.logger import logger
+from prowler.providers.oraclecloud.models import OCISession
+
+# Resource types listed by the services, as named in the Resource Search queries
+SEARCHABLE_RESOURCE_TYPES = [
+    "analyticsinstance",
+    "autonomousdatabase",
+    "bootvolume",
+    "bucket",
+    "filesystem",
+    "instance",
+    "integrationinstance",
+    "loggroup",
+    "networksecuritygroup",
+    "securitylist",
+    "subnet",
+    "vault",
+    "vcn",
+    "volume",
+]
+
+
+class OCIResourceSearch:
+    """
+    Index of the compartments holding each resource type, built with a single
+    paginated OCI Resource Search query per region.
+
+    Services use it to skip the list calls in compartments without resources of
+    the type they audit. Each region is searched once, the first time one of the
+    services asks for it, and the index is shared by all the services.
+
+    Attributes:
+        - resource_types: The resource types included in the search query.
+    """
+
+    def __init__(
+        self,
+        session: OCISession,
+        resource_types: list = SEARCHABLE_RESOURCE_TYPES,
+    ):
+        self._session = session
+        self.resource_types = resource_types
+        self._indexes = {}
+        self._region_locks = defaultdict(threading.Lock)
+        self._lock = threading.Lock()
+
+    def get_compartment_ids(self, region: str, resource_types: list) -> Optional[set]:
+        """
+        Get the IDs of the compartments holding resources of the given types.
+
+        Args:
+            - region: The region key, e.g. us-ashburn-1.
+            - resource_types: The resource types, as named in SEARCHABLE_RESOURCE_TYPES.
+
+        Returns:
+            - set: The compartment IDs, or None if the region could not be searched.
+        """
+        index = self._get_region_index(region)
+        if index is None:
+            return None
+        compartment_ids = set()
+        for resource_type in resource_types:
+            compartment_ids.update(index.get(resource_type.lower(), set()))
+        return compartment_ids
+
+    def _get_region_index(self, region: str) -> Optional[dict]:
+        with self._lock:
+            region_lock = self._region_locks[region]
+        # Concurrent services wait for the first search of the region
+        with region_lock:
+            if region not in self._indexes:
+                self._indexes[region] = self._search_region(region)
+            return self._indexes[region]
+
+    def _search_region(self, region: str) -> Optional[dict]:
+        try:
+            logger.info(f"OCI - Searching resources in {region}...")
+            search_client = self._create_search_client(region)
+            resources = oci.pagination.list_call_get_all_results(
+                search_client.search_resources,
+                search_details=oci.resource_search.models.StructuredSearchDetails(
+                    type="Structured",
+                    query=f"query {', '.join(self.resource_types)} resources",
+                    matching_context_type="NONE",
+                ),
+                limit=1000,
+            ).data
+
+            index = defaultdict(set)
+            for resource in resources:
+                index[resource.resource_type.lower()].add(resource.compartment_id)
+            logger.info(
+                f"OCI - Found {len(resources)} resources in {len(set().union(*index.values()))} compartments in {region}"
+            )
+            return index
+        except Exception as error:
+            logger.error(
+                f"{region} -- {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error} -- Listing resources in every compartment"
+            )
+            return None
+
+    def _create_search_client(self, region: str):
+        config = {**self._session.config, "region": region}
+        # For API key auth, signer is None and the SDK uses the key from config
+        if self._session.signer:
+            return oci.resource_search.ResourceSearchClient(
+                config=config, signer=self._session.signer
+            )
+        return oci.resource_search.ResourceSearchClient(config=config)
@@ -13,7 +13,7 @@ class OCIService:
     - Shared information like the tenancy ID, user ID, and the checks audited
     - OCI Session configuration
     - Thread pool for the __threading_call__
-    - Handles compartment traversal
+    - Handles compartment traversal, skipping compartments without resources when resource search is enabled
     """
 
     def __init__(self, service: str, provider: OciProvider):
@@ -30,6 +30,7 @@ class OCIService:
         self.audited_user = provider.identity.user_id
         self.audited_regions = provider.regions
         self.audited_compartments = provider.compartments
+        self.resource_search = provider.resource_search
         self.audited_checks = provider.audit_metadata.expected_checks
         self.audit_config = provider.audit_config
         self.fixer_config = provider.fixer_config
@@ -132,19 +133,28 @@ class OCIService:
                     f"{self.service.upper()} - Error in compartment threaded execution: {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
 
-    def __threading_call_by_region_and_compartment__(self, call):
+    def __threading_call_by_region_and_compartment__(self, call, resource_types=None):
         """
         Execute a function for each region and compartment combination using threading.
 
         Args:
             call (callable): The function to call for each (region, compartment) pair.
                             The function should accept region and compartment as parameters.
+            resource_types (list, optional): The resource types listed by the call. With resource
+                            search enabled, only the compartments holding them are processed.
         """
         # Create combinations of regions and compartments
         region_compartment_pairs = [
             (region, compartment)
             for region in self.audited_regions
-            for compartment in self.audited_compartments
+            for compartment in (
+                self._get_compartments_with_resources(
+                    region.key if hasattr(region, "key") else str(region),
+                    resource_types,
+                )
+                if resource_types
+                else self.audited_compartments
+            )
         ]
 
         pair_count = len(region_compartment_pairs)
@@ -173,6 +183,33 @@ class OCIService:
                     f"{self.service.upper()} - Error in region-compartment threaded execution: {error.__class__.__name__}[{error.__traceback__.tb_lineno}]: {error}"
                 )
 
+    def _get_compartments_with_resources(
+        self, region_key: str, resource_types: list
+    ) -> list:
+        """
+        Get the audited compartments holding resources of the given types in a region.
+
+        Args:
+            region_key (str): The region key (e.g., 'us-ashburn-1').
+            resource_types (list): The resource types, as named in the OCI Resource Search queries.
+
+        Returns:
+            list: The compartments with resources, or every audited compartment if
+            resource search is disabled or the region could not be searched.
+        """
+        if not self.resource_search:
+            return self.audited_compartments
+        compartment_ids = self.resource_search.get_compartment_ids(
+            region_key, resource_types
+        )
+        if compartment_ids is None:
+            return self.audited_compartments
+        return [
+            compartment
+            for compartment in self.audited_compartments
+            if compartment.id in compartment_ids
+        ]
+
     def get_client_for_region(self, region_key: str):
         """
         Get the OCI service client for a specific region.
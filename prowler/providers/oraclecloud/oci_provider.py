@@ -1,6 +1,7 @@
 import os
 import pathlib
 import re
+from typing import Optional
 
 import oci
 from colorama import Fore, Style
@@ -31,6 +32,9 @@ from prowler.providers.oraclecloud.exceptions.exceptions import (
     OCISetUpSessionError,
 )
 from prowler.providers.oraclecloud.lib.mutelist.mutelist import OCIMutelist
+from prowler.providers.oraclecloud.lib.resource_search.resource_search import (
+    OCIResourceSearch,
+)
 from prowler.providers.oraclecloud.models import (
     OCICompartment,
     OCIIdentityInfo,
@@ -85,6 +89,7 @@ class OciProvider(Provider):
         key_content: str = None,
         tenancy: str = None,
         pass_phrase: str = None,
+        use_resource_search: bool = False,
     ):
         """
         Initializes the OCI provider.
@@ -106,6 +111,7 @@ class OciProvider(Provider):
             - key_content: Content of the private key (base64 encoded).
             - tenancy: The OCID of the tenancy.
             - pass_phrase: The passphrase for the private key, if encrypted.
+            - use_resource_search: Whether to use OCI Resource Search to skip compartments without resources.
 
         Raises:
             - OCISetUpSessionError: If an error occurs during the setup process.
@@ -161,6 +167,11 @@ class OciProvider(Provider):
             compartment_ids, self._identity.tenancy_id
         )
 
+        # Resource Search index shared by the services, to skip empty compartments
+        self._resource_search = (
+            OCIResourceSearch(self._session) if use_resource_search else None
+        )
+
         # Audit Config
         if config_content:
             self._audit_config = config_content
@@ -216,6 +227,10 @@ class OciProvider(Provider):
     def compartments(self):
         return self._compartments
 
+    @property
+    def resource_search(self) -> Optional[OCIResourceSearch]:
+        return self._resource_search
+
     @property
     def mutelist(self) -> OCIMutelist:
         """
@@ -17,7 +17,7 @@ class Analytics(OCIService):
         super().__init__("analytics", provider)
         self.analytics_instances = []
         self.__threading_call_by_region_and_compartment__(
-            self.__list_analytics_instances__
+            self.__list_analytics_instances__, resource_types=["analyticsinstance"]
         )
 
     def __get_client__(self, region: str) -> oci.analytics.AnalyticsClient:
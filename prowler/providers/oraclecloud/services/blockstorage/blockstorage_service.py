@@ -56,7 +56,9 @@ class BlockStorage(OCIService):
                 f"BlockStorage - Listing Volumes in {regional_client.region}..."
             )
 
-            for compartment in self.audited_compartments:
+            for compartment in self._get_compartments_with_resources(
+                regional_client.region, ["volume"]
+            ):
                 try:
                     volumes = oci.pagination.list_call_get_all_results(
                         blockstorage_client.list_volumes, compartment_id=compartment.id
@@ -108,7 +110,9 @@ class BlockStorage(OCIService):
                 f"BlockStorage - Listing Boot Volumes in {regional_client.region}..."
             )
 
-            for compartment in self.audited_compartments:
+            for compartment in self._get_compartments_with_resources(
+                regional_client.region, ["bootvolume"]
+            ):
                 try:
                     # Get availability domains for this compartment
                     identity_client = self._create_oci_client(
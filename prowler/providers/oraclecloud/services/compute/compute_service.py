@@ -52,7 +52,9 @@ class Compute(OCIService):
 
             logger.info(f"Compute - Listing Instances in {regional_client.region}...")
 
-            for compartment in self.audited_compartments:
+            for compartment in self._get_compartments_with_resources(
+                regional_client.region, ["instance"]
+            ):
                 try:
                     instances = oci.pagination.list_call_get_all_results(
                         compute_client.list_instances, compartment_id=compartment.id
@@ -17,7 +17,7 @@ class Database(OCIService):
         super().__init__("database", provider)
         self.autonomous_databases = []
         self.__threading_call_by_region_and_compartment__(
-            self.__list_autonomous_databases__
+            self.__list_autonomous_databases__, resource_types=["autonomousdatabase"]
         )
 
     def __get_client__(self, region: str) -> oci.database.DatabaseClient:
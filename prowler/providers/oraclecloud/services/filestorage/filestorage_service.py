@@ -36,7 +36,9 @@ class Filestorage(OCIService):
                 f"Filestorage - Listing file_systems in {regional_client.region}..."
             )
 
-            for compartment in self.audited_compartments:
+            for compartment in self._get_compartments_with_resources(
+                regional_client.region, ["filesystem"]
+            ):
                 try:
                     # Get availability domains for this compartment
                     identity_client = self._create_oci_client(
@@ -17,7 +17,7 @@ class Integration(OCIService):
         super().__init__("integration", provider)
         self.integration_instances = []
         self.__threading_call_by_region_and_compartment__(
-            self.__list_integration_instances__
+            self.__list_integration_instances__, resource_types=["integrationinstance"]
         )
 
     def __get_client__(self, region: str) -> oci.integration.IntegrationInstanceClient:
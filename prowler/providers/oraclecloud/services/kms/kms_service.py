@@ -34,7 +34,9 @@ class Kms(OCIService):
 
             logger.info(f"Kms - Listing keys in {regional_client.region}...")
 
-            for compartment in self.audited_compartments:
+            for compartment in self._get_compartments_with_resources(
+                regional_client.region, ["vault"]
+            ):
                 try:
                     # First, list all vaults in this compartment
                     vaults = oci.pagination.list_call_get_all_results(
@@ -23,8 +23,12 @@ class Logging(OCIService):
         super().__init__("logging", provider)
         self.log_groups = []
         self.logs = []
-        self.__threading_call_by_region_and_compartment__(self.__list_log_groups__)
-        self.__threading_call_by_region_and_compartment__(self.__list_logs__)
+        self.__threading_call_by_region_and_compartment__(
+            self.__list_log_groups__, resource_types=["loggroup"]
+        )
+        self.__threading_call_by_region_and_compartment__(
+            self.__list_logs__, resource_types=["loggroup"]
+        )
 
     def __get_client__(self, region):
         """
@@ -25,12 +25,19 @@ class Network(OCIService):
         self.security_lists = []
         self.network_security_groups = []
         self.subnets = []
-        self.__threading_call_by_region_and_compartment__(self.__list_vcns__)
-        self.__threading_call_by_region_and_compartment__(self.__list_security_lists__)
         self.__threading_call_by_region_and_compartment__(
-            self.__list_network_security_groups__
+            self.__list_vcns__, resource_types=["vcn"]
+        )
+        self.__threading_call_by_region_and_compartment__(
+            self.__list_security_lists__, resource_types=["securitylist"]
+        )
+        self.__threading_call_by_region_and_compartment__(
+            self.__list_network_security_groups__,
+            resource_types=["networksecuritygroup"],
+        )
+        self.__threading_call_by_region_and_compartment__(
+            self.__list_subnets__, resource_types=["subnet"]
         )
-        self.__threading_call_by_region_and_compartment__(self.__list_subnets__)
 
     def __get_client__(self, region):
         """
@@ -24,7 +24,9 @@ class ObjectStorage(OCIService):
         self.buckets = []
         self.namespace = self.__get_namespace__()
         if self.namespace:
-            self.__threading_call_by_region_and_compartment__(self.__list_buckets__)
+            self.__threading_call_by_region_and_compartment__(
+                self.__list_buckets__, resource_types=["bucket"]
+            )
 
     def __get_client__(self, region):
         """
@@ -0,0 +1,196 @@
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httplib2
+import pytest
+import requests
+from boto3 import session
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from moto import mock_aws
+
+from prowler.lib.cassette import (
+    RECORD_MODE,
+    REDACTED_VALUE,
+    REPLAY_MODE,
+    CassetteEntryNotFoundError,
+    RecordedResponse,
+    cassette,
+    install_hooks,
+)
+from tests.providers.aws.utils import AWS_REGION_US_EAST_1
+
+BUCKET_NAME = "test-bucket"
+
+
+@pytest.fixture
+def cassette_file(tmp_path, monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    install_hooks()
+    yield str(tmp_path / "test.cassette.jsonl.gz")
+    cassette.disable()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = json.dumps({"path": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _s3_client(max_attempts=1):
+    return session.Session(region_name=AWS_REGION_US_EAST_1).client(
+        "s3", config=Config(retries={"max_attempts": max_attempts, "mode": "standard"})
+    )
+
+
+class TestRecordedResponse:
+    def test_to_dict_from_dict(self):
+        text_response = RecordedResponse(200, {"Content-Type": "text/xml"}, b"<a/>")
+        binary_response = RecordedResponse(200, {}, b"\x1f\x8b\xff")
+
+        assert text_response.to_dict() == {
+            "status": 200,
+            "headers": {"Content-Type": "text/xml"},
+            "body": "<a/>",
+        }
+        assert binary_response.to_dict()["encoding"] == "base64"
+        assert RecordedResponse.from_dict(text_response.to_dict()) == text_response
+        assert RecordedResponse.from_dict(binary_response.to_dict()) == binary_response
+
+    def test_redacted(self):
+        json_response = RecordedResponse(
+            200,
+            {"Content-Type": "application/json", "Content-Length": "71"},
+            b'{"token_type": "Bearer", "access_token": "eyJ0eXAi", "expires_in": 3599}',
+        )
+        xml_response = RecordedResponse(
+            200,
+            {"Set-Cookie": "session=secret"},
+            b"<Credentials><AccessKeyId>ASIA</AccessKeyId>"
+            b"<SecretAccessKey>secret</SecretAccessKey>"
+            b"<SessionToken>token</SessionToken></Credentials>",
+        )
+        gzip_response = RecordedResponse(
+            200,
+            {"Content-Encoding": "gzip"},
+            gzip.compress(b'{"refresh_token": "secret"}'),
+        )
+
+        redacted_json_response = json_response.redacted()
+        assert json.loads(redacted_json_response.body) == {
+            "token_type": "Bearer",
+            "access_token": REDACTED_VALUE,
+            "expires_in": 3599,
+        }
+        assert redacted_json_response.headers["Content-Length"] == str(
+            len(redacted_json_response.body)
+        )
+        assert xml_response.redacted() == RecordedResponse(
+            200,
+            {"Set-Cookie": REDACTED_VALUE},
+            b"<Credentials><AccessKeyId>ASIA</AccessKeyId>"
+            b"<SecretAccessKey>REDACTED</SecretAccessKey>"
+            b"<SessionToken>REDACTED</SessionToken></Credentials>",
+        )
+        assert json.loads(gzip.decompress(gzip_response.redacted().body)) == {
+            "refresh_token": REDACTED_VALUE
+        }
+        # The original responses are not changed
+        assert b"eyJ0eXAi" in json_response.body
+
+
+class TestCassette:
+    def test_record_and_replay_aws(self, cassette_file):
+        cassette.enable(RECORD_MODE, cassette_file)
+        with mock_aws():
+            s3_client = _s3_client()
+            s3_client.create_bucket(Bucket=BUCKET_NAME)
+            s3_client.list_buckets()
+        cassette.save()
+
+        # moto is not running, the responses are served from the cassette
+        cassette.enable(REPLAY_MODE, cassette_file)
+        buckets = _s3_client().list_buckets()["Buckets"]
+
+        assert [bucket["Name"] for bucket in buckets] == [BUCKET_NAME]
+
+    def test_replay_missing_request(self, cassette_file):
+        cassette.enable(RECORD_MODE, cassette_file)
+        cassette.save()
+
+        cassette.enable(REPLAY_MODE, cassette_file)
+        with pytest.raises(CassetteEntryNotFoundError):
+            _s3_client().list_buckets()
+
+    def test_replay_throttling(self, cassette_file):
+        cassette.enable(RECORD_MODE, cassette_file)
+        with mock_aws():
+            _s3_client().list_buckets()
+        cassette.save()
+
+        cassette.enable(REPLAY_MODE, cassette_file, throttling_rate=1)
+        with pytest.raises(ClientError) as error:
+            _s3_client(max_attempts=2).list_buckets()
+
+        assert error.value.response["Error"]["Code"] == "Throttling"
+        assert error.value.response["ResponseMetadata"]["RetryAttempts"] == 2
+
+    def test_replay_by_name(self, cassette_file):
+        cassette.enable(RECORD_MODE, cassette_file)
+        cassette.record("recorded-key", "s3.ListBuckets", RecordedResponse(200, {}))
+        cassette.record("recorded-key", "s3.ListBuckets", RecordedResponse(404, {}))
+        cassette.save()
+
+        cassette.enable(REPLAY_MODE, cassette_file)
+
+        assert cassette.replay("other-key", "s3.ListBuckets").status == 200
+        assert cassette.replay("other-key", "s3.ListBuckets").status == 404
+        # The last recorded response is repeated
+        assert cassette.replay("other-key", "s3.ListBuckets").status == 404
+
+    def test_record_and_replay_urllib3(self, cassette_file, http_server):
+        cassette.enable(RECORD_MODE, cassette_file)
+        assert requests.get(f"{http_server}/subscriptions").json() == {
+            "path": "/subscriptions"
+        }
+        cassette.save()
+
+        cassette.enable(REPLAY_MODE, cassette_file)
+        assert requests.get(f"{http_server}/subscriptions").json() == {
+            "path": "/subscriptions"
+        }
+
+        cassette.enable(REPLAY_MODE, cassette_file, throttling_rate=1)
+        assert requests.get(f"{http_server}/subscriptions").status_code == 429
+
+    def test_record_and_replay_httplib2(self, cassette_file, http_server):
+        cassette.enable(RECORD_MODE, cassette_file)
+        response, content = httplib2.Http().request(f"{http_server}/projects")
+        assert response.status == 200
+        assert json.loads(content) == {"path": "/projects"}
+        cassette.save()
+
+        cassette.enable(REPLAY_MODE, cassette_file)
+        response, content = httplib2.Http().request(f"{http_server}/projects")
+        assert response.status == 200
+        assert json.loads(content) == {"path": "/projects"}
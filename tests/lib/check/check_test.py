@@ -6,6 +6,7 @@ from logging import ERROR
 from pkgutil import ModuleInfo
 from unittest import mock
 
+import pytest
 from boto3 import client
 from mock import Mock, patch
 from moto import mock_aws
@@ -20,11 +21,14 @@ from prowler.lib.check.check import (
     list_services,
     parse_checks_from_file,
     parse_checks_from_folder,
+    plan_fixes,
     remove_custom_checks_module,
+    run_fixer,
     update_audit_metadata,
 )
 from prowler.lib.check.models import load_check_metadata
 from prowler.lib.check.utils import (
+    get_checks_attributes,
     list_modules,
     recover_checks_from_provider,
     recover_checks_from_service,
@@ -44,165 +48,6 @@ from tests.providers.aws.utils import (
 # AWS_ACCOUNT_NUMBER = "123456789012"
 # AWS_REGION = "us-east-1"
 
-expected_packages = [
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/storage/storage_ensure_minimum_tls_version_12"
-        ),
-        name="prowler.providers.azure.services.storage.storage_ensure_minimum_tls_version_12.storage_ensure_minimum_tls_version_12",
-        ispkg=False,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/storage/storage_key_rotation_90_days"
-        ),
-        name="prowler.providers.azure.services.storage.storage_key_rotation_90_days.storage_key_rotation_90_days",
-        ispkg=False,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/storage/storage_ensure_private_endpoints_in_storage_accounts"
-        ),
-        name="prowler.providers.azure.services.storage.storage_ensure_private_endpoints_in_storage_accounts.storage_ensure_private_endpoints_in_storage_accounts",
-        ispkg=False,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/storage/storage_ensure_soft_delete_is_enabled"
-        ),
-        name="prowler.providers.azure.services.storage.storage_ensure_soft_delete_is_enabled.storage_ensure_soft_delete_is_enabled",
-        ispkg=False,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder("/root_dir/prowler/providers/azure/services/storage"),
-        name="prowler.providers.azure.services.storage.storage_ensure_encryption_with_customer_managed_keys",
-        ispkg=True,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/storage/storage_ensure_encryption_with_customer_managed_keys"
-        ),
-        name="prowler.providers.azure.services.storage.storage_ensure_encryption_with_customer_managed_keys.storage_ensure_encryption_with_customer_managed_keys",
-        ispkg=False,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_tde_encrypted_with_cmk",
-        ispkg=True,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver/sqlserver_tde_encrypted_with_cmk"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_tde_encrypted_with_cmk.sqlserver_tde_encrypted_with_cmk",
-        ispkg=False,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_tde_encryption_enabled",
-        ispkg=True,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver/sqlserver_tde_encryption_enabled"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_tde_encryption_enabled.sqlserver_tde_encryption_enabled",
-        ispkg=False,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_auditing_retention_90_days",
-        ispkg=True,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver/sqlserver_auditing_retention_90_days"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_auditing_retention_90_days.sqlserver_auditing_retention_90_days",
-        ispkg=False,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_vulnerability_assessment_enabled",
-        ispkg=True,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver/sqlserver_vulnerability_assessment_enabled"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_vulnerability_assessment_enabled.sqlserver_vulnerability_assessment_enabled",
-        ispkg=False,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_va_periodic_recurring_scans_enabled",
-        ispkg=True,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver/sqlserver_va_periodic_recurring_scans_enabled"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_va_periodic_recurring_scans_enabled.sqlserver_va_periodic_recurring_scans_enabled",
-        ispkg=False,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_va_scan_reports_configured",
-        ispkg=True,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver/sqlserver_va_scan_reports_configured"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_va_scan_reports_configured.sqlserver_va_scan_reports_configured",
-        ispkg=False,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_va_emails_notifications_admins_enabled",
-        ispkg=True,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/sqlserver/sqlserver_va_emails_notifications_admins_enabled"
-        ),
-        name="prowler.providers.azure.services.sqlserver.sqlserver_va_emails_notifications_admins_enabled.sqlserver_va_emails_notifications_admins_enabled",
-        ispkg=False,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/postgresql"
-        ),
-        name="prowler.providers.azure.services.postgresql.postgresql_flexible_server_enforce_ssl_enabled",
-        ispkg=True,
-    ),
-    ModuleInfo(
-        module_finder=FileFinder(
-            "/root_dir/prowler/providers/azure/services/postgresql/postgresql_flexible_server_enforce_ssl_enabled"
-        ),
-        name="prowler.providers.azure.services.postgresql.postgresql_flexible_server_enforce_ssl_enabled.postgresql_flexible_server_enforce_ssl_enabled",
-        ispkg=False,
-    ),
-]
-
-
-def mock_walk_packages(*_):
-    return expected_packages
-
 
 def mock_list_modules(*_):
     modules = [
@@ -636,12 +481,45 @@ class TestCheck:
         returned_checks = recover_checks_from_provider(provider, service)
         assert returned_checks == expected_checks
 
-    @patch("prowler.lib.check.utils.walk_packages", new=mock_walk_packages)
     def test_list_modules(self):
         provider = "azure"
         service = "storage"
-        expected_modules = list_modules(provider, service)
-        assert expected_modules == expected_packages
+        modules = {module.name: module for module in list_modules(provider, service)}
+
+        check_module = (
+            "prowler.providers.azure.services.storage."
+            "storage_ensure_minimum_tls_version_12.storage_ensure_minimum_tls_version_12"
+        )
+        assert check_module in modules
+        assert not modules[check_module].ispkg
+        assert modules[check_module].module_finder.path.endswith(
+            os.path.join("storage", "storage_ensure_minimum_tls_version_12")
+        )
+        assert modules[check_module.rsplit(".", 1)[0]].ispkg
+        assert "prowler.providers.azure.services.storage.storage_service" in modules
+
+    def test_get_checks_attributes(self):
+        attributes = get_checks_attributes(
+            "aws", ["s3_bucket_object_versioning", "s3_bucket_default_encryption"]
+        )
+
+        assert "buckets" in attributes
+        assert "versioning" in attributes
+        assert "encryption" in attributes
+        assert "notification_config" not in attributes
+
+    def test_get_checks_attributes_unknown(self):
+        assert get_checks_attributes("aws", []) is None
+        assert (
+            get_checks_attributes(
+                "aws", ["s3_bucket_object_versioning", "s3_nonexistent_check"]
+            )
+            is None
+        )
+
+    def test_list_modules_service_not_found(self):
+        with pytest.raises(ModuleNotFoundError):
+            list(list_modules("azure", "nonexistent_service"))
 
     @patch(
         "prowler.lib.check.utils.recover_checks_from_provider",
@@ -973,3 +851,79 @@ class TestCheck:
             assert caplog.record_tuples == [
                 ("root", 40, f"Check '{checks[0]}' was not found for the AWS provider")
             ]
+
+    def test_plan_fixes(self):
+        def region_fixer(region):
+            return True
+
+        def resource_fixer(resource_id: str, region: str) -> bool:
+            return True
+
+        fixers = {
+            "ec2_ebs_default_encryption": region_fixer,
+            "ec2_instance_public_ip": resource_fixer,
+        }
+        findings = [
+            mock_fixer_finding("ec2_ebs_default_encryption", "vol-1", "FAIL"),
+            mock_fixer_finding("ec2_ebs_default_encryption", "vol-2", "FAIL"),
+            mock_fixer_finding("ec2_ebs_default_encryption", "vol-3", "PASS"),
+            mock_fixer_finding("ec2_instance_public_ip", "i-1", "FAIL"),
+            mock_fixer_finding("ec2_instance_public_ip", "i-2", "FAIL"),
+        ]
+
+        with patch(
+            "prowler.lib.check.check.import_check",
+            side_effect=lambda check_path: Mock(
+                fixer=fixers[check_path.split(".")[-2]]
+            ),
+        ):
+            fixer_tasks = plan_fixes(findings)
+
+        # The region fixer is called once for all the findings in the region
+        assert [
+            (fixer_task.check, fixer_task.arguments, len(fixer_task.findings))
+            for fixer_task in fixer_tasks
+        ] == [
+            ("ec2_ebs_default_encryption", {"region": AWS_REGION_US_EAST_1}, 2),
+            (
+                "ec2_instance_public_ip",
+                {"resource_id": "i-1", "region": AWS_REGION_US_EAST_1},
+                1,
+            ),
+            (
+                "ec2_instance_public_ip",
+                {"resource_id": "i-2", "region": AWS_REGION_US_EAST_1},
+                1,
+            ),
+        ]
+
+    def test_run_fixer(self):
+        fixed_resources = []
+
+        def resource_fixer(resource_id: str, region: str) -> bool:
+            fixed_resources.append(resource_id)
+            return resource_id != "i-3"
+
+        findings = [
+            mock_fixer_finding("ec2_instance_public_ip", resource_id, "FAIL")
+            for resource_id in ["i-1", "i-2", "i-3"]
+        ]
+
+        with patch(
+            "prowler.lib.check.check.import_check",
+            return_value=Mock(fixer=resource_fixer),
+        ):
+            assert run_fixer(findings) == 2
+
+        assert sorted(fixed_resources) == ["i-1", "i-2", "i-3"]
+
+
+def mock_fixer_finding(check_id, resource_id, status):
+    finding = Mock()
+    finding.check_metadata.CheckID = check_id
+    finding.check_metadata.Provider = "aws"
+    finding.check_metadata.ServiceName = "ec2"
+    finding.resource_id = resource_id
+    finding.region = AWS_REGION_US_EAST_1
+    finding.status = status
+    return finding
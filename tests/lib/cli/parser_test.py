@@ -329,6 +329,49 @@ class Test_Parser:
         assert len(parsed.output_formats) == 1
         assert "html" in parsed.output_formats
 
+    def test_root_parser_record_cassette(self):
+        command = [prowler_command, "--record-cassette", "aws.cassette.jsonl.gz"]
+        parsed = self.parser.parse(command)
+        assert parsed.record_cassette == "aws.cassette.jsonl.gz"
+        assert parsed.replay_cassette is None
+
+    @pytest.mark.parametrize("flag", ["--record-cassette", "--replay-cassette"])
+    def test_root_parser_cassette_without_file(self, flag):
+        command = [prowler_command, flag]
+        with pytest.raises(SystemExit) as wrapped_exit:
+            _ = self.parser.parse(command)
+        assert wrapped_exit.value.code == 2
+
+    def test_root_parser_output_compression_default(self):
+        command = [prowler_command]
+        parsed = self.parser.parse(command)
+        assert parsed.output_compression is None
+
+    def test_root_parser_output_compression_gzip(self):
+        command = [prowler_command, "--output-compression", "gzip"]
+        parsed = self.parser.parse(command)
+        assert parsed.output_compression == "gzip"
+
+    def test_root_parser_output_compression_zstd_not_installed(self, capsys):
+        command = [prowler_command, "--output-compression", "zstd"]
+        with patch(
+            "prowler.lib.cli.parser.is_compression_available", return_value=False
+        ):
+            with pytest.raises(SystemExit) as wrapped_exit:
+                _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+        assert "requires the zstandard package" in capsys.readouterr().err
+
+    def test_root_parser_output_formats_parquet_not_installed(self, capsys):
+        command = [prowler_command, "--output-formats", "parquet"]
+        with patch("prowler.lib.cli.parser.is_parquet_available", return_value=False):
+            with pytest.raises(SystemExit) as wrapped_exit:
+                _ = self.parser.parse(command)
+        assert wrapped_exit.type == SystemExit
+        assert wrapped_exit.value.code == 2
+        assert "requires the pyarrow package" in capsys.readouterr().err
+
     def test_root_parser_output_filename_short(self):
         filename = "test_output.txt"
         command = [prowler_command, "-F", filename]
@@ -1115,6 +1158,12 @@ class Test_Parser:
         parsed = self.parser.parse(command)
         assert parsed.fixer
 
+    def test_aws_parser_fixer_dry_run(self):
+        argument = "--fixer-dry-run"
+        command = [prowler_command, argument]
+        parsed = self.parser.parse(command)
+        assert parsed.fixer_dry_run
+
     def test_aws_parser_config_file(self):
         argument = "--config-file"
         config_file = "./test-config.yaml"
@@ -0,0 +1,165 @@
+import csv
+import gzip
+import json
+from unittest import mock
+
+import pytest
+
+from prowler.lib.outputs.compression import (
+    CompressedTextFile,
+    is_compression_available,
+)
+from prowler.lib.outputs.csv.csv import CSV
+from prowler.lib.outputs.ocsf.ocsf import OCSF
+from tests.lib.outputs.fixtures.fixtures import generate_finding_output
+
+
+class TestCompressedTextFile:
+    def test_gzip_write(self, tmp_path):
+        file_path = str(tmp_path / "output.csv.gz")
+        file_descriptor = CompressedTextFile(file_path, "gzip")
+        assert file_descriptor.tell() == 0
+        file_descriptor.write("header\n")
+        file_descriptor.write("línea\n")
+        assert file_descriptor.tell() == 13
+        assert not file_descriptor.closed
+        file_descriptor.close()
+        assert file_descriptor.closed
+
+        with gzip.open(file_path, "rt", encoding="utf-8") as compressed_file:
+            assert compressed_file.read() == "header\nlínea\n"
+
+    def test_gzip_append(self, tmp_path):
+        file_path = str(tmp_path / "output.csv.gz")
+        file_descriptor = CompressedTextFile(file_path, "gzip")
+        file_descriptor.write("first\n")
+        file_descriptor.close()
+
+        file_descriptor = CompressedTextFile(file_path, "gzip")
+        # The existing file is not empty
+        assert file_descriptor.tell() > 0
+        file_descriptor.write("second\n")
+        file_descriptor.close()
+
+        with gzip.open(file_path, "rt", encoding="utf-8") as compressed_file:
+            assert compressed_file.read() == "first\nsecond\n"
+
+    def test_zstd_write(self, tmp_path):
+        zstandard = pytest.importorskip("zstandard")
+        file_path = str(tmp_path / "output.csv.zst")
+        file_descriptor = CompressedTextFile(file_path, "zstd")
+        assert file_descriptor.tell() == 0
+        file_descriptor.write("header\n")
+        file_descriptor.write("línea\n")
+        assert file_descriptor.tell() == 13
+        file_descriptor.close()
+        assert file_descriptor.closed
+
+        with open(file_path, "rb") as compressed_file:
+            content = zstandard.ZstdDecompressor().stream_reader(compressed_file).read()
+        assert content.decode("utf-8") == "header\nlínea\n"
+
+    def test_zstd_append(self, tmp_path):
+        zstandard = pytest.importorskip("zstandard")
+        file_path = str(tmp_path / "output.csv.zst")
+        file_descriptor = CompressedTextFile(file_path, "zstd")
+        file_descriptor.write("first\n")
+        file_descriptor.close()
+
+        file_descriptor = CompressedTextFile(file_path, "zstd")
+        # The existing file is not empty
+        assert file_descriptor.tell() > 0
+        file_descriptor.write("second\n")
+        file_descriptor.close()
+
+        with open(file_path, "rb") as compressed_file:
+            content = (
+                zstandard.ZstdDecompressor()
+                .stream_reader(compressed_file, read_across_frames=True)
+                .read()
+            )
+        assert content.decode("utf-8") == "first\nsecond\n"
+
+    def test_unsupported_compression(self, tmp_path):
+        with pytest.raises(ValueError):
+            CompressedTextFile(str(tmp_path / "output.csv.bz2"), "bzip2")
+
+    def test_is_compression_available(self):
+        assert is_compression_available("gzip")
+        assert not is_compression_available("bzip2")
+        with mock.patch.dict("sys.modules", {"zstandard": None}):
+            assert not is_compression_available("zstd")
+
+    def test_is_compression_available_zstd(self):
+        pytest.importorskip("zstandard")
+        assert is_compression_available("zstd")
+
+
+class TestCompressedOutputs:
+    def test_csv_gzip(self, tmp_path):
+        findings = [
+            generate_finding_output(check_id="service_check_1"),
+            generate_finding_output(check_id="service_check_2"),
+        ]
+        output = CSV(
+            findings=findings,
+            file_path=str(tmp_path / "output.csv"),
+            compression="gzip",
+        )
+        assert output.file_path == str(tmp_path / "output.csv.gz")
+        assert output.file_extension == ".csv"
+
+        output.batch_write_data_to_file()
+
+        with gzip.open(output.file_path, "rt", encoding="utf-8") as compressed_file:
+            rows = list(csv.DictReader(compressed_file, delimiter=";"))
+        assert [row["CHECK_ID"] for row in rows] == [
+            "service_check_1",
+            "service_check_2",
+        ]
+
+    def test_csv_zstd(self, tmp_path):
+        zstandard = pytest.importorskip("zstandard")
+        findings = [
+            generate_finding_output(check_id="service_check_1"),
+            generate_finding_output(check_id="service_check_2"),
+        ]
+        output = CSV(
+            findings=findings,
+            file_path=str(tmp_path / "output.csv"),
+            compression="zstd",
+        )
+        assert output.file_path == str(tmp_path / "output.csv.zst")
+        assert output.file_extension == ".csv"
+
+        output.batch_write_data_to_file()
+
+        with open(output.file_path, "rb") as compressed_file:
+            content = zstandard.ZstdDecompressor().stream_reader(compressed_file).read()
+        rows = list(csv.DictReader(content.decode("utf-8").splitlines(), delimiter=";"))
+        assert [row["CHECK_ID"] for row in rows] == [
+            "service_check_1",
+            "service_check_2",
+        ]
+
+    def test_ocsf_gzip_in_batches(self, tmp_path):
+        file_path = str(tmp_path / "output.ocsf.json")
+        output = OCSF(
+            findings=[generate_finding_output(check_id="service_check_1")],
+            file_path=file_path,
+            from_cli=False,
+            compression="gzip",
+        )
+        output.batch_write_data_to_file()
+        output._data.clear()
+
+        output.transform([generate_finding_output(check_id="service_check_2")])
+        output.close_file = True
+        output.batch_write_data_to_file()
+
+        with gzip.open(f"{file_path}.gz", "rt", encoding="utf-8") as compressed_file:
+            content = json.load(compressed_file)
+        assert [finding["metadata"]["event_code"] for finding in content] == [
+            "service_check_1",
+            "service_check_2",
+        ]
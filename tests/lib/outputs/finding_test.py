@@ -111,11 +111,14 @@ class DummyResource:
 
 
 class DummyResources:
-    """Simulate a collection with a first() method."""
+    """Simulate a related manager with all() and first() methods."""
 
     def __init__(self, resource):
         self._resource = resource
 
+    def all(self):
+        return [self._resource]
+
     def first(self):
         return self._resource
 
@@ -1159,6 +1162,153 @@ class TestFinding:
         assert finding_obj.account_uid == "cluster-1"
         assert finding_obj.region == "namespace: default"
 
+    @patch(
+        "prowler.lib.outputs.finding.get_check_compliance",
+        new=mock_get_check_compliance,
+    )
+    def test_transform_api_finding_check_metadata_cache(self):
+        provider = MagicMock()
+        provider.type = "kubernetes"
+        provider.identity.context = "In-Cluster"
+        provider.identity.cluster = "cluster-1"
+        check_metadata = {
+            "provider": "kubernetes",
+            "checkid": "service_k8s_check_001",
+            "checktitle": "Test K8s Check",
+            "checktype": [],
+            "servicename": "service",
+            "subservicename": "",
+            "severity": "low",
+            "resourcetype": "K8sResourceType",
+            "description": "K8s check description",
+            "risk": "Low risk",
+            "relatedurl": "http://k8s.example.com",
+            "remediation": {
+                "code": {
+                    "nativeiac": "",
+                    "terraform": "",
+                    "cli": "",
+                    "other": "",
+                },
+                "recommendation": {"text": "Fix it", "url": "http://fix-k8s.com"},
+            },
+            "resourceidtemplate": "",
+            "categories": [],
+            "dependson": [],
+            "relatedto": [],
+            "notes": "",
+        }
+        check_metadata_cache = {}
+        finding_objs = []
+        for index in range(2):
+            api_finding = DummyAPIFinding()
+            api_finding.inserted_at = 1234567890
+            api_finding.scan = DummyScan(provider=provider)
+            api_finding.uid = f"finding-uid-k8s-{index}"
+            api_finding.status = "PASS"
+            api_finding.status_extended = "K8s check extended"
+            api_finding.check_metadata = dict(check_metadata)
+            api_finding.check_metadata_entry_id = "check-metadata-entry-1"
+            api_finding.muted = False
+            resource = DummyResource(
+                uid=f"k8s-resource-uid-{index}",
+                name=f"k8s-resource-name-{index}",
+                resource_arn="arn",
+                region="namespace: default",
+                tags=[],
+            )
+            api_finding.resources = DummyResources(resource)
+
+            with patch.object(
+                Finding,
+                "_transform_api_check_metadata",
+                wraps=Finding._transform_api_check_metadata,
+            ) as mock_transform_check_metadata:
+                finding_objs.append(
+                    Finding.transform_api_finding(
+                        api_finding,
+                        provider,
+                        check_metadata_cache=check_metadata_cache,
+                    )
+                )
+                assert mock_transform_check_metadata.call_count == (
+                    1 if index == 0 else 0
+                )
+
+        assert list(check_metadata_cache) == ["check-metadata-entry-1"]
+        assert finding_objs[0].metadata == finding_objs[1].metadata
+        assert finding_objs[1].resource_uid == "k8s-resource-uid-1"
+
+    def test_transform_api_finding_check_metadata_cache_per_finding_severity(self):
+        provider = MagicMock()
+        provider.type = "kubernetes"
+        provider.identity.context = "In-Cluster"
+        provider.identity.cluster = "cluster-1"
+        check_metadata_cache = {}
+        finding_objs = []
+        # The last finding has no check metadata entry, like the findings stored inline
+        for index, (severity, check_metadata_entry_id) in enumerate(
+            (("critical", "entry-critical"), ("low", "entry-low"), ("low", None))
+        ):
+            api_finding = DummyAPIFinding()
+            api_finding.inserted_at = 1234567890
+            api_finding.scan = DummyScan(provider=provider)
+            api_finding.uid = f"finding-uid-k8s-{index}"
+            api_finding.status = "FAIL"
+            api_finding.status_extended = "K8s check extended"
+            api_finding.check_metadata = {
+                "provider": "kubernetes",
+                "checkid": "service_k8s_check_001",
+                "checktitle": "Test K8s Check",
+                "checktype": [],
+                "servicename": "service",
+                "subservicename": "",
+                "severity": severity,
+                "resourcetype": "K8sResourceType",
+                "description": "K8s check description",
+                "risk": "Risk",
+                "relatedurl": "http://k8s.example.com",
+                "remediation": {
+                    "code": {
+                        "nativeiac": "",
+                        "terraform": "",
+                        "cli": "",
+                        "other": "",
+                    },
+                    "recommendation": {"text": "Fix it", "url": "http://fix-k8s.com"},
+                },
+                "resourceidtemplate": "",
+                "categories": [],
+                "dependson": [],
+                "relatedto": [],
+                "notes": "",
+            }
+            api_finding.check_metadata_entry_id = check_metadata_entry_id
+            api_finding.muted = False
+            api_finding.resources = DummyResources(
+                DummyResource(
+                    uid=f"k8s-resource-uid-{index}",
+                    name=f"k8s-resource-name-{index}",
+                    resource_arn="arn",
+                    region="namespace: default",
+                    tags=[],
+                )
+            )
+            finding_objs.append(
+                Finding.transform_api_finding(
+                    api_finding,
+                    provider,
+                    check_metadata_cache=check_metadata_cache,
+                )
+            )
+
+        assert [finding_obj.severity for finding_obj in finding_objs] == [
+            Severity.critical,
+            Severity.low,
+            Severity.low,
+        ]
+        assert len(check_metadata_cache) == 3
+
     @patch(
         "prowler.lib.outputs.finding.get_check_compliance",
         new=mock_get_check_compliance,
@@ -104,6 +104,29 @@ class TestJiraIntegration:
                 return row
         raise AssertionError(f"Row with header '{header}' not found")
 
+    @staticmethod
+    def _build_finding(resource_uid: str = "resource-1") -> MagicMock:
+        finding = MagicMock()
+        finding.status.value = "FAIL"
+        finding.status_extended = "status_extended"
+        finding.metadata.Severity.value = "HIGH"
+        finding.metadata.CheckID = "CHECK-1"
+        finding.metadata.CheckTitle = "Check Title"
+        finding.resource_uid = resource_uid
+        finding.resource_name = "resource_name"
+        finding.metadata.Provider = "aws"
+        finding.region = "region"
+        finding.metadata.Risk = "risk"
+        finding.metadata.Remediation.Recommendation.Text = "remediation_text"
+        finding.metadata.Remediation.Recommendation.Url = "remediation_url"
+        finding.metadata.Remediation.Code.NativeIaC = ""
+        finding.metadata.Remediation.Code.Terraform = ""
+        finding.metadata.Remediation.Code.CLI = ""
+        finding.metadata.Remediation.Code.Other = ""
+        finding.resource_tags = {}
+        finding.compliance = {}
+        return finding
+
     @patch.object(Jira, "get_auth", return_value=None)
     def test_auth_code_url(self, mock_get_auth):
         """Test to verify the authorization URL generation with correct query parameters"""
@@ -693,7 +716,7 @@ class TestJiraIntegration:
         Jira, "get_available_issue_types", return_value=["Bug", "Task", "Story"]
     )
     @patch.object(Jira, "get_projects", return_value={"TEST-1": "Test Project"})
-    @patch("prowler.lib.outputs.jira.jira.requests.post")
+    @patch("prowler.lib.outputs.jira.jira.requests.Session.post")
     def test_send_findings_successful(
         self,
         mock_post,
@@ -707,10 +730,16 @@ class TestJiraIntegration:
         mock_get_access_token = mock_get_access_token
         mock_get_projects = mock_get_projects
 
+        mock_search_response = MagicMock()
+        mock_search_response.status_code = 200
+        mock_search_response.json.return_value = {"issues": [], "isLast": True}
         mock_response = MagicMock()
         mock_response.status_code = 201
-        mock_response.json.return_value = {"id": "12345", "key": "TEST-1"}
-        mock_post.return_value = mock_response
+        mock_response.json.return_value = {
+            "issues": [{"id": "12345", "key": "TEST-1"}],
+            "errors": [],
+        }
+        mock_post.side_effect = [mock_search_response, mock_response]
 
         finding = MagicMock()
         finding.status.value = "FAIL"
@@ -751,12 +780,19 @@ class TestJiraIntegration:
             tenant_info="Tenant Info",
         )
 
-        mock_post.assert_called_once()
+        assert mock_post.call_count == 2
+
+        search_call_args = mock_post.call_args_list[0]
+        assert (
+            search_call_args[0][0]
+            == "https://api.atlassian.com/ex/jira/valid_cloud_id/rest/api/3/search/jql"
+        )
+        assert 'project = "TEST-1"' in search_call_args.kwargs["json"]["jql"]
 
         call_args = mock_post.call_args
 
         expected_url = (
-            "https://api.atlassian.com/ex/jira/valid_cloud_id/rest/api/3/issue"
+            "https://api.atlassian.com/ex/jira/valid_cloud_id/rest/api/3/issue/bulk"
         )
         expected_headers = {
             "Authorization": "Bearer valid_access_token",
@@ -768,7 +804,8 @@ class TestJiraIntegration:
         assert call_args[0][0] == expected_url
         assert call_args.kwargs["headers"] == expected_headers
 
-        payload = call_args.kwargs["json"]
+        assert len(call_args.kwargs["json"]["issueUpdates"]) == 1
+        payload = call_args.kwargs["json"]["issueUpdates"][0]
         assert payload["fields"]["project"]["key"] == "TEST-1"
         assert payload["fields"]["summary"] == "[Prowler] HIGH - CHECK-1 - resource-1"
         assert payload["fields"]["issuetype"]["name"] == "Bug"
@@ -986,7 +1023,7 @@ class TestJiraIntegration:
     @patch.object(
         Jira, "get_available_issue_types", return_value=["Bug", "Task", "Story"]
     )
-    @patch("prowler.lib.outputs.jira.jira.requests.post")
+    @patch("prowler.lib.outputs.jira.jira.requests.Session.post")
     def test_send_findings_invalid_issue_type(
         self, mock_post, mock_get_available_issue_types, mock_get_access_token
     ):
@@ -1006,7 +1043,7 @@ class TestJiraIntegration:
     @patch.object(
         Jira, "get_available_issue_types", return_value=["Bug", "Task", "Story"]
     )
-    @patch("prowler.lib.outputs.jira.jira.requests.post")
+    @patch("prowler.lib.outputs.jira.jira.requests.Session.post")
     def test_send_findings_response_error(
         self, mock_post, mock_get_available_issue_types, mock_get_access_token
     ):
@@ -1036,7 +1073,7 @@ class TestJiraIntegration:
         Jira, "get_available_issue_types", return_value=["Bug", "Task", "Story"]
     )
     @patch.object(Jira, "get_projects", return_value={"TEST-1": "Test Project"})
-    @patch("prowler.lib.outputs.jira.jira.requests.post")
+    @patch("prowler.lib.outputs.jira.jira.requests.Session.post")
     def test_send_findings_custom_fields_required_error(
         self,
         mock_post,
@@ -1098,7 +1135,7 @@ class TestJiraIntegration:
         Jira, "get_available_issue_types", return_value=["Bug", "Task", "Story"]
     )
     @patch.object(Jira, "get_projects", return_value={"TEST-1": "Test Project"})
-    @patch("prowler.lib.outputs.jira.jira.requests.post")
+    @patch("prowler.lib.outputs.jira.jira.requests.Session.post")
     def test_send_findings_non_custom_field_400_error(
         self,
         mock_post,
@@ -1155,6 +1192,168 @@ class TestJiraIntegration:
                 tenant_info="Tenant Info",
             )
 
+    @patch.object(Jira, "get_access_token", return_value="valid_access_token")
+    @patch.object(
+        Jira, "get_available_issue_types", return_value=["Bug", "Task", "Story"]
+    )
+    @patch.object(Jira, "get_projects", return_value={"TEST-1": "Test Project"})
+    @patch("prowler.lib.outputs.jira.jira.requests.Session.post")
+    def test_send_findings_skips_open_issues(
+        self,
+        mock_post,
+        mock_get_projects,
+        mock_get_available_issue_types,
+        mock_get_access_token,
+    ):
+        """Test that send_findings does not create issues already open in Jira."""
+        # To disable vulture
+        mock_get_available_issue_types = mock_get_available_issue_types
+        mock_get_access_token = mock_get_access_token
+        mock_get_projects = mock_get_projects
+
+        first_search_page = MagicMock()
+        first_search_page.status_code = 200
+        first_search_page.json.return_value = {
+            "issues": [
+                {"fields": {"summary": "[Prowler] HIGH - CHECK-1 - resource-1"}}
+            ],
+            "nextPageToken": "next",
+            "isLast": False,
+        }
+        second_search_page = MagicMock()
+        second_search_page.status_code = 200
+        second_search_page.json.return_value = {
+            "issues": [{"fields": {"summary": "Not created by Prowler"}}],
+            "isLast": True,
+        }
+        bulk_response = MagicMock()
+        bulk_response.status_code = 201
+        bulk_response.json.return_value = {
+            "issues": [{"id": "12346", "key": "TEST-2"}],
+            "errors": [],
+        }
+        mock_post.side_effect = [first_search_page, second_search_page, bulk_response]
+
+        self.jira_integration.cloud_id = "valid_cloud_id"
+
+        created = self.jira_integration.send_findings(
+            findings=[
+                self._build_finding("resource-1"),
+                self._build_finding("resource-2"),
+                self._build_finding("resource-2"),
+            ],
+            project_key="TEST-1",
+            issue_type="Bug",
+        )
+
+        assert created == 1
+        assert mock_post.call_count == 3
+        assert mock_post.call_args_list[1].kwargs["json"]["nextPageToken"] == "next"
+        issue_updates = mock_post.call_args.kwargs["json"]["issueUpdates"]
+        assert [issue["fields"]["summary"] for issue in issue_updates] == [
+            "[Prowler] HIGH - CHECK-1 - resource-2"
+        ]
+
+    @patch.object(Jira, "get_access_token", return_value="valid_access_token")
+    @patch.object(
+        Jira, "get_available_issue_types", return_value=["Bug", "Task", "Story"]
+    )
+    @patch.object(Jira, "get_projects", return_value={"TEST-1": "Test Project"})
+    @patch("prowler.lib.outputs.jira.jira.time.sleep")
+    @patch("prowler.lib.outputs.jira.jira.requests.Session.post")
+    def test_send_findings_retries_throttled_requests(
+        self,
+        mock_post,
+        mock_sleep,
+        mock_get_projects,
+        mock_get_available_issue_types,
+        mock_get_access_token,
+    ):
+        """Test that send_findings waits for the Retry-After header of throttled requests."""
+        # To disable vulture
+        mock_get_available_issue_types = mock_get_available_issue_types
+        mock_get_access_token = mock_get_access_token
+        mock_get_projects = mock_get_projects
+
+        throttled_response = MagicMock()
+        throttled_response.status_code = 429
+        throttled_response.headers = {"Retry-After": "7"}
+        bulk_response = MagicMock()
+        bulk_response.status_code = 201
+        bulk_response.json.return_value = {
+            "issues": [{"id": "12345", "key": "TEST-1"}],
+            "errors": [],
+        }
+        mock_post.side_effect = [throttled_response, bulk_response]
+
+        self.jira_integration.cloud_id = "valid_cloud_id"
+
+        created = self.jira_integration.send_findings(
+            findings=[self._build_finding()],
+            project_key="TEST-1",
+            issue_type="Bug",
+            deduplicate=False,
+        )
+
+        assert created == 1
+        assert mock_post.call_count == 2
+        mock_sleep.assert_called_once_with(7.0)
+
+    @patch.object(Jira, "get_access_token", return_value="valid_access_token")
+    @patch.object(
+        Jira, "get_available_issue_types", return_value=["Bug", "Task", "Story"]
+    )
+    @patch.object(Jira, "get_projects", return_value={"TEST-1": "Test Project"})
+    @patch("prowler.lib.outputs.jira.jira.requests.Session.post")
+    def test_send_findings_bulk_not_available(
+        self,
+        mock_post,
+        mock_get_projects,
+        mock_get_available_issue_types,
+        mock_get_access_token,
+    ):
+        """Test that send_findings creates the issues one by one if the bulk endpoint is not available."""
+        # To disable vulture
+        mock_get_available_issue_types = mock_get_available_issue_types
+        mock_get_access_token = mock_get_access_token
+        mock_get_projects = mock_get_projects
+
+        not_found_response = MagicMock()
+        not_found_response.status_code = 404
+        created_response = MagicMock()
+        created_response.status_code = 201
+        created_response.json.return_value = {"id": "12345", "key": "TEST-1"}
+        mock_post.side_effect = [
+            not_found_response,
+            created_response,
+            created_response,
+        ]
+
+        self.jira_integration.cloud_id = "valid_cloud_id"
+
+        created = self.jira_integration.send_findings(
+            findings=[
+                self._build_finding("resource-1"),
+                self._build_finding("resource-2"),
+            ],
+            project_key="TEST-1",
+            issue_type="Bug",
+            deduplicate=False,
+        )
+
+        assert created == 2
+        assert mock_post.call_count == 3
+        assert (
+            mock_post.call_args_list[0][0][0]
+            == "https://api.atlassian.com/ex/jira/valid_cloud_id/rest/api/3/issue/bulk"
+        )
+        for call in mock_post.call_args_list[1:]:
+            assert (
+                call[0][0]
+                == "https://api.atlassian.com/ex/jira/valid_cloud_id/rest/api/3/issue"
+            )
+        assert not self.jira_integration._bulk_create_supported
+
     @pytest.mark.parametrize(
         "status, expected_color",
         [
@@ -1456,7 +1655,7 @@ class TestJiraIntegration:
     )
     @patch.object(Jira, "get_projects", return_value={"TEST": {"name": "Test Project"}})
     @patch.object(Jira, "get_available_issue_types", return_value=["Bug"])
-    @patch("prowler.lib.outputs.jira.jira.requests.post")
+    @patch("prowler.lib.outputs.jira.jira.requests.Session.post")
     def test_send_finding_successful(
         self,
         mock_post,
@@ -1496,7 +1695,7 @@ class TestJiraIntegration:
     )
     @patch.object(Jira, "get_projects", return_value={"TEST": {"name": "Test Project"}})
     @patch.object(Jira, "get_available_issue_types", return_value=["Bug"])
-    @patch("prowler.lib.outputs.jira.jira.requests.post")
+    @patch("prowler.lib.outputs.jira.jira.requests.Session.post")
     def test_send_finding_failure(
         self,
         mock_post,
@@ -1536,7 +1735,7 @@ class TestJiraIntegration:
     )
     @patch.object(Jira, "get_projects", return_value={"TEST": {"name": "Test Project"}})
     @patch.object(Jira, "get_available_issue_types", return_value=["Bug"])
-    @patch("prowler.lib.outputs.jira.jira.requests.post")
+    @patch("prowler.lib.outputs.jira.jira.requests.Session.post")
     def test_send_finding_custom_fields_error(
         self,
         mock_post,
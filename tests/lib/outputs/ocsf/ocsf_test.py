@@ -21,7 +21,7 @@ from py_ocsf_models.objects.remediation import Remediation
 from py_ocsf_models.objects.resource_details import ResourceDetails
 
 from prowler.config.config import prowler_version
-from prowler.lib.outputs.ocsf.ocsf import OCSF
+from prowler.lib.outputs.ocsf.ocsf import OCSF, OCSFNDJSON
 from tests.lib.outputs.fixtures.fixtures import generate_finding_output
 from tests.providers.aws.utils import AWS_REGION_EU_WEST_1
 
@@ -461,3 +461,75 @@ class TestOCSF:
     def test_suppressed_when_muted(self):
         muted = True
         assert OCSF.get_finding_status_id(muted) == StatusID.Suppressed
+
+
+class TestOCSFNDJSON:
+    def test_transform_same_as_ocsf(self):
+        findings = [
+            generate_finding_output(
+                status="FAIL",
+                muted=True,
+                resource_tags={"Name": "test"},
+                timestamp=1700000000,
+            ),
+            generate_finding_output(
+                resource_name="resource_name",
+                resource_uid="resource-id",
+                timestamp=datetime.now(timezone.utc),
+            ),
+            generate_finding_output(
+                provider="kubernetes",
+                region="namespace: default",
+                check_id="service_kubernetes_check_id",
+            ),
+            # The severity of a check can change for each finding
+            generate_finding_output(
+                check_id="service_severity_check_id", severity="low"
+            ),
+            generate_finding_output(
+                check_id="service_severity_check_id", severity="critical"
+            ),
+        ]
+        findings[1].account_organization_uid = None
+
+        ocsf_findings = [
+            json.loads(finding.json(exclude_none=True))
+            for finding in OCSF(findings).data
+        ]
+        ndjson_findings = [
+            json.loads(json.dumps(finding)) for finding in OCSFNDJSON(findings).data
+        ]
+
+        assert ndjson_findings == ocsf_findings
+        assert [finding["severity"] for finding in ndjson_findings[-2:]] == [
+            "Low",
+            "Critical",
+        ]
+
+    def test_batch_write_data_to_file(self):
+        mock_file = StringIO()
+        findings = [
+            generate_finding_output(status="FAIL", resource_uid="resource-1"),
+            generate_finding_output(status="PASS", resource_uid="resource-2"),
+        ]
+
+        output = OCSFNDJSON(findings)
+        output._file_descriptor = mock_file
+        with patch.object(mock_file, "close", return_value=None):
+            output.batch_write_data_to_file()
+            # Next batches are appended
+            output.batch_write_data_to_file()
+
+        mock_file.seek(0)
+        lines = mock_file.read().splitlines()
+        assert len(lines) == 4
+        assert [json.loads(line)["resources"][0]["uid"] for line in lines] == [
+            "resource-1",
+            "resource-2",
+            "resource-1",
+            "resource-2",
+        ]
+        assert json.loads(lines[0])["status_code"] == "FAIL"
+
+    def test_batch_write_data_to_file_without_findings(self):
+        assert not OCSFNDJSON([])._file_descriptor
@@ -0,0 +1,109 @@
+from datetime import datetime, timezone
+from unittest import mock
+
+import pytest
+
+from prowler.lib.outputs.parquet.parquet import (
+    PARQUET_DEFAULT_COMPRESSION_CODEC,
+    Parquet,
+    is_parquet_available,
+)
+from tests.lib.outputs.fixtures.fixtures import generate_finding_output
+from tests.providers.aws.utils import AWS_ACCOUNT_NUMBER, AWS_REGION_EU_WEST_1
+
+
+class TestParquet:
+    def test_transform(self):
+        findings = [
+            generate_finding_output(
+                status="FAIL",
+                severity="low",
+                resource_tags={"Name": "test", "Count": 1},
+                compliance={"CIS-1.4": ["2.1.3", "2.1.4"], "ISO27001": "A.8.2"},
+                timestamp=1700000000,
+            )
+        ]
+        parquet = Parquet(findings=findings)
+        output_data = parquet.data[0]
+
+        assert output_data["timestamp"] == datetime.fromtimestamp(
+            1700000000, tz=timezone.utc
+        )
+        assert output_data["account_uid"] == AWS_ACCOUNT_NUMBER
+        assert output_data["check_id"] == "service_test_check_id"
+        assert output_data["check_type"] == ["test-type"]
+        assert output_data["status"] == "FAIL"
+        assert output_data["severity"] == "low"
+        assert output_data["region"] == AWS_REGION_EU_WEST_1
+        assert output_data["resource_tags"] == [("Name", "test"), ("Count", "1")]
+        assert output_data["compliance"] == [
+            ("CIS-1.4", ["2.1.3", "2.1.4"]),
+            ("ISO27001", ["A.8.2"]),
+        ]
+        assert output_data["categories"] == ["test-category"]
+
+    def test_compression_codec(self):
+        assert Parquet(findings=[], compression="zstd")._codec == "zstd"
+        assert (
+            Parquet(findings=[], compression=None)._codec
+            == PARQUET_DEFAULT_COMPRESSION_CODEC
+        )
+
+    def test_compression_not_added_to_file_path(self, tmp_path):
+        file_path = str(tmp_path / "output.parquet")
+        parquet = Parquet(
+            findings=[generate_finding_output()],
+            file_path=file_path,
+            compression="gzip",
+        )
+
+        assert parquet.file_path == file_path
+        assert parquet.file_extension == ".parquet"
+        assert parquet.compression is None
+        parquet.file_descriptor.close()
+
+    def test_is_parquet_available_without_pyarrow(self):
+        with mock.patch.dict("sys.modules", {"pyarrow": None}):
+            assert not is_parquet_available()
+
+    def test_batch_write_data_to_file(self, tmp_path):
+        pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+        file_path = str(tmp_path / "output.parquet")
+        findings = [
+            generate_finding_output(check_id="service_check_1", status="FAIL"),
+            generate_finding_output(check_id="service_check_2"),
+        ]
+        parquet = Parquet(findings=findings, file_path=file_path)
+        parquet.batch_write_data_to_file()
+
+        assert parquet.file_descriptor.closed
+        table = pyarrow_parquet.read_table(file_path, columns=["check_id", "status"])
+        assert table.column("check_id").to_pylist() == [
+            "service_check_1",
+            "service_check_2",
+        ]
+        assert table.column("status").to_pylist() == ["FAIL", "PASS"]
+
+    def test_batch_write_data_to_file_in_batches(self, tmp_path):
+        pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+        file_path = str(tmp_path / "output.parquet")
+        parquet = Parquet(
+            findings=[generate_finding_output(check_id="service_check_1")],
+            file_path=file_path,
+            from_cli=False,
+        )
+        parquet.batch_write_data_to_file()
+        parquet._data.clear()
+
+        parquet.transform([generate_finding_output(check_id="service_check_2")])
+        parquet.close_file = True
+        parquet.batch_write_data_to_file()
+
+        parquet_file = pyarrow_parquet.ParquetFile(file_path)
+        assert parquet_file.metadata.num_row_groups == 2
+        assert parquet_file.read(columns=["check_id"]).column(
+            "check_id"
+        ).to_pylist() == ["service_check_1", "service_check_2"]
+
+    def test_batch_write_data_to_file_without_findings(self):
+        assert not Parquet([])._file_descriptor
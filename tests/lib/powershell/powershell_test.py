@@ -1,3 +1,5 @@
+import json
+import threading
 from unittest.mock import MagicMock, patch
 
 from prowler.providers.m365.lib.powershell.m365_powershell import PowerShellSession
@@ -58,109 +60,198 @@ class TestPowerShellSession:
 
     @patch("subprocess.Popen")
     def test_execute(self, mock_popen):
-        """Test the execute method with various scenarios:
-        - Normal command execution
-        - JSON parsing enabled
-        - Timeout handling
-        - Error handling
-        """
-        # Setup
         mock_process = MagicMock()
         mock_popen.return_value = mock_process
+        mock_process.stdout.readline.side_effect = [
+            '<END:1>"Hello World\\r\\n"\n',
+            "",
+        ]
+        mock_process.stderr.readline.side_effect = ["<END:1>\n", ""]
         session = PowerShellSession()
 
-        # Test 1: Normal command execution
-        mock_process.stdout.readline.side_effect = ["Hello World\n", f"{session.END}\n"]
-        mock_process.stderr.readline.return_value = f"Write-Error: {session.END}\n"
-        with patch.object(session, "remove_ansi", side_effect=lambda x: x):
-            result = session.execute("Get-Command")
-            assert result == "Hello World"
-            mock_process.stdin.write.assert_any_call("Get-Command\n")
-            mock_process.stdin.write.assert_any_call(f"Write-Output '{session.END}'\n")
-            mock_process.stdin.write.assert_any_call(f"Write-Error '{session.END}'\n")
+        result = session.execute("Get-Command")
+
+        assert result == "Hello World"
+        mock_process.stdin.write.assert_any_call(
+            "$prowlerOutput = . { Get-Command } | Out-String\n"
+        )
+        mock_process.stdin.write.assert_any_call(
+            "Write-Output ('<END:1>' + (ConvertTo-Json -InputObject $prowlerOutput -Compress))\n"
+        )
+        mock_process.stdin.write.assert_any_call(
+            "[Console]::Error.WriteLine('<END:1>')\n"
+        )
+        session.close()
+
+    @patch("subprocess.Popen")
+    def test_send_does_not_block_readers_while_writing(self, mock_popen):
+        mock_process = MagicMock()
+        mock_popen.return_value = mock_process
+        writing = threading.Event()
+        release_write = threading.Event()
+
+        def blocking_write(_):
+            # Simulates a full stdin pipe
+            writing.set()
+            release_write.wait(5)
 
-        # Test 2: JSON parsing enabled
+        mock_process.stdin.write.side_effect = blocking_write
+        mock_process.stdout.readline.side_effect = [""]
+        mock_process.stderr.readline.side_effect = [""]
+        session = PowerShellSession()
+        session._start_readers = MagicMock()
+
+        sender = threading.Thread(target=session.send, args=("Get-Command",))
+        sender.start()
+        assert writing.wait(5)
+
+        # The lock used by the reader threads is free while stdin is written
+        assert session._lock.acquire(timeout=1)
+        session._lock.release()
+
+        release_write.set()
+        sender.join(5)
+        assert not sender.is_alive()
+        session.close()
+
+    @patch("subprocess.Popen")
+    def test_execute_with_host_output(self, mock_popen):
+        mock_process = MagicMock()
+        mock_popen.return_value = mock_process
         mock_process.stdout.readline.side_effect = [
-            '{"key": "value"}\n',
-            f"{session.END}\n",
+            "\x1b[32mConnected\x1b[0m\n",
+            '<END:1>"output  \\n"\n',
+            "",
         ]
-        mock_process.stderr.readline.return_value = f"Write-Error: {session.END}\n"
-        with patch.object(session, "remove_ansi", side_effect=lambda x: x):
-            with patch.object(
-                session, "json_parse_output", return_value={"key": "value"}
-            ) as mock_json_parse:
-                result = session.execute("Get-Command", json_parse=True)
-                assert result == {"key": "value"}
-                mock_json_parse.assert_called_once_with('{"key": "value"}')
-
-        # Test 3: Timeout handling
-        mock_process.stdout.readline.side_effect = ["test output\n"]  # No END marker
-        mock_process.stderr.readline.return_value = f"Write-Error: {session.END}\n"
-        result = session.execute("Get-Command", timeout=0.1)
-        assert result == ""
-
-        # Test 4: Error handling
-        mock_process.stdout.readline.side_effect = ["\n", f"{session.END}\n"]
-        mock_process.stderr.readline.side_effect = [
-            "Write-Error: This is an error\n",
-            f"Write-Error: {session.END}\n",
+        mock_process.stderr.readline.side_effect = ["<END:1>\n", ""]
+        session = PowerShellSession()
+
+        assert session.execute("Connect-Service") == "Connected\noutput"
+        session.close()
+
+    @patch("subprocess.Popen")
+    def test_execute_json_parse(self, mock_popen):
+        mock_process = MagicMock()
+        mock_popen.return_value = mock_process
+        mock_process.stdout.readline.side_effect = [
+            "WARNING: host message {not json}\n",
+            f"<END:1>{json.dumps(json.dumps([{'key': 'value'}], indent=4))}\n",
+            "",
         ]
-        with patch.object(session, "remove_ansi", side_effect=lambda x: x):
-            with patch("prowler.lib.logger.logger.error") as mock_error:
-                result = session.execute("Get-Command")
-                assert result == ""
-                mock_error.assert_called_once_with(
-                    "PowerShell error output: Write-Error: This is an error"
-                )
+        mock_process.stderr.readline.side_effect = ["<END:1>\n", ""]
+        session = PowerShellSession()
+
+        result = session.execute("Get-Command | ConvertTo-Json", json_parse=True)
 
+        assert result == [{"key": "value"}]
         session.close()
 
     @patch("subprocess.Popen")
-    def test_read_output(self, mock_popen):
-        """Test the read_output method with various scenarios:
-        - Normal stdout output
-        - Error in stderr
-        - Timeout in stdout
-        - Empty output
-        """
-        # Setup
+    def test_execute_timeout(self, mock_popen):
         mock_process = MagicMock()
         mock_popen.return_value = mock_process
+        mock_process.stdout.readline.side_effect = (
+            lambda: threading.Event().wait(1) and ""
+        )
+        mock_process.stderr.readline.side_effect = ["", ""]
         session = PowerShellSession()
 
-        # Test 1: Normal stdout output
-        mock_process.stdout.readline.side_effect = ["Hello World\n", f"{session.END}\n"]
-        mock_process.stderr.readline.return_value = f"Write-Error: {session.END}\n"
-        with patch.object(session, "remove_ansi", side_effect=lambda x: x):
-            result = session.read_output()
-            assert result == "Hello World"
+        assert session.execute("Get-Command", timeout=0.1) == ""
+        assert session.execute("Get-Command", json_parse=True, timeout=0.1) == {}
+        session.close()
+
+    @patch("subprocess.Popen")
+    def test_execute_closed_stream(self, mock_popen):
+        mock_process = MagicMock()
+        mock_popen.return_value = mock_process
+        mock_process.stdout.readline.side_effect = ["test output\n", ""]
+        mock_process.stderr.readline.side_effect = [""]
+        session = PowerShellSession()
 
-        # Test 2: Error in stderr
-        mock_process.stdout.readline.side_effect = ["\n", f"{session.END}\n"]
+        assert session.execute("Get-Command") == ""
+        session.close()
+
+    @patch("subprocess.Popen")
+    def test_execute_error_output(self, mock_popen):
+        mock_process = MagicMock()
+        mock_popen.return_value = mock_process
+        mock_process.stdout.readline.side_effect = ['<END:1>""\n', ""]
         mock_process.stderr.readline.side_effect = [
-            "Write-Error: This is an error\n",
-            f"Write-Error: {session.END}\n",
+            "This is an error\n",
+            "<END:1>\n",
+            "",
         ]
-        with patch.object(session, "remove_ansi", side_effect=lambda x: x):
-            with patch("prowler.lib.logger.logger.error") as mock_error:
-                result = session.read_output()
-                assert result == ""
-                mock_error.assert_called_once_with(
-                    "PowerShell error output: Write-Error: This is an error"
-                )
+        session = PowerShellSession()
+
+        with patch("prowler.lib.logger.logger.error") as mock_error:
+            result = session.execute("Get-Command")
+            assert result == ""
+            mock_error.assert_called_once_with(
+                "PowerShell error output: This is an error"
+            )
+        session.close()
 
-        # Test 3: Timeout in stdout
-        mock_process.stdout.readline.side_effect = ["test output\n"]  # No END marker
-        mock_process.stderr.readline.return_value = f"Write-Error: {session.END}\n"
-        result = session.read_output(timeout=0.1, default="timeout")
-        assert result == "timeout"
+    @patch("subprocess.Popen")
+    def test_send_pipelined_commands(self, mock_popen):
+        mock_process = MagicMock()
+        mock_popen.return_value = mock_process
+        commands_sent = threading.Event()
 
-        # Test 4: Empty output
-        mock_process.stdout.readline.side_effect = [f"{session.END}\n"]
-        mock_process.stderr.readline.return_value = f"Write-Error: {session.END}\n"
-        result = session.read_output()
-        assert result == ""
+        def stdout_lines():
+            # PowerShell does not answer before the commands are sent
+            commands_sent.wait(1)
+            yield '<END:1>"first"\n'
+            yield '<END:2>"{\\"key\\": \\"value\\"}"\n'
+            yield ""
 
+        mock_process.stdout.readline.side_effect = stdout_lines()
+        mock_process.stderr.readline.side_effect = [
+            "<END:1>\n",
+            "<END:2>\n",
+            "",
+        ]
+        session = PowerShellSession()
+
+        first_command = session.send("Get-First")
+        second_command = session.send("Get-Second | ConvertTo-Json")
+        commands_sent.set()
+
+        assert session.receive(first_command) == "first"
+        assert session.receive(second_command, json_parse=True) == {"key": "value"}
+        session.close()
+
+    @patch("subprocess.Popen")
+    def test_execute_failed_command_after_successful_one(self, mock_popen):
+        mock_process = MagicMock()
+        mock_popen.return_value = mock_process
+        mock_process.stdout.readline.side_effect = [
+            '<END:1>"{\\"key\\": \\"value\\"}"\n',
+            # The second command threw a terminating error
+            "<END:2>null\n",
+            "",
+        ]
+        mock_process.stderr.readline.side_effect = [
+            "<END:1>\n",
+            "Get-Failing: terminating error\n",
+            "<END:2>\n",
+            "",
+        ]
+        session = PowerShellSession()
+
+        with patch("prowler.lib.logger.logger.error"):
+            assert session.execute("Get-First | ConvertTo-Json", json_parse=True) == {
+                "key": "value"
+            }
+            assert (
+                session.execute("Get-Failing | ConvertTo-Json", json_parse=True) == {}
+            )
+
+        # The output variable is reset before each command runs
+        writes = [call.args[0] for call in mock_process.stdin.write.call_args_list]
+        failing_command = writes.index(
+            "$prowlerOutput = . { Get-Failing | ConvertTo-Json } | Out-String\n"
+        )
+        assert writes[failing_command - 1] == "$prowlerOutput = $null\n"
         session.close()
 
     @patch("subprocess.Popen")
@@ -216,6 +307,10 @@ class TestPowerShellSession:
         result = session.json_parse_output('prefix [{"key": "value"}] suffix')
         assert result == [{"key": "value"}]
 
+        # Test only the first JSON document is decoded
+        result = session.json_parse_output('{"key": "value"} {"other": "value"}')
+        assert result == {"key": "value"}
+
         # Test non-JSON text returns empty dict
         result = session.json_parse_output("just some text")
         assert result == {}
@@ -0,0 +1,198 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from boto3 import session
+from moto import mock_aws
+
+from prowler.lib.profiler import (
+    API_CALL_SPAN,
+    CHECK_SPAN,
+    OUTPUT_SPAN,
+    Profiler,
+    _on_aws_needs_retry,
+    azure_operation_name,
+    instrument_boto3_session,
+    instrument_kubernetes_api_client,
+    profiler,
+)
+from tests.providers.aws.utils import AWS_REGION_US_EAST_1
+
+
+@pytest.fixture
+def enabled_profiler():
+    profiler.reset()
+    profiler.enable()
+    yield profiler
+    profiler.enabled = False
+    profiler.reset()
+
+
+class TestProfiler:
+    def test_disabled_profiler_does_not_record(self):
+        test_profiler = Profiler()
+
+        with test_profiler.span(CHECK_SPAN, "test_check") as attributes:
+            attributes["findings"] = 1
+
+        assert test_profiler.spans == []
+
+    def test_span(self):
+        test_profiler = Profiler()
+        test_profiler.enable()
+
+        with test_profiler.span(CHECK_SPAN, "test_check", service="ec2") as attributes:
+            attributes["findings"] = 2
+
+        assert len(test_profiler.spans) == 1
+        span = test_profiler.spans[0]
+        assert span.kind == CHECK_SPAN
+        assert span.name == "test_check"
+        assert span.attributes == {"service": "ec2", "findings": 2}
+        assert span.end_time >= span.start_time
+        assert span.duration >= 0
+
+    def test_span_records_error(self):
+        test_profiler = Profiler()
+        test_profiler.enable()
+
+        with pytest.raises(ValueError):
+            with test_profiler.span(CHECK_SPAN, "test_check"):
+                raise ValueError("check failed")
+
+        assert test_profiler.spans[0].attributes == {"error": "ValueError"}
+
+    def test_summary(self):
+        test_profiler = Profiler()
+        test_profiler.enable()
+        test_profiler.record(API_CALL_SPAN, "ec2.DescribeInstances", 0, 2e9)
+        test_profiler.record(
+            API_CALL_SPAN,
+            "ec2.DescribeInstances",
+            0,
+            1e9,
+            {"retries": 2, "throttles": 1},
+        )
+        test_profiler.record(API_CALL_SPAN, "s3.ListBuckets", 0, 1e9)
+        test_profiler.record(OUTPUT_SPAN, "csv", 0, 5e8)
+
+        summary = test_profiler.summary(top=1)
+
+        assert summary[API_CALL_SPAN] == [
+            {
+                "name": "ec2.DescribeInstances",
+                "count": 2,
+                "total": 3.0,
+                "max": 2.0,
+                "retries": 2,
+                "throttles": 1,
+            }
+        ]
+        assert summary[OUTPUT_SPAN][0]["name"] == "csv"
+        assert summary[OUTPUT_SPAN][0]["total"] == 0.5
+
+    def test_write_otlp(self, tmp_path):
+        test_profiler = Profiler()
+        test_profiler.enable()
+        test_profiler.record(
+            API_CALL_SPAN, "s3.ListBuckets", 10, 20, {"region": "us-east-1"}
+        )
+        test_profiler.record(CHECK_SPAN, "test_check", 5, 30, {"error": "KeyError"})
+
+        file_path = tmp_path / "prowler.performance.json"
+        test_profiler.write(str(file_path), {"prowler.provider": "aws"})
+
+        with open(file_path) as file_descriptor:
+            report = json.load(file_descriptor)
+        resource_spans = report["resourceSpans"][0]
+        assert {
+            "key": "prowler.provider",
+            "value": {"stringValue": "aws"},
+        } in resource_spans["resource"]["attributes"]
+        api_call, check = resource_spans["scopeSpans"][0]["spans"]
+        assert api_call["name"] == "s3.ListBuckets"
+        assert api_call["kind"] == 3
+        assert api_call["startTimeUnixNano"] == "10"
+        assert api_call["endTimeUnixNano"] == "20"
+        assert api_call["status"] == {"code": 0}
+        assert {
+            "key": "region",
+            "value": {"stringValue": "us-east-1"},
+        } in api_call["attributes"]
+        assert check["kind"] == 1
+        assert check["status"] == {"code": 2}
+        assert check["traceId"] == api_call["traceId"]
+
+
+class TestProfilerInstrumentation:
+    @mock_aws
+    def test_instrument_boto3_session(self, enabled_profiler):
+        boto3_session = session.Session(region_name=AWS_REGION_US_EAST_1)
+        instrument_boto3_session(boto3_session)
+
+        boto3_session.client("s3").list_buckets()
+
+        api_calls = [
+            span for span in enabled_profiler.spans if span.kind == API_CALL_SPAN
+        ]
+        assert len(api_calls) == 1
+        assert api_calls[0].name == "s3.ListBuckets"
+        assert api_calls[0].attributes == {
+            "provider": "aws",
+            "region": AWS_REGION_US_EAST_1,
+            "retries": 0,
+            "throttles": 0,
+        }
+
+    def test_aws_needs_retry_counts_throttles(self):
+        context = {"prowler_throttles": 0}
+        request_dict = {"context": context}
+
+        _on_aws_needs_retry(
+            request_dict=request_dict,
+            response=(MagicMock(), {"Error": {"Code": "ThrottlingException"}}),
+        )
+        _on_aws_needs_retry(
+            request_dict=request_dict,
+            response=(MagicMock(), {"Error": {"Code": "AccessDenied"}}),
+        )
+        _on_aws_needs_retry(request_dict=request_dict, response=None)
+
+        assert context["prowler_throttles"] == 1
+
+    def test_instrument_kubernetes_api_client(self, enabled_profiler):
+        api_client = MagicMock()
+        call_api = api_client.call_api
+        call_api.return_value = "response"
+        instrument_kubernetes_api_client(api_client)
+
+        response = api_client.call_api(
+            "/api/v1/namespaces/{namespace}/pods", "GET", {"namespace": "default"}
+        )
+
+        assert response == "response"
+        call_api.assert_called_once_with(
+            "/api/v1/namespaces/{namespace}/pods", "GET", {"namespace": "default"}
+        )
+        assert enabled_profiler.spans[0].name == (
+            "GET /api/v1/namespaces/{namespace}/pods"
+        )
+
+    def test_azure_operation_name(self):
+        assert (
+            azure_operation_name(
+                "GET",
+                "https://management.azure.com/subscriptions/1234/resourceGroups/rg"
+                "/providers/Microsoft.Storage/storageAccounts/account/blobServices"
+                "?api-version=2023-01-01",
+            )
+            == "GET management.azure.com/subscriptions/{}/resourceGroups/{}"
+            "/providers/Microsoft.Storage/storageAccounts/{}/blobServices"
+        )
+        assert (
+            azure_operation_name(
+                "GET",
+                "https://management.azure.com/subscriptions/1234/providers/Microsoft.Compute/virtualMachines",
+            )
+            == "GET management.azure.com/subscriptions/{}/providers/Microsoft.Compute/virtualMachines"
+        )
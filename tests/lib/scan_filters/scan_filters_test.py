@@ -1,4 +1,8 @@
-from prowler.lib.scan_filters.scan_filters import is_resource_filtered
+from prowler.lib.scan_filters.scan_filters import (
+    AuditResources,
+    is_region_filtered,
+    is_resource_filtered,
+)
 
 
 class Test_Scan_Filters:
@@ -14,3 +18,60 @@ class Test_Scan_Filters:
             "arn:aws:iam::123456789012:user/test1", audit_resources
         )
         assert is_resource_filtered("arn:aws:s3:::test_bucket", audit_resources)
+
+    def test_is_resource_filtered_audit_resources(self):
+        audit_resources = AuditResources(
+            [
+                "arn:aws:iam::123456789012:user/test_user",
+                "arn:aws:s3:::prod-*",
+            ]
+        )
+        assert is_resource_filtered(
+            "arn:aws:iam::123456789012:user/test_user", audit_resources
+        )
+        assert not is_resource_filtered(
+            "arn:aws:iam::123456789012:user/test1", audit_resources
+        )
+        assert is_resource_filtered("arn:aws:s3:::prod-bucket", audit_resources)
+        assert not is_resource_filtered("arn:aws:s3:::dev-bucket", audit_resources)
+
+    def test_audit_resources_is_a_list(self):
+        resources = [
+            "arn:aws:iam::123456789012:user/test_user",
+            "arn:aws:s3:::test_bucket",
+        ]
+        audit_resources = AuditResources(resources)
+
+        assert audit_resources == resources
+        audit_resources.append("arn:aws:s3:::new_bucket")
+        assert "arn:aws:s3:::new_bucket" in audit_resources
+
+    def test_is_region_filtered(self):
+        audit_resources = AuditResources(
+            [
+                "arn:aws:ec2:us-east-1:123456789012:instance/i-1234567890abcdef0",
+                "arn:aws:s3:::test_bucket",
+            ]
+        )
+        assert is_region_filtered(audit_resources, "ec2", "us-east-1", "instance")
+        assert is_region_filtered(audit_resources, "ec2", "us-east-1")
+        assert not is_region_filtered(
+            audit_resources, "ec2", "us-east-1", "security-group"
+        )
+        assert not is_region_filtered(audit_resources, "ec2", "eu-west-1", "instance")
+        assert not is_region_filtered(audit_resources, "rds", "us-east-1")
+        # Resources without region are in every region
+        assert is_region_filtered(audit_resources, "s3", "eu-west-1", "bucket")
+
+    def test_is_region_filtered_wildcards(self):
+        audit_resources = AuditResources(["arn:aws:ec2:*:123456789012:volume/*"])
+        assert is_region_filtered(audit_resources, "ec2", "eu-west-1", "volume")
+        assert not is_region_filtered(audit_resources, "ec2", "eu-west-1", "image")
+
+    def test_is_region_filtered_no_audit_resources(self):
+        assert is_region_filtered([], "ec2", "eu-west-1", "instance")
+        assert is_region_filtered(
+            ["arn:aws:ec2:us-east-1:123456789012:instance/i-1"], "ec2", "us-east-1"
+        )
+        # Resources that are not ARNs can be anywhere
+        assert is_region_filtered(["d-1234567890"], "ds", "eu-west-1")
@@ -145,6 +145,45 @@ class TestS3:
 
         remove(f"{CURRENT_DIRECTORY}/{csv_file}")
 
+    @mock_aws
+    def test_send_to_s3_bucket_csv_compressed(self):
+        # Create bucket
+        current_session = boto3.session.Session(region_name=AWS_REGION_US_EAST_1)
+        client = current_session.client("s3")
+        client.create_bucket(Bucket=S3_BUCKET_NAME)
+
+        s3 = S3(
+            session=current_session,
+            bucket_name=S3_BUCKET_NAME,
+            output_directory=CURRENT_DIRECTORY,
+        )
+
+        extension = ".csv"
+        csv_file = f"test_compressed{extension}"
+        csv = CSV(
+            findings=[FINDING],
+            file_path=f"{CURRENT_DIRECTORY}/{csv_file}",
+            compression="gzip",
+        )
+        csv.batch_write_data_to_file()
+
+        s3_send_result = s3.send_to_bucket(outputs={"regular": [csv]})
+
+        assert s3_send_result["failure"] == {}
+        assert len(s3_send_result["success"][extension]) == 1
+
+        uploaded_object_name = s3_send_result["success"][extension][0]
+        assert uploaded_object_name.endswith(f"{csv_file}.gz")
+
+        uploaded_object = client.get_object(
+            Bucket=S3_BUCKET_NAME,
+            Key=uploaded_object_name,
+        )
+        assert uploaded_object["ContentType"] == "text/csv"
+        assert uploaded_object["ContentEncoding"] == "gzip"
+
+        remove(f"{CURRENT_DIRECTORY}/{csv_file}.gz")
+
     @mock_aws
     def test_send_to_s3_bucket_ocsf(self):
         # Create bucket
@@ -324,6 +363,12 @@ class TestS3:
     def test_generate_subfolder_name_by_extension_json_ocsf(self):
         assert S3.generate_subfolder_name_by_extension(".ocsf.json") == "json-ocsf"
 
+    def test_generate_subfolder_name_by_extension_ndjson_ocsf(self):
+        assert S3.generate_subfolder_name_by_extension(".ocsf.ndjson") == "ndjson-ocsf"
+
+    def test_generate_subfolder_name_by_extension_parquet(self):
+        assert S3.generate_subfolder_name_by_extension(".parquet") == "parquet"
+
     @mock_aws
     def test_test_connection_S3(self):
         # Create a mock IAM user
@@ -1,6 +1,8 @@
+from typing import Optional
+
 from mock import patch
 
-from prowler.providers.aws.lib.service.service import AWSService
+from prowler.providers.aws.lib.service.service import AWSService, LazyResource
 from tests.providers.aws.utils import (
     AWS_ACCOUNT_ARN,
     AWS_ACCOUNT_NUMBER,
@@ -10,6 +12,13 @@ from tests.providers.aws.utils import (
 )
 
 
+class Resource(LazyResource):
+    name: str
+    versioning: bool = False
+    replication: bool = False
+    tags: Optional[list] = []
+
+
 def mock_generate_regional_clients(provider, service):
     regional_client = provider._session.current_session.client(
         service, region_name=AWS_REGION_US_EAST_1
@@ -61,6 +70,113 @@ class TestAWSService:
         assert service.region == AWS_REGION_US_EAST_1
         assert service.client.__class__.__name__ == "CloudFront"
 
+    def test_AWSService_lazy_collect(self):
+        provider = set_mocked_aws_provider(
+            expected_checks=["s3_bucket_object_versioning"]
+        )
+        service = AWSService("s3", provider)
+        calls = []
+
+        def _get_versioning(regional_client):
+            calls.append("versioning")
+            service.versioning[regional_client.region] = True
+
+        def _get_replication(regional_client):
+            calls.append("replication")
+            service.replication[regional_client.region] = True
+
+        service.__lazy_collect__({"versioning": {}}, _get_versioning)
+        service.__lazy_collect__({"replication": {}}, _get_replication)
+
+        # The check reads versioning, so it is collected right away
+        assert calls == ["versioning"]
+        assert service.versioning == {AWS_REGION_US_EAST_1: True}
+        # Replication is collected on first read
+        assert "replication" not in service.__dict__
+        assert service.replication == {AWS_REGION_US_EAST_1: True}
+        assert service.replication == {AWS_REGION_US_EAST_1: True}
+        assert calls == ["versioning", "replication"]
+
+    def test_AWSService_lazy_collect_no_expected_checks(self):
+        provider = set_mocked_aws_provider()
+        service = AWSService("s3", provider)
+        calls = []
+
+        def _get_replication(regional_client):
+            calls.append(regional_client.region)
+
+        service.__lazy_collect__({"replication": {}}, _get_replication)
+
+        assert service.audited_attributes is None
+        assert calls == [AWS_REGION_US_EAST_1]
+
+    def test_AWSService_lazy_pipeline_call(self):
+        provider = set_mocked_aws_provider(
+            expected_checks=["s3_bucket_object_versioning"]
+        )
+        service = AWSService("s3", provider)
+        resources = [Resource(name="bucket-1"), Resource(name="bucket-2")]
+
+        def _get_versioning(resource):
+            resource.versioning = True
+
+        def _get_tags(resource):
+            resource.tags = [{"Key": "Name", "Value": resource.name}]
+
+        def _get_replication(resource):
+            resource.replication = True
+
+        service.__lazy_pipeline_call__(
+            [
+                (_get_versioning, ("versioning",)),
+                (_get_tags, ("tags",)),
+                (_get_replication, ("replication",)),
+            ],
+            resources,
+        )
+
+        for resource in resources:
+            # The calls of the attributes read are all run in a single pass
+            assert resource.__dict__["versioning"]
+            assert resource.__dict__["tags"] == [
+                {"Key": "Name", "Value": resource.name}
+            ]
+            # The rest are deferred until first read
+            assert not resource.__dict__["replication"]
+            assert resource.replication
+
+    def test_AWSService_lazy_pipeline_call_dict(self):
+        provider = set_mocked_aws_provider(
+            expected_checks=["s3_bucket_object_versioning"]
+        )
+        service = AWSService("s3", provider)
+        resource = Resource(name="bucket-1")
+        replication_calls = []
+
+        def _get_versioning(resource):
+            resource.versioning = True
+
+        def _get_replication(resource):
+            replication_calls.append(resource.name)
+            resource.replication = True
+
+        service.__lazy_pipeline_call__(
+            [
+                (_get_versioning, ("versioning",)),
+                (_get_replication, ("replication",)),
+            ],
+            [resource],
+        )
+
+        # The deferred attributes are reported with their default values
+        assert resource.dict() == {
+            "name": "bucket-1",
+            "versioning": True,
+            "replication": False,
+            "tags": [],
+        }
+        assert replication_calls == []
+
     def test_AWSService_set_failed_check(self):
 
         AWSService.failed_checks.clear()
@@ -1,7 +1,14 @@
+import json
+from unittest.mock import patch
+
+import botocore
 from boto3 import client
 from moto import mock_aws
 
-from prowler.providers.aws.services.cloudtrail.cloudtrail_service import Cloudtrail
+from prowler.providers.aws.services.cloudtrail.cloudtrail_service import (
+    Cloudtrail,
+    Trail,
+)
 from tests.providers.aws.utils import (
     AWS_ACCOUNT_NUMBER,
     AWS_REGION_EU_SOUTH_2,
@@ -10,6 +17,9 @@ from tests.providers.aws.utils import (
     set_mocked_aws_provider,
 )
 
+# Original botocore _make_api_call function
+orig = botocore.client.BaseClient._make_api_call
+
 
 class Test_Cloudtrail_Service:
     # Test Cloudtrail Service
@@ -315,6 +325,116 @@ class Test_Cloudtrail_Service:
         cloudtrail = Cloudtrail(aws_provider)
         assert len(cloudtrail.trails) == len(aws_provider.identity.audited_regions)
 
+    @mock_aws
+    def test_get_event_identities(self):
+        lookup_events_calls = []
+
+        def mock_lookup_events(self, operation_name, kwarg):
+            if operation_name == "LookupEvents":
+                lookup_events_calls.append(kwarg)
+                user_identity = {
+                    "type": "IAMUser",
+                    "arn": f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:user/test",
+                }
+                if "NextToken" not in kwarg:
+                    return {
+                        "Events": [
+                            {
+                                "CloudTrailEvent": json.dumps(
+                                    {"userIdentity": user_identity}
+                                )
+                            },
+                            {
+                                "CloudTrailEvent": json.dumps(
+                                    {"userIdentity": {"type": "AWSService"}}
+                                )
+                            },
+                        ],
+                        "NextToken": "next-page",
+                    }
+                return {
+                    "Events": [
+                        {"CloudTrailEvent": json.dumps({"userIdentity": user_identity})}
+                    ]
+                }
+            return orig(self, operation_name, kwarg)
+
+        aws_provider = set_mocked_aws_provider([AWS_REGION_US_EAST_1])
+        cloudtrail = Cloudtrail(aws_provider)
+        trail = Trail(region=AWS_REGION_US_EAST_1)
+        with patch("botocore.client.BaseClient._make_api_call", new=mock_lookup_events):
+            event_identities = cloudtrail._get_event_identities(
+                trail=trail, event_names=["ListUsers"], minutes=60
+            )
+            # The events already looked up are shared by the next lookups
+            cloudtrail._get_event_identities(
+                trail=trail, event_names=["ListUsers"], minutes=60
+            )
+
+        assert event_identities == {
+            "ListUsers": {
+                (f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:user/test", "IAMUser"): 2
+            }
+        }
+        # Every page of the time window is looked up once
+        assert len(lookup_events_calls) == 2
+        assert lookup_events_calls[1]["NextToken"] == "next-page"
+
+    @mock_aws
+    def test_get_event_identities_max_pages(self):
+        lookup_events_calls = []
+        window_lock_free = []
+
+        def mock_lookup_events(self, operation_name, kwarg):
+            if operation_name == "LookupEvents":
+                lookup_events_calls.append(kwarg)
+                # The window lock is not held while the events are looked up
+                acquired = cloudtrail._event_windows_lock.acquire(blocking=False)
+                if acquired:
+                    cloudtrail._event_windows_lock.release()
+                window_lock_free.append(acquired)
+                user_identity = {
+                    "type": "IAMUser",
+                    "arn": f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:user/test",
+                }
+                return {
+                    "Events": [
+                        {"CloudTrailEvent": json.dumps({"userIdentity": user_identity})}
+                    ],
+                    "NextToken": f"page-{len(lookup_events_calls)}",
+                }
+            return orig(self, operation_name, kwarg)
+
+        aws_provider = set_mocked_aws_provider(
+            [AWS_REGION_US_EAST_1],
+            audit_config={"threat_detection_lookup_events_max_pages": 2},
+        )
+        cloudtrail = Cloudtrail(aws_provider)
+        trail = Trail(region=AWS_REGION_US_EAST_1)
+        with (
+            patch("botocore.client.BaseClient._make_api_call", new=mock_lookup_events),
+            patch(
+                "prowler.providers.aws.services.cloudtrail.cloudtrail_service.logger"
+            ) as mock_logger,
+        ):
+            event_identities = cloudtrail._get_event_identities(
+                trail=trail, event_names=["ListUsers"], minutes=60
+            )
+
+        assert event_identities == {
+            "ListUsers": {
+                (f"arn:aws:iam::{AWS_ACCOUNT_NUMBER}:user/test", "IAMUser"): 2
+            }
+        }
+        # The lookup stops at the configured number of pages
+        assert len(lookup_events_calls) == 2
+        assert window_lock_free == [True, True]
+        # The truncated lookup is reported with its region and event name
+        mock_logger.warning.assert_called_once()
+        warning = mock_logger.warning.call_args.args[0]
+        assert AWS_REGION_US_EAST_1 in warning
+        assert "ListUsers" in warning
+
     @mock_aws
     def test_list_tags_for_resource(self):
         tag = "test-tag"
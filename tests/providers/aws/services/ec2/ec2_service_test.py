@@ -11,6 +11,7 @@ from freezegun import freeze_time
 from moto import mock_aws
 
 from prowler.config.config import encoding_format_utf_8
+from prowler.lib.scan_filters.scan_filters import AuditResources
 from prowler.providers.aws.services.ec2.ec2_service import EC2
 from tests.providers.aws.utils import (
     AWS_ACCOUNT_NUMBER,
@@ -152,6 +153,33 @@ class Test_EC2_Service:
         assert ec2.instances[0].network_interfaces is not None
         assert ec2.instances[0].virtualization_type == "hvm"
 
+    # Test EC2 Describe Instances filtered by --resource-arn
+    @mock_aws
+    def test_describe_instances_audit_resources(self):
+        # Generate EC2 Client
+        ec2_resource = resource("ec2", region_name=AWS_REGION_US_EAST_1)
+        ec2_client = client("ec2", region_name=AWS_REGION_US_EAST_1)
+        # Get AMI image
+        image_response = ec2_client.describe_images()
+        image_id = image_response["Images"][0]["ImageId"]
+        # Create EC2 Instances running
+        instances = ec2_resource.create_instances(
+            MinCount=2,
+            MaxCount=2,
+            ImageId=image_id,
+        )
+        instance_arn = f"arn:aws:ec2:{AWS_REGION_US_EAST_1}:{AWS_ACCOUNT_NUMBER}:instance/{instances[0].id}"
+        # EC2 client for this test class
+        aws_provider = set_mocked_aws_provider(
+            [AWS_REGION_EU_WEST_1, AWS_REGION_US_EAST_1]
+        )
+        aws_provider._audit_resources = AuditResources([instance_arn])
+        ec2 = EC2(aws_provider)
+        assert len(ec2.instances) == 1
+        assert ec2.instances[0].arn == instance_arn
+        # No security groups are targeted, so they are not listed
+        assert ec2.security_groups == {}
+
     # Test EC2 Describe Security Groups
     @mock_aws
     def test_describe_security_groups(self):
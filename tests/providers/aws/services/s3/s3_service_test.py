@@ -9,6 +9,7 @@ from moto import mock_aws
 from prowler.providers.aws.services.s3.s3_service import S3, S3Control
 from tests.providers.aws.utils import (
     AWS_ACCOUNT_NUMBER,
+    AWS_REGION_EU_WEST_1,
     AWS_REGION_US_EAST_1,
     set_mocked_aws_provider,
 )
@@ -95,6 +96,35 @@ class Test_S3_Service:
         assert s3.buckets[bucket_arn].region == AWS_REGION_US_EAST_1
         assert not s3.buckets[bucket_arn].object_lock
 
+    # Test S3 List Buckets with the region of every bucket
+    @mock_aws
+    def test_list_buckets_with_bucket_region(self):
+        def mock_list_buckets(self, operation_name, kwarg):
+            if operation_name == "ListBuckets":
+                assert kwarg["MaxBuckets"] == 10000
+                return {
+                    "Buckets": [
+                        {"Name": "bucket-us", "BucketRegion": AWS_REGION_US_EAST_1},
+                        {"Name": "bucket-eu", "BucketRegion": AWS_REGION_EU_WEST_1},
+                    ],
+                    "Owner": {"ID": "canonical-id"},
+                }
+            if operation_name == "GetBucketLocation":
+                raise AssertionError("The bucket location must not be requested")
+            return orig(self, operation_name, kwarg)
+
+        aws_provider = set_mocked_aws_provider(
+            [AWS_REGION_US_EAST_1], expected_checks=["s3_bucket_object_versioning"]
+        )
+        with patch("botocore.client.BaseClient._make_api_call", new=mock_list_buckets):
+            s3 = S3(aws_provider)
+
+        assert s3.audited_canonical_id == "canonical-id"
+        assert s3.regions_with_buckets == [AWS_REGION_US_EAST_1, AWS_REGION_EU_WEST_1]
+        # Only the buckets of the audited regions are kept
+        assert list(s3.buckets) == ["arn:aws:s3:::bucket-us"]
+        assert s3.buckets["arn:aws:s3:::bucket-us"].region == AWS_REGION_US_EAST_1
+
     # Test S3 Get Bucket Versioning
     @mock_aws
     def test_get_bucket_versioning(self):
@@ -117,6 +147,51 @@ class Test_S3_Service:
         assert s3.buckets[bucket_arn].region == AWS_REGION_US_EAST_1
         assert s3.buckets[bucket_arn].versioning is True
 
+    # Test S3 collecting only the attributes read by the checks to execute
+    @mock_aws
+    def test_get_bucket_attributes_of_expected_checks(self):
+        s3_client = client("s3")
+        bucket_name = "test-bucket"
+        bucket_arn = f"arn:aws:s3:::{bucket_name}"
+        s3_client.create_bucket(Bucket=bucket_name)
+        s3_client.put_bucket_versioning(
+            Bucket=bucket_name,
+            VersioningConfiguration={"MFADelete": "Disabled", "Status": "Enabled"},
+        )
+        s3_client.put_bucket_policy(
+            Bucket=bucket_name,
+            Policy=json.dumps(
+                {
+                    "Version": "2012-10-17",
+                    "Statement": [
+                        {
+                            "Effect": "Deny",
+                            "Principal": "*",
+                            "Action": "s3:*",
+                            "Resource": f"{bucket_arn}/*",
+                        }
+                    ],
+                }
+            ),
+        )
+        aws_provider = set_mocked_aws_provider(
+            [AWS_REGION_US_EAST_1], expected_checks=["s3_bucket_object_versioning"]
+        )
+        with patch.object(
+            S3, "_get_bucket_policy", autospec=True, side_effect=S3._get_bucket_policy
+        ) as mock_get_bucket_policy:
+            s3 = S3(aws_provider)
+            bucket = s3.buckets[bucket_arn]
+            assert bucket.versioning is True
+            mock_get_bucket_policy.assert_not_called()
+            # Attributes not collected keep their default value in the resource metadata
+            assert bucket.dict()["policy"] is None
+            mock_get_bucket_policy.assert_not_called()
+            # And are collected on first read
+            assert bucket.policy["Statement"][0]["Effect"] == "Deny"
+            mock_get_bucket_policy.assert_called_once()
+            assert bucket.dict()["policy"]["Statement"][0]["Effect"] == "Deny"
+
     # Test S3 Get Bucket ACL
     @mock_aws
     def test_get_bucket_acl(self):
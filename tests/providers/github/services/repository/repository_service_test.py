@@ -374,3 +374,131 @@ class Test_Repository_ErrorHandling:
                 # Should log rate limit error
                 mock_logger.error.assert_called()
                 assert "Rate limit exceeded" in str(mock_logger.error.call_args)
+
+
+class Test_Repository_Concurrent_Collection:
+    def setup_method(self):
+        self.mock_repo1 = MagicMock()
+        self.mock_repo1.id = 1
+        self.mock_repo1.name = "repo1"
+        self.mock_repo1.owner.login = "owner1"
+        self.mock_repo1.full_name = "owner1/repo1"
+        self.mock_repo1.default_branch = "main"
+        self.mock_repo1.private = False
+        self.mock_repo1.archived = False
+        self.mock_repo1.pushed_at = datetime.now(timezone.utc)
+        self.mock_repo1.delete_branch_on_merge = True
+        self.mock_repo1.security_and_analysis = None
+        self.mock_repo1.get_branch.side_effect = Exception("404 Not Found")
+        self.mock_repo1.get_dependabot_alerts.side_effect = Exception("404 Not Found")
+
+    def test_get_repository_files_graphql(self):
+        repository_service = Repository(set_mocked_github_provider())
+        mock_client = MagicMock()
+        mock_client.requester.graphql_query.return_value = (
+            {},
+            {
+                "data": {
+                    "repo_0": {
+                        "securitymd": {"id": "file-id"},
+                        "codeowners_github": None,
+                        "codeowners_root": {"id": "file-id"},
+                        "codeowners_docs": None,
+                    }
+                }
+            },
+        )
+
+        files = repository_service._get_repository_files_graphql(
+            mock_client, [self.mock_repo1]
+        )
+
+        assert files == {
+            "owner1/repo1": {
+                "SECURITY.md": True,
+                ".github/CODEOWNERS": False,
+                "CODEOWNERS": True,
+                "docs/CODEOWNERS": False,
+            }
+        }
+        mock_client.requester.graphql_query.assert_called_once()
+        query = mock_client.requester.graphql_query.call_args[0][0]
+        assert 'repo_0: repository(owner: "owner1", name: "repo1")' in query
+
+    def test_get_repository_files_graphql_error(self):
+        repository_service = Repository(set_mocked_github_provider())
+        mock_client = MagicMock()
+        mock_client.requester.graphql_query.side_effect = GithubException(
+            400, "Bad Request", None
+        )
+
+        assert (
+            repository_service._get_repository_files_graphql(
+                mock_client, [self.mock_repo1]
+            )
+            == {}
+        )
+
+    def test_process_repositories_uses_graphql_files(self):
+        repository_service = Repository(set_mocked_github_provider())
+        mock_client = MagicMock()
+        mock_client.rate_limiting = (5000, 5000)
+        repos = {}
+
+        with patch.object(
+            repository_service,
+            "_get_repository_files_graphql",
+            return_value={
+                "owner1/repo1": {
+                    "SECURITY.md": True,
+                    ".github/CODEOWNERS": False,
+                    "CODEOWNERS": False,
+                    "docs/CODEOWNERS": False,
+                }
+            },
+        ):
+            repository_service._process_repositories(
+                mock_client, [self.mock_repo1], repos
+            )
+
+        assert repos[1].securitymd is True
+        assert repos[1].codeowners_exists is False
+        self.mock_repo1.get_contents.assert_not_called()
+
+    def test_process_repositories_falls_back_to_rest(self):
+        repository_service = Repository(set_mocked_github_provider())
+        mock_client = MagicMock()
+        mock_client.rate_limiting = (5000, 5000)
+        self.mock_repo1.get_contents.side_effect = Exception("404 Not Found")
+        repos = {}
+
+        with patch.object(
+            repository_service, "_get_repository_files_graphql", return_value={}
+        ):
+            repository_service._process_repositories(
+                mock_client, [self.mock_repo1], repos
+            )
+
+        assert repos[1].securitymd is False
+        assert repos[1].codeowners_exists is False
+        assert self.mock_repo1.get_contents.call_count == 4
+
+    def test_wait_for_rate_limit_sleeps_until_reset(self):
+        repository_service = Repository(set_mocked_github_provider())
+        mock_client = MagicMock()
+        mock_client.rate_limiting = (10, 5000)
+        mock_client.rate_limiting_resettime = 1000
+
+        with patch("prowler.providers.github.lib.service.service.time") as mock_time:
+            mock_time.time.return_value = 970
+            repository_service._wait_for_rate_limit(mock_client)
+            mock_time.sleep.assert_called_once_with(31)
+
+    def test_wait_for_rate_limit_enough_quota(self):
+        repository_service = Repository(set_mocked_github_provider())
+        mock_client = MagicMock()
+        mock_client.rate_limiting = (4000, 5000)
+
+        with patch("prowler.providers.github.lib.service.service.time") as mock_time:
+            repository_service._wait_for_rate_limit(mock_client)
+            mock_time.sleep.assert_not_called()
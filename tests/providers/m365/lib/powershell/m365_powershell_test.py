@@ -1,4 +1,6 @@
 import base64
+import queue
+import threading
 from unittest.mock import MagicMock, call, patch
 
 import pytest
@@ -8,7 +10,10 @@ from prowler.providers.m365.exceptions.exceptions import (
     M365CertificateCreationError,
     M365GraphConnectionError,
 )
-from prowler.providers.m365.lib.powershell.m365_powershell import M365PowerShell
+from prowler.providers.m365.lib.powershell.m365_powershell import (
+    M365PowerShell,
+    M365PowerShellPool,
+)
 from prowler.providers.m365.models import M365Credentials, M365IdentityInfo
 
 
@@ -196,8 +201,8 @@ class Testm365PowerShell:
         session.close()
 
     @patch("subprocess.Popen")
-    def test_read_output(self, mock_popen):
-        """Test the read_output method with various scenarios"""
+    def test_receive(self, mock_popen):
+        """Test the receive method with output and errors"""
         mock_process = MagicMock()
         mock_popen.return_value = mock_process
         credentials = M365Credentials(
@@ -213,37 +218,32 @@ class Testm365PowerShell:
             tenant_domains=["example.com"],
             location="test_location",
         )
-        session = M365PowerShell(credentials, identity)
+        with patch.object(M365PowerShell, "init_credential"):
+            session = M365PowerShell(credentials, identity)
 
-        # Test 1: Normal stdout output
-        mock_process.stdout.readline.side_effect = [
-            "test@example.com\n",
-            f"{session.END}\n",
-        ]
-        mock_process.stderr.readline.return_value = f"Write-Error: {session.END}\n"
-        with patch.object(session, "remove_ansi", side_effect=lambda x: x):
-            result = session.read_output()
-            assert result == "test@example.com"
-
-        # Test 2: Error in stderr
-        mock_process.stdout.readline.side_effect = ["\n", f"{session.END}\n"]
-        mock_process.stderr.readline.side_effect = [
-            "Write-Error: Authentication failed\n",
-            f"Write-Error: {session.END}\n",
-        ]
-        with patch.object(session, "remove_ansi", side_effect=lambda x: x):
-            with patch("prowler.lib.logger.logger.error") as mock_error:
-                result = session.read_output()
-                assert result == ""
-                mock_error.assert_called_once_with(
-                    "PowerShell error output: Write-Error: Authentication failed"
-                )
-
-        # Test 3: Timeout in stdout
-        mock_process.stdout.readline.side_effect = ["test output\n"]  # No END marker
-        mock_process.stderr.readline.return_value = f"Write-Error: {session.END}\n"
-        result = session.read_output(timeout=0.1, default="timeout")
-        assert result == "timeout"
+        commands_sent = threading.Event()
+
+        def stream_lines(lines):
+            # PowerShell does not answer before the commands are sent
+            commands_sent.wait(1)
+            yield from lines
+
+        mock_process.stdout.readline.side_effect = stream_lines(
+            ['<END:1>"test@example.com\\n"\n', '<END:2>""\n', ""]
+        )
+        mock_process.stderr.readline.side_effect = stream_lines(
+            ["<END:1>\n", "Authentication failed\n", "<END:2>\n", ""]
+        )
+        first_command = session.send("Write-Output $user")
+        second_command = session.send("Connect-Service")
+        commands_sent.set()
+
+        assert session.receive(first_command) == "test@example.com"
+        with patch("prowler.lib.logger.logger.error") as mock_error:
+            assert session.receive(second_command, default="failed") == "failed"
+            mock_error.assert_called_once_with(
+                "PowerShell error output: Authentication failed"
+            )
 
         session.close()
 
@@ -1139,6 +1139,60 @@ class Testm365PowerShell:
 
         session.close()
 
+    @patch("subprocess.Popen")
+    def test_connect_exchange_online_only_once_per_session(self, mock_popen):
+        """Test connect_exchange_online reuses the connection of the session"""
+        mock_popen.return_value = MagicMock()
+
+        session = M365PowerShell(M365Credentials(), M365IdentityInfo())
+        session.execute = MagicMock(return_value="")
+        session.test_exchange_connection = MagicMock(return_value=True)
+
+        assert session.connect_exchange_online() is True
+        assert session.connect_exchange_online() is True
+
+        session.test_exchange_connection.assert_called_once()
+        assert session.connected_workloads == {"exchange"}
+
+        session.close()
+
+    @patch("subprocess.Popen")
+    def test_connect_exchange_online_retries_failed_connection(self, mock_popen):
+        """Test connect_exchange_online does not remember a failed connection"""
+        mock_popen.return_value = MagicMock()
+
+        session = M365PowerShell(M365Credentials(), M365IdentityInfo())
+        session.execute = MagicMock(return_value="")
+        session.test_exchange_connection = MagicMock(side_effect=[False, True])
+
+        assert session.connect_exchange_online() is False
+        assert session.connected_workloads == set()
+        assert session.connect_exchange_online() is True
+        assert session.connect_exchange_online() is True
+
+        assert session.test_exchange_connection.call_count == 2
+        assert session.connected_workloads == {"exchange"}
+
+        session.close()
+
+    @patch("subprocess.Popen")
+    def test_connect_microsoft_teams_retries_failed_connection(self, mock_popen):
+        """Test connect_microsoft_teams does not remember a failed connection"""
+        mock_popen.return_value = MagicMock()
+
+        session = M365PowerShell(M365Credentials(), M365IdentityInfo())
+        session.execute = MagicMock(return_value="")
+        session.test_teams_connection = MagicMock(side_effect=[False, True])
+
+        assert session.connect_microsoft_teams() is False
+        assert session.connect_microsoft_teams() is True
+        assert session.connect_microsoft_teams() is True
+
+        assert session.test_teams_connection.call_count == 2
+        assert session.connected_workloads == {"teams"}
+
+        session.close()
+
     @patch("subprocess.Popen")
     def test_clean_certificate_content_basic(self, mock_popen):
         """Test clean_certificate_content method with basic certificate content"""
@@ -1393,3 +1447,143 @@ class Testm365PowerShell:
         session.test_exchange_certificate_connection.assert_called_once()
 
         session.close()
+
+
+class TestM365PowerShellPool:
+    @patch.object(M365PowerShell, "init_credential")
+    @patch("subprocess.Popen")
+    def test_acquire_reuses_released_session(self, mock_popen, _):
+        mock_popen.return_value = MagicMock()
+        pool = M365PowerShellPool(M365Credentials(), M365IdentityInfo())
+
+        session = pool.acquire()
+        pool.release(session)
+
+        assert pool.acquire() is session
+        mock_popen.assert_called_once()
+
+        pool.close()
+
+    @patch.object(M365PowerShell, "init_credential")
+    @patch("subprocess.Popen")
+    def test_acquire_starts_sessions_up_to_max(self, mock_popen, _):
+        mock_popen.side_effect = lambda *args, **kwargs: MagicMock()
+        pool = M365PowerShellPool(M365Credentials(), M365IdentityInfo(), max_sessions=2)
+
+        first_session = pool.acquire()
+        second_session = pool.acquire()
+
+        assert first_session is not second_session
+        assert mock_popen.call_count == 2
+        with pytest.raises(queue.Empty):
+            pool.acquire(timeout=0.01)
+
+        pool.release(second_session)
+        with pool.session() as session:
+            assert session is second_session
+        assert mock_popen.call_count == 2
+
+        pool.close()
+
+    @patch.object(M365PowerShell, "init_credential")
+    @patch("subprocess.Popen")
+    def test_release_discards_closed_session(self, mock_popen, _):
+        mock_popen.side_effect = lambda *args, **kwargs: MagicMock()
+        pool = M365PowerShellPool(M365Credentials(), M365IdentityInfo(), max_sessions=1)
+
+        session = pool.acquire()
+        session.close()
+        pool.release(session)
+
+        assert pool.acquire() is not session
+        assert mock_popen.call_count == 2
+
+        pool.close()
+
+    @patch.object(M365PowerShell, "test_exchange_connection", return_value=True)
+    @patch.object(M365PowerShell, "execute", return_value="")
+    @patch.object(M365PowerShell, "init_credential")
+    @patch("subprocess.Popen")
+    def test_sessions_connect_to_pool_workloads(
+        self, mock_popen, _, __, mock_test_exchange_connection
+    ):
+        mock_popen.side_effect = lambda *args, **kwargs: MagicMock()
+        pool = M365PowerShellPool(M365Credentials(), M365IdentityInfo(), max_sessions=2)
+
+        assert pool.connect_exchange_online() is True
+        assert pool.connect_exchange_online() is True
+        assert pool.connected_workloads == {"exchange"}
+        mock_test_exchange_connection.assert_called_once()
+
+        # A session started after the pool connected also connects, only once
+        with pool.session() as first_session, pool.session() as second_session:
+            assert first_session.connected_workloads == {"exchange"}
+            assert second_session.connected_workloads == {"exchange"}
+        with pool.session(), pool.session():
+            pass
+        assert mock_test_exchange_connection.call_count == 2
+
+        pool.close()
+
+    @patch.object(M365PowerShell, "test_teams_connection", side_effect=[False, True])
+    @patch.object(M365PowerShell, "execute", return_value="")
+    @patch.object(M365PowerShell, "init_credential")
+    @patch("subprocess.Popen")
+    def test_connect_retries_failed_connection(self, mock_popen, _, __, ___):
+        mock_popen.return_value = MagicMock()
+        pool = M365PowerShellPool(M365Credentials(), M365IdentityInfo())
+
+        assert pool.connect_microsoft_teams() is False
+        assert pool.connected_workloads == set()
+        assert pool.connect_microsoft_teams() is True
+        assert pool.connected_workloads == {"teams"}
+
+        pool.close()
+
+    @patch.object(M365PowerShell, "init_credential")
+    @patch("subprocess.Popen")
+    def test_cmdlets_run_concurrently(self, mock_popen, _):
+        mock_popen.side_effect = lambda *args, **kwargs: MagicMock()
+        pool = M365PowerShellPool(M365Credentials(), M365IdentityInfo(), max_sessions=2)
+        barrier = threading.Barrier(2, timeout=5)
+        sessions = []
+
+        def get_transport_config(session):
+            sessions.append(session)
+            # Both cmdlets must be running at the same time to pass the barrier
+            barrier.wait()
+            return {"SmtpClientAuthenticationDisabled": True}
+
+        with patch.object(
+            M365PowerShell, "get_transport_config", autospec=True
+        ) as mock_get_transport_config:
+            mock_get_transport_config.side_effect = get_transport_config
+            threads = [
+                threading.Thread(target=pool.get_transport_config) for _ in range(2)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert mock_get_transport_config.call_count == 2
+        assert sessions[0] is not sessions[1]
+        assert mock_popen.call_count == 2
+        with pytest.raises(AttributeError):
+            pool._sanitize
+
+        pool.close()
+
+    @patch.object(M365PowerShell, "init_credential")
+    @patch("subprocess.Popen")
+    def test_close(self, mock_popen, _):
+        mock_process = MagicMock()
+        mock_popen.return_value = mock_process
+        pool = M365PowerShellPool(M365Credentials(), M365IdentityInfo())
+
+        session = pool.acquire()
+        pool.release(session)
+        pool.close()
+
+        mock_process.terminate.assert_called_once()
+        assert session.process is None
@@ -409,6 +409,25 @@ class TestM365Provider:
             assert result.client_id == credentials_dict["client_id"]
             assert result.client_secret == credentials_dict["client_secret"]
 
+    def test_powershell_shared_by_services(self):
+        provider = M365Provider.__new__(M365Provider)
+        provider._credentials = M365Credentials(
+            client_id=CLIENT_ID, client_secret=CLIENT_SECRET, tenant_id=TENANT_ID
+        )
+        provider._identity = M365IdentityInfo(tenant_id=TENANT_ID)
+        provider._powershell = None
+
+        with (
+            patch(
+                "prowler.providers.m365.m365_provider.M365PowerShellPool"
+            ) as mock_pool,
+            patch("prowler.providers.m365.m365_provider.atexit") as mock_atexit,
+        ):
+            pool = provider.powershell
+            assert provider.powershell is pool
+            mock_pool.assert_called_once_with(provider._credentials, provider._identity)
+            mock_atexit.register.assert_called_once_with(pool.close)
+
     def test_validate_static_credentials_invalid_tenant_id(self):
         with pytest.raises(M365NotValidTenantIdError) as exception:
             M365Provider.validate_static_credentials(
@@ -14,7 +14,7 @@ class Test_admincenter_settings_password_never_expire:
                 "prowler.providers.common.provider.Provider.get_global_provider",
                 return_value=set_mocked_m365_provider(),
             ),
-            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShell"),
+            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShellPool"),
             mock.patch(
                 "prowler.providers.m365.lib.powershell.m365_powershell.M365PowerShell.connect_exchange_online"
             ),
@@ -43,7 +43,7 @@ class Test_admincenter_settings_password_never_expire:
                 "prowler.providers.common.provider.Provider.get_global_provider",
                 return_value=set_mocked_m365_provider(),
             ),
-            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShell"),
+            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShellPool"),
             mock.patch(
                 "prowler.providers.m365.lib.powershell.m365_powershell.M365PowerShell.connect_exchange_online"
             ),
@@ -86,7 +86,7 @@ class Test_admincenter_settings_password_never_expire:
                 "prowler.providers.common.provider.Provider.get_global_provider",
                 return_value=set_mocked_m365_provider(),
             ),
-            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShell"),
+            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShellPool"),
             mock.patch(
                 "prowler.providers.m365.lib.powershell.m365_powershell.M365PowerShell.connect_exchange_online"
             ),
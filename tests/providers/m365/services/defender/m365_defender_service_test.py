@@ -221,14 +221,12 @@ class Test_Defender_Service:
                 "prowler.providers.m365.lib.powershell.m365_powershell.M365PowerShell.connect_exchange_online"
             ),
         ):
-            defender_client = Defender(
-                set_mocked_m365_provider(
-                    identity=M365IdentityInfo(tenant_domain=DOMAIN)
-                )
+            provider = set_mocked_m365_provider(
+                identity=M365IdentityInfo(tenant_domain=DOMAIN)
             )
+            defender_client = Defender(provider)
             assert defender_client.client.__class__.__name__ == "GraphServiceClient"
-            assert defender_client.powershell.__class__.__name__ == "M365PowerShell"
-            defender_client.powershell.close()
+            assert defender_client.powershell is provider.powershell
 
     @patch(
         "prowler.providers.m365.services.defender.defender_service.Defender._get_malware_filter_policy",
@@ -156,7 +156,7 @@ async def mock_entra_get_organization(_):
 
 class Test_Entra_Service:
     def test_get_client(self):
-        with patch("prowler.providers.m365.lib.service.service.M365PowerShell"):
+        with patch("prowler.providers.m365.lib.service.service.M365PowerShellPool"):
             admincenter_client = Entra(
                 set_mocked_m365_provider(
                     identity=M365IdentityInfo(tenant_domain=DOMAIN)
@@ -169,7 +169,7 @@ class Test_Entra_Service:
         new=mock_entra_get_authorization_policy,
     )
     def test_get_authorization_policy(self):
-        with patch("prowler.providers.m365.lib.service.service.M365PowerShell"):
+        with patch("prowler.providers.m365.lib.service.service.M365PowerShellPool"):
             entra_client = Entra(set_mocked_m365_provider())
         assert entra_client.authorization_policy.id == "id-1"
         assert entra_client.authorization_policy.name == "Name 1"
@@ -198,7 +198,7 @@ class Test_Entra_Service:
         new=mock_entra_get_conditional_access_policies,
     )
     def test_get_conditional_access_policies(self):
-        with patch("prowler.providers.m365.lib.service.service.M365PowerShell"):
+        with patch("prowler.providers.m365.lib.service.service.M365PowerShellPool"):
             entra_client = Entra(set_mocked_m365_provider())
         assert entra_client.conditional_access_policies == {
             "id-1": ConditionalAccessPolicy(
@@ -248,7 +248,7 @@ class Test_Entra_Service:
         new=mock_entra_get_groups,
     )
     def test_get_groups(self):
-        with patch("prowler.providers.m365.lib.service.service.M365PowerShell"):
+        with patch("prowler.providers.m365.lib.service.service.M365PowerShellPool"):
             entra_client = Entra(set_mocked_m365_provider())
         assert len(entra_client.groups) == 2
         assert entra_client.groups[0]["id"] == "id-1"
@@ -265,7 +265,7 @@ class Test_Entra_Service:
         new=mock_entra_get_admin_consent_policy,
     )
     def test_get_admin_consent_policy(self):
-        with patch("prowler.providers.m365.lib.service.service.M365PowerShell"):
+        with patch("prowler.providers.m365.lib.service.service.M365PowerShellPool"):
             entra_client = Entra(set_mocked_m365_provider())
         assert entra_client.admin_consent_policy.admin_consent_enabled
         assert entra_client.admin_consent_policy.notify_reviewers
@@ -277,7 +277,7 @@ class Test_Entra_Service:
         new=mock_entra_get_organization,
     )
     def test_get_organization(self):
-        with patch("prowler.providers.m365.lib.service.service.M365PowerShell"):
+        with patch("prowler.providers.m365.lib.service.service.M365PowerShellPool"):
             entra_client = Entra(set_mocked_m365_provider())
         assert len(entra_client.organizations) == 1
         assert entra_client.organizations[0].id == "org1"
@@ -289,7 +289,7 @@ class Test_Entra_Service:
         new=mock_entra_get_users,
     )
     def test_get_users(self):
-        with patch("prowler.providers.m365.lib.service.service.M365PowerShell"):
+        with patch("prowler.providers.m365.lib.service.service.M365PowerShellPool"):
             entra_client = Entra(set_mocked_m365_provider())
         assert len(entra_client.users) == 3
         assert entra_client.users["user-1"].id == "user-1"
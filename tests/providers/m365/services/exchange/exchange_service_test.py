@@ -158,14 +158,12 @@ class Test_Exchange_Service:
                 "prowler.providers.m365.lib.powershell.m365_powershell.M365PowerShell.connect_exchange_online"
             ),
         ):
-            exchange_client = Exchange(
-                set_mocked_m365_provider(
-                    identity=M365IdentityInfo(tenant_domain=DOMAIN)
-                )
+            provider = set_mocked_m365_provider(
+                identity=M365IdentityInfo(tenant_domain=DOMAIN)
             )
+            exchange_client = Exchange(provider)
             assert exchange_client.client.__class__.__name__ == "GraphServiceClient"
-            assert exchange_client.powershell.__class__.__name__ == "M365PowerShell"
-            exchange_client.powershell.close()
+            assert exchange_client.powershell is provider.powershell
 
     @patch(
         "prowler.providers.m365.services.exchange.exchange_service.Exchange._get_organization_config",
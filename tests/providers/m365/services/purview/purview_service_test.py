@@ -20,13 +20,12 @@ class Test_Purview_Service:
                 "prowler.providers.m365.lib.powershell.m365_powershell.M365PowerShell.connect_exchange_online"
             ),
         ):
-            purview_client = Purview(
-                set_mocked_m365_provider(
-                    identity=M365IdentityInfo(tenant_domain=DOMAIN)
-                )
+            provider = set_mocked_m365_provider(
+                identity=M365IdentityInfo(tenant_domain=DOMAIN)
             )
+            purview_client = Purview(provider)
             assert purview_client.client.__class__.__name__ == "GraphServiceClient"
-            assert purview_client.powershell.__class__.__name__ == "M365PowerShell"
+            assert purview_client.powershell is provider.powershell
 
     @patch(
         "prowler.providers.m365.services.purview.purview_service.Purview._get_audit_log_config",
@@ -20,7 +20,7 @@ class Test_sharepoint_external_sharing_managed:
                 "prowler.providers.common.provider.Provider.get_global_provider",
                 return_value=set_mocked_m365_provider(),
             ),
-            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShell"),
+            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShellPool"),
             mock.patch(
                 "prowler.providers.m365.services.sharepoint.sharepoint_external_sharing_managed.sharepoint_external_sharing_managed.sharepoint_client",
                 new=sharepoint_client,
@@ -67,7 +67,7 @@ class Test_sharepoint_external_sharing_managed:
                 "prowler.providers.common.provider.Provider.get_global_provider",
                 return_value=set_mocked_m365_provider(),
             ),
-            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShell"),
+            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShellPool"),
             mock.patch(
                 "prowler.providers.m365.services.sharepoint.sharepoint_external_sharing_managed.sharepoint_external_sharing_managed.sharepoint_client",
                 new=sharepoint_client,
@@ -114,7 +114,7 @@ class Test_sharepoint_external_sharing_managed:
                 "prowler.providers.common.provider.Provider.get_global_provider",
                 return_value=set_mocked_m365_provider(),
             ),
-            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShell"),
+            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShellPool"),
             mock.patch(
                 "prowler.providers.m365.services.sharepoint.sharepoint_external_sharing_managed.sharepoint_external_sharing_managed.sharepoint_client",
                 new=sharepoint_client,
@@ -161,7 +161,7 @@ class Test_sharepoint_external_sharing_managed:
                 "prowler.providers.common.provider.Provider.get_global_provider",
                 return_value=set_mocked_m365_provider(),
             ),
-            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShell"),
+            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShellPool"),
             mock.patch(
                 "prowler.providers.m365.services.sharepoint.sharepoint_external_sharing_managed.sharepoint_external_sharing_managed.sharepoint_client",
                 new=sharepoint_client,
@@ -256,7 +256,7 @@ class Test_sharepoint_external_sharing_managed:
                 "prowler.providers.common.provider.Provider.get_global_provider",
                 return_value=set_mocked_m365_provider(),
             ),
-            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShell"),
+            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShellPool"),
             mock.patch(
                 "prowler.providers.m365.services.sharepoint.sharepoint_external_sharing_managed.sharepoint_external_sharing_managed.sharepoint_client",
                 new=sharepoint_client,
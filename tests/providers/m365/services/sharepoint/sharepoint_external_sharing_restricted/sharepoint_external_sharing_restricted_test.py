@@ -20,7 +20,7 @@ class Test_sharepoint_external_sharing_restricted:
                 "prowler.providers.common.provider.Provider.get_global_provider",
                 return_value=set_mocked_m365_provider(),
             ),
-            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShell"),
+            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShellPool"),
             mock.patch(
                 "prowler.providers.m365.services.sharepoint.sharepoint_external_sharing_restricted.sharepoint_external_sharing_restricted.sharepoint_client",
                 new=sharepoint_client,
@@ -65,7 +65,7 @@ class Test_sharepoint_external_sharing_restricted:
                 "prowler.providers.common.provider.Provider.get_global_provider",
                 return_value=set_mocked_m365_provider(),
             ),
-            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShell"),
+            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShellPool"),
             mock.patch(
                 "prowler.providers.m365.services.sharepoint.sharepoint_external_sharing_restricted.sharepoint_external_sharing_restricted.sharepoint_client",
                 new=sharepoint_client,
@@ -112,7 +112,7 @@ class Test_sharepoint_external_sharing_restricted:
                 "prowler.providers.common.provider.Provider.get_global_provider",
                 return_value=set_mocked_m365_provider(),
             ),
-            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShell"),
+            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShellPool"),
             mock.patch(
                 "prowler.providers.m365.services.sharepoint.sharepoint_external_sharing_restricted.sharepoint_external_sharing_restricted.sharepoint_client",
                 new=sharepoint_client,
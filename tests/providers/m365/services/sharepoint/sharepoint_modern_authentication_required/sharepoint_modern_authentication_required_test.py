@@ -17,7 +17,7 @@ class Test_sharepoint_modern_authentication_required:
                 "prowler.providers.common.provider.Provider.get_global_provider",
                 return_value=set_mocked_m365_provider(),
             ),
-            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShell"),
+            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShellPool"),
             mock.patch(
                 "prowler.providers.m365.services.sharepoint.sharepoint_modern_authentication_required.sharepoint_modern_authentication_required.sharepoint_client",
                 new=sharepoint_client,
@@ -65,7 +65,7 @@ class Test_sharepoint_modern_authentication_required:
                 "prowler.providers.common.provider.Provider.get_global_provider",
                 return_value=set_mocked_m365_provider(),
             ),
-            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShell"),
+            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShellPool"),
             mock.patch(
                 "prowler.providers.m365.services.sharepoint.sharepoint_modern_authentication_required.sharepoint_modern_authentication_required.sharepoint_client",
                 new=sharepoint_client,
@@ -115,7 +115,7 @@ class Test_sharepoint_modern_authentication_required:
                 "prowler.providers.common.provider.Provider.get_global_provider",
                 return_value=set_mocked_m365_provider(),
             ),
-            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShell"),
+            mock.patch("prowler.providers.m365.lib.service.service.M365PowerShellPool"),
             mock.patch(
                 "prowler.providers.m365.services.sharepoint.sharepoint_modern_authentication_required.sharepoint_modern_authentication_required.sharepoint_client",
                 new=sharepoint_client,
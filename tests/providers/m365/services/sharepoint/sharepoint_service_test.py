@@ -29,7 +29,7 @@ async def mock_sharepoint_get_settings(_):
 )
 class Test_SharePoint_Service:
     def test_get_client(self):
-        with patch("prowler.providers.m365.lib.service.service.M365PowerShell"):
+        with patch("prowler.providers.m365.lib.service.service.M365PowerShellPool"):
             sharepoint_client = SharePoint(
                 set_mocked_m365_provider(
                     identity=M365IdentityInfo(tenant_domain=DOMAIN)
@@ -38,7 +38,7 @@ class Test_SharePoint_Service:
         assert sharepoint_client.client.__class__.__name__ == "GraphServiceClient"
 
     def test_get_settings(self):
-        with patch("prowler.providers.m365.lib.service.service.M365PowerShell"):
+        with patch("prowler.providers.m365.lib.service.service.M365PowerShellPool"):
             sharepoint_client = SharePoint(set_mocked_m365_provider())
         settings = sharepoint_client.settings
         assert settings.sharingCapability == "ExternalUserAndGuestSharing"
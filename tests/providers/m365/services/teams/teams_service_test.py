@@ -58,14 +58,12 @@ class Test_Teams_Service:
                 "prowler.providers.m365.lib.powershell.m365_powershell.M365PowerShell.connect_microsoft_teams"
             ),
         ):
-            teams_client = Teams(
-                set_mocked_m365_provider(
-                    identity=M365IdentityInfo(tenant_domain=DOMAIN)
-                )
+            provider = set_mocked_m365_provider(
+                identity=M365IdentityInfo(tenant_domain=DOMAIN)
             )
+            teams_client = Teams(provider)
             assert teams_client.client.__class__.__name__ == "GraphServiceClient"
-            assert teams_client.powershell.__class__.__name__ == "M365PowerShell"
-            teams_client.powershell.close()
+            assert teams_client.powershell is provider.powershell
 
     @patch(
         "prowler.providers.m365.services.teams.teams_service.Teams._get_teams_client_configuration",
@@ -0,0 +1,149 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from prowler.providers.mongodbatlas.lib.service.service import (
+    MongoDBAtlasRateLimiter,
+    MongoDBAtlasService,
+    create_http_session,
+)
+from tests.providers.mongodbatlas.mongodbatlas_fixtures import (
+    ATLAS_BASE_URL,
+    ATLAS_PRIVATE_KEY,
+    set_mocked_mongodbatlas_provider,
+)
+
+
+def mock_response(status_code=200, json_data=None, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = json_data or {}
+    response.headers = headers or {}
+    return response
+
+
+def set_mocked_service(responses):
+    provider = set_mocked_mongodbatlas_provider()
+    provider.http_session = MagicMock()
+    provider.http_session.request.side_effect = responses
+    provider.rate_limiter = MongoDBAtlasRateLimiter(1000)
+    return MongoDBAtlasService("Test", provider)
+
+
+class Test_MongoDBAtlasService:
+    def test_create_http_session(self):
+        http_session = create_http_session(set_mocked_mongodbatlas_provider().session)
+
+        assert http_session.auth.password == ATLAS_PRIVATE_KEY
+        assert http_session.headers["Accept"] == "application/vnd.atlas.2025-01-01+json"
+        assert http_session.get_adapter(ATLAS_BASE_URL)._pool_maxsize == 10
+
+    def test_paginate_request_fetches_remaining_pages(self):
+        def request(method, url, params, **_):
+            page_num = params["pageNum"]
+            return mock_response(
+                json_data={
+                    "results": [{"id": f"{page_num}-{index}"} for index in range(2)],
+                    "totalCount": 6,
+                }
+            )
+
+        service = set_mocked_service(request)
+
+        items = service._paginate_request("/groups", page_size=2)
+
+        assert [item["id"] for item in items] == [
+            "1-0",
+            "1-1",
+            "2-0",
+            "2-1",
+            "3-0",
+            "3-1",
+        ]
+        assert service.http_session.request.call_count == 3
+
+    def test_paginate_request_max_pages(self):
+        service = set_mocked_service(
+            lambda *_, **__: mock_response(
+                json_data={"results": [{"id": "item"}], "totalCount": 10}
+            )
+        )
+
+        items = service._paginate_request("/groups", page_size=1, max_pages=2)
+
+        assert len(items) == 2
+        assert service.http_session.request.call_count == 2
+
+    def test_make_request_honors_retry_after(self):
+        service = set_mocked_service(
+            [
+                mock_response(429, headers={"Retry-After": "3"}),
+                mock_response(json_data={"id": "project"}),
+            ]
+        )
+
+        with patch(
+            "prowler.providers.mongodbatlas.lib.service.service.time.sleep"
+        ) as mock_sleep:
+            response = service._make_request("GET", "/groups/project")
+
+        assert response == {"id": "project"}
+        mock_sleep.assert_called_once_with(3.0)
+
+    def test_threading_call_keeps_order(self):
+        service = set_mocked_service([])
+
+        def call(item):
+            if item == 2:
+                raise Exception("error")
+            return item * 10
+
+        assert service.__threading_call__(call, [1, 2, 3]) == [10, None, 30]
+
+
+class Test_MongoDBAtlasRateLimiter:
+    def test_acquire_waits_for_tokens(self):
+        rate_limiter = MongoDBAtlasRateLimiter(2)
+
+        with patch(
+            "prowler.providers.mongodbatlas.lib.service.service.time.sleep"
+        ) as mock_sleep:
+            rate_limiter.acquire()
+            rate_limiter.acquire()
+            mock_sleep.assert_not_called()
+
+            rate_limiter._tokens = 0
+            mock_sleep.side_effect = lambda _: setattr(rate_limiter, "_tokens", 1)
+            rate_limiter.acquire()
+
+        mock_sleep.assert_called_once()
+
+    def test_acquire_below_one_request_per_second(self):
+        rate_limiter = MongoDBAtlasRateLimiter(0.5)
+        now = [0.0]
+
+        def sleep(seconds):
+            now[0] += seconds
+
+        with (
+            patch(
+                "prowler.providers.mongodbatlas.lib.service.service.time.monotonic",
+                side_effect=lambda: now[0],
+            ),
+            patch(
+                "prowler.providers.mongodbatlas.lib.service.service.time.sleep",
+                side_effect=sleep,
+            ) as mock_sleep,
+        ):
+            rate_limiter._last_refill = now[0]
+            rate_limiter.acquire()
+            mock_sleep.assert_not_called()
+
+            # The next token is available after two seconds
+            rate_limiter.acquire()
+
+        assert now[0] == pytest.approx(2)
+
+    def test_invalid_requests_per_second(self):
+        with pytest.raises(ValueError):
+            MongoDBAtlasRateLimiter(0)
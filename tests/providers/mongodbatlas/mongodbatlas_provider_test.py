@@ -8,6 +8,7 @@ from prowler.providers.mongodbatlas.exceptions.exceptions import (
     MongoDBAtlasCredentialsError,
     MongoDBAtlasIdentityError,
 )
+from prowler.providers.mongodbatlas.lib.service.service import MAX_REQUESTS_PER_SECOND
 from prowler.providers.mongodbatlas.models import (
     MongoDBAtlasIdentityInfo,
     MongoDBAtlasSession,
@@ -203,3 +204,46 @@ class TestMongodbatlasProvider:
             assert provider.project_id == "test_project"
             assert provider.session.public_key == ATLAS_PUBLIC_KEY
             assert provider.identity.organization_name == ORGANIZATION_NAME
+
+    @pytest.mark.parametrize(
+        "max_api_requests_per_second, expected_requests_per_second",
+        [
+            (0.5, 0.5),
+            (0, MAX_REQUESTS_PER_SECOND),
+            (-1, MAX_REQUESTS_PER_SECOND),
+            ("fast", MAX_REQUESTS_PER_SECOND),
+        ],
+    )
+    def test_provider_rate_limiter(
+        self, max_api_requests_per_second, expected_requests_per_second
+    ):
+        """Test the rate limiter built from the audit config"""
+        with (
+            patch(
+                "prowler.providers.mongodbatlas.mongodbatlas_provider.MongodbatlasProvider.setup_session",
+                return_value=MongoDBAtlasSession(
+                    public_key=ATLAS_PUBLIC_KEY,
+                    private_key=ATLAS_PRIVATE_KEY,
+                ),
+            ),
+            patch(
+                "prowler.providers.mongodbatlas.mongodbatlas_provider.MongodbatlasProvider.setup_identity",
+                return_value=MongoDBAtlasIdentityInfo(
+                    organization_id=ORGANIZATION_ID,
+                    organization_name=ORGANIZATION_NAME,
+                    roles=["ORGANIZATION_ADMIN"],
+                ),
+            ),
+        ):
+            provider = MongodbatlasProvider(
+                atlas_public_key=ATLAS_PUBLIC_KEY,
+                atlas_private_key=ATLAS_PRIVATE_KEY,
+                config_content={
+                    "max_api_requests_per_second": max_api_requests_per_second
+                },
+            )
+
+            assert (
+                provider.rate_limiter.requests_per_second
+                == expected_requests_per_second
+            )
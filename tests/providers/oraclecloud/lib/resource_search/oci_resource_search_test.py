@@ -0,0 +1,103 @@
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from prowler.providers.oraclecloud.lib.resource_search.resource_search import (
+    OCIResourceSearch,
+)
+from prowler.providers.oraclecloud.lib.service.service import OCIService
+from prowler.providers.oraclecloud.models import OCICompartment
+from tests.providers.oraclecloud.oci_fixtures import (
+    OCI_COMPARTMENT_ID,
+    OCI_REGION,
+    OCI_TENANCY_ID,
+    set_mocked_oci_provider,
+)
+
+RESOURCE_SEARCH_PATH = (
+    "prowler.providers.oraclecloud.lib.resource_search.resource_search"
+)
+
+
+def mock_resource(resource_type, compartment_id):
+    resource = MagicMock()
+    resource.resource_type = resource_type
+    resource.compartment_id = compartment_id
+    return resource
+
+
+class TestOCIResourceSearch:
+    def test_get_compartment_ids(self):
+        resource_search = OCIResourceSearch(set_mocked_oci_provider().session)
+
+        with (
+            patch(f"{RESOURCE_SEARCH_PATH}.oci.resource_search.ResourceSearchClient"),
+            patch(
+                f"{RESOURCE_SEARCH_PATH}.oci.pagination.list_call_get_all_results"
+            ) as mock_list_call,
+        ):
+            mock_list_call.return_value.data = [
+                mock_resource("Instance", OCI_COMPARTMENT_ID),
+                mock_resource("Vcn", OCI_TENANCY_ID),
+                mock_resource("Subnet", OCI_TENANCY_ID),
+            ]
+
+            assert resource_search.get_compartment_ids(OCI_REGION, ["instance"]) == {
+                OCI_COMPARTMENT_ID
+            }
+            assert resource_search.get_compartment_ids(
+                OCI_REGION, ["vcn", "instance"]
+            ) == {OCI_COMPARTMENT_ID, OCI_TENANCY_ID}
+            assert resource_search.get_compartment_ids(OCI_REGION, ["bucket"]) == set()
+
+        # The region is searched once
+        mock_list_call.assert_called_once()
+        search_details = mock_list_call.call_args.kwargs["search_details"]
+        assert search_details.query.startswith("query analyticsinstance, ")
+
+    def test_get_compartment_ids_search_error(self):
+        resource_search = OCIResourceSearch(set_mocked_oci_provider().session)
+
+        with (
+            patch(f"{RESOURCE_SEARCH_PATH}.oci.resource_search.ResourceSearchClient"),
+            patch(
+                f"{RESOURCE_SEARCH_PATH}.oci.pagination.list_call_get_all_results",
+                side_effect=Exception("NotAuthorized"),
+            ),
+        ):
+            assert resource_search.get_compartment_ids(OCI_REGION, ["instance"]) is None
+
+    def test_service_compartments_with_resources(self):
+        provider = set_mocked_oci_provider()
+        compartments = [
+            OCICompartment(
+                id=compartment_id,
+                name=compartment_id,
+                lifecycle_state="ACTIVE",
+                time_created=datetime.now(),
+            )
+            for compartment_id in (OCI_TENANCY_ID, OCI_COMPARTMENT_ID)
+        ]
+        provider.compartments = compartments
+        provider.resource_search = MagicMock()
+        provider.resource_search.get_compartment_ids.return_value = {OCI_COMPARTMENT_ID}
+        service = OCIService("compute", provider)
+
+        assert service._get_compartments_with_resources(OCI_REGION, ["instance"]) == [
+            compartments[1]
+        ]
+        provider.resource_search.get_compartment_ids.assert_called_once_with(
+            OCI_REGION, ["instance"]
+        )
+
+        # Every compartment is listed if the region could not be searched
+        provider.resource_search.get_compartment_ids.return_value = None
+        assert (
+            service._get_compartments_with_resources(OCI_REGION, ["instance"])
+            == compartments
+        )
+
+        service.resource_search = None
+        assert (
+            service._get_compartments_with_resources(OCI_REGION, ["instance"])
+            == compartments
+        )
@@ -68,6 +68,9 @@ def set_mocked_oci_provider(
     # Mock regions
     provider.regions = [region]
 
+    # Resource search disabled
+    provider.resource_search = None
+
     # Mock audit metadata
     provider.audit_metadata = Audit_Metadata(
         services_scanned=0,
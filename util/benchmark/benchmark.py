@@ -0,0 +1,480 @@
+"""
+Prowler scale benchmark
+
+Generates a synthetic AWS account with moto, or a synthetic Kubernetes cluster
+served by a fake API server, runs a scan against it and reports the scan wall
+time, the peak RSS, the findings per second and the time spent per stage:
+service initialization, checks, mutelist and output writers.
+
+Usage:
+    python util/benchmark/benchmark.py aws --ec2-instances 10000 --security-groups 5000 --iam-roles 20000 --s3-buckets 50000
+    python util/benchmark/benchmark.py kubernetes --pods 5000 --namespaces 50
+"""
+
+import argparse
+import json
+import os
+import resource
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from tabulate import tabulate
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from prowler.lib.logger import logger, set_logging_config  # noqa: E402
+from prowler.lib.outputs.csv.csv import CSV  # noqa: E402
+from prowler.lib.outputs.html.html import HTML  # noqa: E402
+from prowler.lib.outputs.ocsf.ocsf import OCSF  # noqa: E402
+from prowler.lib.outputs.outputs import extract_findings_statistics  # noqa: E402
+from prowler.lib.profiler import (  # noqa: E402
+    API_CALL_SPAN,
+    CHECK_LOAD_SPAN,
+    CHECK_SPAN,
+    MUTELIST_SPAN,
+    OUTPUT_SPAN,
+    SERVICE_SPAN,
+    profiler,
+)
+from prowler.lib.scan.scan import Scan  # noqa: E402
+
+AWS_REGION = "us-east-1"
+# AMI available in the moto backend
+EXAMPLE_AMI_ID = "ami-12c6146b"
+# Resources created per API call, when the API allows it
+EC2_INSTANCES_BATCH_SIZE = 1000
+STAGE_TITLES = {
+    "services_and_check_loading": "Services and check loading",
+    "service_calls": "Service calls",
+    "checks": "Checks",
+    "mutelist": "Mutelist",
+    "outputs": "Output writers",
+    "api_calls": "API calls",
+}
+# Metrics compared against the baseline, lower is better
+REGRESSION_METRICS = ("scan_seconds", "peak_rss_mib")
+ASSUME_ROLE_POLICY_DOCUMENT = json.dumps(
+    {
+        "Version": "2012-10-17",
+        "Statement": [
+            {
+                "Effect": "Allow",
+                "Principal": {"Service": "ec2.amazonaws.com"},
+                "Action": "sts:AssumeRole",
+            }
+        ],
+    }
+)
+
+
+def peak_rss_mib() -> float:
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return peak_rss / 1024 / 1024
+    return peak_rss / 1024
+
+
+def synthetic_mutelist(entries: int) -> dict:
+    """Mutelist with `entries` resource patterns that match none of the resources."""
+    return {
+        "Accounts": {
+            "*": {
+                "Checks": {
+                    "*": {
+                        "Regions": ["*"],
+                        "Resources": [
+                            f"benchmark-muted-resource-{index}$"
+                            for index in range(entries)
+                        ],
+                    }
+                }
+            }
+        }
+    }
+
+
+def generate_aws_account(arguments):
+    """Create the synthetic resources in the moto backend."""
+    import boto3
+
+    ec2_client = boto3.client("ec2", region_name=AWS_REGION)
+    remaining_instances = arguments.ec2_instances
+    while remaining_instances > 0:
+        batch_size = min(remaining_instances, EC2_INSTANCES_BATCH_SIZE)
+        ec2_client.run_instances(
+            ImageId=EXAMPLE_AMI_ID, MinCount=batch_size, MaxCount=batch_size
+        )
+        remaining_instances -= batch_size
+
+    for index in range(arguments.security_groups):
+        security_group_id = ec2_client.create_security_group(
+            GroupName=f"benchmark-security-group-{index}",
+            Description="Prowler benchmark security group",
+        )["GroupId"]
+        # One out of ten security groups allows SSH from the Internet
+        ec2_client.authorize_security_group_ingress(
+            GroupId=security_group_id,
+            IpPermissions=[
+                {
+                    "IpProtocol": "tcp",
+                    "FromPort": 22,
+                    "ToPort": 22,
+                    "IpRanges": [
+                        {"CidrIp": "0.0.0.0/0" if index % 10 == 0 else "10.0.0.0/8"}
+                    ],
+                }
+            ],
+        )
+
+    iam_client = boto3.client("iam", region_name=AWS_REGION)
+    for index in range(arguments.iam_roles):
+        iam_client.create_role(
+            RoleName=f"benchmark-role-{index}",
+            AssumeRolePolicyDocument=ASSUME_ROLE_POLICY_DOCUMENT,
+        )
+
+    s3_client = boto3.client("s3", region_name=AWS_REGION)
+    for index in range(arguments.s3_buckets):
+        s3_client.create_bucket(Bucket=f"benchmark-bucket-{index}")
+
+
+def aws_provider(arguments):
+    from prowler.providers.aws.aws_provider import AwsProvider
+
+    return AwsProvider(
+        regions={AWS_REGION},
+        mutelist_content=synthetic_mutelist(arguments.mutelist_entries),
+    )
+
+
+class FakeKubernetesAPIHandler(BaseHTTPRequestHandler):
+    """
+    Serves the pods and namespaces of the synthetic cluster and an empty list for
+    any other resource.
+    """
+
+    pods_by_namespace: dict = {}
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        segments = path.strip("/").split("/")
+        if path == "/api/v1/namespaces":
+            body = {
+                "kind": "NamespaceList",
+                "apiVersion": "v1",
+                "metadata": {},
+                "items": [
+                    {"metadata": {"name": namespace, "uid": namespace}}
+                    for namespace in self.pods_by_namespace
+                ],
+            }
+        elif segments[:3] == ["api", "v1", "namespaces"] and segments[-1] == "pods":
+            body = {
+                "kind": "PodList",
+                "apiVersion": "v1",
+                "metadata": {},
+                "items": self.pods_by_namespace.get(segments[3], []),
+            }
+        else:
+            body = {"kind": "List", "apiVersion": "v1", "metadata": {}, "items": []}
+        content = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *_):
+        pass
+
+
+def generate_kubernetes_cluster(arguments) -> dict:
+    """Return the synthetic pods by namespace."""
+    namespaces = [
+        f"benchmark-namespace-{index}" for index in range(arguments.namespaces)
+    ]
+    pods_by_namespace = defaultdict(list)
+    for index in range(arguments.pods):
+        namespace = namespaces[index % len(namespaces)]
+        pods_by_namespace[namespace].append(
+            {
+                "metadata": {
+                    "name": f"benchmark-pod-{index}",
+                    "uid": f"benchmark-pod-{index}",
+                    "namespace": namespace,
+                    "labels": {"app": "benchmark"},
+                },
+                "spec": {
+                    "nodeName": "benchmark-node",
+                    "serviceAccountName": "default",
+                    # One out of ten pods shares the host network and is privileged
+                    "hostNetwork": index % 10 == 0,
+                    "containers": [
+                        {
+                            "name": "benchmark",
+                            "image": "nginx:latest",
+                            "securityContext": {"privileged": index % 10 == 0},
+                        }
+                    ],
+                },
+                "status": {"phase": "Running", "podIP": "10.0.0.1"},
+            }
+        )
+    return dict(pods_by_namespace)
+
+
+def kubernetes_provider(arguments, server_address: str):
+    from prowler.providers.kubernetes.kubernetes_provider import KubernetesProvider
+
+    kubeconfig = {
+        "apiVersion": "v1",
+        "kind": "Config",
+        "clusters": [{"name": "benchmark", "cluster": {"server": server_address}}],
+        "users": [{"name": "benchmark", "user": {"token": "benchmark"}}],
+        "contexts": [
+            {
+                "name": "benchmark",
+                "context": {"cluster": "benchmark", "user": "benchmark"},
+            }
+        ],
+        "current-context": "benchmark",
+    }
+    return KubernetesProvider(
+        kubeconfig_content=json.dumps(kubeconfig),
+        namespace=list(FakeKubernetesAPIHandler.pods_by_namespace),
+        mutelist_content=synthetic_mutelist(arguments.mutelist_entries),
+    )
+
+
+def run_scan(provider, arguments) -> tuple[list, float]:
+    scan = Scan(
+        provider,
+        checks=arguments.checks,
+        services=None if arguments.checks else arguments.services,
+    )
+    findings = []
+    start_time = time.perf_counter()
+    for _, check_findings in scan.scan():
+        findings.extend(check_findings)
+    return findings, time.perf_counter() - start_time
+
+
+def write_outputs(findings: list, provider, output_directory: str):
+    stats = extract_findings_statistics(findings)
+    file_path = os.path.join(output_directory, "prowler-benchmark")
+    for output_class, file_extension in (
+        (CSV, ".csv"),
+        (OCSF, ".ocsf.json"),
+        (HTML, ".html"),
+    ):
+        with profiler.span(OUTPUT_SPAN, output_class.__name__):
+            output = output_class(
+                findings=findings, file_path=f"{file_path}{file_extension}"
+            )
+            if output_class is HTML:
+                output.batch_write_data_to_file(provider=provider, stats=stats)
+            else:
+                output.batch_write_data_to_file()
+
+
+def stages() -> dict:
+    """Total seconds spent per kind of span."""
+    stage_durations = defaultdict(float)
+    for span in profiler.spans:
+        # The output transforms are included in the output writer spans
+        if span.kind == OUTPUT_SPAN and span.name.endswith(".transform"):
+            continue
+        stage_durations[span.kind] += span.duration
+    return {
+        "services_and_check_loading": stage_durations[CHECK_LOAD_SPAN],
+        "service_calls": stage_durations[SERVICE_SPAN],
+        "checks": stage_durations[CHECK_SPAN],
+        "mutelist": stage_durations[MUTELIST_SPAN],
+        "outputs": stage_durations[OUTPUT_SPAN],
+        "api_calls": stage_durations[API_CALL_SPAN],
+    }
+
+
+def benchmark(arguments) -> dict:
+    results = {"provider": arguments.provider, "scale": {}}
+    profiler.enable()
+
+    start_time = time.perf_counter()
+    if arguments.provider == "aws":
+        from moto import mock_aws
+
+        from prowler.lib.profiler import instrument_boto3_session
+
+        results["scale"] = {
+            "ec2_instances": arguments.ec2_instances,
+            "security_groups": arguments.security_groups,
+            "iam_roles": arguments.iam_roles,
+            "s3_buckets": arguments.s3_buckets,
+        }
+        mock = mock_aws()
+        mock.start()
+        generate_aws_account(arguments)
+        results["setup_seconds"] = time.perf_counter() - start_time
+        results["setup_peak_rss_mib"] = peak_rss_mib()
+        provider = aws_provider(arguments)
+        instrument_boto3_session(provider.session.current_session)
+    else:
+        from prowler.lib.profiler import instrument_kubernetes_api_client
+
+        results["scale"] = {"pods": arguments.pods, "namespaces": arguments.namespaces}
+        FakeKubernetesAPIHandler.pods_by_namespace = generate_kubernetes_cluster(
+            arguments
+        )
+        server = ThreadingHTTPServer(("127.0.0.1", 0), FakeKubernetesAPIHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        results["setup_seconds"] = time.perf_counter() - start_time
+        results["setup_peak_rss_mib"] = peak_rss_mib()
+        provider = kubernetes_provider(
+            arguments, f"http://127.0.0.1:{server.server_address[1]}"
+        )
+        instrument_kubernetes_api_client(provider.session.api_client)
+
+    findings, scan_seconds = run_scan(provider, arguments)
+    results["scan_seconds"] = scan_seconds
+    results["findings"] = len(findings)
+    results["findings_per_second"] = len(findings) / scan_seconds if scan_seconds else 0
+
+    with tempfile.TemporaryDirectory() as output_directory:
+        write_outputs(findings, provider, output_directory)
+
+    results["stages_seconds"] = stages()
+    results["peak_rss_mib"] = peak_rss_mib()
+
+    if arguments.provider == "aws":
+        mock.stop()
+    else:
+        server.shutdown()
+        server.server_close()
+    return results
+
+
+def print_results(results: dict):
+    print(
+        tabulate(
+            [
+                ["Provider", results["provider"]],
+                *[
+                    [resource_type.replace("_", " ").capitalize(), count]
+                    for resource_type, count in results["scale"].items()
+                ],
+                ["Setup (s)", round(results["setup_seconds"], 2)],
+                ["Scan (s)", round(results["scan_seconds"], 2)],
+                ["Findings", results["findings"]],
+                ["Findings/s", round(results["findings_per_second"], 2)],
+                ["Peak RSS after setup (MiB)", round(results["setup_peak_rss_mib"])],
+                ["Peak RSS (MiB)", round(results["peak_rss_mib"])],
+                *[
+                    [f"{STAGE_TITLES[stage]} (s)", round(seconds, 2)]
+                    for stage, seconds in results["stages_seconds"].items()
+                ],
+            ],
+            tablefmt="rounded_grid",
+        )
+    )
+
+
+def find_regressions(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Return the metrics that are `threshold` times worse than the baseline."""
+    regressions = []
+    for metric in REGRESSION_METRICS:
+        if baseline.get(metric) and results[metric] > baseline[metric] * (
+            1 + threshold
+        ):
+            regressions.append(
+                f"{metric}: {round(results[metric], 2)} (baseline {round(baseline[metric], 2)})"
+            )
+    return regressions
+
+
+def parse_arguments(args=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark Prowler scans against synthetic large environments."
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        default="CRITICAL",
+        help="Select Log Level",
+    )
+    parser.add_argument(
+        "--mutelist-entries",
+        type=int,
+        default=100,
+        help="Number of resource patterns in the synthetic mutelist. Default: 100",
+    )
+    parser.add_argument(
+        "--checks",
+        nargs="+",
+        help="Checks to execute. Default: all the checks of the benchmarked services",
+    )
+    parser.add_argument(
+        "--output-file",
+        help="Save the results in this JSON file, e.g. to compare two releases",
+    )
+    parser.add_argument(
+        "--baseline",
+        help="JSON results of a previous run, the benchmark fails if the scan time or the peak RSS regress",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed regression over the baseline. Default: 0.2 (20%%)",
+    )
+    providers = parser.add_subparsers(dest="provider", required=True)
+
+    aws_parser = providers.add_parser("aws", help="Synthetic AWS account with moto")
+    aws_parser.add_argument("--ec2-instances", type=int, default=100)
+    aws_parser.add_argument("--security-groups", type=int, default=100)
+    aws_parser.add_argument("--iam-roles", type=int, default=100)
+    aws_parser.add_argument("--s3-buckets", type=int, default=100)
+    aws_parser.add_argument(
+        "--services", nargs="+", default=["ec2", "iam", "s3"], help=argparse.SUPPRESS
+    )
+
+    kubernetes_parser = providers.add_parser(
+        "kubernetes", help="Synthetic Kubernetes cluster served by a fake API server"
+    )
+    kubernetes_parser.add_argument("--pods", type=int, default=1000)
+    kubernetes_parser.add_argument("--namespaces", type=int, default=10)
+    kubernetes_parser.add_argument(
+        "--services", nargs="+", default=["core", "rbac"], help=argparse.SUPPRESS
+    )
+    return parser.parse_args(args)
+
+
+def main():
+    arguments = parse_arguments()
+    set_logging_config(arguments.log_level)
+    # moto and the synthetic cluster do not need real credentials
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+    os.environ.setdefault("AWS_DEFAULT_REGION", AWS_REGION)
+
+    logger.info(f"Running the {arguments.provider} benchmark")
+    results = benchmark(arguments)
+    print_results(results)
+    if arguments.output_file:
+        with open(arguments.output_file, "w") as file_descriptor:
+            json.dump(results, file_descriptor, indent=4)
+    if arguments.baseline:
+        with open(arguments.baseline) as file_descriptor:
+            baseline = json.load(file_descriptor)
+        regressions = find_regressions(results, baseline, arguments.threshold)
+        if regressions:
+            print("Performance regressions found:\n  " + "\n  ".join(regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()